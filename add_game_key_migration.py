@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Add game_key field to Team, GameSession, GameRound, WelcomeSession and FieldConfiguration
+
+game_key scopes rows to one game so several games can run on one instance.
+Existing rows belong to the default game ('default'). Also creates the
+per-game lookup indexes and the event index used by the per-game streams.
+
+field_configuration holds the active board layout of each game. Its unique
+constraint moves from field_type to (game_key, field_type), which SQLite can
+only do by rebuilding the table.
+
+Schema changes since the baseline database, run in this order:
+
+    1. add_profile_image_variants_migration.py
+    2. add_rng_seed_migration.py
+    3. add_turn_index_migration.py
+    4. add_game_key_migration.py
+    5. add_player_rotation_migration.py (needs the game_session columns of 2-4)
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from sqlalchemy import text
+
+GAME_SCOPED_TABLES = ('team', 'game_session', 'game_round', 'welcome_session')
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_team_game_key ON team (game_key);",
+    "CREATE INDEX IF NOT EXISTS ix_game_session_game_active ON game_session (game_key, is_active);",
+    "CREATE INDEX IF NOT EXISTS ix_game_round_game_active ON game_round (game_key, is_active);",
+    "CREATE INDEX IF NOT EXISTS ix_welcome_session_game_active ON welcome_session (game_key, is_active);",
+    "CREATE INDEX IF NOT EXISTS ix_game_event_session_id ON game_event (game_session_id, id);",
+)
+
+
+def rebuild_field_configuration(conn, default_game):
+    """Rebuild field_configuration with game_key and the per-game unique constraint"""
+    from app.models import FieldConfiguration
+
+    columns = [row[1] for row in conn.execute(text("PRAGMA table_info(field_configuration);"))]
+    if not columns:
+        print("Table 'field_configuration' does not exist. Skipped.")
+        return
+    if 'game_key' in columns:
+        print("Column 'game_key' already exists in field_configuration. Skipped.")
+        return
+
+    copied = ', '.join(columns)
+    conn.execute(text("ALTER TABLE field_configuration RENAME TO field_configuration_old;"))
+    FieldConfiguration.__table__.create(conn)
+    conn.execute(text(
+        f"INSERT INTO field_configuration ({copied}, game_key) "
+        f"SELECT {copied}, :game_key FROM field_configuration_old;"
+    ), {'game_key': default_game})
+    conn.execute(text("DROP TABLE field_configuration_old;"))
+    print("✅ Successfully rebuilt field_configuration with 'game_key' column.")
+
+
+def add_game_key_field():
+    """Add game_key field and per-game indexes"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: Add game_key field...")
+        default_game = app.config.get('DEFAULT_GAME_KEY', 'default')
+
+        try:
+            with db.engine.begin() as conn:
+                for table in GAME_SCOPED_TABLES:
+                    # Check if column already exists
+                    columns = [row[1] for row in conn.execute(text(f"PRAGMA table_info({table});"))]
+
+                    if 'game_key' in columns:
+                        print(f"Column 'game_key' already exists in {table}. Skipped.")
+                        continue
+
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ADD COLUMN game_key VARCHAR(50) NOT NULL DEFAULT '{default_game}';"
+                    ))
+                    print(f"✅ Successfully added 'game_key' column to {table} table.")
+
+                rebuild_field_configuration(conn, default_game)
+
+                for statement in INDEXES:
+                    conn.execute(text(statement))
+                print(f"✅ Ensured {len(INDEXES)} per-game indexes.")
+
+            print("Migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_game_key_field()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Add player_rotation table
+
+Rotation counters move from the GameSession.player_rotation_data JSON blob
+into one row per (session, team, player). Existing JSON data is copied into
+the table and the blob is cleared afterwards.
+
+Run after add_game_key_migration.py (see there for the full order). The
+game_session rows are read with raw SQL, so the script does not depend on
+the current GameSession model.
+"""
+
+import sys
+import os
+import json
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from sqlalchemy import text
+
+
+def rotation_rows(game_session_id, rotation_data):
+    """Rows for player_rotation from {team_id: {player: plays}} (non-numeric team ids are skipped)"""
+    return [
+        {
+            'game_session_id': game_session_id,
+            'team_id': int(team_id),
+            'player_name': player,
+            'plays': int(plays),
+        }
+        for team_id, players in rotation_data.items() if str(team_id).isdigit()
+        for player, plays in players.items()
+    ]
+
+
+def add_player_rotation_table():
+    """Create player_rotation table and migrate JSON rotation data"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: Add player_rotation table...")
+
+        from app.models import PlayerRotation
+
+        try:
+            with db.engine.begin() as conn:
+                tables = db.inspect(conn).get_table_names()
+
+                if 'player_rotation' in tables:
+                    print("Table 'player_rotation' already exists. Skipped creation.")
+                else:
+                    PlayerRotation.__table__.create(conn, checkfirst=True)
+                    print("✅ Successfully created 'player_rotation' table.")
+
+                sessions = conn.execute(text(
+                    "SELECT id, player_rotation_data FROM game_session "
+                    "WHERE player_rotation_data IS NOT NULL;"
+                )).fetchall()
+                migrated = 0
+                for session_id, raw_data in sessions:
+                    try:
+                        rotation_data = json.loads(raw_data)
+                    except (json.JSONDecodeError, TypeError):
+                        print(f"⚠️ Skipping unreadable rotation data of game session {session_id}.")
+                        continue
+                    rows = rotation_rows(session_id, rotation_data)
+                    conn.execute(text("DELETE FROM player_rotation WHERE game_session_id = :id;"),
+                                 {'id': session_id})
+                    if rows:
+                        conn.execute(text(
+                            "INSERT INTO player_rotation (game_session_id, team_id, player_name, plays) "
+                            "VALUES (:game_session_id, :team_id, :player_name, :plays);"
+                        ), rows)
+                    conn.execute(text("UPDATE game_session SET player_rotation_data = NULL WHERE id = :id;"),
+                                 {'id': session_id})
+                    migrated += 1
+            if migrated:
+                print(f"🔄 Migrated rotation data of {migrated} game session(s).")
+
+            print("Migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_player_rotation_table()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Add profile_image_variants fields to Team and PlayerRegistration tables
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from sqlalchemy import text
+
+TABLES = ('team', 'player_registration')
+
+
+def add_profile_image_variants_fields():
+    """Add profile_image_variants field to Team and PlayerRegistration tables"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: Add profile_image_variants fields...")
+
+        try:
+            with db.engine.begin() as conn:
+                for table in TABLES:
+                    # Check if column already exists
+                    columns = [row[1] for row in conn.execute(text(f"PRAGMA table_info({table});"))]
+
+                    if 'profile_image_variants' in columns:
+                        print(f"Column 'profile_image_variants' already exists in {table}. Skipped.")
+                        continue
+
+                    # Add the new column
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN profile_image_variants TEXT;"))
+
+                    print(f"✅ Successfully added 'profile_image_variants' column to {table} table.")
+
+            # Existing single images keep working via profile_image_path / profile_images;
+            # variants are created on the next upload.
+            print("Migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_profile_image_variants_fields()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Add rng_seed / rng_draws fields to GameSession table
+
+Existing sessions get a fresh seed, so their future draws are replayable
+(draws before the migration were not recorded).
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.services.game_rng import new_seed
+from sqlalchemy import text
+
+COLUMNS = (
+    ('rng_seed', 'BIGINTEGER'),
+    ('rng_draws', 'INTEGER DEFAULT 0'),
+)
+
+
+def add_rng_fields():
+    """Add rng_seed and rng_draws fields to GameSession table"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: Add rng_seed / rng_draws fields...")
+
+        try:
+            with db.engine.begin() as conn:
+                # Check which columns already exist
+                columns = [row[1] for row in conn.execute(text("PRAGMA table_info(game_session);"))]
+
+                for column, column_type in COLUMNS:
+                    if column in columns:
+                        print(f"Column '{column}' already exists in game_session. Skipped.")
+                        continue
+
+                    conn.execute(text(f"ALTER TABLE game_session ADD COLUMN {column} {column_type};"))
+                    print(f"✅ Successfully added '{column}' column to game_session table.")
+
+                # Seed existing sessions
+                session_ids = [row[0] for row in conn.execute(text(
+                    "SELECT id FROM game_session WHERE rng_seed IS NULL;"
+                ))]
+                for session_id in session_ids:
+                    conn.execute(
+                        text("UPDATE game_session SET rng_seed = :seed, rng_draws = 0 WHERE id = :id;"),
+                        {'seed': new_seed(), 'id': session_id}
+                    )
+                if session_ids:
+                    print(f"🔄 Seeded {len(session_ids)} existing game session(s).")
+
+            print("Migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_rng_fields()
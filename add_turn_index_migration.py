@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Migration Script: Add turn_index field to GameSession table
+
+turn_index stores the position of current_team_turn_id in dice_roll_order.
+Existing sessions are initialised from their current team.
+"""
+
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.game_logic.turn_order import TurnOrder
+from sqlalchemy import text
+
+
+def initial_turn_index(dice_roll_order, current_team_turn_id):
+    """Index of the current team in dice_roll_order (end of the order if none or unknown)"""
+    order = TurnOrder.parse(dice_roll_order)
+    if current_team_turn_id is None:
+        return len(order)
+    try:
+        position = order.position(int(current_team_turn_id))
+    except (TypeError, ValueError):
+        position = None
+    return position if position is not None else len(order)
+
+
+def add_turn_index_field():
+    """Add turn_index field to GameSession table"""
+
+    app = create_app()
+
+    with app.app_context():
+        print("Starting migration: Add turn_index field...")
+
+        try:
+            with db.engine.begin() as conn:
+                # Check if column already exists
+                columns = [row[1] for row in conn.execute(text("PRAGMA table_info(game_session);"))]
+
+                if 'turn_index' in columns:
+                    print("Column 'turn_index' already exists in game_session. Skipped.")
+                    return
+
+                # Compute the backfill before the ALTER (raw SQL: the ORM model maps columns of
+                # later migrations), so a failure here leaves the table unchanged for a re-run
+                sessions = conn.execute(text(
+                    "SELECT id, dice_roll_order, current_team_turn_id FROM game_session "
+                    "WHERE dice_roll_order IS NOT NULL;"
+                )).fetchall()
+                turn_indexes = [
+                    {'turn_index': initial_turn_index(dice_roll_order, current_team_turn_id), 'id': session_id}
+                    for session_id, dice_roll_order, current_team_turn_id in sessions
+                ]
+
+                conn.execute(text("ALTER TABLE game_session ADD COLUMN turn_index INTEGER DEFAULT 0;"))
+                print("✅ Successfully added 'turn_index' column to game_session table.")
+
+                # Initialise from current_team_turn_id
+                if turn_indexes:
+                    conn.execute(text("UPDATE game_session SET turn_index = :turn_index WHERE id = :id;"),
+                                 turn_indexes)
+                    print(f"🔄 Initialised turn_index for {len(turn_indexes)} game session(s).")
+
+            print("Migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            db.session.rollback()
+            raise
+
+if __name__ == "__main__":
+    add_turn_index_field()
@@ -17,13 +17,15 @@ csrf = CSRFProtect()
 @login_manager.user_loader
 def load_user(user_id_with_prefix): # user_id kommt jetzt als String mit Präfix
     from app.models import Admin, Team
+    from app.services.identity_cache import load_identity
     
+    # Kurzlebiger Identitäts-Cache statt einer Abfrage pro Request
     if user_id_with_prefix.startswith('admin_'):
         admin_id = int(user_id_with_prefix.split('_')[1])
-        return Admin.query.get(admin_id)
+        return load_identity(Admin, admin_id, db.session)
     elif user_id_with_prefix.startswith('team_'):
         team_id = int(user_id_with_prefix.split('_')[1])
-        return Team.query.get(team_id)
+        return load_identity(Team, team_id, db.session)
     return None
 
 def create_app(config_class=Config):
@@ -79,6 +81,30 @@ def create_app(config_class=Config):
                 user_type_in_context = 'team'
         return {'now_year': datetime.utcnow().year, 'user_type_in_context': user_type_in_context}
 
+    # Versionierte URLs für gecachte Referenz-Endpunkte (Feld-Layout, Charaktere)
+    from app.services.response_cache import versioned_url, get_version as get_cache_version
+    app.jinja_env.globals.update(versioned_url=versioned_url, cache_version=get_cache_version)
+
+    # Gehashte Seiten-Bundles (build_assets.py) über asset_url() einbinden
+    from app.services import asset_manifest
+    asset_manifest.init_app(app)
+
+    # Vorkomprimierte statische Dateien und gzip/brotli für große JSON-Antworten
+    from app.services import compression
+    compression.init_app(app)
+
+    # Videos/Audio mit Range-Requests, Zero-Copy oder Proxy-Übergabe (X-Accel-Redirect/X-Sendfile)
+    from app.services import media_files
+    media_files.init_app(app)
+
+    # Inhalts-gehashte Profilbild-Varianten (immutable Cache-Header, Jinja-Helper)
+    from app.services import profile_images
+    profile_images.init_app(app)
+
+    # Begrenzter Worker-Pool für Profilbild-Uploads
+    from app.services import image_jobs
+    image_jobs.init_app(app)
+
     @app.template_filter('is_admin')
     def is_admin_filter(user):
         from app.models import Admin as AdminModel
@@ -92,4 +118,32 @@ def create_app(config_class=Config):
     with app.app_context():
         from app import models 
 
+        # Request-lokale Lookups (aktive Session/Runde/Ordner) und Identitäts-Cache
+        from app.services import request_context, identity_cache
+        request_context.init_app(app)
+        identity_cache.register_invalidation_hooks(models.Admin, models.Team)
+
+        # Board-Version für den gemeinsamen Dashboard-Schnappschuss
+        from app.services.board_snapshot import register_invalidation_hooks as register_board_hooks
+        register_board_hooks()
+
+        # Avatar-Manifest bei Team-/Charakter-Änderungen nach dem Commit verwerfen
+        from app.services.avatar_manifest import register_invalidation_hooks
+        register_invalidation_hooks()
+
+        # Bild-GC nach Änderungen an Profilbildern (unreferenzierte Dateien entfernen)
+        from app.services import image_store
+        image_store.init_app(app)
+
+        # Gesichter-Atlas für Overlays nach Auswahl-/Bildänderungen vorbauen
+        from app.services import face_atlas
+        face_atlas.init_app(app)
+
+        # Charakter-Katalog vorwärmen (Tabellen existieren evtl. noch nicht, z. B. vor init_db)
+        try:
+            from app.services.character_catalog import get_catalog
+            get_catalog()
+        except Exception as e:
+            app.logger.debug(f"Charakter-Katalog beim Start nicht geladen: {e}")
+
     return app
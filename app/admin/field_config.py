@@ -6,6 +6,7 @@ import json
 from typing import Dict, List, Optional, Any
 from flask import current_app
 from app.models import FieldConfiguration, db
+from app.services.game_scope import current_game_key
 from app.game_logic.special_fields import get_all_special_field_positions, get_field_statistics
 
 
@@ -13,7 +14,7 @@ def get_field_type_color_mapping():
     """
     Gibt eine Zuordnung von Feld-Typen zu Farben zurück
     """
-    field_configs = FieldConfiguration.query.all()
+    field_configs = FieldConfiguration.in_game().all()
     color_mapping = {}
     
     for config in field_configs:
@@ -28,18 +29,24 @@ def get_field_type_color_mapping():
     return color_mapping
 
 
-def get_field_preview_data(max_fields=73):
+def get_field_preview_data(max_fields=None):
     """
     Generiert Vorschau-Daten für die Feld-Verteilung
+    (Standard: Brettgröße aus `MAX_BOARD_FIELDS`; Konfigurationen in einer Abfrage)
     """
-    from app.game_logic.special_fields import get_field_type_at_position
+    from app.game_logic.special_fields import get_board_size, get_field_distribution
+    
+    if max_fields is None:
+        max_fields = get_board_size()
+    distribution = get_field_distribution(max_fields)
+    configs = {config.field_type: config for config in FieldConfiguration.in_game().all()}
     
     field_preview = []
     field_counts = {}
     
     for position in range(max_fields):
-        field_type = get_field_type_at_position(position)
-        config = FieldConfiguration.get_config_for_field(field_type)
+        field_type = distribution.get(position, 'normal')
+        config = configs.get(field_type)
         
         field_info = {
             'position': position,
@@ -96,7 +103,7 @@ def update_field_config(config_id, form_data):
     """
     Aktualisiert eine Feld-Konfiguration basierend auf Formulardaten
     """
-    config = FieldConfiguration.query.get_or_404(config_id)
+    config = FieldConfiguration.in_game().filter_by(id=config_id).first_or_404()
     
     # Basis-Felder aktualisieren
     config.display_name = form_data.get('display_name', config.display_name)
@@ -231,7 +238,7 @@ def export_field_configurations():
     """
     Exportiert alle Feld-Konfigurationen als JSON
     """
-    configs = FieldConfiguration.query.all()
+    configs = FieldConfiguration.in_game().all()
     export_data = []
     
     for config in configs:
@@ -258,6 +265,9 @@ def import_field_configurations(import_data):
     imported_count = 0
     errors = []
     
+    # Import betrifft nur die Konfiguration des aktuellen Spiels
+    FieldConfiguration.ensure_game_configs()
+    
     for config_data in import_data:
         try:
             field_type = config_data.get('field_type')
@@ -266,7 +276,7 @@ def import_field_configurations(import_data):
                 continue
             
             # Prüfe ob Konfiguration bereits existiert
-            existing_config = FieldConfiguration.query.filter_by(field_type=field_type).first()
+            existing_config = FieldConfiguration.in_game().filter_by(field_type=field_type).first()
             
             if existing_config:
                 # Aktualisiere existierende Konfiguration
@@ -286,6 +296,8 @@ def import_field_configurations(import_data):
     if imported_count > 0:
         try:
             db.session.commit()
+            from app.game_logic.special_fields import clear_field_distribution_cache
+            clear_field_distribution_cache()
         except Exception as e:
             db.session.rollback()
             errors.append(f"Fehler beim Speichern: {str(e)}")
@@ -302,13 +314,16 @@ def reset_to_default_configurations():
     Setzt alle Feld-Konfigurationen auf Standard-Werte zurück
     """
     try:
-        # Lösche alle existierenden Konfigurationen
-        FieldConfiguration.query.delete()
+        # Lösche alle existierenden Konfigurationen des aktuellen Spiels
+        game_key = current_game_key()
+        FieldConfiguration.query.filter_by(game_key=game_key).delete()
         
         # Erstelle Standard-Konfigurationen
-        FieldConfiguration.initialize_default_configs()
+        FieldConfiguration.initialize_default_configs(game_key)
         
         db.session.commit()
+        from app.game_logic.special_fields import clear_field_distribution_cache
+        clear_field_distribution_cache()
         return True
     except Exception as e:
         db.session.rollback()
@@ -324,7 +339,7 @@ def validate_field_conflicts():
     positions_map = {}
     
     # Sammle alle Positionen für jeden Feld-Typ
-    special_positions = get_all_special_field_positions(73)
+    special_positions = get_all_special_field_positions()
     
     for field_type, positions in special_positions.items():
         for position in positions:
@@ -1,4 +1,5 @@
 from app.models import Character, CharacterPart, db # Import db direkt vom app.models Modul oder app Modul
+from app.services.character_catalog import invalidate_catalog
 import json
 
 # Liste der Standardcharaktere mit erweiterten Eigenschaften
@@ -221,6 +222,7 @@ def initialize_characters():
         
         if new_characters_added:
             db.session.commit()
+            invalidate_catalog()
             print("Neue Charaktere erfolgreich in die Datenbank geschrieben.")
         else:
             print("Alle Standardcharaktere sind bereits in der Datenbank vorhanden.")
@@ -283,6 +285,7 @@ def initialize_character_parts():
         
         if new_parts_added:
             db.session.commit()
+            invalidate_catalog()
             print("Neue Charakter-Teile erfolgreich in die Datenbank geschrieben.")
         else:
             print("Alle Standard-Charakter-Teile sind bereits in der Datenbank vorhanden.")
@@ -11,6 +11,7 @@ from flask import current_app
 from typing import List, Dict, Optional, Any
 import uuid
 from app.services.session_service import get_active_session
+from app.services.game_rng import get_session_rng
 
 def get_minigame_folders_path() -> str:
     """Gibt den vollständigen Pfad zum Minigame-Ordner zurück"""
@@ -239,13 +240,15 @@ def get_minigame_from_folder(folder_name: str, minigame_id: str) -> Optional[Dic
     
     return None
 
-def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: List[str] = None,
+                                    rng=None) -> Optional[Dict[str, Any]]:
     """
     Gibt ein zufälliges Minispiel oder eine Frage aus einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
         exclude_played_ids: Liste von IDs, die ausgeschlossen werden sollen
+        rng: Zufallsquelle (Standard: Zufall der aktiven Spielsitzung)
         
     Returns:
         Zufälliges Minispiel/Frage oder None wenn keines verfügbar
@@ -267,8 +270,8 @@ def get_random_minigame_from_folder(folder_name: str, exclude_played_ids: List[s
         # Optional: Alle wieder verfügbar machen oder None zurückgeben
         available_minigames = all_minigames  # Alle wieder verfügbar machen
     
-    import random
-    return random.choice(available_minigames)
+    rng = rng or get_session_rng(get_active_session())
+    return rng.choice(available_minigames)
 
 def list_available_folders() -> List[str]:
     """Gibt eine Liste aller verfügbaren Minigame-Ordner zurück"""
@@ -420,7 +423,7 @@ def save_round_to_filesystem(round_obj) -> bool:
         # 2. TEAMS.JSON - Alle Teams mit kompletten Daten
         teams_data = []
         from app.models import Team
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         
         for team in teams:
             team_data = {
@@ -463,9 +466,10 @@ def save_round_to_filesystem(round_obj) -> bool:
                 'selected_folder_minigame_id': active_session.selected_folder_minigame_id,
                 'minigame_source': active_session.minigame_source,
                 'played_content_ids': active_session.played_content_ids,
-                'player_rotation_data': active_session.player_rotation_data,
+                'player_rotation_data': json.dumps(active_session.get_player_rotation_data()),
                 'current_phase': active_session.current_phase,
                 'dice_roll_order': active_session.dice_roll_order,
+                'turn_index': active_session.turn_index,
                 'current_team_turn_id': active_session.current_team_turn_id,
                 'volcano_countdown': active_session.volcano_countdown,
                 'volcano_active': active_session.volcano_active,
@@ -475,7 +479,9 @@ def save_round_to_filesystem(round_obj) -> bool:
                 'field_minigame_opponent_team_id': active_session.field_minigame_opponent_team_id,
                 'field_minigame_content_id': active_session.field_minigame_content_id,
                 'field_minigame_content_type': active_session.field_minigame_content_type,
-                'field_minigame_result': active_session.field_minigame_result
+                'field_minigame_result': active_session.field_minigame_result,
+                'rng_seed': active_session.rng_seed,
+                'rng_draws': active_session.rng_draws
             }
             
             with open(os.path.join(round_path, 'spielsitzung.json'), 'w', encoding='utf-8') as f:
@@ -989,6 +995,7 @@ def _restore_game_session_from_data(session_data, round_id):
     from app.models import GameSession
     from app import db
     from datetime import datetime
+    from app.services.game_rng import new_seed
     
     try:
         # Prüfe ob bereits eine aktive GameSession existiert
@@ -1011,9 +1018,9 @@ def _restore_game_session_from_data(session_data, round_id):
             selected_folder_minigame_id=session_data.get('selected_folder_minigame_id'),
             minigame_source=session_data.get('minigame_source', 'manual'),
             played_content_ids=session_data.get('played_content_ids', ''),
-            player_rotation_data=session_data.get('player_rotation_data'),
             current_phase=session_data.get('current_phase', 'SETUP_MINIGAME'),
             dice_roll_order=session_data.get('dice_roll_order'),
+            turn_index=session_data.get('turn_index', 0),
             current_team_turn_id=session_data.get('current_team_turn_id'),
             volcano_countdown=session_data.get('volcano_countdown', 0),
             volcano_active=session_data.get('volcano_active', False),
@@ -1023,11 +1030,18 @@ def _restore_game_session_from_data(session_data, round_id):
             field_minigame_opponent_team_id=session_data.get('field_minigame_opponent_team_id'),
             field_minigame_content_id=session_data.get('field_minigame_content_id'),
             field_minigame_content_type=session_data.get('field_minigame_content_type'),
-            field_minigame_result=session_data.get('field_minigame_result')
+            field_minigame_result=session_data.get('field_minigame_result'),
+            rng_seed=session_data.get('rng_seed', new_seed()),
+            rng_draws=session_data.get('rng_draws', 0)
         )
         
         db.session.add(session)
         
+        # Rotations-Zähler (JSON im Backup) in die Tabelle player_rotation übernehmen
+        if session_data.get('player_rotation_data'):
+            db.session.flush()
+            session.set_player_rotation_data(json.loads(session_data['player_rotation_data']))
+        
     except Exception as e:
         print(f"Fehler beim Wiederherstellen der GameSession: {e}")
 
@@ -1196,13 +1210,15 @@ def get_all_content_from_folder(folder_name: str) -> Dict[str, List[Dict[str, An
         'questions': questions
     }
 
-def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[str] = None,
+                                   rng=None) -> Optional[Dict[str, Any]]:
     """
     Gibt zufälligen Inhalt (Minispiel oder Frage) aus einem Ordner zurück.
     
     Args:
         folder_name: Name des Ordners
         exclude_played_ids: Liste von IDs, die ausgeschlossen werden sollen
+        rng: Zufallsquelle (Standard: Zufall der aktiven Spielsitzung)
         
     Returns:
         Zufälliges Minispiel/Frage oder None wenn keines verfügbar
@@ -1223,8 +1239,8 @@ def get_random_content_from_folder(folder_name: str, exclude_played_ids: List[st
         current_app.logger.warning(f"Alle Inhalte aus Ordner '{folder_name}' wurden bereits gespielt. Alle werden wieder verfügbar gemacht.")
         available_items = all_items  # Alle wieder verfügbar machen
     
-    import random
-    selected = random.choice(available_items)
+    rng = rng or get_session_rng(get_active_session())
+    selected = rng.choice(available_items)
     
     # Füge Typ-Info hinzu falls nicht vorhanden
     if 'type' not in selected:
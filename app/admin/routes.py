@@ -1,7 +1,6 @@
 # app/admin/routes.py
 import sys
 import os
-import random
 import json
 import uuid
 from datetime import datetime
@@ -11,7 +10,7 @@ import json
 import time
 from ..models import (Admin, Team, Character, GameSession, GameEvent, MinigameFolder, GameRound, 
                      QuestionResponse, FieldConfiguration, WelcomeSession, PlayerRegistration, 
-                     MinigameSequence, db)
+                     MinigameSequence, PlayerRotation, db)
 from ..forms import (AdminLoginForm, CreateTeamForm, EditTeamForm, SetNextMinigameForm, 
                      AdminConfirmPasswordForm, CreateMinigameFolderForm, EditMinigameFolderForm,
                      CreateGameRoundForm, EditGameRoundForm, FolderMinigameForm, EditFolderMinigameForm,
@@ -38,13 +37,23 @@ from .field_config import (
 )
 
 # SONDERFELD-LOGIK IMPORT
-from app.services.session_service import get_active_session, get_or_create_active_session, get_active_session_events
+from app.services.session_service import (delete_game_sessions, get_active_session, get_or_create_active_session,
+                                          get_active_session_events)
 from app.services.event_service import create_event
+from app.services.game_rng import get_session_rng
+from app.services.game_scope import current_game_key, default_game_key, known_game_keys, select_game
+from app.services.response_cache import cached_response, get_version, FIELD_CONFIG
+from app.services.character_catalog import rebuild_catalog
+from app.services.profile_images import process_base64_image, remove_legacy_image
+from app.services.image_jobs import ImageQueueFullError, run_image_job
+from app.services.image_store import reset_image_store, schedule_gc
+from app.services.avatar_manifest import invalidate_avatar_manifest
+from app.services.board_snapshot import invalidate_board_snapshot
+from app.services.face_atlas import schedule_prewarm
 from app.game_logic.special_fields import (
-    handle_special_field_action, 
-    check_barrier_release, 
     get_field_type_at_position,
     get_all_special_field_positions,
+    get_board_size,
     get_field_statistics,
     start_selected_field_minigame,  # NEU: Für Admin-Auswahl
     handle_field_minigame_result  # NEU: Für Ergebnis-Verarbeitung
@@ -106,6 +115,8 @@ def add_field_update_event(event_data):
 
     payload = dict(event_data or {})
     payload.setdefault('type', 'field_update')
+    # Clients laden Feld-Daten über die versionierte URL neu
+    payload.setdefault('config_version', get_version(FIELD_CONFIG))
 
     evt = create_event(
         session.id,
@@ -283,7 +294,7 @@ def calculate_automatic_placements():
         placement += 1
 
     # Teams die nicht geantwortet haben bekommen letzte Plätze
-    all_teams = Team.query.all()
+    all_teams = Team.in_game().all()
     answered_team_ids = {r.team_id for r in responses}
     
     for team in all_teams:
@@ -701,7 +712,7 @@ def _get_team_response_status(active_session):
         }
     
     try:
-        all_teams = Team.query.all()
+        all_teams = Team.in_game().all()
         
         # Lade Antworten für aktuelle Frage mit Details
         responses = QuestionResponse.query.filter_by(
@@ -927,7 +938,7 @@ def _get_game_results(active_session):
     
     try:
         # Hole alle Teams mit ihren Platzierungen
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         team_placements = []
         
         current_app.logger.info(f"DEBUG: Checking results for {len(teams)} teams")
@@ -981,11 +992,11 @@ def admin_dashboard():
         return redirect(url_for('main.index'))
 
     active_session = get_or_create_active_session()
-    teams = Team.query.order_by(Team.name).all()
+    teams = Team.in_game().order_by(Team.name).all()
 
     active_round = GameRound.get_active_round()
     available_folders = MinigameFolder.query.order_by(MinigameFolder.name).all()
-    available_rounds = GameRound.query.order_by(GameRound.name).all()
+    available_rounds = GameRound.in_game().order_by(GameRound.name).all()
 
     set_minigame_form = SetNextMinigameForm()
     
@@ -1047,7 +1058,10 @@ def admin_dashboard():
         "active_sequence": active_sequence,
         # NEU: Feld-Management Daten
         "field_stats": field_stats,
-        "field_color_mapping": field_color_mapping
+        "field_color_mapping": field_color_mapping,
+        # Mehrere Spiele pro Instanz
+        "current_game": current_game_key(),
+        "known_games": known_game_keys()
     }
     
     return render_template('admin.html', **template_data)
@@ -1061,7 +1075,7 @@ def open_board():
         return redirect(url_for('main.index'))
     
     # Prüfe ob Teams registriert sind
-    teams_count = Team.query.count()
+    teams_count = Team.in_game().count()
     if teams_count == 0:
         # Keine Teams -> zur Welcome-Seite umleiten
         flash('Noch keine Teams registriert. Nutze das Welcome-System, um Teams zu erstellen.', 'info')
@@ -1070,6 +1084,29 @@ def open_board():
     # Teams vorhanden -> zum Spielbrett weiterleiten
     return redirect(url_for('main.game_board'))
 
+@admin_bp.route('/select_game', methods=['POST'])
+@login_required
+def select_game_route():
+    """Wechselt das Spiel, das dieser Admin-Browser verwaltet (Teams, Runden, Sitzung)."""
+    if not isinstance(current_user, Admin):
+        flash('Aktion nicht erlaubt.', 'danger')
+        return redirect(url_for('main.index'))
+
+    data = request.get_json(silent=True) or request.form
+    try:
+        game_key = select_game(data.get('game_key', ''))
+    except ValueError:
+        message = 'Ungültiger Spiel-Schlüssel (a-z, 0-9, "-" und "_", max. 50 Zeichen).'
+        if request.is_json:
+            return jsonify({"success": False, "error": message}), 400
+        flash(message, 'danger')
+        return redirect(url_for('admin.admin_dashboard'))
+
+    if request.is_json:
+        return jsonify({"success": True, "game_key": game_key})
+    flash(f"Spiel '{game_key}' ausgewählt.", 'success')
+    return redirect(url_for('admin.admin_dashboard'))
+
 @admin_bp.route('/login', methods=['GET', 'POST'])
 def login():
     if current_user.is_authenticated and isinstance(current_user, Admin):
@@ -1103,272 +1140,35 @@ def admin_roll_dice():
         return jsonify({"success": False, "error": "Nur Admins können würfeln."}), 403
 
     try:
-        from app.services.session_service import get_active_session
-
-        active_session = get_active_session()
-        if not active_session:
-            return jsonify({"success": False, "error": "Keine aktive Spielsitzung."}), 404
-
-        if active_session.current_phase != 'DICE_ROLLING':
-            return jsonify({"success": False, "error": "Es ist nicht die Würfelphase."}), 403
-        
-        current_team_id = active_session.current_team_turn_id
-        if not current_team_id:
-            return jsonify({"success": False, "error": "Kein Team für aktuellen Zug festgelegt."}), 404
-
-        team = Team.query.get(current_team_id)
-        if not team:
-            return jsonify({"success": False, "error": "Aktuelles Team nicht gefunden."}), 404
-
-        # EINFACHE ABER ROBUSTE LÖSUNG: Zähle aktuelle Würfel-Events in der Runde  
-        if active_session.dice_roll_order:
-            try:
-                # Parse die Würfelreihenfolge
-                dice_order_team_ids = [int(tid) for tid in active_session.dice_roll_order.split(',') if tid.strip().isdigit()]
-                total_teams = len(dice_order_team_ids)
-                
-                # Zähle ALLE Würfel-Events in dieser Session
-                all_dice_events_in_session = GameEvent.query.filter_by(
-                    game_session_id=active_session.id
-                ).filter(
-                    GameEvent.event_type.in_(['team_dice_roll', 'admin_dice_roll'])
-                ).count()
-                
-                # Zähle Würfel-Events für dieses spezifische Team
-                team_dice_events = GameEvent.query.filter_by(
-                    game_session_id=active_session.id,
-                    related_team_id=team.id
-                ).filter(
-                    GameEvent.event_type.in_(['team_dice_roll', 'admin_dice_roll'])
-                ).count()
-                
-                # Ermittle welche "Runde" wir sind (wie oft jedes Team gewürfelt haben sollte)
-                expected_round = (all_dice_events_in_session // total_teams) + 1
-                
-                # Wenn das Team bereits in dieser Runde gewürfelt hat, verweigern
-                if team_dice_events >= expected_round:
-                    if team.id != active_session.current_team_turn_id:
-                        return jsonify({"success": False, "error": f"Team {team.name} hat bereits in dieser Runde gewürfelt."}), 403
-                        
-            except (ValueError, ZeroDivisionError) as e:
-                current_app.logger.warning(f"Fehler bei Würfel-Validierung: {e}")
-                pass  # Bei Fehlern in der Logik, erlaube Würfeln
-
-        # SONDERFELD: Prüfe ob Team blockiert ist (Sperren-Feld)
-        standard_dice_roll = random.randint(1, 6)
-        bonus_dice_roll = 0
-        
-        current_app.logger.info(f"Team {team.name} würfelt - Bonus-Würfel-Seiten: {team.bonus_dice_sides}")
-        
-        if team.bonus_dice_sides and team.bonus_dice_sides > 0:
-            bonus_dice_roll = random.randint(1, team.bonus_dice_sides)
-            current_app.logger.info(f"Team {team.name} erhält Bonus-Würfel: {bonus_dice_roll} (von 1-{team.bonus_dice_sides})")
-        else:
-            current_app.logger.info(f"Team {team.name} erhält keinen Bonus-Würfel")
-        
-        total_roll = standard_dice_roll + bonus_dice_roll
-        old_position = team.current_position
-        new_position = old_position  # Default: keine Bewegung
-        special_field_result = None
-        barrier_check_result = None
-
-        # SONDERFELD: Prüfe Sperren-Status
-        if team.is_blocked:
-            # Team ist blockiert - prüfe ob es freikommt
-            barrier_check_result = check_barrier_release(team, standard_dice_roll, active_session, bonus_dice_roll)
-            
-            if barrier_check_result['released']:
-                # Team ist befreit und kann sich normal bewegen
-                max_field_index = current_app.config.get('MAX_BOARD_FIELDS', 72)
-                new_position = min(team.current_position + total_roll, max_field_index)
-                team.current_position = new_position
-                
-                # Prüfe Sonderfeld-Aktion nach Bewegung
-                all_teams = Team.query.all()
-                dice_info = {
-                    "old_position": old_position,
-                    "new_position": new_position,
-                    "dice_roll": standard_dice_roll,
-                    "bonus_roll": bonus_dice_roll,
-                    "total_roll": total_roll
-                }
-                special_field_result = handle_special_field_action(team, all_teams, active_session, dice_info)
-            else:
-                # Team bleibt blockiert, keine Bewegung
-                new_position = old_position
-        else:
-            # Team ist nicht blockiert - normale Bewegung
-            max_field_index = current_app.config.get('MAX_BOARD_FIELDS', 72)
-            new_position = min(team.current_position + total_roll, max_field_index)
-            team.current_position = new_position
-            
-            # SONDERFELD: Prüfe Sonderfeld-Aktion nach Bewegung
-            all_teams = Team.query.all()
-            dice_info = {
-                "old_position": old_position,
-                "new_position": new_position,
-                "dice_roll": standard_dice_roll,
-                "bonus_roll": bonus_dice_roll,
-                "total_roll": total_roll
-            }
-            special_field_result = handle_special_field_action(team, all_teams, active_session, dice_info)
-
-        # ZIELFELD: Prüfe Gewinn-Bedingung
-        # WICHTIG: Team muss BEREITS auf Position 72 gewesen sein (old_position), nicht erst durch den Wurf dorthin gekommen
-        victory_triggered = False
-        current_app.logger.info(f"🔍 ADMIN DICE DEBUG: Team {team.name} - old_position: {old_position}, new_position: {new_position}, total_roll: {total_roll}")
-        
-        if old_position == 72 and total_roll >= 6:
-            # Team war bereits auf Zielfeld und hat 6+ gewürfelt - hat gewonnen!
-            victory_triggered = True
-            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position 72 und würfelte {total_roll} (>= 6) - SIEG!")
-        elif old_position == 72 and total_roll < 6:
-            # Team war auf Zielfeld, hat aber weniger als 6 gewürfelt
-            current_app.logger.info(f"🎯 FINAL FIELD: Team {team.name} war auf Position 72, würfelte {total_roll} - braucht mindestens 6 zum Gewinnen")
-        elif new_position == 72:
-            # Team ist gerade erst auf Position 72 angekommen - muss nächste Runde 6+ würfeln
-            current_app.logger.info(f"🎯 REACHED FINAL FIELD: Team {team.name} erreichte Position 72 - muss nächste Runde mindestens 6 würfeln")
-            
-        current_app.logger.info(f"🔍 ADMIN DICE DEBUG: victory_triggered = {victory_triggered}")
-
-        # Event für den Würfelwurf erstellen
-        event_description = f"Admin würfelte für Team {team.name}: {standard_dice_roll}"
-        if bonus_dice_roll > 0:
-            event_description += f" (Bonus: {bonus_dice_roll}, Gesamt: {total_roll})"
-        
-        if team.is_blocked and (not barrier_check_result or not barrier_check_result.get('released', False)):
-            event_description += f" - BLOCKIERT: Konnte sich nicht befreien."
-        else:
-            event_description += f" und bewegte sich von Feld {old_position} zu Feld {new_position}."
-            
-        if victory_triggered:
-            event_description += f" 🏆 SIEG! Team war auf Zielfeld und würfelte {total_roll}!"
-        elif old_position == 72 and total_roll < 6:
-            event_description += f" 🎯 War auf Zielfeld - braucht mindestens 6 zum Gewinnen (gewürfelt: {total_roll})"
-        elif new_position == 72:
-            event_description += f" 🎯 Erreichte Zielfeld - braucht nächste Runde mindestens 6 zum Gewinnen"
-        
-        dice_event = GameEvent(
-            game_session_id=active_session.id,
-            event_type="admin_dice_roll",
-            description=event_description,
-            related_team_id=team.id,
-            data_json=json.dumps({
-                "standard_roll": standard_dice_roll,
-                "bonus_roll": bonus_dice_roll,
-                "total_roll": total_roll,
-                "old_position": old_position,
-                "new_position": new_position,
-                "rolled_by": "admin",
-                "was_blocked": team.is_blocked if barrier_check_result else False,
-                "barrier_released": barrier_check_result.get('released', False) if barrier_check_result else False,
-                "victory_triggered": victory_triggered,
-                "needs_final_roll": old_position == 72 and total_roll < 6
-            })
-        )
-        db.session.add(dice_event)
-
-        # Nächstes Team ermitteln
-        dice_order_ids_str = active_session.dice_roll_order
-        if not dice_order_ids_str: 
-            db.session.rollback()
-            current_app.logger.error("Würfelreihenfolge ist leer in der aktiven Session.")
-            return jsonify({"success": False, "error": "Fehler: Würfelreihenfolge nicht gesetzt."}), 500
-
-        dice_order_ids_int = [int(tid) for tid in dice_order_ids_str.split(',') if tid.isdigit()]
-        
-        current_team_index_in_order = -1
-        if team.id in dice_order_ids_int:
-            current_team_index_in_order = dice_order_ids_int.index(team.id)
-        else:
-            db.session.rollback()
-            current_app.logger.error(f"Team {team.id} nicht in Würfelreihenfolge {dice_order_ids_int} gefunden.")
-            return jsonify({"success": False, "error": "Fehler in der Würfelreihenfolge (Team nicht gefunden)."}), 500
-
-        next_team_name = None 
-        if current_team_index_in_order < len(dice_order_ids_int) - 1:
-            active_session.current_team_turn_id = dice_order_ids_int[current_team_index_in_order + 1]
-            next_team = Team.query.get(active_session.current_team_turn_id)
-            next_team_name = next_team.name if next_team else "Unbekannt"
-        else:
-            # Prüfe ob ein Feld-Minigame gestartet wurde (Phase geändert von special_field_action)
-            if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
-                # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Letztes Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame")
-                active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
-            else:
-                # Kein Feld-Minigame - normale Rundenvervollständigung
-                active_session.current_phase = 'ROUND_OVER'
-                active_session.current_team_turn_id = None 
-                
-                # WICHTIG: Erstelle Event für Rundenende nur wenn Runde wirklich beendet
-                round_end_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="dice_round_ended",
-                    description="Würfelrunde beendet (Admin) - alle Teams haben gewürfelt"
-                )
-                db.session.add(round_end_event)
-                
-                # VERBESSERT: Nur Bonus-Würfel zurücksetzen, Platzierungen beibehalten für Statistiken
-                all_teams_in_db = Team.query.all()
-                for t_obj in all_teams_in_db:
-                    current_app.logger.info(f"Runde beendet - Bonus-Würfel für Team {t_obj.name} zurückgesetzt (war: {t_obj.bonus_dice_sides})")
-                    t_obj.bonus_dice_sides = 0
-                    # Platzierungen NICHT zurücksetzen - die bleiben für Statistiken
-                
-                round_over_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="dice_round_finished",
-                    description="Admin beendete die Würfelrunde. Alle Teams haben gewürfelt."
-                )
-                db.session.add(round_over_event)
-
-        # ZIELFELD: Victory automatisch auslösen wenn gewonnen
-        if victory_triggered:
-            try:
-                # Speichere Victory Event
-                victory_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="game_victory",
-                    description=f"Team {team.name} hat das Spiel gewonnen!",
-                    related_team_id=team.id,
-                    data_json=json.dumps({
-                        "winning_team_id": team.id,
-                        "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
-                        "final_position": team.current_position,
-                        "final_dice_roll": total_roll
-                    })
-                )
-                db.session.add(victory_event)
-                
-                # Setze Spiel auf beendet
-                active_session.current_phase = 'GAME_FINISHED'
-                
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
-                
-            except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
-                db.session.rollback()
-                return jsonify({"success": False, "error": f"Victory-Fehler: {str(ve)}"}), 500
+        # Zug prüfen → würfeln → Feld → Zug weitergeben → Events, ein Commit
+        from app.services.roll_pipeline import RollRejected, execute_roll
+        try:
+            outcome = execute_roll('admin')
+        except RollRejected as rejected:
+            return jsonify({"success": False, "error": rejected.message}), rejected.status
 
-        db.session.commit()
+        team = outcome["team"]
+        next_team = outcome["next_team"]
+        active_session = outcome["session"]
+        roll_result = outcome["roll"]
+        barrier_check_result = roll_result["barrier_check_result"]
+        special_field_result = roll_result["special_field_result"]
 
         # Response zusammenstellen
         response_data = {
             "success": True,
             "team_id": team.id,
             "team_name": team.name,
-            "standard_roll": standard_dice_roll,
-            "bonus_roll": bonus_dice_roll,
-            "total_roll": total_roll,
-            "old_position": old_position,
+            "standard_roll": roll_result["standard_roll"],
+            "bonus_roll": roll_result["bonus_roll"],
+            "total_roll": roll_result["total_roll"],
+            "old_position": roll_result["old_position"],
             "new_position": team.current_position,  # Aktuelle finale Position (nach Special Field)
             "next_team_id": active_session.current_team_turn_id,
-            "next_team_name": next_team_name, 
+            "next_team_name": next_team.name if next_team else None,
             "new_phase": active_session.current_phase,
-            "victory_triggered": victory_triggered,
-            "needs_final_roll": old_position == 72 and total_roll < 6
+            "victory_triggered": roll_result["victory_triggered"],
+            "needs_final_roll": roll_result["needs_final_roll"]
         }
 
         # SONDERFELD: Füge Sonderfeld-Informationen hinzu
@@ -1385,6 +1185,66 @@ def admin_roll_dice():
         current_app.logger.error(f"Schwerer Fehler in admin_roll_dice: {e}", exc_info=True)
         return jsonify({"success": False, "error": "Ein interner Serverfehler beim Würfeln ist aufgetreten.", "details": str(e)}), 500
 
+@admin_bp.route('/admin_roll_round', methods=['POST'])
+@login_required
+def admin_roll_round():
+    """Würfelt für alle restlichen Teams der Runde in einem Request (eine Transaktion)."""
+    if not isinstance(current_user, Admin):
+        return jsonify({"success": False, "error": "Nur Admins können würfeln."}), 403
+
+    data = request.get_json(silent=True) or {}
+    pace_ms = data.get('pace_ms')
+    try:
+        pace_ms = int(pace_ms) if pace_ms is not None else None
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "error": "pace_ms muss eine Zahl sein."}), 400
+
+    try:
+        from app.services.roll_pipeline import RollRejected, execute_round_roll
+        try:
+            outcome = execute_round_roll('admin', pace_ms=pace_ms)
+        except RollRejected as rejected:
+            return jsonify({"success": False, "error": rejected.message}), rejected.status
+
+        active_session = outcome["session"]
+        next_team = outcome["next_team"]
+        rolls = []
+        for entry in outcome["rolls"]:
+            team, roll_result = entry["team"], entry["roll"]
+            roll_data = {
+                "team_id": team.id,
+                "team_name": team.name,
+                "standard_roll": roll_result["standard_roll"],
+                "bonus_roll": roll_result["bonus_roll"],
+                "total_roll": roll_result["total_roll"],
+                "old_position": roll_result["old_position"],
+                "new_position": roll_result["final_position"],  # nach Sonderfeld, vor späteren Würfen
+                "victory_triggered": roll_result["victory_triggered"],
+                "needs_final_roll": roll_result["needs_final_roll"],
+                "pacing": entry["pacing"],
+            }
+            if roll_result["barrier_check_result"]:
+                roll_data["barrier_check"] = roll_result["barrier_check_result"]
+            special_field_result = roll_result["special_field_result"]
+            if special_field_result and special_field_result.get("success"):
+                roll_data["special_field"] = special_field_result
+            rolls.append(roll_data)
+
+        return jsonify({
+            "success": True,
+            "batch_id": outcome["batch_id"],
+            "rolls": rolls,
+            "stopped": outcome["stopped"],
+            "next_team_id": active_session.current_team_turn_id,
+            "next_team_name": next_team.name if next_team else None,
+            "new_phase": active_session.current_phase,
+        })
+
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Schwerer Fehler in admin_roll_round: {e}", exc_info=True)
+        return jsonify({"success": False, "error": "Ein interner Serverfehler beim Würfeln ist aufgetreten.", "details": str(e)}), 500
+
 @admin_bp.route('/abort-minigame', methods=['POST'])
 @login_required
 def abort_current_minigame():
@@ -1524,7 +1384,7 @@ def set_minigame():
                     # BUGFIX: Commit session changes before expire_all() to prevent data loss
                     db.session.commit()
                     db.session.expire_all()
-                    teams = Team.query.all()
+                    teams = Team.in_game().all()
                     selected_players = active_session.select_random_players(teams, player_count)
                     
                     # Flash-Nachricht mit ausgewählten Spielern
@@ -1612,7 +1472,8 @@ def set_minigame():
                 played_ids = active_session.get_played_content_ids()
                 random_content = get_random_content_from_folder(
                     active_round.minigame_folder.folder_path, 
-                    played_ids
+                    played_ids,
+                    rng=get_session_rng(active_session)
                 )
                 
                 if random_content:
@@ -1662,7 +1523,7 @@ def set_minigame():
                             # BUGFIX: Commit session changes before expire_all() to prevent data loss
                             db.session.commit()
                             db.session.expire_all()
-                            teams = Team.query.all()
+                            teams = Team.in_game().all()
                             selected_players = active_session.select_random_players(teams, player_count)
                             selection_type = "Ganze Teams" if player_count == "all" else f"{player_count} Spieler pro Team"
                             config_source = " (aus Minigame-Konfiguration)" if minigame_player_count else " (aus Formular)"
@@ -1726,7 +1587,7 @@ def set_minigame():
                             # BUGFIX: Commit session changes before expire_all() to prevent data loss
                             db.session.commit()
                             db.session.expire_all()
-                            teams = Team.query.all()
+                            teams = Team.in_game().all()
                             selected_players = active_session.select_random_players(teams, player_count)
                             selection_type = "Ganze Teams" if player_count == "all" else f"{player_count} Spieler pro Team"
                             config_source = " (aus Minigame-Konfiguration)" if minigame_player_count else " (aus Formular)"
@@ -1823,7 +1684,7 @@ def set_minigame():
                 active_session.current_phase = 'MINIGAME_ANNOUNCED'
             
             # VERBESSERT: Nur Platzierungen zurücksetzen, nicht Bonus-Würfel (die werden erst beim Würfeln zurückgesetzt)
-            teams_to_reset = Team.query.all()
+            teams_to_reset = Team.in_game().all()
             for t in teams_to_reset:
                 t.minigame_placement = None
                 # t.bonus_dice_sides NICHT hier zurücksetzen - das passiert erst nach dem Würfeln
@@ -1879,11 +1740,9 @@ def end_question():
         db.session.add(new_round_event)
         
         # Erstelle Würfelreihenfolge basierend auf Platzierungen
-        teams_by_placement = Team.query.filter(Team.minigame_placement.isnot(None)).order_by(Team.minigame_placement).all()
+        teams_by_placement = Team.in_game().filter(Team.minigame_placement.isnot(None)).order_by(Team.minigame_placement).all()
         if teams_by_placement:
-            dice_order_ids = [str(team.id) for team in teams_by_placement]
-            active_session.dice_roll_order = ",".join(dice_order_ids)
-            active_session.current_team_turn_id = teams_by_placement[0].id
+            active_session.set_turn_order([team.id for team in teams_by_placement])
         
         # Reset Fragen-Daten
         active_session.current_question_id = None
@@ -1962,7 +1821,7 @@ def question_responses_api():
             "success": True,
             "responses": formatted_responses,
             "total_responses": len(formatted_responses),
-            "total_teams": Team.query.count(),
+            "total_teams": Team.in_game().count(),
             "question_name": active_session.current_minigame_name
         })
         
@@ -1985,7 +1844,7 @@ def record_placements():
         flash('Platzierungen können nur nach Ankündigung eines Minispiels eingegeben werden.', 'warning')
         return redirect(url_for('admin.admin_dashboard'))
 
-    teams = Team.query.all()
+    teams = Team.in_game().all()
     if not teams:
         flash('Keine Teams vorhanden, um Platzierungen einzutragen.', 'warning')
         return redirect(url_for('admin.admin_dashboard'))
@@ -2012,11 +1871,9 @@ def record_placements():
 
     sorted_teams_by_placement = sorted(teams, key=lambda t: placements[t.id])
     
-    dice_roll_order_ids = []
     for team_obj in sorted_teams_by_placement:
         placement = placements[team_obj.id]
         team_obj.minigame_placement = placement
-        dice_roll_order_ids.append(str(team_obj.id))
 
         # VERBESSERT: Bonus-Würfel Logik mit Logging
         bonus_config = current_app.config.get('PLACEMENT_BONUS_DICE', {1: 6, 2: 4, 3: 2})
@@ -2025,8 +1882,7 @@ def record_placements():
         
         current_app.logger.info(f"Manuelle Platzierung - Team {team_obj.name} (Platz {placement}) erhält Bonus-Würfel: 1-{bonus_dice}")
         
-    active_session.dice_roll_order = ",".join(dice_roll_order_ids)
-    active_session.current_team_turn_id = int(dice_roll_order_ids[0]) if dice_roll_order_ids else None
+    active_session.set_turn_order([team_obj.id for team_obj in sorted_teams_by_placement])
     active_session.current_phase = 'DICE_ROLLING'
     
     # WICHTIG: Markiere den Beginn einer neuen Würfelrunde
@@ -2066,11 +1922,9 @@ def reset_game_state_confirmed():
     if form.validate_on_submit():
         if admin_user and admin_user.check_password(form.password.data):
             try:
-                GameEvent.query.delete() 
-                QuestionResponse.query.delete()
-                GameSession.query.delete() 
+                delete_game_sessions()
 
-                teams = Team.query.all()
+                teams = Team.in_game().all()
                 for team in teams:
                     team.minigame_placement = None
                     team.bonus_dice_sides = 0
@@ -2174,7 +2028,7 @@ def manage_fields():
     
     try:
         # Lade alle Feld-Konfigurationen
-        field_configs = FieldConfiguration.query.order_by(FieldConfiguration.field_type).all()
+        field_configs = FieldConfiguration.in_game().order_by(FieldConfiguration.field_type).all()
         
         # Aktive Runde für Kontext
         active_round = GameRound.get_active_round()
@@ -2186,7 +2040,7 @@ def manage_fields():
         color_mapping = get_field_type_color_mapping()
         
         # Feld-Verteilungs-Vorschau
-        preview_data = get_field_preview_data(73)
+        preview_data = get_field_preview_data()
         
         # Nutzungsstatistiken
         usage_stats = get_field_usage_statistics()
@@ -2218,6 +2072,9 @@ def edit_field(field_type):
         return redirect(url_for('main.index'))
     
     try:
+        # Änderungen betreffen nur die Feld-Konfiguration des aktuellen Spiels
+        FieldConfiguration.ensure_game_configs()
+        
         # Lade existierende Konfiguration oder erstelle neue
         config = FieldConfiguration.get_config_for_field(field_type)
         
@@ -2307,6 +2164,7 @@ def toggle_field(field_type):
         
         # Feld-Konfiguration laden oder erstellen
         current_app.logger.info(f"Looking for config for field: {field_type}")
+        FieldConfiguration.ensure_game_configs()
         config = FieldConfiguration.get_config_for_field(field_type)
         
         if not config:
@@ -2381,7 +2239,7 @@ def field_preview():
     
     try:
         form = FieldPreviewForm()
-        max_fields = int(request.args.get('max_fields', 73))
+        max_fields = request.args.get('max_fields', get_board_size(), type=int)
         
         # Generiere Vorschau-Daten
         preview_data = get_field_preview_data(max_fields)
@@ -2425,10 +2283,11 @@ def field_preview():
         return redirect(url_for('admin.manage_fields'))
 
 @admin_bp.route('/api/field_data')
+@cached_response(FIELD_CONFIG)
 def api_field_data():
     """Öffentliche API für Feld-Daten (für Game-Board)"""
     try:
-        max_fields = int(request.args.get('max_fields', 73))
+        max_fields = request.args.get('max_fields', get_board_size(), type=int)
         
         # Generiere Vorschau-Daten
         from .field_config import get_field_preview_data
@@ -2449,6 +2308,33 @@ def api_field_data():
         current_app.logger.error(f"Fehler bei der öffentlichen Feld-API: {e}", exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
+@admin_bp.route('/api/field_balance')
+@login_required
+def api_field_balance():
+    """Markov-Analyse der Feld-Verteilung: erwartete Restzüge je Feld (für field_preview)"""
+    if not isinstance(current_user, Admin):
+        return jsonify({"success": False, "error": "Zugriff verweigert"}), 403
+
+    try:
+        from app.game_logic.markov import analyze_board
+        from app.services.dice_service import get_engine_rules
+
+        bonus_sides = max(0, min(int(request.args.get('bonus', 0)), 20))
+        placement_bonus = current_app.config.get('PLACEMENT_BONUS_DICE', {1: 6, 2: 4, 3: 2})
+        analysis = analyze_board(get_engine_rules(), bonus_sides, list(placement_bonus.values()))
+
+        return jsonify({
+            "success": True,
+            "analysis": analysis,
+            "placement_bonus": placement_bonus
+        })
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        current_app.logger.error(f"Fehler bei der Feld-Balance-Analyse: {e}", exc_info=True)
+        return jsonify({"success": False, "error": str(e)}), 500
+
 @admin_bp.route('/import_export_fields', methods=['GET', 'POST'])
 @login_required
 def import_export_fields():
@@ -2542,7 +2428,7 @@ def import_export_fields():
     return render_template('admin/import_export_fields.html',
                          form=form,
                          export_preview=export_preview,
-                         total_configs=FieldConfiguration.query.count())
+                         total_configs=FieldConfiguration.in_game().count())
 
 @admin_bp.route('/bulk_edit_fields', methods=['GET', 'POST'])
 @login_required
@@ -2558,7 +2444,8 @@ def bulk_edit_fields():
         try:
             # Frontend sendet Feld-Typen (Strings), nicht IDs
             selected_field_types = form.selected_fields.data
-            selected_configs = FieldConfiguration.query.filter(FieldConfiguration.field_type.in_(selected_field_types)).all()
+            FieldConfiguration.ensure_game_configs()
+            selected_configs = FieldConfiguration.in_game().filter(FieldConfiguration.field_type.in_(selected_field_types)).all()
             
             if not selected_configs:
                 flash('Keine Felder für Bearbeitung ausgewählt.', 'warning')
@@ -2640,6 +2527,7 @@ def bulk_edit_fields():
     return render_template('admin/bulk_edit_fields.html', form=form)
 
 @admin_bp.route('/api/field_colors')
+@cached_response(FIELD_CONFIG)
 def api_field_colors():
     """API-Endpunkt für Feld-Farb-Mapping (für Frontend-Integration) - Öffentlich zugänglich"""
     
@@ -2730,7 +2618,8 @@ def create_team():
                         
                         # Kopiere Profilbild ins Team falls vorhanden
                         if player_registration.profile_image_path:
-                            team.set_profile_image(member_name, player_registration.profile_image_path)
+                            team.set_profile_image(member_name, player_registration.profile_image_path,
+                                                   player_registration.get_profile_image_variants())
             
             # Setze welcome_password für die Klartext-Anzeige
             team.welcome_password = form.password.data
@@ -2843,7 +2732,7 @@ def edit_team(team_id):
             form.character_id.data = team.character_id
 
     # Alle Teams für Dropdown in Spieler-Zuordnung laden
-    all_teams = Team.query.order_by(Team.name).all()
+    all_teams = Team.in_game().order_by(Team.name).all()
     return render_template('edit_team.html', title='Team bearbeiten', form=form, team=team, all_teams=all_teams)
 
 @admin_bp.route('/add_player', methods=['GET', 'POST'])
@@ -2952,20 +2841,22 @@ def delete_team(team_id):
             char.is_selected = False
             db.session.add(char)
 
-    GameSession.query.filter_by(current_team_turn_id=team.id).update({"current_team_turn_id": None})
     GameEvent.query.filter_by(related_team_id=team.id).update({"related_team_id": None})
     QuestionResponse.query.filter_by(team_id=team.id).delete()
+    PlayerRotation.query.filter_by(team_id=team.id).delete()
     
     active_sessions = GameSession.query.filter(GameSession.dice_roll_order.like(f"%{str(team.id)}%")).all()
     for sess in active_sessions:
-        order_list = sess.dice_roll_order.split(',')
-        team_id_str = str(team.id)
-        if team_id_str in order_list:
-            order_list.remove(team_id_str)
-            sess.dice_roll_order = ",".join(order_list)
-            if not order_list and sess.current_phase == 'DICE_ROLLING': 
+        turn_order = sess.turn_order
+        if team.id in turn_order:
+            # Team am Zug wird gelöscht: sein Nachfolger rückt auf
+            turn_order = turn_order.without(team.id)
+            sess.dice_roll_order = turn_order.serialize()
+            sess.turn_index = turn_order.index
+            sess.current_team_turn_id = turn_order.current
+            if not turn_order and sess.current_phase == 'DICE_ROLLING': 
                 sess.current_phase = 'ROUND_OVER' 
-                sess.current_team_turn_id = None
+    GameSession.query.filter_by(current_team_turn_id=team.id).update({"current_team_turn_id": None})
 
     db.session.delete(team)
     db.session.commit()
@@ -3013,7 +2904,7 @@ def _update_team_members_from_registrations():
     """Aktualisiert die Team-Member-Listen basierend auf PlayerRegistration-Zuweisungen"""
     try:
         # Alle Teams holen
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         
         # Für jedes Team die Members-Liste aktualisieren
         for team in teams:
@@ -3130,7 +3021,7 @@ def add_player_to_team():
         if not welcome_session and not active_game_session:
             # Erstelle neue WelcomeSession nur falls keine aktiv ist UND kein Spiel läuft
             # Erst alle anderen deaktivieren
-            WelcomeSession.query.update({'is_active': False})
+            WelcomeSession.in_game().update({'is_active': False})
             # Dann neue Session erstellen
             welcome_session = WelcomeSession(is_active=True)
             db.session.add(welcome_session)
@@ -3437,14 +3328,7 @@ def delete_player():
         
         # Profilbild löschen falls vorhanden
         if player.profile_image_path:
-            import os
-            image_path = os.path.join(current_app.root_path, 'static', player.profile_image_path.lstrip('/static/'))
-            if os.path.exists(image_path):
-                try:
-                    os.remove(image_path)
-                    current_app.logger.info(f"Profilbild gelöscht: {image_path}")
-                except Exception as e:
-                    current_app.logger.warning(f"Fehler beim Löschen des Profilbildes: {e}")
+            remove_legacy_image(player.profile_image_path)
         
         # Spieler aus Datenbank löschen
         db.session.delete(player)
@@ -3468,12 +3352,6 @@ def upload_team_player_image():
         return jsonify({'success': False, 'error': 'Nicht autorisiert'})
     
     try:
-        import base64
-        import binascii
-        import os
-        from PIL import Image
-        import io
-        
         data = request.get_json()
         if not data:
             return jsonify({'success': False, 'error': 'Keine Daten erhalten'})
@@ -3502,62 +3380,29 @@ def upload_team_player_image():
         if not player:
             return jsonify({'success': False, 'error': 'Spieler nicht gefunden'})
         
-        # Entferne data:image/...;base64, prefix falls vorhanden
-        if 'base64,' in image_data:
-            image_data = image_data.split('base64,')[1]
-        elif image_data.startswith('data:'):
-            parts = image_data.split(',', 1)
-            if len(parts) > 1:
-                image_data = parts[1]
-        
-        # Dekodiere Base64
+        # Dekodieren und Größenvarianten speichern im Worker-Pool (48/96/150px, inhalts-gehasht)
         try:
-            image_bytes = base64.b64decode(image_data)
-        except (binascii.Error, ValueError) as e:
-            current_app.logger.error(f"Base64 decode error: {e}")
-            return jsonify({'success': False, 'error': 'Ungültige Bilddaten'})
-        
-        # Erstelle PIL Image
-        try:
-            image = Image.open(io.BytesIO(image_bytes))
-            image = image.convert('RGB')  # Konvertiere zu RGB falls nötig
-        except Exception as e:
+            result = run_image_job(process_base64_image, (image_data,))
+        except (ValueError, ImageQueueFullError) as e:
             current_app.logger.error(f"Image processing error: {e}")
-            return jsonify({'success': False, 'error': 'Bild konnte nicht verarbeitet werden'})
-        
-        # Resize auf 150x150
-        image = image.resize((150, 150), Image.Resampling.LANCZOS)
-        
-        # Stelle sicher, dass das profile_images Verzeichnis existiert
-        profile_dir = os.path.join(current_app.static_folder, 'profile_images')
-        if not os.path.exists(profile_dir):
-            os.makedirs(profile_dir, exist_ok=True)
-        
-        # Erstelle Dateinamen
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{team_id}_{player_name}_{timestamp}.jpg"
-        filepath = os.path.join(profile_dir, filename)
-        
-        # Speichere Bild
-        try:
-            image.save(filepath, 'JPEG', quality=85, optimize=True)
-            current_app.logger.info(f"Profile image saved: {filepath}")
-        except Exception as e:
-            current_app.logger.error(f"Error saving image: {e}")
-            return jsonify({'success': False, 'error': 'Bild konnte nicht gespeichert werden'})
+            return jsonify({'success': False, 'error': str(e)})
+        image_path, variants = result['image_path'], result['image_variants']
+        current_app.logger.info(f"Profile image saved: {image_path}")
         
         # Aktualisiere PlayerRegistration
-        player.profile_image_path = f"profile_images/{filename}"
+        remove_legacy_image(player.profile_image_path)
+        player.set_profile_image(image_path, variants)
         
         # Aktualisiere auch Team profile_images
-        team.set_profile_image(player_name, f"profile_images/{filename}")
+        team.set_profile_image(player_name, image_path, variants)
         
         db.session.commit()
         
         return jsonify({
             'success': True,
             'message': 'Profilbild erfolgreich hochgeladen',
-            'image_path': f"profile_images/{filename}"
+            'image_path': image_path,
+            'image_variants': variants
         })
     
     except Exception as e:
@@ -3605,11 +3450,9 @@ def update_player_emoji():
             
             # CLEANUP: Entferne vorhandenes Profilbild falls vorhanden (Wechsel von Bild zu Emoji)
             if player.profile_image_path:
-                old_file_path = os.path.join(current_app.static_folder, player.profile_image_path)
-                if os.path.exists(old_file_path):
-                    os.remove(old_file_path)
-                    current_app.logger.info(f"Removed old profile image: {old_file_path}")
-                player.profile_image_path = None
+                remove_legacy_image(player.profile_image_path)
+                current_app.logger.info(f"Removed old profile image: {player.profile_image_path}")
+                player.set_profile_image(None)
             
             # Emoji in player_config speichern
             player_config = team.get_player_config()
@@ -3629,15 +3472,11 @@ def update_player_emoji():
                 return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
             
             # CLEANUP: Entferne vorhandenes Profilbild falls vorhanden (Wechsel von Bild zu Emoji)
-            profile_images = team.get_profile_images() or {}
-            if player_name in profile_images:
-                old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
-                if os.path.exists(old_file_path):
-                    os.remove(old_file_path)
-                    current_app.logger.info(f"Removed old profile image: {old_file_path}")
-                
-                del profile_images[player_name]
-                team.profile_images = json.dumps(profile_images)
+            old_image_path = team.get_profile_image(player_name)
+            if old_image_path:
+                remove_legacy_image(old_image_path)
+                current_app.logger.info(f"Removed old profile image: {old_image_path}")
+                team.remove_profile_image(player_name)
             
             # Emoji in player_config speichern
             player_config = team.get_player_config()
@@ -3669,12 +3508,6 @@ def update_player_image():
         return jsonify({'success': False, 'error': 'Nicht autorisiert'})
     
     try:
-        import base64
-        import binascii
-        import os
-        from PIL import Image
-        import io
-        
         data = request.get_json()
         if not data:
             return jsonify({'success': False, 'error': 'Keine Daten erhalten'})
@@ -3706,10 +3539,8 @@ def update_player_image():
                 
                 # Entferne Profilbild-Datei falls vorhanden
                 if player.profile_image_path:
-                    old_file_path = os.path.join(current_app.static_folder, player.profile_image_path)
-                    if os.path.exists(old_file_path):
-                        os.remove(old_file_path)
-                    player.profile_image_path = None
+                    remove_legacy_image(player.profile_image_path)
+                    player.set_profile_image(None)
             
             else:  # member
                 # Prüfe ob Spieler in team.members existiert
@@ -3720,15 +3551,11 @@ def update_player_image():
                     return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
                 
                 # Team-Mitglied Profilbild entfernen
-                profile_images = team.get_profile_images() or {}
-                if player_name in profile_images:
-                    # Entferne Datei falls vorhanden
-                    old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
-                    if os.path.exists(old_file_path):
-                        os.remove(old_file_path)
-                    
-                    del profile_images[player_name]
-                    team.profile_images = json.dumps(profile_images)
+                old_image_path = team.get_profile_image(player_name)
+                if old_image_path:
+                    # Entferne alte Einzeldatei falls vorhanden
+                    remove_legacy_image(old_image_path)
+                    team.remove_profile_image(player_name)
             
             db.session.commit()
             return jsonify({
@@ -3741,49 +3568,12 @@ def update_player_image():
             if not image_data:
                 return jsonify({'success': False, 'error': 'Bilddaten fehlen'})
             
-            # Entferne data:image/...;base64, prefix falls vorhanden
-            if 'base64,' in image_data:
-                image_data = image_data.split('base64,')[1]
-            elif image_data.startswith('data:'):
-                parts = image_data.split(',', 1)
-                if len(parts) > 1:
-                    image_data = parts[1]
-            
-            # Dekodiere Base64
-            try:
-                image_binary = base64.b64decode(image_data)
-            except (binascii.Error, ValueError) as e:
-                return jsonify({'success': False, 'error': 'Ungültige Base64-Daten'})
-            
             # Validiere und verarbeite Bild
             try:
-                img = Image.open(io.BytesIO(image_binary))
-                
-                # Konvertiere zu RGB falls nötig
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize auf 150x150 und schneide zu Kreis
-                img = img.resize((150, 150), Image.Resampling.LANCZOS)
-                
-                # Erstelle Upload-Verzeichnis
-                upload_dir = os.path.join(current_app.static_folder, 'team_images')
-                os.makedirs(upload_dir, exist_ok=True)
-                
-                # Generiere Dateinamen
-                import time
-                filename = f"player_{team_id}_{player_name}_{int(time.time())}.jpg"
-                file_path = os.path.join(upload_dir, filename)
-                relative_path = f"team_images/{filename}"
-                
-                # Speichere Bild
-                img.save(file_path, 'JPEG', quality=85, optimize=True)
+                # Dekodieren und Größenvarianten speichern im Worker-Pool
+                # (48/96/150px, inhalts-gehasht, RGB auf weißem Hintergrund)
+                result = run_image_job(process_base64_image, (image_data,))
+                relative_path, variants = result['image_path'], result['image_variants']
                 
                 # Aktualisiere Datenbankrecord
                 if player_type == 'registration':
@@ -3796,10 +3586,7 @@ def update_player_image():
                         return jsonify({'success': False, 'error': 'Registrierter Spieler nicht gefunden'})
                     
                     # Entferne altes Profilbild
-                    if player.profile_image_path:
-                        old_file_path = os.path.join(current_app.static_folder, player.profile_image_path)
-                        if os.path.exists(old_file_path):
-                            os.remove(old_file_path)
+                    remove_legacy_image(player.profile_image_path)
                     
                     # CLEANUP: Entferne Emoji-Config falls vorhanden (Wechsel von Emoji zu Bild)
                     player_config = team.get_player_config()
@@ -3811,7 +3598,7 @@ def update_player_image():
                         team.set_player_config(player_config)
                         current_app.logger.info(f"Removed emoji config for player: {player_name}")
                     
-                    player.profile_image_path = relative_path
+                    player.set_profile_image(relative_path, variants)
                 
                 else:  # member
                     # Prüfe ob Spieler in team.members existiert
@@ -3821,14 +3608,8 @@ def update_player_image():
                     if player_name not in clean_members:
                         return jsonify({'success': False, 'error': 'Team-Mitglied nicht gefunden'})
                     
-                    # Team-Mitglied Profilbild aktualisieren
-                    profile_images = team.get_profile_images() or {}
-                    
                     # Entferne altes Bild falls vorhanden
-                    if player_name in profile_images:
-                        old_file_path = os.path.join(current_app.static_folder, profile_images[player_name])
-                        if os.path.exists(old_file_path):
-                            os.remove(old_file_path)
+                    remove_legacy_image(team.get_profile_image(player_name))
                     
                     # CLEANUP: Entferne Emoji-Config falls vorhanden (Wechsel von Emoji zu Bild)
                     player_config = team.get_player_config()
@@ -3840,15 +3621,15 @@ def update_player_image():
                         team.set_player_config(player_config)
                         current_app.logger.info(f"Removed emoji config for player: {player_name}")
                     
-                    profile_images[player_name] = relative_path
-                    team.profile_images = json.dumps(profile_images)
+                    team.set_profile_image(player_name, relative_path, variants)
                 
                 db.session.commit()
                 
                 return jsonify({
                     'success': True, 
                     'message': f'Profilbild für {player_name} erfolgreich aktualisiert',
-                    'image_path': relative_path
+                    'image_path': relative_path,
+                    'image_variants': variants
                 })
                 
             except Exception as img_error:
@@ -3871,6 +3652,7 @@ def init_chars():
     
     try:
         initialize_characters() 
+        rebuild_catalog()
         flash("Charaktere initialisiert/überprüft.", "info")
     except Exception as e:
         current_app.logger.error(f"Fehler bei der Charakterinitialisierung: {e}", exc_info=True)
@@ -4255,7 +4037,7 @@ def manage_rounds():
     if not isinstance(current_user, Admin):
         return redirect(url_for('main.index'))
     
-    rounds = GameRound.query.order_by(GameRound.name).all()
+    rounds = GameRound.in_game().order_by(GameRound.name).all()
     active_round = GameRound.get_active_round()
     
     return render_template('manage_rounds.html', rounds=rounds, active_round=active_round)
@@ -4351,7 +4133,7 @@ def delete_round(round_id):
             
             # Falls es die aktive Runde war, aktiviere eine andere
             if was_active:
-                other_round = GameRound.query.first()
+                other_round = GameRound.in_game(round_obj.game_key).first()
                 if other_round:
                     other_round.is_active = True
                     flash(f"Runde '{other_round.name}' wurde automatisch aktiviert.", 'info')
@@ -4509,7 +4291,7 @@ def start_welcome():
             return jsonify({"success": False, "error": "Welcome-System ist bereits aktiv"}), 400
         
         # NEU: Prüfe ob bereits Teams existieren oder ein Spiel aktiv ist
-        existing_teams = Team.query.all()
+        existing_teams = Team.in_game().all()
         active_game_session = get_active_session()
         
         if existing_teams or active_game_session:
@@ -4556,60 +4338,43 @@ def reset_game_complete():
     try:
         current_app.logger.info(f"Complete game reset initiated by admin: {current_user.username}")
         
-        # Sammle Statistiken vor dem Reset für Logging
-        teams_count = Team.query.count()
-        sessions_count = GameSession.query.count()
-        events_count = GameEvent.query.count()
-        registrations_count = PlayerRegistration.query.count()
-        welcome_sessions_count = WelcomeSession.query.count()
-        
-        current_app.logger.info(f"Reset stats - Teams: {teams_count}, Sessions: {sessions_count}, Events: {events_count}, Registrations: {registrations_count}, Welcome Sessions: {welcome_sessions_count}")
-        
-        # 1. Lösche alle PlayerRegistrations
-        PlayerRegistration.query.delete()
+        # Sammle Statistiken vor dem Reset für Logging (nur das aktuelle Spiel)
+        game_key = current_game_key()
+        welcome_session_ids = db.session.query(WelcomeSession.id).filter(WelcomeSession.game_key == game_key)
+        team_character_ids = db.session.query(Team.character_id).filter(Team.game_key == game_key,
+                                                                         Team.character_id.isnot(None))
+        teams_count = Team.in_game().count()
+        sessions_count = GameSession.in_game().count()
+        events_count = GameEvent.query.join(GameSession).filter(GameSession.game_key == game_key).count()
+        registrations_count = PlayerRegistration.query.filter(
+            PlayerRegistration.welcome_session_id.in_(welcome_session_ids)).count()
+        welcome_sessions_count = WelcomeSession.in_game().count()
+        
+        current_app.logger.info(f"Reset stats (game {game_key}) - Teams: {teams_count}, Sessions: {sessions_count}, Events: {events_count}, Registrations: {registrations_count}, Welcome Sessions: {welcome_sessions_count}")
+        
+        # 1. Lösche alle PlayerRegistrations des Spiels
+        PlayerRegistration.query.filter(
+            PlayerRegistration.welcome_session_id.in_(welcome_session_ids)).delete(synchronize_session=False)
         current_app.logger.info("PlayerRegistrations deleted")
         
-        # 2. Lösche alle WelcomeSessions
-        WelcomeSession.query.delete()
+        # 2. Lösche alle WelcomeSessions des Spiels
+        WelcomeSession.in_game().delete()
         current_app.logger.info("WelcomeSessions deleted")
         
-        # 3. Lösche alle GameEvents
-        GameEvent.query.delete()
-        current_app.logger.info("GameEvents deleted")
-        
-        # 4. Lösche alle GameSessions
-        GameSession.query.delete()
-        current_app.logger.info("GameSessions deleted")
+        # 3./4. Lösche GameEvents und GameSessions des Spiels
+        delete_game_sessions(game_key)
+        current_app.logger.info("GameEvents and GameSessions deleted")
         
-        # 5. Setze alle Charaktere auf nicht ausgewählt
-        Character.query.update({'is_selected': False})
+        # 5. Setze die Charaktere der Teams dieses Spiels auf nicht ausgewählt
+        Character.query.filter(Character.id.in_(team_character_ids)).update(
+            {'is_selected': False}, synchronize_session=False)
         current_app.logger.info("Characters reset to not selected")
         
-        # 6. Lösche alle Teams
-        Team.query.delete()
+        # 6. Lösche alle Teams des Spiels
+        Team.in_game().delete()
         current_app.logger.info("Teams deleted")
         
-        # 7. Lösche Profilbilder
-        try:
-            import os
-            import shutil
-            profile_images_dir = os.path.join(current_app.root_path, 'static', 'profile_images')
-            if os.path.exists(profile_images_dir):
-                # Lösche alle Dateien im Ordner, aber behalte den Ordner
-                for filename in os.listdir(profile_images_dir):
-                    file_path = os.path.join(profile_images_dir, filename)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                    except Exception as file_e:
-                        current_app.logger.warning(f"Could not delete profile image file {file_path}: {file_e}")
-                current_app.logger.info("Profile images cleared")
-        except Exception as profile_e:
-            current_app.logger.warning(f"Error clearing profile images: {profile_e}")
-        
-        # 8. Lösche gespielte Content-IDs aus aktiven Runden (Reset für Minigames)
+        # 7. Lösche gespielte Content-IDs aus aktiven Runden (Reset für Minigames)
         try:
             from app.models import GameRound
             active_round = GameRound.get_active_round()
@@ -4621,9 +4386,27 @@ def reset_game_complete():
         except Exception as round_e:
             current_app.logger.warning(f"Error resetting round content: {round_e}")
         
-        # 9. Commit alle Änderungen
+        # 8. Commit alle Änderungen
         db.session.commit()
         
+        # Sammel-Löschungen lösen keine ORM-Events aus: Avatar-Manifest, Board-Schnappschuss
+        # und Gesichter-Atlas des Spiels selbst erneuern
+        invalidate_avatar_manifest()
+        invalidate_board_snapshot(game_key)
+        schedule_prewarm(game_key)
+        
+        # 9. Bildordner (Profil- und Team-Spielerbilder) als Ganzes austauschen -
+        #    nur wenn kein anderes Spiel mehr Teams oder Anmeldungen hat (der Ordner
+        #    ist gemeinsam). Sonst räumt der GC die Bilder dieses Spiels auf; die
+        #    Sammel-Löschungen oben lösen seine Commit-Hooks nicht aus.
+        try:
+            if not Team.query.first() and not PlayerRegistration.query.first():
+                reset_image_store()
+            else:
+                schedule_gc()
+        except Exception as image_e:
+            current_app.logger.warning(f"Error clearing profile images: {image_e}")
+        
         # 10. NEU: Automatisch Welcome-System starten nach Reset
         try:
             new_welcome_session = WelcomeSession(is_active=True)
@@ -4661,7 +4444,7 @@ def create_teams():
         return jsonify({"success": False, "error": "Nur Admins können Teams erstellen"}), 403
     
     try:
-        import random
+        import secrets
         import string
         
         data = request.get_json()
@@ -4687,24 +4470,25 @@ def create_teams():
         players_list = list(players)
         current_app.logger.info(f"Spieler vor Mischen: {[p.player_name for p in players_list]}")
         
-        # Mehrfaches Mischen für bessere Zufälligkeit
-        import time
-        random.seed(int(time.time() * 1000000) % 1000000)  # Microsekunden-basierter Seed
-        for _ in range(3):
-            random.shuffle(players_list)
+        # Eigene Zufallsquelle aus dem Betriebssystem - der globale RNG wird nicht neu geseedet
+        secrets.SystemRandom().shuffle(players_list)
         
         current_app.logger.info(f"Spieler nach Mischen: {[p.player_name for p in players_list]}")
         
         # Erstelle Teams mit zufälligen 6-stelligen Passwörtern
         created_teams = []
         
+        # Team-Namen sind instanzweit eindeutig (Login) - in weiteren Spielen mit Spiel-Suffix
+        game_key = current_game_key()
+        name_suffix = "" if game_key == default_game_key() else f" ({game_key})"
+        
         for i in range(team_count):
             # Generiere 6-stelliges Passwort
-            password = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+            password = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(6))
             
             # Erstelle Team
             team = Team(
-                name=f"Team {i+1}",
+                name=f"Team {i+1}{name_suffix}",
                 members="",  # Wird später mit Spielernamen gefüllt
                 welcome_password=password  # Speichere Klartext-Passwort für Welcome-System
             )
@@ -4730,7 +4514,8 @@ def create_teams():
             
             # Kopiere Profilbild ins Team falls vorhanden
             if player.profile_image_path:
-                selected_team["team"].set_profile_image(player.player_name, player.profile_image_path)
+                selected_team["team"].set_profile_image(player.player_name, player.profile_image_path,
+                                                        player.get_profile_image_variants())
         
         # Aktualisiere Team-Members String
         for team_data in created_teams:
@@ -4877,7 +4662,7 @@ def player_rotation_stats():
         rotation_stats = active_session.get_player_statistics()
         
         # Hole Team-Informationen
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         team_lookup = {str(team.id): team for team in teams}
         
         # Format für Template
@@ -5532,11 +5317,10 @@ def start_field_minigame():
             # Wähle zufälliges anderes Team als Gegner
             from app.models import Team
             landing_team_id = active_session.field_minigame_landing_team_id
-            other_teams = Team.query.filter(Team.id != landing_team_id).all()
+            other_teams = Team.in_game().filter(Team.id != landing_team_id).all()
             
             if other_teams:
-                import random
-                opponent_team = random.choice(other_teams)
+                opponent_team = get_session_rng(active_session).choice(other_teams)
                 active_session.field_minigame_opponent_team_id = opponent_team.id
             else:
                 # Fallback zu team_vs_all wenn nur ein Team vorhanden
@@ -5608,7 +5392,7 @@ def submit_field_minigame_result():
         if result['success']:
             # Setze Session zurück zur Würfelphase falls Runde noch nicht fertig
             # Prüfe ob noch Teams in der Würfelreihenfolge dran sind
-            if active_session.dice_roll_order and active_session.current_team_turn_id:
+            if active_session.turn_order.current is not None:
                 # Es ist noch ein Team dran - zurück zur Würfelphase
                 active_session.current_phase = 'DICE_ROLLING'  # Würfelrunde fortsetzen
             else:
@@ -5650,12 +5434,7 @@ def debug_field_distribution():
         return redirect(url_for('main.index'))
     
     try:
-        from app.game_logic.special_fields import (
-            force_field_cache_refresh, 
-            get_field_type_at_position,
-            calculate_smart_field_distribution,
-            clear_field_distribution_cache
-        )
+        from app.game_logic.special_fields import force_field_cache_refresh, calculate_smart_field_distribution
         from app.models import FieldConfiguration
         
         # Erzwinge Cache-Refresh
@@ -5672,7 +5451,7 @@ def debug_field_distribution():
             current_app.logger.info(f"Position {pos}: {field_type}")
         
         # Hole Minigame-Konfiguration
-        minigame_config = FieldConfiguration.query.filter_by(field_type='minigame').first()
+        minigame_config = FieldConfiguration.get_config_for_field('minigame')
         config_info = {}
         if minigame_config:
             config_info = {
@@ -5683,7 +5462,7 @@ def debug_field_distribution():
             }
         
         # Berechne komplette Verteilung
-        full_distribution = calculate_smart_field_distribution(73)
+        full_distribution = calculate_smart_field_distribution()
         all_minigame_positions = [pos for pos, field_type in full_distribution.items() if field_type == 'minigame']
         
         return jsonify({
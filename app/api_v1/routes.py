@@ -6,6 +6,10 @@ import json
 from . import api_v1_bp
 from app.models import Team, GameSession, GameEvent
 from app.services.session_service import get_active_session, get_active_session_events
+from app.services.response_cache import cached_response, FIELD_CONFIG
+from app.services.board_bootstrap import get_bootstrap
+from app.services.game_scope import current_game_key
+from app.services.sparse_fields import FieldSelection
 
 
 def _sse_format(data, *, event=None, event_id=None, retry=None):
@@ -47,7 +51,11 @@ def stream_events_v1():
     """
     Server-Sent Events Endpoint für standardisierte GameEvents.
 
+    Jedes Spiel ist ein eigener Kanal: gestreamt werden nur Events der aktiven
+    Sitzung des Spiels (`game=` bzw. Spiel des Teams, siehe `game_scope`).
+
     Unterstützt optionale Query-Parameter:
+      - game: Spiel-Schlüssel (Standard: gemerkte Auswahl bzw. 'default').
       - since_id: Nur Events mit ID > since_id werden gesendet.
       - limit: Maximale Anzahl Events pro Poll (1-200, Default 50).
       - poll: Poll-Intervall in Sekunden (0.2-5.0, Default 1.0).
@@ -82,6 +90,9 @@ def stream_events_v1():
 
     retry_ms = int(max(poll_interval, 0.5) * 1000)
 
+    # Vor dem ersten yield auflösen: die Auswahl landet so noch im Session-Cookie
+    game_key = current_game_key()
+
     def generate():
         last_sent_id = since_id
         keepalive_marker = time.time()
@@ -93,6 +104,7 @@ def stream_events_v1():
 
         handshake_payload = {
             "type": "stream_connected",
+            "game": game_key,
             "active_session_id": reported_session_id,
             "poll_interval": poll_interval,
             "keepalive_interval": keepalive_interval,
@@ -161,8 +173,10 @@ def stream_events_v1():
 
 @api_v1_bp.get('/status/board')
 def status_board_v1():
+    """Board-Status; `fields=` wählt Felder aus `data`, `encoding=compact` kodiert Listen spaltenweise."""
     try:
-        teams = Team.query.order_by(Team.id).all()
+        selection = FieldSelection.from_request()
+        teams = Team.in_game().order_by(Team.id).all()
         active_session = get_active_session()
 
         team_data = []
@@ -206,20 +220,12 @@ def status_board_v1():
                     "folder": folder_name,
                 }
 
-            # Dice order parsing
-            order = []
-            if active_session.dice_roll_order:
-                try:
-                    order = [int(x) for x in active_session.dice_roll_order.split(',') if x.strip().isdigit()]
-                except Exception:
-                    order = []
-
             session_data = {
                 "id": active_session.id,
                 "phase": active_session.current_phase,
                 "round": round_info,
                 "current_team_turn_id": active_session.current_team_turn_id,
-                "dice_roll_order": order,
+                "dice_roll_order": list(active_session.turn_order),
                 "question": {"id": active_session.current_question_id} if active_session.current_question_id else {"id": None},
                 "field_minigame": {"active": active_session.current_phase in [
                     'FIELD_MINIGAME_SELECTION_PENDING', 'FIELD_MINIGAME_TRIGGERED', 'FIELD_MINIGAME_ACTIVE'
@@ -229,9 +235,8 @@ def status_board_v1():
         # Recent events (10s window)
         last_dice = None
         last_special = None
-        if active_session:
-            recent_time = datetime.utcnow() - timedelta(seconds=10)
-
+        recent_time = datetime.utcnow() - timedelta(seconds=10)
+        if active_session and selection.wants('last_dice'):
             dice_evt = GameEvent.query.filter_by(game_session_id=active_session.id) \
                 .filter(GameEvent.event_type.in_([
                     'dice_roll', 'admin_dice_roll', 'admin_dice_roll_legacy', 'team_dice_roll'
@@ -254,6 +259,7 @@ def status_board_v1():
                 except Exception:
                     last_dice = None
 
+        if active_session and selection.wants('last_special'):
             special_evt = GameEvent.query.filter_by(game_session_id=active_session.id) \
                 .filter(GameEvent.event_type.in_([
                     'special_field_catapult_forward', 'special_field_catapult_backward', 'special_field_player_swap',
@@ -275,18 +281,43 @@ def status_board_v1():
                 except Exception:
                     last_special = None
 
-        return _ok({
+        return _ok(selection.apply({
             "teams": team_data,
             "session": session_data,
             "last_dice": last_dice,
             "last_special": last_special
-        })
+        }))
     except Exception as e:
         current_app.logger.error(f"/api/v1/status/board error: {e}", exc_info=True)
         return _err("INTERNAL_ERROR", "Unerwarteter Fehler", status=500)
 
 
+@api_v1_bp.get('/board/bootstrap')
+def board_bootstrap_v1():
+    """
+    Alles, was das Spielbrett zum ersten Zeichnen braucht, in einer Antwort:
+    Feld-Layout, Feld-Farben, Board-Schnappschuss, Avatare und aktuelle Frage.
+
+    Die Antwort ist gecacht und wird per ETag revalidiert; `data.versions`
+    enthält die Versions-Tokens der enthaltenen Domänen.
+    """
+    try:
+        body, etag = get_bootstrap()
+    except Exception as e:
+        current_app.logger.error(f"/api/v1/board/bootstrap error: {e}", exc_info=True)
+        return _err("INTERNAL_ERROR", "Unerwarteter Fehler", status=500)
+
+    if request.if_none_match and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "public, no-cache"
+    return response
+
+
 @api_v1_bp.get('/fields/positions')
+@cached_response(FIELD_CONFIG)
 def fields_positions_v1():
     try:
         # Preferred: use special_fields util if available
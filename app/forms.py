@@ -63,7 +63,7 @@ class EditPlayerForm(FlaskForm):
 
     def __init__(self, *args, **kwargs):
         super(EditPlayerForm, self).__init__(*args, **kwargs)
-        teams = Team.query.order_by(Team.name).all()
+        teams = Team.in_game().order_by(Team.name).all()
         self.assigned_team_id.choices = [(0, '-- Kein Team --')] + [(t.id, t.name) for t in teams]
 
 class AddPlayerForm(FlaskForm):
@@ -73,7 +73,7 @@ class AddPlayerForm(FlaskForm):
 
     def __init__(self, *args, **kwargs):
         super(AddPlayerForm, self).__init__(*args, **kwargs)
-        teams = Team.query.order_by(Team.name).all()
+        teams = Team.in_game().order_by(Team.name).all()
         self.team_id.choices = [(t.id, t.name) for t in teams]
 
 class SetNextMinigameForm(FlaskForm):
@@ -512,7 +512,7 @@ class FieldBulkEditForm(FlaskForm):
     def __init__(self, *args, **kwargs):
         super(FieldBulkEditForm, self).__init__(*args, **kwargs)
         # Lade verfügbare Felder - verwende field_type als Value (nicht ID)
-        field_configs = FieldConfiguration.query.all()
+        field_configs = FieldConfiguration.in_game().all()
         self.selected_fields.choices = [(config.field_type, f"{config.display_name} ({config.field_type})") 
                                        for config in field_configs]
 
@@ -0,0 +1,281 @@
+"""
+Reine Spiel-Engine für Würfelwürfe (ohne Flask und SQLAlchemy).
+
+Bewegung, Sperren-Befreiung, Katapulte, Positionstausch, Zielfeld-Regel und
+Bonuswürfel auf einem kompakten Zustand (`GameState`, `FieldRules`); jeder
+Wurf liefert ein `RollResult` mit seinen `DomainEvent`s. Zufall kommt nur aus
+dem übergebenen `rng`. Persistenz und Event-Texte übernimmt
+`app/services/dice_service.py`.
+"""
+
+import random
+from collections import namedtuple
+from typing import Dict, List, Optional
+
+VICTORY_MIN_ROLL = 6
+DEFAULT_MAX_FIELD = 72
+
+# Event-Arten der Engine
+BARRIER_CHECKED = 'barrier_checked'
+CATAPULT_FORWARD = 'catapult_forward'
+CATAPULT_BACKWARD = 'catapult_backward'
+PLAYER_SWAP = 'player_swap'
+BARRIER_SET = 'barrier_set'
+MINIGAME_FIELD = 'minigame_field'
+DICE_ROLLED = 'dice_rolled'
+VICTORY = 'victory'
+
+DomainEvent = namedtuple('DomainEvent', ('kind', 'team', 'data'))
+
+
+def parse_barrier_config(target_numbers) -> dict:
+    """
+    Parst die target_numbers Konfiguration und bestimmt den Modus
+
+    Args:
+        target_numbers: Liste oder String mit Ziel-Zahlen ("4+", "-3", "2,4,6")
+
+    Returns:
+        dict: Parsed configuration with mode, numbers, display_text
+    """
+    if isinstance(target_numbers, str):
+        target_str = target_numbers.strip()
+    elif isinstance(target_numbers, list):
+        target_str = ','.join(str(x) for x in target_numbers)
+    else:
+        target_str = "4,5,6"  # Default
+
+    # Maximum-Modus (beginnt mit -)
+    if target_str.startswith('-'):
+        try:
+            max_number = min(max(int(target_str[1:]), 1), 6)
+            return {
+                'mode': 'maximum',
+                'numbers': list(range(1, max_number + 1)),
+                'max_number': max_number,
+                'min_number': 1,
+                'display_text': f"Würfle höchstens eine {max_number}!"
+            }
+        except ValueError:
+            pass
+
+    # Minimum-Modus (endet mit +)
+    if target_str.endswith('+'):
+        try:
+            min_number = min(max(int(target_str[:-1]), 1), 6)
+            return {
+                'mode': 'minimum',
+                'numbers': list(range(min_number, 7)),
+                'min_number': min_number,
+                'display_text': f"Würfle mindestens eine {min_number}!"
+            }
+        except ValueError:
+            pass
+
+    # Exakte Zahlen
+    try:
+        numbers = [int(x.strip()) for x in target_str.split(',') if x.strip()]
+        numbers = sorted(n for n in numbers if 1 <= n <= 6) or [4, 5, 6]
+
+        if len(numbers) == 1:
+            display_text = f"Würfle eine {numbers[0]}!"
+        elif len(numbers) == 2:
+            display_text = f"Würfle eine {numbers[0]} oder {numbers[1]}!"
+        else:
+            display_text = f"Würfle eine {', '.join(str(n) for n in numbers[:-1])} oder {numbers[-1]}!"
+
+        return {
+            'mode': 'exact',
+            'numbers': numbers,
+            'min_number': min(numbers),
+            'display_text': display_text
+        }
+    except ValueError:
+        return {
+            'mode': 'exact',
+            'numbers': [4, 5, 6],
+            'min_number': 4,
+            'display_text': "Würfle eine 4, 5 oder 6!"
+        }
+
+
+def fallback_barrier_config(target_number: Optional[int]) -> dict:
+    """Sperren-Konfiguration für Altdaten, die nur `blocked_target_number` kennen."""
+    target_number = target_number or 6
+    return {
+        'mode': 'minimum',
+        'numbers': list(range(target_number, 7)),
+        'min_number': target_number,
+        'display_text': f"Würfle mindestens eine {target_number}!"
+    }
+
+
+def barrier_released(total_roll: int, barrier_config: dict) -> bool:
+    """Prüft, ob der Gesamtwurf (Standard + Bonus) die Sperren-Bedingung erfüllt."""
+    mode = barrier_config.get('mode', 'exact')
+    if mode == 'minimum':
+        # 4+ heißt: mindestens 4 (mit Bonus auch 7, 8, 9, ...)
+        return total_roll >= barrier_config.get('min_number', 4)
+    if mode == 'maximum':
+        return total_roll <= barrier_config.get('max_number', 3)
+    return total_roll in barrier_config['numbers']
+
+
+class FieldRules:
+    """Feldtypen und Sonderfeld-Parameter; deaktivierte Sonderfelder sind None."""
+
+    __slots__ = ('field_types', 'max_field', 'catapult_forward', 'catapult_backward',
+                 'swap_min_distance', 'barrier_config')
+
+    def __init__(self, field_types: Dict[int, str], max_field: int = DEFAULT_MAX_FIELD,
+                 catapult_forward=(3, 5), catapult_backward=(4, 10),
+                 swap_min_distance: Optional[int] = 3, barrier_config: Optional[dict] = None):
+        self.field_types = field_types
+        self.max_field = max_field
+        self.catapult_forward = catapult_forward
+        self.catapult_backward = catapult_backward
+        self.swap_min_distance = swap_min_distance
+        self.barrier_config = barrier_config
+
+    def field_type(self, position: int) -> str:
+        return self.field_types.get(position, 'normal')
+
+
+class GameState:
+    """Kompakter Spielzustand aller Teams, adressiert über den Team-Index."""
+
+    __slots__ = ('team_ids', 'index', 'positions', 'blocked', 'barrier_configs', 'bonus_sides')
+
+    def __init__(self, team_ids: List[int], positions: List[int], blocked: List[bool] = None,
+                 barrier_configs: List[Optional[dict]] = None, bonus_sides: List[int] = None):
+        count = len(team_ids)
+        self.team_ids = list(team_ids)
+        self.index = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        self.positions = list(positions)
+        self.blocked = list(blocked) if blocked is not None else [False] * count
+        self.barrier_configs = list(barrier_configs) if barrier_configs is not None else [None] * count
+        self.bonus_sides = list(bonus_sides) if bonus_sides is not None else [0] * count
+
+    def copy(self) -> 'GameState':
+        return GameState(self.team_ids, self.positions, self.blocked, self.barrier_configs, self.bonus_sides)
+
+
+class RollResult:
+    """Ergebnis eines Wurfs; Positionen vor/nach dem Würfeln und nach Sonderfeldern."""
+
+    __slots__ = ('team', 'standard_roll', 'bonus_roll', 'total_roll', 'old_position', 'new_position',
+                 'final_position', 'was_blocked', 'barrier_released', 'field_type',
+                 'victory_triggered', 'needs_final_roll', 'events')
+
+    def __init__(self, team: int, standard_roll: int, bonus_roll: int, old_position: int, was_blocked: bool):
+        self.team = team
+        self.standard_roll = standard_roll
+        self.bonus_roll = bonus_roll
+        self.total_roll = standard_roll + bonus_roll
+        self.old_position = old_position
+        self.new_position = old_position
+        self.final_position = old_position
+        self.was_blocked = was_blocked
+        self.barrier_released = False
+        self.field_type = None
+        self.victory_triggered = False
+        self.needs_final_roll = False
+        self.events: List[DomainEvent] = []
+
+    @property
+    def stayed_blocked(self) -> bool:
+        return self.was_blocked and not self.barrier_released
+
+
+def _apply_field(state: GameState, rules: FieldRules, team: int, result: RollResult, rng):
+    position = state.positions[team]
+    field_type = rules.field_type(position)
+    result.field_type = field_type
+    events = result.events
+
+    if field_type == 'catapult_forward' and rules.catapult_forward:
+        distance = rng.randint(*rules.catapult_forward)
+        state.positions[team] = min(position + distance, rules.max_field)
+        events.append(DomainEvent(CATAPULT_FORWARD, team, {
+            'distance': distance, 'old_position': position, 'new_position': state.positions[team]}))
+
+    elif field_type == 'catapult_backward' and rules.catapult_backward:
+        distance = rng.randint(*rules.catapult_backward)
+        state.positions[team] = max(0, position - distance)
+        events.append(DomainEvent(CATAPULT_BACKWARD, team, {
+            'distance': distance, 'old_position': position, 'new_position': state.positions[team]}))
+
+    elif field_type == 'player_swap' and rules.swap_min_distance is not None:
+        positions = state.positions
+        candidates = [other for other in range(len(positions))
+                      if other != team and abs(positions[other] - position) >= rules.swap_min_distance]
+        if not candidates:
+            # Fallback: jedes andere Team auf einem anderen Feld
+            candidates = [other for other in range(len(positions))
+                          if other != team and positions[other] != position]
+        if candidates:
+            other = rng.choice(candidates)
+            other_position = positions[other]
+            positions[team], positions[other] = other_position, position
+            events.append(DomainEvent(PLAYER_SWAP, team, {
+                'swap_team': other, 'old_position': position, 'swap_old_position': other_position}))
+        else:
+            events.append(DomainEvent(PLAYER_SWAP, team, {'swap_team': None}))
+
+    elif field_type == 'barrier' and rules.barrier_config:
+        state.blocked[team] = True
+        state.barrier_configs[team] = rules.barrier_config
+        events.append(DomainEvent(BARRIER_SET, team, {'barrier_config': rules.barrier_config}))
+
+    elif field_type == 'minigame':
+        # Minispiel-Auswahl hängt an Dateien und Session -> Adapter
+        events.append(DomainEvent(MINIGAME_FIELD, team, {'position': position}))
+
+
+def resolve_roll(state: GameState, rules: FieldRules, team: int, standard_roll: int, bonus_roll: int = 0,
+                 rng=random) -> RollResult:
+    """
+    Wendet einen gegebenen Wurf auf den Zustand an (verändert `state`).
+
+    Args:
+        team: Index des würfelnden Teams in `state`
+        rng: Zufallsquelle für Sonderfelder (Katapult-Weite, Tauschpartner)
+    """
+    old_position = state.positions[team]
+    result = RollResult(team, standard_roll, bonus_roll, old_position, state.blocked[team])
+    total_roll = result.total_roll
+
+    if result.was_blocked:
+        # Verglichen wird immer das Gesamtergebnis beider Würfel
+        barrier_config = state.barrier_configs[team] or fallback_barrier_config(None)
+        result.barrier_released = barrier_released(total_roll, barrier_config)
+        result.events.append(DomainEvent(BARRIER_CHECKED, team, {
+            'barrier_config': barrier_config, 'released': result.barrier_released}))
+        if result.barrier_released:
+            state.blocked[team] = False
+            state.barrier_configs[team] = None
+
+    if not result.stayed_blocked:
+        result.new_position = min(old_position + total_roll, rules.max_field)
+        state.positions[team] = result.new_position
+        _apply_field(state, rules, team, result, rng)
+
+    result.final_position = state.positions[team]
+    result.events.append(DomainEvent(DICE_ROLLED, team, None))
+
+    # Zielfeld (letztes Feld): das Team muss BEREITS auf dem Ziel gestanden haben
+    if old_position == rules.max_field:
+        if total_roll >= VICTORY_MIN_ROLL:
+            result.victory_triggered = True
+            result.events.append(DomainEvent(VICTORY, team, {'final_dice_roll': total_roll}))
+        else:
+            result.needs_final_roll = True
+    return result
+
+
+def roll(state: GameState, rules: FieldRules, team: int, rng=random) -> RollResult:
+    """Würfelt Standard- (1-6) und ggf. Bonuswürfel für `team` und wendet den Wurf an."""
+    standard_roll = rng.randint(1, 6)
+    bonus_sides = state.bonus_sides[team]
+    bonus_roll = rng.randint(1, bonus_sides) if bonus_sides and bonus_sides > 0 else 0
+    return resolve_roll(state, rules, team, standard_roll, bonus_roll, rng)
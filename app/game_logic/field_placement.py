@@ -0,0 +1,199 @@
+"""
+Platzierung der Sonderfelder auf dem Spielbrett (ohne Flask und SQLAlchemy).
+
+Die Feld-Konfigurationen werden einmal gelesen und als `FieldSpec` übergeben.
+Die Verteilung arbeitet dann nur noch auf Listen und einer Belegungs-Bitmap:
+
+1. Wunsch-Positionen je Feld-Typ (Start, Ziel, Modulo als Schrittfolgen,
+   feste Positionen, Wahrscheinlichkeit),
+2. Konflikte (mehrere Typen wollen dieselbe Position) per gewichteter
+   Zufallsauswahl auflösen - seltene Typen haben Vorrang,
+3. verdrängte Felder auf die nächste freie Position neben einer
+   Wunsch-Position umverteilen (`FreeSlots`), sonst auf die erste freie,
+4. Rest ist 'normal'.
+
+Bei gleicher Konfiguration und gleichem Zufall entsteht dasselbe Brett; die
+Laufzeit wächst linear mit der Brettgröße.
+"""
+
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence
+
+# Umverteilung sucht höchstens so weit neben einer Wunsch-Position
+MAX_REDISTRIBUTION_DISTANCE = 9
+
+FieldSpec = namedtuple('FieldSpec', ('field_type', 'frequency_type', 'frequency_value', 'positions'))
+
+
+class FreeSlots:
+    """
+    Belegungs-Bitmap der Positionen `low..high` mit Sprungzeigern
+    (Union-Find mit Pfadhalbierung) zum nächsten freien Feld links/rechts.
+    Belegen und Suchen kosten damit amortisiert O(1) statt eines Rescans.
+    """
+
+    __slots__ = ('low', 'high', 'occupied', '_right', '_left')
+
+    def __init__(self, size: int, low: int, high: int):
+        self.low = low
+        self.high = high
+        self.occupied = bytearray(size)
+        # _right[p]: Kandidat für das nächste freie Feld >= p (size = keins)
+        self._right = list(range(size + 1))
+        # _left[p + 1]: Kandidat für das nächste freie Feld <= p (Index 0 = keins)
+        self._left = list(range(size + 1))
+        for position in range(size):
+            if position < low or position > high:
+                self.occupy(position)
+
+    def occupy(self, position: int) -> None:
+        if not self.occupied[position]:
+            self.occupied[position] = 1
+            self._right[position] = position + 1
+            self._left[position + 1] = position
+
+    @staticmethod
+    def _find(parent: List[int], index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def next_free(self, position: int) -> Optional[int]:
+        """Erstes freies Feld >= position."""
+        position = max(position, 0)
+        if position >= len(self.occupied):
+            return None
+        found = self._find(self._right, position)
+        return found if found < len(self.occupied) else None
+
+    def previous_free(self, position: int) -> Optional[int]:
+        """Letztes freies Feld <= position."""
+        if position < 0:
+            return None
+        position = min(position, len(self.occupied) - 1)
+        found = self._find(self._left, position + 1)
+        return found - 1 if found > 0 else None
+
+    def nearest_free(self, position: int, max_distance: int) -> Optional[int]:
+        """Nächstes freies Feld neben `position` (Abstand 1..max_distance, bei Gleichstand links)."""
+        left = self.previous_free(position - 1)
+        right = self.next_free(position + 1)
+        left_distance = position - left if left is not None else None
+        right_distance = right - position if right is not None else None
+        if left_distance is not None and left_distance <= max_distance and (
+                right_distance is None or left_distance <= right_distance):
+            return left
+        if right_distance is not None and right_distance <= max_distance:
+            return right
+        return None
+
+
+def modulo_positions(step: int, max_fields: int) -> List[int]:
+    """
+    Positionen 1..max_fields-2 mit `pos % step == 0` oder
+    `(pos + step // 2) % step == 0` - als zwei Schrittfolgen statt Vollscan.
+    """
+    end = max_fields - 1
+    offset = (step - step // 2) % step or step
+    if offset == step:
+        return list(range(step, end, step))
+    return sorted(set(range(step, end, step)).union(range(offset, end, step)))
+
+
+def desired_positions(spec: FieldSpec, max_fields: int, rng) -> List[int]:
+    """Wunsch-Positionen eines Feld-Typs (Wahrscheinlichkeit zieht je Feld einmal aus `rng`)."""
+    if spec.field_type == 'start':
+        return [0]
+    if spec.field_type == 'goal':
+        return [max_fields - 1]
+    if spec.field_type == 'normal':
+        return []
+    if spec.frequency_type == 'modulo' and spec.frequency_value > 0:
+        return modulo_positions(spec.frequency_value, max_fields)
+    if spec.frequency_type == 'fixed_positions':
+        return [position for position in spec.positions if 0 <= position < max_fields]
+    if spec.frequency_type == 'probability':
+        probability = spec.frequency_value / 100.0
+        return [position for position in range(1, max_fields - 1) if rng.random() < probability]
+    return []
+
+
+def _priority(spec: FieldSpec) -> float:
+    # Niedrigere frequency_value = höhere Priorität (seltener = wichtiger)
+    return 1000 / max(spec.frequency_value, 1) if spec.frequency_value else 1
+
+
+def place_fields(specs: Sequence[FieldSpec], max_fields: int, rng, stats: Optional[dict] = None) -> Dict[int, str]:
+    """
+    Konfliktfreie Zuordnung {position: field_type} für Positionen 0..max_fields-1.
+
+    Args:
+        specs: aktivierte Feld-Konfigurationen in Datenbank-Reihenfolge
+        max_fields: Anzahl Felder inkl. Start und Ziel
+        rng: Zufallsquelle mit `random()`
+        stats: optional, wird mit Konflikt-Zählern gefüllt
+    """
+    priorities = {spec.field_type: _priority(spec) for spec in specs}
+
+    desired: Dict[str, List[int]] = {}
+    for spec in specs:
+        positions = desired_positions(spec, max_fields, rng)
+        if positions:
+            desired[spec.field_type] = positions
+
+    # Wünsche je Position in der Reihenfolge ihres ersten Auftretens
+    claims: Dict[int, List[str]] = {}
+    for field_type, positions in desired.items():
+        for position in positions:
+            claims.setdefault(position, []).append(field_type)
+
+    counters = {'total_conflicts': 0, 'resolved_randomly': 0, 'redistributed': 0}
+    slot_types: List[Optional[str]] = [None] * max_fields
+    assigned_counts = dict.fromkeys(desired, 0)
+
+    for position, field_types in claims.items():
+        if len(field_types) == 1:
+            chosen = field_types[0]
+        else:
+            counters['total_conflicts'] += 1
+            weights = {field_type: priorities.get(field_type, 1) for field_type in field_types}
+            threshold = rng.random() * sum(weights.values())
+            chosen = field_types[0]
+            cumulative = 0
+            for field_type, weight in weights.items():
+                cumulative += weight
+                if threshold <= cumulative:
+                    chosen = field_type
+                    break
+            counters['resolved_randomly'] += 1
+        slot_types[position] = chosen
+        assigned_counts[chosen] += 1
+
+    # Umverteilung: verdrängte Felder neben ihre Wunsch-Positionen setzen
+    free = FreeSlots(max_fields, 1, max_fields - 2)
+    for position, field_type in enumerate(slot_types):
+        if field_type is not None:
+            free.occupy(position)
+
+    for field_type, positions in desired.items():
+        missing = len(positions) - assigned_counts[field_type]
+        cursor = 0
+        for _ in range(max(missing, 0)):
+            target = None
+            # Felder werden nur belegt, nie frei: ausgeschöpfte Wunsch-Positionen bleiben es
+            while cursor < len(positions) and target is None:
+                target = free.nearest_free(positions[cursor], MAX_REDISTRIBUTION_DISTANCE)
+                if target is None:
+                    cursor += 1
+            if target is None:
+                target = free.next_free(1)
+            if target is None:
+                break
+            free.occupy(target)
+            slot_types[target] = field_type
+            counters['redistributed'] += 1
+
+    if stats is not None:
+        stats.update(counters)
+    return {position: field_type or 'normal' for position, field_type in enumerate(slot_types)}
@@ -0,0 +1,188 @@
+"""
+Exakte Markov-Ketten-Analyse des Spielbretts für ein einzelnes Team.
+
+Bei fester Feld-Verteilung ist die Bewegung eines Teams eine endliche
+Markov-Kette:
+
+- Zustände: jedes Feld frei, Sperren-Felder zusätzlich "blockiert",
+- ein Zug: Standardwürfel (1-6) plus optional Bonuswürfel (1-n),
+- Katapulte: gleichverteilter Sprung über die konfigurierte Weite,
+- Sperren: blockiert, bis der Gesamtwurf die Bedingung erfüllt
+  (`engine.barrier_released`), danach normale Bewegung ab dem Sperren-Feld,
+- Ziel: wer vor dem Wurf auf Feld 72 steht und mindestens 6 würfelt, ist fertig.
+
+Aus den Übergängen ergeben sich durch Lösen von (I - Q) · E = 1 die
+erwarteten Restzüge von jedem Feld und durch (I - Qᵀ) · v = e_start die
+erwarteten Landungen je Feld. Positionstausch hängt von den Gegnern ab und
+wird als normales Feld behandelt.
+
+Die Gleichungssysteme löst numpy (LAPACK); ohne Flask/SQLAlchemy.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.game_logic import engine
+
+
+def roll_distribution(bonus_sides: int = 0) -> Dict[int, float]:
+    """Wahrscheinlichkeit je Gesamtwurf (Standard + Bonus)."""
+    bonus_values = range(1, bonus_sides + 1) if bonus_sides and bonus_sides > 0 else (0,)
+    weight = 1.0 / (6 * len(bonus_values))
+    distribution: Dict[int, float] = {}
+    for standard in range(1, 7):
+        for bonus in bonus_values:
+            distribution[standard + bonus] = distribution.get(standard + bonus, 0.0) + weight
+    return distribution
+
+
+class _Chain:
+    """Zustandsraum: Feld p frei = p, Sperren-Feld p blockiert = eigener Index."""
+
+    def __init__(self, rules: engine.FieldRules):
+        self.rules = rules
+        self.size = rules.max_field + 1
+        self.blocked_index: Dict[int, int] = {}
+        if rules.barrier_config:
+            for position in range(self.size):
+                if rules.field_type(position) == 'barrier':
+                    self.blocked_index[position] = self.size + len(self.blocked_index)
+        self.states = self.size + len(self.blocked_index)
+
+    def landing(self, position: int) -> Dict[int, float]:
+        """Zustandsverteilung nach dem Landen auf `position` (inkl. Sonderfeld-Aktion)."""
+        rules = self.rules
+        field_type = rules.field_type(position)
+        if field_type == 'catapult_forward' and rules.catapult_forward:
+            low, high = rules.catapult_forward
+            return _spread(min(position + d, rules.max_field) for d in range(low, high + 1))
+        if field_type == 'catapult_backward' and rules.catapult_backward:
+            low, high = rules.catapult_backward
+            return _spread(max(0, position - d) for d in range(low, high + 1))
+        if position in self.blocked_index:
+            return {self.blocked_index[position]: 1.0}
+        return {position: 1.0}
+
+    def landing_rows(self, rolls: Dict[int, float]) -> List[Dict[int, float]]:
+        """Je Zustand: Wahrscheinlichkeit, auf Feld n zu landen (vor der Sonderfeld-Aktion)."""
+        rules = self.rules
+        rows: List[Dict[int, float]] = [dict() for _ in range(self.states)]
+        starts = [(position, position, None) for position in range(self.size)]
+        starts += [(index, position, rules.barrier_config) for position, index in self.blocked_index.items()]
+
+        for state, position, barrier_config in starts:
+            row = rows[state]
+            for total, probability in rolls.items():
+                if position == rules.max_field:
+                    # Unter 6 bleibt das Team auf dem Ziel, ab 6 ist es fertig
+                    if total >= engine.VICTORY_MIN_ROLL:
+                        continue
+                elif barrier_config and not engine.barrier_released(total, barrier_config):
+                    continue
+                target = min(position + total, rules.max_field)
+                row[target] = row.get(target, 0.0) + probability
+        return rows
+
+    def transitions(self, rolls: Dict[int, float], landing_rows=None) -> List[Dict[int, float]]:
+        """Übergangswahrscheinlichkeiten je Zustand (Ziel-Abschluss fehlt = absorbierend)."""
+        landing_rows = landing_rows or self.landing_rows(rolls)
+        rows: List[Dict[int, float]] = [dict() for _ in range(self.states)]
+        for state, landings in enumerate(landing_rows):
+            row = rows[state]
+            for position, probability in landings.items():
+                for target, share in self.landing(position).items():
+                    row[target] = row.get(target, 0.0) + probability * share
+
+        # Blockiert ohne Befreiung: Team bleibt stehen
+        for index in self.blocked_index.values():
+            stay = 1.0 - sum(landing_rows[index].values())
+            if stay > 0:
+                rows[index][index] = rows[index].get(index, 0.0) + stay
+        return rows
+
+
+def _spread(targets) -> Dict[int, float]:
+    targets = list(targets)
+    distribution: Dict[int, float] = {}
+    for target in targets:
+        distribution[target] = distribution.get(target, 0.0) + 1.0 / len(targets)
+    return distribution
+
+
+def _solve(matrix: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Löst matrix · x = rhs; nicht lösbar, wenn ein Zustand das Ziel nie erreicht."""
+    try:
+        solution = np.linalg.solve(matrix, rhs)
+    except np.linalg.LinAlgError:
+        solution = None
+    if solution is None or not np.all(np.isfinite(solution)):
+        raise ValueError("Ziel ist von mindestens einem Feld aus nicht erreichbar")
+    return solution
+
+
+def _identity_minus(rows: List[Dict[int, float]]) -> np.ndarray:
+    """I - Q für die Übergangszeilen (transponiert über `.T`)."""
+    matrix = np.identity(len(rows))
+    for state, row in enumerate(rows):
+        for target, probability in row.items():
+            matrix[state, target] -= probability
+    return matrix
+
+
+def expected_turns(rules: engine.FieldRules, bonus_sides: int = 0) -> List[float]:
+    """Erwartete Restzüge bis zum Sieg für jeden Zustand (Index wie `_Chain`)."""
+    chain = _Chain(rules)
+    rows = chain.transitions(roll_distribution(bonus_sides))
+    return _solve(_identity_minus(rows), np.ones(chain.states)).tolist()
+
+
+def analyze_board(rules: engine.FieldRules, bonus_sides: int = 0,
+                  compare_bonus: Optional[List[int]] = None) -> dict:
+    """
+    Komplette Analyse für das Admin-Panel.
+
+    Returns:
+        expected_turns_from_start, expected_turns (je Feld, frei),
+        expected_turns_blocked (je Sperren-Feld), expected_landings (je Feld,
+        ohne den Siegwurf),
+        landing_delta (Restzüge nach Landung minus Restzüge auf normalem Feld)
+        und expected_turns_by_bonus (Start, Bonuswürfel in jedem Zug).
+    """
+    chain = _Chain(rules)
+    rolls = roll_distribution(bonus_sides)
+    landing_rows = chain.landing_rows(rolls)
+    rows = chain.transitions(rolls, landing_rows)
+    matrix = _identity_minus(rows)
+    turns = _solve(matrix, np.ones(chain.states)).tolist()
+
+    start = np.zeros(chain.states)
+    start[0] = 1.0
+    visits = _solve(matrix.T, start).tolist()
+
+    positions = range(chain.size)
+    landings = [0.0] * chain.size
+    for state, row in enumerate(landing_rows):
+        for position, probability in row.items():
+            landings[position] += visits[state] * probability
+
+    landing_delta = []
+    for position in positions:
+        after_landing = sum(share * turns[state] for state, share in chain.landing(position).items())
+        landing_delta.append(after_landing - turns[position])
+
+    by_bonus = {}
+    for sides in sorted(set(compare_bonus or []) | {0}):
+        by_bonus[sides] = turns[0] if sides == bonus_sides else expected_turns(rules, sides)[0]
+
+    return {
+        'bonus_sides': bonus_sides,
+        'max_field': rules.max_field,
+        'expected_turns_from_start': turns[0],
+        'expected_turns': turns[:chain.size],
+        'expected_turns_blocked': {position: turns[index] for position, index in chain.blocked_index.items()},
+        'expected_landings': landings,
+        'landing_delta': landing_delta,
+        'expected_turns_by_bonus': by_bonus,
+        'field_types': [rules.field_type(position) for position in positions],
+    }
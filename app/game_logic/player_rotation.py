@@ -0,0 +1,35 @@
+"""
+Faire Spieler-Rotation (ohne Flask und SQLAlchemy).
+
+Ausgelost werden die Spieler mit den wenigsten Einsätzen; bei Gleichstand
+entscheidet der Zufall der Sitzung. Statt alle Spieler eines Teams zu
+sortieren, entsteht ein Min-Heap über (Einsätze, Zufallsrang) in O(n), aus
+dem `count`-mal entnommen wird (O(k log n)). Der Zufallsrang ist die
+Position nach einmaligem Mischen - eine einzige Ziehung pro Team.
+"""
+
+import heapq
+from typing import Dict, Iterable, List
+
+
+def select_fair(members: Iterable[str], plays: Dict[str, int], count: int, rng) -> List[str]:
+    """
+    Wählt `count` Spieler mit den wenigsten Einsätzen.
+
+    Args:
+        members: auslosbare Spieler (Duplikate zählen einmal)
+        plays: {spieler: einsätze}, fehlende Spieler haben 0 Einsätze
+        count: gewünschte Anzahl (höchstens alle Spieler)
+        rng: Zufallsquelle mit `shuffle()` für Gleichstände
+
+    Returns:
+        Spieler aufsteigend nach Einsätzen, innerhalb gleicher Einsätze zufällig.
+    """
+    order = list(dict.fromkeys(members))
+    count = min(max(count, 0), len(order))
+    if not count:
+        return []
+    rng.shuffle(order)
+    heap = [(plays.get(member, 0), rank, member) for rank, member in enumerate(order)]
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[2] for _ in range(count)]
@@ -0,0 +1,276 @@
+"""
+Monte-Carlo-Simulation ganzer Spiele auf einer Feld-Konfiguration.
+
+Spielt viele Spiele gleichzeitig: pro Runde und Zugplatz werden die Würfel
+aller noch laufenden Spiele als NumPy-Array gezogen. Die Regeln kommen aus
+der Engine (`engine.FieldRules` aus `special_fields.get_field_rules`,
+`engine.barrier_released`, Zielfeld-Regel); `simulate_reference()` spielt
+dieselben Spiele langsam über `engine.roll` und dient als Gegenprobe.
+
+Ablauf einer Runde wie im Spiel: Nach dem Minispiel bestimmen die
+Platzierungen Würfelreihenfolge und Bonuswürfel (`PLACEMENT_BONUS_DICE`),
+dann würfelt jedes Team einmal. Platzierungs-Strategien:
+
+- `random`: jede Runde zufällige Platzierungen (gleich starke Teams),
+- `fixed`: Team 1 gewinnt jedes Minispiel, Team 2 wird Zweiter, ...
+- `none`: zufällige Reihenfolge, keine Bonuswürfel.
+
+Minispiel-Felder werden nur gezählt; ihr Ausgang ändert keine Positionen.
+
+Benötigt `numpy` (nur für die Simulation, nicht für die App).
+"""
+
+import random
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.game_logic import engine
+
+POLICIES = ('random', 'fixed', 'none')
+FIELD_TYPES = ('start', 'normal', 'goal', 'catapult_forward', 'catapult_backward',
+               'player_swap', 'barrier', 'minigame')
+DEFAULT_MAX_ROUNDS = 400
+
+_CODES = {field_type: code for code, field_type in enumerate(FIELD_TYPES)}
+_NORMAL = _CODES['normal']
+
+
+def _type_codes(rules: engine.FieldRules) -> np.ndarray:
+    """Feldtyp-Code je Position 0..max_field (unbekannte Typen zählen als normal)."""
+    return np.array([_CODES.get(rules.field_type(position), _NORMAL)
+                     for position in range(rules.max_field + 1)], dtype=np.int8)
+
+
+def _release_table(rules: engine.FieldRules, max_total: int) -> np.ndarray:
+    """Befreit-Flag je Gesamtwurf nach der Sperren-Regel der Engine."""
+    config = rules.barrier_config or engine.fallback_barrier_config(None)
+    return np.array([engine.barrier_released(total, config) for total in range(max_total + 1)], dtype=bool)
+
+
+def _placement_orders(policy: str, games: int, teams: int, rng) -> np.ndarray:
+    """Team-Index je Platzierung (Spalte 0 = Platz 1) für jedes Spiel."""
+    if policy == 'fixed':
+        return np.broadcast_to(np.arange(teams), (games, teams))
+    return np.argsort(rng.random((games, teams)), axis=1)
+
+
+def _bonus_by_place(policy: str, bonus_dice: Dict[int, int], teams: int):
+    if policy == 'none':
+        return [0] * teams
+    return [int(bonus_dice.get(place, 0)) for place in range(1, teams + 1)]
+
+
+def _percentiles(values: np.ndarray) -> dict:
+    if values.size == 0:
+        return {'mean': None, 'p10': None, 'p50': None, 'p90': None}
+    p10, p50, p90 = np.percentile(values, (10, 50, 90))
+    return {'mean': float(values.mean()), 'p10': float(p10), 'p50': float(p50), 'p90': float(p90)}
+
+
+def simulate(rules: engine.FieldRules, teams: int, games: int, bonus_dice: Dict[int, int],
+             policy: str = 'random', seed: Optional[int] = None, max_rounds: int = DEFAULT_MAX_ROUNDS) -> dict:
+    """
+    Simuliert `games` Spiele mit `teams` Teams vektorisiert.
+
+    Returns:
+        Kennzahlen: Spiellänge (Runden/Würfe), Landungen je Feldtyp,
+        Katapult-/Tausch-Wirkung, Verweildauer auf Sperren und Siegquoten
+        je Team und je Platzierung in der Siegrunde.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unbekannte Strategie '{policy}' (erlaubt: {', '.join(POLICIES)})")
+    if teams < 1 or games < 1:
+        raise ValueError("Mindestens ein Team und ein Spiel erforderlich")
+
+    rng = np.random.default_rng(seed)
+    types = _type_codes(rules)
+    max_field = rules.max_field
+    bonus_by_place = _bonus_by_place(policy, bonus_dice, teams)
+    release = _release_table(rules, 6 + max(bonus_by_place + [0]))
+
+    positions = np.zeros((games, teams), dtype=np.int32)
+    blocked = np.zeros((games, teams), dtype=bool)
+    blocked_since = np.zeros((games, teams), dtype=np.int32)
+    running = np.ones(games, dtype=bool)
+    rounds = np.full(games, -1, dtype=np.int32)
+    rolls = np.zeros(games, dtype=np.int32)
+    winner = np.full(games, -1, dtype=np.int32)
+    winner_place = np.full(games, -1, dtype=np.int32)
+
+    landings = np.zeros(len(FIELD_TYPES), dtype=np.int64)
+    catapult = {kind: {'count': 0, 'distance': 0} for kind in (engine.CATAPULT_FORWARD, engine.CATAPULT_BACKWARD)}
+    swaps = {'count': 0, 'failed': 0, 'gains': []}
+    barrier_hits = 0
+    dwell_samples = []
+
+    for round_number in range(1, max_rounds + 1):
+        if not running.any():
+            break
+        orders = _placement_orders(policy, games, teams, rng)
+
+        for place in range(teams):
+            rows = np.flatnonzero(running)
+            if rows.size == 0:
+                break
+            team = orders[rows, place]
+            old = positions[rows, team]
+            count = rows.size
+
+            standard = rng.integers(1, 7, count)
+            sides = bonus_by_place[place]
+            bonus = rng.integers(1, sides + 1, count) if sides > 0 else np.zeros(count, dtype=np.int64)
+            total = standard + bonus
+            rolls[rows] += 1
+
+            # Sperre: verglichen wird der Gesamtwurf
+            was_blocked = blocked[rows, team]
+            released = was_blocked & release[total]
+            if released.any():
+                released_rows, released_team = rows[released], team[released]
+                dwell_samples.append(round_number - blocked_since[released_rows, released_team])
+                blocked[released_rows, released_team] = False
+            moving = ~was_blocked | released
+
+            new = np.where(moving, np.minimum(old + total, max_field), old)
+            final = new.copy()
+            landed = types[new]
+            landings += np.bincount(landed[moving], minlength=len(FIELD_TYPES))
+
+            forward = moving & (landed == _CODES['catapult_forward'])
+            if rules.catapult_forward and forward.any():
+                distance = rng.integers(rules.catapult_forward[0], rules.catapult_forward[1] + 1, int(forward.sum()))
+                final[forward] = np.minimum(new[forward] + distance, max_field)
+                catapult[engine.CATAPULT_FORWARD]['count'] += int(forward.sum())
+                catapult[engine.CATAPULT_FORWARD]['distance'] += int((final[forward] - new[forward]).sum())
+
+            backward = moving & (landed == _CODES['catapult_backward'])
+            if rules.catapult_backward and backward.any():
+                distance = rng.integers(rules.catapult_backward[0], rules.catapult_backward[1] + 1, int(backward.sum()))
+                final[backward] = np.maximum(new[backward] - distance, 0)
+                catapult[engine.CATAPULT_BACKWARD]['count'] += int(backward.sum())
+                catapult[engine.CATAPULT_BACKWARD]['distance'] += int((new[backward] - final[backward]).sum())
+
+            barrier = moving & (landed == _CODES['barrier'])
+            if rules.barrier_config and barrier.any():
+                blocked[rows[barrier], team[barrier]] = True
+                blocked_since[rows[barrier], team[barrier]] = round_number
+                barrier_hits += int(barrier.sum())
+
+            positions[rows, team] = final
+
+            swap = moving & (landed == _CODES['player_swap'])
+            if rules.swap_min_distance is not None and swap.any():
+                _swap(positions, rows[swap], team[swap], new[swap], rules.swap_min_distance, rng, swaps)
+
+            # Zielfeld: das Team muss vor dem Wurf schon auf dem Ziel stehen
+            won = (old == max_field) & (total >= engine.VICTORY_MIN_ROLL)
+            if won.any():
+                won_rows = rows[won]
+                running[won_rows] = False
+                rounds[won_rows] = round_number
+                winner[won_rows] = team[won]
+                winner_place[won_rows] = place
+
+    finished = rounds > 0
+    finished_count = int(finished.sum())
+    total_landings = max(int(landings.sum()), 1)
+    dwell = np.concatenate(dwell_samples) if dwell_samples else np.zeros(0, dtype=np.int32)
+    swap_gains = np.concatenate(swaps['gains']) if swaps['gains'] else np.zeros(0, dtype=np.int32)
+
+    return {
+        'games': games,
+        'teams': teams,
+        'policy': policy,
+        'bonus_by_place': bonus_by_place,
+        'finished': finished_count,
+        'unfinished': games - finished_count,
+        'rounds': _percentiles(rounds[finished]),
+        'rolls': _percentiles(rolls[finished]),
+        'landings': {
+            field_type: {
+                'share': int(landings[code]) / total_landings,
+                'per_game': int(landings[code]) / games,
+            }
+            for field_type, code in _CODES.items() if landings[code]
+        },
+        'catapult': {
+            kind: {
+                'per_game': values['count'] / games,
+                'mean_distance': values['distance'] / values['count'] if values['count'] else None,
+            }
+            for kind, values in catapult.items()
+        },
+        'swap': {
+            'per_game': swaps['count'] / games,
+            'failed_per_game': swaps['failed'] / games,
+            'gain': _percentiles(swap_gains),
+        },
+        'barrier': {
+            'per_game': barrier_hits / games,
+            'dwell_rounds': _percentiles(dwell),
+        },
+        'win_rate_by_team': (np.bincount(winner[finished], minlength=teams) / max(finished_count, 1)).tolist(),
+        'win_rate_by_place': (np.bincount(winner_place[finished], minlength=teams) / max(finished_count, 1)).tolist(),
+    }
+
+
+def _swap(positions, rows, team, landed_at, min_distance, rng, swaps):
+    """Positionstausch wie `engine._apply_field`, für viele Spiele gleichzeitig."""
+    board = positions[rows]
+    selector = np.arange(rows.size)
+    others = np.ones(board.shape, dtype=bool)
+    others[selector, team] = False
+
+    candidates = others & (np.abs(board - landed_at[:, None]) >= min_distance)
+    # Fallback: jedes andere Team auf einem anderen Feld
+    empty = ~candidates.any(axis=1)
+    candidates[empty] = (others & (board != landed_at[:, None]))[empty]
+
+    possible = candidates.any(axis=1)
+    swaps['failed'] += int((~possible).sum())
+    if not possible.any():
+        return
+    choice = np.argmax(np.where(candidates, rng.random(board.shape), -1.0), axis=1)
+
+    rows, team, choice, landed_at = rows[possible], team[possible], choice[possible], landed_at[possible]
+    partner_position = positions[rows, choice]
+    positions[rows, choice] = landed_at
+    positions[rows, team] = partner_position
+    swaps['count'] += int(rows.size)
+    swaps['gains'].append(partner_position - landed_at)
+
+
+def simulate_reference(rules: engine.FieldRules, teams: int, games: int, bonus_dice: Dict[int, int],
+                       policy: str = 'random', seed: Optional[int] = None,
+                       max_rounds: int = DEFAULT_MAX_ROUNDS) -> dict:
+    """Gegenprobe: dieselben Spiele Wurf für Wurf über `engine.roll` (langsam)."""
+    rng = random.Random(seed)
+    bonus_by_place = _bonus_by_place(policy, bonus_dice, teams)
+    rounds, wins = [], [0] * teams
+
+    for _ in range(games):
+        state = engine.GameState(list(range(teams)), [0] * teams)
+        finished = False
+        for round_number in range(1, max_rounds + 1):
+            order = list(range(teams))
+            if policy != 'fixed':
+                rng.shuffle(order)
+            for place, team in enumerate(order):
+                state.bonus_sides[team] = bonus_by_place[place]
+                result = engine.roll(state, rules, team, rng)
+                if result.victory_triggered:
+                    rounds.append(round_number)
+                    wins[team] += 1
+                    finished = True
+                    break
+            if finished:
+                break
+
+    finished_count = len(rounds)
+    return {
+        'games': games,
+        'finished': finished_count,
+        'rounds': _percentiles(np.array(rounds, dtype=np.int32)),
+        'win_rate_by_team': [count / max(finished_count, 1) for count in wins],
+    }
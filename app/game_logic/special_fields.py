@@ -3,15 +3,19 @@ Sonderfeld-Logik für Wii Party Clone - Erweitert mit konfigurierbaren Feld-Häu
 Enthält alle Funktionen für die verschiedenen Sonderfelder basierend auf FieldConfiguration
 Mit intelligentem Konflikt-Auflösungs-Algorithmus
 """
-import random
 import json
 import os
 from flask import current_app
 from app.models import db, GameEvent, FieldConfiguration
+from app.services.response_cache import bump_version, game_keys_with_version, FIELD_CONFIG
+from app.services.game_rng import get_layout_rng, get_session_rng
+from app.services.game_scope import current_game_key, default_game_key
+from app.services.player_rotation import RotationLedger
+from app.game_logic.engine import FieldRules, barrier_released, fallback_barrier_config, parse_barrier_config
+from app.game_logic.field_placement import FieldSpec, FreeSlots, MAX_REDISTRIBUTION_DISTANCE, place_fields
 
-# Cache für berechnete Feld-Verteilung
-_field_distribution_cache = None
-_cache_max_fields = None
+# Cache für berechnete Feld-Verteilungen je Spiel: game_key -> ((Felder, Layout-Seed), Verteilung)
+_field_distribution_cache = {}
 
 
 def handle_catapult_forward(team, current_position, game_session, dice_info=None):
@@ -27,7 +31,7 @@ def handle_catapult_forward(team, current_position, game_session, dice_info=None
     max_distance = config_data.get('max_distance', 5)
     
     max_board_fields = current_app.config.get('MAX_BOARD_FIELDS', 72)
-    catapult_distance = random.randint(min_distance, max_distance)
+    catapult_distance = get_session_rng(game_session).randint(min_distance, max_distance)
     
     # Katapult-Positionen (vor und nach Katapult)
     catapult_old_position = current_position
@@ -85,7 +89,7 @@ def handle_catapult_backward(team, current_position, game_session, dice_info=Non
     min_distance = config_data.get('min_distance', 4)
     max_distance = config_data.get('max_distance', 10)
     
-    catapult_distance = random.randint(min_distance, max_distance)
+    catapult_distance = get_session_rng(game_session).randint(min_distance, max_distance)
     
     # Katapult-Positionen (vor und nach Katapult)
     catapult_old_position = current_position
@@ -162,7 +166,7 @@ def handle_player_swap(current_team, all_teams, game_session, dice_info=None):
         }
     
     # Wähle zufälliges Team zum Tauschen
-    swap_team = random.choice(other_teams)
+    swap_team = get_session_rng(game_session).choice(other_teams)
     
     # Tausche Positionen
     old_current_position = current_team.current_position
@@ -311,21 +315,9 @@ def check_barrier_release(team, dice_roll, game_session, bonus_roll=0):
             barrier_config = json.loads(blocked_config_data)
         else:
             # Fallback for old data
-            barrier_config = {
-                'mode': 'minimum',
-                'numbers': list(range(team.blocked_target_number, 7)),
-                'min_number': team.blocked_target_number,
-                'display_text': f"Würfle mindestens eine {team.blocked_target_number}!"
-            }
+            barrier_config = fallback_barrier_config(team.blocked_target_number)
     except (json.JSONDecodeError, AttributeError):
-        # Fallback
-        target_number = team.blocked_target_number or 6
-        barrier_config = {
-            'mode': 'minimum',
-            'numbers': list(range(target_number, 7)),
-            'min_number': target_number,
-            'display_text': f"Würfle mindestens eine {target_number}!"
-        }
+        barrier_config = fallback_barrier_config(team.blocked_target_number)
     
     current_app.logger.info(f"[BARRIER] Team {team.name} Konfiguration: {barrier_config}")
     
@@ -401,7 +393,31 @@ def check_barrier_release(team, dice_roll, game_session, bonus_roll=0):
         }
 
 
-def calculate_smart_field_distribution(max_fields=73):
+def get_board_size():
+    """
+    Anzahl Felder des Spielbretts inkl. Start und Ziel (0..MAX_BOARD_FIELDS)
+    """
+    return current_app.config.get('MAX_BOARD_FIELDS', 72) + 1
+
+
+def get_field_specs(field_configs=None):
+    """
+    Aktivierte Feld-Konfigurationen als `FieldSpec` (eine Abfrage, JSON nur einmal geparst)
+    """
+    if field_configs is None:
+        field_configs = FieldConfiguration.get_all_enabled()
+    return [
+        FieldSpec(
+            field_type=config.field_type,
+            frequency_type=config.frequency_type,
+            frequency_value=config.frequency_value or 0,
+            positions=config.config_dict.get('positions', []) if config.frequency_type == 'fixed_positions' else (),
+        )
+        for config in field_configs
+    ]
+
+
+def calculate_smart_field_distribution(max_fields=None, rng=None):
     """
     Intelligenter Algorithmus zur konfliktfreien Feld-Verteilung
     
@@ -409,115 +425,22 @@ def calculate_smart_field_distribution(max_fields=73):
     2. Erkennt Konflikte (mehrere Feld-Typen für eine Position)
     3. Löst Konflikte durch gewichtete Zufallsauswahl oder Umverteilung auf
     4. Gibt eine konfliktfreie Zuordnung zurück: {position: field_type}
-    """
-    # Lade alle aktivierten Konfigurationen
-    field_configs = FieldConfiguration.get_all_enabled()
     
-    # Sammle gewünschte Positionen für jeden Feld-Typ
-    desired_positions = {}
+    Die Platzierung selbst liegt in `field_placement.place_fields`; hier werden
+    nur die Konfigurationen einmal geladen. `max_fields` ist standardmäßig die
+    Brettgröße aus `MAX_BOARD_FIELDS`.
     
-    for config in field_configs:
-        field_type = config.field_type
-        positions = []
-        
-        # Spezielle Behandlung für Start und Ziel
-        if field_type == 'start':
-            positions = [0]
-        elif field_type == 'goal':
-            positions = [max_fields - 1]
-        elif field_type == 'normal':
-            # Normale Felder werden später als Fallback zugewiesen
-            continue
-        elif config.frequency_type == 'modulo' and config.frequency_value > 0:
-            # Modulo-basierte Felder - erweiterte Logik für bessere Verteilung
-            for pos in range(1, max_fields - 1):  # Nicht Start oder Ziel
-                # Erweiterte Modulo-Logik: Verteile Felder in regelmäßigen Abständen
-                # aber berücksichtige auch Offset-Positionen für bessere Abdeckung
-                if (pos % config.frequency_value == 0 or 
-                    (pos + config.frequency_value // 2) % config.frequency_value == 0):
-                    positions.append(pos)
-        elif config.frequency_type == 'fixed_positions':
-            # Fest definierte Positionen
-            fixed_positions = config.config_dict.get('positions', [])
-            positions = [pos for pos in fixed_positions if 0 <= pos < max_fields]
-        elif config.frequency_type == 'probability':
-            # Wahrscheinlichkeitsbasierte Verteilung
-            probability = config.frequency_value / 100.0
-            for pos in range(1, max_fields - 1):  # Nicht Start oder Ziel
-                if random.random() < probability:
-                    positions.append(pos)
-        
-        if positions:
-            desired_positions[field_type] = positions
-    
-    # Erkenne Konflikte
-    position_conflicts = {}
-    for field_type, positions in desired_positions.items():
-        for pos in positions:
-            if pos not in position_conflicts:
-                position_conflicts[pos] = []
-            position_conflicts[pos].append(field_type)
-    
-    # Erstelle finale Zuordnung
-    final_assignment = {}
-    conflict_resolution_stats = {
-        'total_conflicts': 0,
-        'resolved_randomly': 0,
-        'redistributed': 0
-    }
+    Zufall kommt aus `rng` (Standard: Layout-Strom der aktiven Sitzung), so
+    dass dieselbe Konfiguration in derselben Sitzung dasselbe Brett ergibt.
+    """
+    if max_fields is None:
+        max_fields = get_board_size()
+    if rng is None:
+        from app.services.session_service import get_active_session
+        rng = get_layout_rng(get_active_session())
     
-    for position, field_types in position_conflicts.items():
-        if len(field_types) == 1:
-            # Kein Konflikt
-            final_assignment[position] = field_types[0]
-        else:
-            # Konflikt gefunden
-            conflict_resolution_stats['total_conflicts'] += 1
-            
-            # Gewichtete Zufallsauswahl basierend auf Prioritäten
-            field_priorities = {}
-            for field_type in field_types:
-                config = FieldConfiguration.get_config_for_field(field_type)
-                if config:
-                    # Niedrigere frequency_value = höhere Priorität (seltener = wichtiger)
-                    priority = 1000 / max(config.frequency_value, 1) if config.frequency_value else 1
-                    field_priorities[field_type] = priority
-                else:
-                    field_priorities[field_type] = 1
-            
-            # Gewichtete Zufallsauswahl
-            total_weight = sum(field_priorities.values())
-            if total_weight > 0:
-                rand_value = random.random() * total_weight
-                cumulative_weight = 0
-                chosen_field = field_types[0]  # Fallback
-                
-                for field_type, weight in field_priorities.items():
-                    cumulative_weight += weight
-                    if rand_value <= cumulative_weight:
-                        chosen_field = field_type
-                        break
-                
-                final_assignment[position] = chosen_field
-                conflict_resolution_stats['resolved_randomly'] += 1
-    
-    # Umverteilung: Versuche überzählige Felder auf benachbarte Positionen zu verteilen
-    for field_type, desired_pos_list in desired_positions.items():
-        assigned_count = sum(1 for pos, assigned_type in final_assignment.items() if assigned_type == field_type)
-        missing_count = len(desired_pos_list) - assigned_count
-        
-        if missing_count > 0:
-            # Finde alternative Positionen in der Nähe
-            for _ in range(missing_count):
-                alternative_pos = find_alternative_position(final_assignment, desired_pos_list, max_fields)
-                if alternative_pos is not None:
-                    final_assignment[alternative_pos] = field_type
-                    conflict_resolution_stats['redistributed'] += 1
-    
-    # Fülle verbleibende Positionen mit 'normal'
-    for position in range(max_fields):
-        if position not in final_assignment:
-            final_assignment[position] = 'normal'
+    conflict_resolution_stats = {}
+    final_assignment = place_fields(get_field_specs(), max_fields, rng, conflict_resolution_stats)
     
     # Debug-Info ausgeben (optional)
     if current_app and current_app.config.get('DEBUG_SPECIAL_FIELDS'):
@@ -531,142 +454,50 @@ def calculate_smart_field_distribution(max_fields=73):
 def find_alternative_position(final_assignment, preferred_positions, max_fields):
     """
     Findet eine alternative Position für ein Feld in der Nähe der bevorzugten Positionen
+    (Einzelabfrage; die Verteilung selbst nutzt `FreeSlots` ohne Rescan)
     """
-    # Suche in der Nähe der bevorzugten Positionen
+    free = FreeSlots(max_fields, 1, max_fields - 2)
+    for position in final_assignment:
+        if 0 <= position < max_fields:
+            free.occupy(position)
+    
     for preferred_pos in preferred_positions:
-        # Suche in zunehmendem Abstand um die bevorzugte Position
-        for distance in range(1, 10):  # Maximal 10 Felder Abstand
-            for direction in [-1, 1]:  # Links und rechts
-                alt_pos = preferred_pos + (direction * distance)
-                
-                # Prüfe ob Position gültig und verfügbar ist
-                if (0 < alt_pos < max_fields - 1 and  # Nicht Start oder Ziel
-                    alt_pos not in final_assignment):
-                    return alt_pos
+        alternative = free.nearest_free(preferred_pos, MAX_REDISTRIBUTION_DISTANCE)
+        if alternative is not None:
+            return alternative
     
     # Fallback: Suche irgendeine freie Position
-    for position in range(1, max_fields - 1):
-        if position not in final_assignment:
-            return position
-    
-    return None
+    return free.next_free(1)
 
 
-def _parse_barrier_config(target_numbers):
-    """
-    Parst die target_numbers Konfiguration und bestimmt den Modus
-    
-    Args:
-        target_numbers: Liste oder String mit Ziel-Zahlen
-        
-    Returns:
-        dict: Parsed configuration with mode, numbers, display_text
-    """
-    if isinstance(target_numbers, str):
-        target_str = target_numbers.strip()
-    elif isinstance(target_numbers, list):
-        # Convert list to string for parsing
-        target_str = ','.join(str(x) for x in target_numbers)
-    else:
-        target_str = "4,5,6"  # Default
-    
-    # Check for maximum mode (starts with -)
-    if target_str.startswith('-'):
-        try:
-            max_number = int(target_str[1:])
-            max_number = min(max(max_number, 1), 6)  # Clamp between 1 and 6
-            return {
-                'mode': 'maximum',
-                'numbers': list(range(1, max_number + 1)),  # 1 to max_number
-                'max_number': max_number,
-                'min_number': 1,
-                'display_text': f"Würfle höchstens eine {max_number}!"
-            }
-        except ValueError:
-            pass  # Fall through to other modes
-    
-    # Check for minimum mode (ends with +)
-    if target_str.endswith('+'):
-        try:
-            min_number = int(target_str[:-1])
-            min_number = min(max(min_number, 1), 6)  # Clamp between 1 and 6
-            return {
-                'mode': 'minimum',
-                'numbers': list(range(min_number, 7)),  # min_number to 6
-                'min_number': min_number,
-                'display_text': f"Würfle mindestens eine {min_number}!"
-            }
-        except ValueError:
-            pass  # Fall through to exact mode
-    
-    # Exact numbers mode
-    try:
-        numbers = [int(x.strip()) for x in target_str.split(',') if x.strip()]
-        numbers = [n for n in numbers if 1 <= n <= 6]  # Filter valid dice numbers
-        if not numbers:
-            numbers = [4, 5, 6]  # Default
-            
-        # Sort numbers for consistent display
-        numbers = sorted(numbers)
-        
-        if len(numbers) == 1:
-            display_text = f"Würfle eine {numbers[0]}!"
-        elif len(numbers) == 2:
-            display_text = f"Würfle eine {numbers[0]} oder {numbers[1]}!"
-        else:
-            display_text = f"Würfle eine {', '.join(str(n) for n in numbers[:-1])} oder {numbers[-1]}!"
-            
-        return {
-            'mode': 'exact',
-            'numbers': numbers,
-            'min_number': min(numbers),
-            'display_text': display_text
-        }
-    except ValueError:
-        # Fallback
-        return {
-            'mode': 'exact',
-            'numbers': [4, 5, 6],
-            'min_number': 4,
-            'display_text': "Würfle eine 4, 5 oder 6!"
-        }
+# Reine Sperren-Logik liegt in der Engine; alte Namen bleiben für bestehende Importe
+_parse_barrier_config = parse_barrier_config
+_check_barrier_dice_roll = barrier_released
 
-def _check_barrier_dice_roll(dice_roll, barrier_config):
-    """
-    Prüft ob ein Würfelwurf die Barrier-Bedingung erfüllt
-    
-    Args:
-        dice_roll: Die gewürfelte Zahl (kann durch Bonus-Würfel über 6 sein)
-        barrier_config: Die Barrier-Konfiguration
-        
-    Returns:
-        bool: True wenn befreit, False wenn noch blockiert
-    """
-    mode = barrier_config.get('mode', 'exact')
-    
-    if mode == 'minimum':
-        # Bei 4+ bedeutet: würfle mindestens 4 (auch 7, 8, 9, etc. mit Bonus)
-        min_number = barrier_config.get('min_number', 4)
-        return dice_roll >= min_number
-    elif mode == 'maximum':
-        # Bei -3 bedeutet: würfle höchstens 3
-        max_number = barrier_config.get('max_number', 3)
-        return dice_roll <= max_number
-    else:
-        # Exakte Zahlen: muss in der Liste sein
-        return dice_roll in barrier_config['numbers']
 
-def clear_field_distribution_cache():
+def clear_field_distribution_cache(game_key=None):
     """
-    Löscht den Cache für die Feld-Verteilung (z.B. nach Konfigurations-Änderungen)
+    Löscht den Cache für die Feld-Verteilung eines Spiels (Standard: aktuelles Spiel),
+    z.B. nach Konfigurations-Änderungen
+    
+    Spiele ohne eigene Feld-Konfiguration nutzen die des Standardspiels; dessen
+    Änderungen verwerfen deshalb auch ihre Caches.
     """
-    global _field_distribution_cache, _cache_max_fields
-    _field_distribution_cache = None
-    _cache_max_fields = None
+    game_key = game_key or current_game_key()
+    affected = {game_key}
+    if game_key == default_game_key():
+        own_configs = {key for (key,) in db.session.query(FieldConfiguration.game_key).distinct()}
+        affected.update(key for key in set(_field_distribution_cache) | game_keys_with_version(FIELD_CONFIG)
+                        if key not in own_configs)
+    
+    for key in affected:
+        _field_distribution_cache.pop(key, None)
+        # Gecachte Feld-Antworten (Layout, Farben, Positionen) invalidieren
+        bump_version(FIELD_CONFIG, key)
     
     # Prüfe ob FieldConfiguration-Daten existieren
     try:
-        field_configs = FieldConfiguration.get_all_enabled()
+        field_configs = FieldConfiguration.in_game(game_key).filter_by(is_enabled=True).all()
         if field_configs:
             current_app.logger.info(f"Cache geleert. {len(field_configs)} Feld-Konfigurationen verfügbar.")
             
@@ -684,32 +515,51 @@ def clear_field_distribution_cache():
         current_app.logger.error(f"Fehler beim Prüfen der FieldConfiguration: {e}")
 
 
-def get_field_type_at_position(position):
+def get_field_distribution(max_fields=None):
     """
-    Bestimmt den Feldtyp basierend auf der Position unter Verwendung des intelligenten
-    Konflikt-Auflösungs-Algorithmus mit Caching für bessere Performance
+    Gecachte Feld-Verteilung {position: field_type} aus dem intelligenten
+    Konflikt-Auflösungs-Algorithmus (Standard: Brettgröße aus `MAX_BOARD_FIELDS`)
+    
+    Jedes Spiel hat sein eigenes Brett: gecacht wird je Spiel und neu
+    berechnet, wenn die aktive Sitzung (Layout-Seed) wechselt.
     """
-    global _field_distribution_cache, _cache_max_fields
+    from app.services.session_service import get_active_session
     
-    max_fields = 73  # Standard-Wert
+    board_size = get_board_size()
+    if max_fields is not None and max_fields != board_size:
+        # Vorschau anderer Brettgrößen nicht cachen, sonst wird das Spielbrett verdrängt
+        return calculate_smart_field_distribution(max_fields)
+    
+    active_session = get_active_session()
+    key = (board_size, active_session.rng_seed if active_session else None)
+    game_key = current_game_key()
+    cached = _field_distribution_cache.get(game_key)
     
     # Cache prüfen und neu berechnen falls nötig
-    if (_field_distribution_cache is None or 
-        _cache_max_fields != max_fields):
-        
-        _field_distribution_cache = calculate_smart_field_distribution(max_fields)
-        _cache_max_fields = max_fields
+    if cached is None or cached[0] != key:
+        distribution = calculate_smart_field_distribution(board_size, get_layout_rng(active_session))
+        if cached is not None:
+            # Neue Sitzung = neues Brett: gecachte Layout-Antworten dieses Spiels verwerfen
+            bump_version(FIELD_CONFIG, game_key)
+        cached = _field_distribution_cache[game_key] = (key, distribution)
         
         # DEBUG: Logge Minigame-Positionen
         try:
-            minigame_positions = [pos for pos, field_type in _field_distribution_cache.items() if field_type == 'minigame']
+            minigame_positions = [pos for pos, field_type in distribution.items() if field_type == 'minigame']
             if current_app:
-                current_app.logger.info(f"Minigame-Felder auf Positionen: {sorted(minigame_positions)}")
+                current_app.logger.info(f"Minigame-Felder auf Positionen ({game_key}): {sorted(minigame_positions)}")
         except:
             pass
     
-    # Position aus Cache zurückgeben
-    field_type = _field_distribution_cache.get(position, 'normal')
+    return cached[1]
+
+
+def get_field_type_at_position(position):
+    """
+    Bestimmt den Feldtyp basierend auf der Position unter Verwendung des intelligenten
+    Konflikt-Auflösungs-Algorithmus mit Caching für bessere Performance
+    """
+    field_type = get_field_distribution().get(position, 'normal')
     
     # DEBUG: Logge wenn Minigame-Feld erkannt wird
     if field_type == 'minigame':
@@ -722,6 +572,32 @@ def get_field_type_at_position(position):
     return field_type
 
 
+def get_field_rules(max_board_fields=None):
+    """
+    Feld-Regeln für die Spiel-Engine: Verteilung und Parameter der aktivierten Sonderfelder
+    """
+    if max_board_fields is None:
+        max_board_fields = get_board_size() - 1
+    
+    def enabled_config(field_type):
+        config = FieldConfiguration.get_config_for_field(field_type)
+        return config.config_dict if config and config.is_enabled else None
+    
+    forward = enabled_config('catapult_forward')
+    backward = enabled_config('catapult_backward')
+    swap = enabled_config('player_swap')
+    barrier = enabled_config('barrier')
+    
+    return FieldRules(
+        field_types=get_field_distribution(max_board_fields + 1),
+        max_field=max_board_fields,
+        catapult_forward=(forward.get('min_distance', 3), forward.get('max_distance', 5)) if forward is not None else None,
+        catapult_backward=(backward.get('min_distance', 4), backward.get('max_distance', 10)) if backward is not None else None,
+        swap_min_distance=swap.get('min_distance', 3) if swap is not None else None,
+        barrier_config=parse_barrier_config(barrier.get('target_numbers', [4, 5, 6])) if barrier is not None else None,
+    )
+
+
 def get_field_config_for_position(position):
     """
     Gibt die FieldConfiguration für eine bestimmte Position zurück
@@ -880,6 +756,9 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
         # Spieler auslosen basierend auf player_count
         selected_players_data = {}
         player_count = selected_minigame.get('player_count', 1)
+        # Rotations-Zähler der beteiligten Teams einmal laden, Einsätze am Ende gesammelt schreiben
+        rotation = RotationLedger(game_session, [team_id for team_id in (
+            game_session.field_minigame_landing_team_id, game_session.field_minigame_opponent_team_id) if team_id])
         
         # Hole die beteiligten Teams
         from app.models import Team
@@ -894,16 +773,16 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(landing_team.id), selectable_players, player_count)
+                        selected_players = rotation.select(landing_team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     else:
                         selected_players = selectable_players  # Alle Spieler wenn weniger als benötigt
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(landing_team.id), selected_players)
+                        rotation.record(landing_team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
                     current_app.logger.info(f"[DEBUG] Processing {len(selected_players)} players for team {landing_team.name}")
@@ -935,16 +814,16 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(opponent_team.id), selectable_players, player_count)
+                        selected_players = rotation.select(opponent_team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     else:
                         selected_players = selectable_players
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(opponent_team.id), selected_players)
+                        rotation.record(opponent_team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
                     player_data_list = []
@@ -964,9 +843,10 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
         elif game_session.field_minigame_mode == 'team_vs_all':
             # Hole alle Teams außer dem landenden Team
             from app.models import GameSession
-            all_teams = Team.query.filter(
+            all_teams = Team.in_game().filter(
                 Team.id != game_session.field_minigame_landing_team_id
             ).all()
+            rotation.load(team.id for team in all_teams)
             
             for team in all_teams:
                 selectable_players = team.get_selectable_players()
@@ -975,16 +855,16 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                         # Ganzes Team
                         selected_players = selectable_players
                         # Tracking für alle Spieler aktualisieren
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     elif len(selectable_players) >= player_count:
                         # Faire Rotation verwenden statt zufälliger Auswahl
-                        selected_players = game_session._select_fair_rotation(str(team.id), selectable_players, player_count)
+                        selected_players = rotation.select(team.id, selectable_players, player_count)
                         # Tracking aktualisieren
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     else:
                         selected_players = selectable_players
                         # Tracking für alle verfügbaren Spieler
-                        game_session._update_player_rotation_tracking(str(team.id), selected_players)
+                        rotation.record(team.id, selected_players)
                     
                     # Erweitere Spielerdaten um alle nötigen Informationen für die Anzeige
                     player_data_list = []
@@ -1000,6 +880,8 @@ def start_selected_field_minigame(game_session, selected_minigame_id, selected_m
                     
                     selected_players_data[team.name] = player_data_list
         
+        rotation.flush()
+        
         # Speichere die ausgelosten Spieler in der Session als JSON
         game_session.field_minigame_selected_players = json.dumps(selected_players_data)
         
@@ -1165,16 +1047,12 @@ def handle_special_field_action(team, all_teams, game_session, dice_info=None):
 
 
 
-def get_all_special_field_positions(max_fields=73):
+def get_all_special_field_positions(max_fields=None):
     """
     Gibt alle Positionen der Sonderfelder zurück basierend auf der intelligenten
     Feld-Verteilung (verwendet den Cache)
     """
-    # Verwende die gecachte Verteilung
-    field_distribution = _field_distribution_cache
-    if field_distribution is None:
-        # Cache ist leer, berechne neu
-        field_distribution = calculate_smart_field_distribution(max_fields)
+    field_distribution = get_field_distribution(max_fields)
     
     special_positions = {}
     
@@ -1196,16 +1074,14 @@ def get_field_statistics():
     Gibt Statistiken über die aktuellen Feld-Konfigurationen zurück
     Verwendet die intelligente Feld-Verteilung
     """
-    field_configs = FieldConfiguration.query.all()
+    field_configs = FieldConfiguration.in_game().all()
     
     enabled_count = sum(1 for config in field_configs if config.is_enabled)
     disabled_count = len(field_configs) - enabled_count
     
     # Verwende die intelligente Feld-Verteilung
-    total_fields = 73
-    field_distribution = _field_distribution_cache
-    if field_distribution is None:
-        field_distribution = calculate_smart_field_distribution(total_fields)
+    total_fields = get_board_size()
+    field_distribution = get_field_distribution(total_fields)
     
     # Zähle Felder pro Typ
     field_counts = {}
@@ -1283,7 +1159,7 @@ def regenerate_field_distribution():
     (z.B. nach Konfigurations-Änderungen im Admin-Interface)
     """
     clear_field_distribution_cache()
-    return calculate_smart_field_distribution(73)
+    return calculate_smart_field_distribution()
 
 
 def force_field_cache_refresh():
@@ -1292,13 +1168,12 @@ def force_field_cache_refresh():
     """
     clear_field_distribution_cache()
     
-    # Erzwinge Neuberechnung durch Aufruf von get_field_type_at_position
-    get_field_type_at_position(1)  # Trigger cache rebuild
+    # Erzwinge Neuberechnung für das aktuelle Spiel
+    distribution = get_field_distribution()
     
-    global _field_distribution_cache
-    if _field_distribution_cache:
+    if distribution:
         # Zeige Minigame-Positionen
-        minigame_positions = [pos for pos, field_type in _field_distribution_cache.items() if field_type == 'minigame']
+        minigame_positions = [pos for pos, field_type in distribution.items() if field_type == 'minigame']
         if current_app:
             current_app.logger.info(f"Cache erneuert. Minigame-Felder: {sorted(minigame_positions)}")
         return sorted(minigame_positions)
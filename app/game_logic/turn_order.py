@@ -0,0 +1,91 @@
+"""
+Würfelreihenfolge einer Runde als strukturierte Komponente.
+
+`GameSession.dice_roll_order` bleibt als Speicherform ("3,1,2") erhalten
+(Export/Import, Team-Löschung), wird aber nur noch einmal pro Wert in eine
+`TurnOrder` geparst (`GameSession.turn_order`). Zusammen mit dem gespeicherten
+Index (`GameSession.turn_index`) liefert sie in O(1):
+
+- `current`: Team am Zug (None = Runde abgeschlossen),
+- `position(team_id)`: Platz eines Teams in der Reihenfolge,
+- `peek_next()` / `advance()`: nächstes Team, optional mit `skip`-Prädikat
+  für Teams, die nicht mehr würfeln können (z.B. gelöschte Teams).
+
+Blockierte Teams werden NICHT übersprungen - sie würfeln, um sich von der
+Sperre zu befreien.
+"""
+
+from typing import Callable, Iterator, Optional, Sequence
+
+SkipPredicate = Optional[Callable[[int], bool]]
+
+
+class TurnOrder:
+    """Geordnete Team-IDs einer Würfelrunde mit Index des Teams am Zug."""
+
+    __slots__ = ('team_ids', 'index', '_positions')
+
+    def __init__(self, team_ids: Sequence[int] = (), index: int = 0):
+        self.team_ids = tuple(team_ids)
+        self._positions = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        self.index = index
+
+    @classmethod
+    def parse(cls, value: Optional[str], index: int = 0) -> 'TurnOrder':
+        """Liest die Speicherform "3,1,2" (ungültige Einträge werden ignoriert)."""
+        if not value:
+            return cls((), index)
+        return cls([int(part) for part in value.split(',') if part.strip().isdigit()], index)
+
+    def serialize(self) -> str:
+        return ','.join(str(team_id) for team_id in self.team_ids)
+
+    def __len__(self) -> int:
+        return len(self.team_ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.team_ids)
+
+    def __contains__(self, team_id) -> bool:
+        return team_id in self._positions
+
+    def position(self, team_id) -> Optional[int]:
+        return self._positions.get(team_id)
+
+    @property
+    def current(self) -> Optional[int]:
+        if 0 <= self.index < len(self.team_ids):
+            return self.team_ids[self.index]
+        return None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.index >= len(self.team_ids)
+
+    def _next_index(self, skip: SkipPredicate = None) -> int:
+        index = self.index + 1
+        while index < len(self.team_ids) and skip is not None and skip(self.team_ids[index]):
+            index += 1
+        return index
+
+    def peek_next(self, skip: SkipPredicate = None) -> Optional[int]:
+        """Team nach dem aktuellen (None = das aktuelle ist das letzte der Runde)."""
+        index = self._next_index(skip)
+        return self.team_ids[index] if index < len(self.team_ids) else None
+
+    def advance(self, skip: SkipPredicate = None) -> Optional[int]:
+        """Gibt den Zug weiter und liefert das neue Team am Zug (None = Runde vorbei)."""
+        self.index = min(self._next_index(skip), len(self.team_ids))
+        return self.current
+
+    def without(self, team_id: int) -> 'TurnOrder':
+        """Kopie ohne `team_id`; das Team am Zug bleibt am Zug."""
+        current = self.current
+        remaining = [other for other in self.team_ids if other != team_id]
+        order = TurnOrder(remaining, len(remaining))
+        if current is not None and current != team_id:
+            order.index = order.position(current)
+        elif current == team_id:
+            # Das gelöschte Team war am Zug: sein Nachfolger rückt auf
+            order.index = self.index
+        return order
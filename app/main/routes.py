@@ -7,41 +7,28 @@ import traceback # Für detaillierte Fehlermeldungen
 from flask_login import current_user
 from datetime import datetime, timedelta
 import json
+import os
 from app.services.session_service import get_active_session, get_active_session_events
+from app.services.response_cache import cached_response, FIELD_CONFIG
+from app.services.avatar_manifest import AVATARS, get_avatar_manifest, get_consistent_emoji_for_player
+from app.services.profile_images import (ALLOWED_UPLOAD_FORMATS, process_base64_image, process_image_file,
+                                         remove_legacy_image, spool_upload)
+from app.services.image_jobs import ImageQueueFullError, get_image_job, submit_image_job
+from app.services.face_atlas import get_face_atlas
+from app.services.media_files import send_media
+from app.services.board_bootstrap import serialize_question
+from app.services.sparse_fields import FieldSelection
 
 
-def get_consistent_emoji_for_player(player_name):
-    """
-    Generiert ein deterministisches Emoji für einen Spieler basierend auf seinem Namen.
-    Verwendet die gleiche Hashing-Logik wie das JavaScript Frontend.
-    """
-    available_emojis = [
-        "😀", "😃", "😄", "😁", "😆", "😅", "🤣", "😂", "🙂", "🙃", 
-        "😉", "😊", "😇", "🥰", "😍", "🤩", "😘", "😗", "😚", "😙",
-        "😋", "😛", "😜", "🤪", "😝", "🤑", "🤗", "🤭", "🤫", "🤔",
-        "🤓", "😎", "🤡", "🥳", "😏", "😒", "😞", "😔", "😟", "😕",
-        "🙁", "☹️", "😣", "😖", "😫", "😩", "🥺", "😢", "😭", "😤",
-        "😠", "😡", "🤬", "🤯", "😳", "🥵", "🥶", "😱", "😨", "😰"
-    ]
-    
-    # Verwende die gleiche Hash-Funktion wie JavaScript
-    hash_value = 0
-    for char in player_name:
-        char_code = ord(char)
-        hash_value = ((hash_value << 5) - hash_value) + char_code
-        hash_value = hash_value & 0xFFFFFFFF  # Convert to 32bit integer (JavaScript behavior)
-        if hash_value > 0x7FFFFFFF:  # Handle negative values like JavaScript does
-            hash_value -= 0x100000000
-    
-    return available_emojis[abs(hash_value) % len(available_emojis)]
-
 @main_bp.route('/')
 def index():
     return render_template('index.html')
 
 @main_bp.route('/board')
 def game_board():
-    teams = Team.query.order_by(Team.name).all()
+    from app.game_logic.special_fields import get_board_size
+
+    teams = Team.in_game().order_by(Team.name).all()
     
     # Prüfe ob Teams angemeldet sind - wenn nicht, zur Welcome-Seite weiterleiten
     if len(teams) == 0:
@@ -61,13 +48,15 @@ def game_board():
                            is_admin=is_admin,
                            team_colors=team_colors,
                            active_session=active_session,
-                           minigame_folder_name=minigame_folder_name)
+                           minigame_folder_name=minigame_folder_name,
+                           board_size=get_board_size())
 
 @main_bp.route('/api/board-status')
 def board_status():
-    """API für Spielstatus-Updates via AJAX mit verbesserter Fehlerbehandlung und Sonderfeld-Unterstützung"""
+    """API für Spielstatus-Updates via AJAX mit verbesserter Fehlerbehandlung und Sonderfeld-Unterstützung (?fields=, ?encoding=compact)"""
     try:
-        teams_query = Team.query.order_by(Team.id).all() # Reihenfolge nach ID für Konsistenz
+        selection = FieldSelection.from_request()
+        teams_query = Team.in_game().order_by(Team.id).all() # Reihenfolge nach ID für Konsistenz
         active_session = get_active_session()
 
         team_data = []
@@ -98,14 +87,7 @@ def board_status():
         game_session_data = None
         current_team_id = None  # Initialize current_team_id before use
         if active_session:
-            dice_order_ids = []
-            if active_session.dice_roll_order:
-                try:
-                    # Stellt sicher, dass nur gültige Integer-IDs in der Liste landen
-                    dice_order_ids = [int(tid_str) for tid_str in active_session.dice_roll_order.split(',') if tid_str.strip().isdigit()]
-                except ValueError:
-                    current_app.logger.error(f"Ungültige dice_roll_order: {active_session.dice_roll_order}")
-                    dice_order_ids = [] # Im Fehlerfall leere Liste
+            dice_order_ids = list(active_session.turn_order)
 
             # Sicherstellen, dass current_team_turn_id ein Integer ist oder None
             current_team_id = active_session.current_team_turn_id
@@ -144,7 +126,7 @@ def board_status():
         
         last_dice_event = None
         last_special_event = None
-        if active_session:
+        if active_session and selection.wants('last_dice_result'):
             # Find the most recent dice roll from any team
             last_dice_event = GameEvent.query.filter_by(
                 game_session_id=active_session.id
@@ -153,6 +135,7 @@ def board_status():
                 GameEvent.timestamp >= recent_time
             ).order_by(GameEvent.timestamp.desc()).first()
 
+        if active_session and selection.wants('last_special_field_event'):
             # Find the most recent special field event (catapult, barrier, swap, field minigames)
             last_special_event = GameEvent.query.filter_by(
                 game_session_id=active_session.id
@@ -218,6 +201,7 @@ def board_status():
         # Get question data if question is active
         question_data = None
         if (active_session and 
+            selection.wants('question_data') and
             active_session.current_phase == 'QUESTION_ACTIVE' and 
             active_session.current_question_id):
             
@@ -275,22 +259,23 @@ def board_status():
             response_data["question_data"] = question_data
         
         # Add field update timestamp for live updates
-        last_field_update_ts = 0
-        field_events = get_active_session_events(
-            since_id=None,
-            limit=1,
-            event_types=['field_update'],
-        )
-        if field_events:
-            raw_ts = field_events[-1].get("timestamp")
-            if raw_ts:
-                try:
-                    last_field_update_ts = datetime.fromisoformat(raw_ts).timestamp()
-                except ValueError:
-                    last_field_update_ts = 0
-        response_data["last_field_update"] = last_field_update_ts
+        if selection.wants('last_field_update'):
+            last_field_update_ts = 0
+            field_events = get_active_session_events(
+                since_id=None,
+                limit=1,
+                event_types=['field_update'],
+            )
+            if field_events:
+                raw_ts = field_events[-1].get("timestamp")
+                if raw_ts:
+                    try:
+                        last_field_update_ts = datetime.fromisoformat(raw_ts).timestamp()
+                    except ValueError:
+                        last_field_update_ts = 0
+            response_data["last_field_update"] = last_field_update_ts
             
-        return jsonify(response_data)
+        return jsonify(selection.apply(response_data))
 
     except Exception as e:
         current_app.logger.error(f"Schwerer Fehler in /api/board-status: {e}")
@@ -337,36 +322,12 @@ def question_status_for_gameboard():
         if not question_data:
             return jsonify({'question_active': False, 'message': 'Frage nicht gefunden'})
         
-        # Try different field names for question text
-        question_text = (question_data.get('question_text') or   # <-- Das war's!
-                        question_data.get('question') or 
-                        question_data.get('text') or 
-                        question_data.get('content') or 
-                        question_data.get('description') or '')
-        
-        # Get question title/name
-        question_title = (question_data.get('name') or           # <-- Und das!
-                         question_data.get('title') or
-                         'Aktuelle Frage')
+        # Feldnamen der Fragedateien vereinheitlichen (gleiche Logik wie im Board-Bootstrap)
+        payload = serialize_question(active_session.current_question_id, question_data)
+        current_app.logger.info(f"[QUESTION BANNER] Processed - text: '{payload['question']['text']}', answers: {payload['answers']}")
         
-        # Try different field names for answers
-        answers = (question_data.get('options') or 
-                  question_data.get('answers') or 
-                  question_data.get('choices') or [])
-        
-        current_app.logger.info(f"[QUESTION BANNER] Processed - text: '{question_text}', answers: {answers}")
-        
-        return jsonify({
-            'question_active': True,
-            'question': {
-                'id': active_session.current_question_id,
-                'title': question_title,
-                'text': question_text,
-                'type': question_data.get('question_type', 'multiple_choice')
-            },
-            'answers': answers,
-            'debug_raw_data': question_data  # Temporary debug field
-        })
+        payload['debug_raw_data'] = question_data  # Temporary debug field
+        return jsonify(payload)
         
     except Exception as e:
         current_app.logger.error(f"Error in question_status_for_gameboard: {e}")
@@ -419,110 +380,24 @@ def roll_dice_action_admin_only():
         if not team_id_from_request:
             return jsonify({"success": False, "error": "Team-ID fehlt."}), 400
 
-        active_session = get_active_session()
-        if not active_session:
-            return jsonify({"success": False, "error": "Keine aktive Spielsitzung."}), 404
-
-        if active_session.current_phase != 'DICE_ROLLING':
-            return jsonify({"success": False, "error": "Es ist nicht die Würfelphase."}), 403
-        
-        # Admin kann für jedes Team würfeln, nicht nur für das aktuelle
-        if active_session.current_team_turn_id != team_id_from_request:
-            current_turn_team_obj = Team.query.get(active_session.current_team_turn_id)
-            return jsonify({"success": False, "error": f"Nicht Zug von Team-ID {team_id_from_request}. {current_turn_team_obj.name if current_turn_team_obj else 'Unbekanntes Team'} (ID: {active_session.current_team_turn_id}) ist dran."}), 403
-
-        team = Team.query.get(team_id_from_request)
-        if not team:
-            return jsonify({"success": False, "error": "Anfragendes Team nicht gefunden."}), 404
-
-        # SONDERFELD: Importiere Sonderfeld-Funktionen falls verfügbar
+        # Gleiche Würfel-Pipeline wie Admin- und Team-Wurf (ein Commit)
+        from app.services.roll_pipeline import RollRejected, execute_roll
         try:
-            from app.game_logic.special_fields import (
-                handle_special_field_action, 
-                check_barrier_release, 
-                get_field_type_at_position
-            )
-            special_fields_available = True
-        except ImportError:
-            current_app.logger.warning("Sonderfeld-Module nicht verfügbar - Legacy-Modus")
-            special_fields_available = False
-
-        # Dice-/Bewegungs-/Eventlogik über Service ausführen
-        from app.services.dice_service import admin_roll_for_team
-        roll_result = admin_roll_for_team(active_session, team)
+            outcome = execute_roll('admin_legacy_route', team_id=team_id_from_request)
+        except RollRejected as rejected:
+            return jsonify({"success": False, "error": rejected.message}), rejected.status
+
+        team = outcome["team"]
+        active_session = outcome["session"]
+        roll_result = outcome["roll"]
         standard_dice_roll = roll_result["standard_roll"]
         bonus_dice_roll = roll_result["bonus_roll"]
         total_roll = roll_result["total_roll"]
-        old_position = roll_result["old_position"]
         new_position = roll_result["new_position"]
         victory_triggered = roll_result["victory_triggered"]
         special_field_result = roll_result.get("special_field_result")
         barrier_check_result = roll_result.get("barrier_check_result")
 
-        dice_order_ids_str = active_session.dice_roll_order.split(',')
-        dice_order_ids_int = [int(tid) for tid in dice_order_ids_str if tid.isdigit()]
-        
-        current_team_index_in_order = -1
-        if team.id in dice_order_ids_int:
-            current_team_index_in_order = dice_order_ids_int.index(team.id)
-        else:
-            db.session.rollback()
-            current_app.logger.error(f"Team {team.id} nicht in Würfelreihenfolge {dice_order_ids_int} gefunden.")
-            return jsonify({"success": False, "error": "Fehler in der Würfelreihenfolge (Team nicht gefunden)."}), 500
-
-        # Prüfe ob ein Field-Minigame durch Sonderfeld-Behandlung gestartet wurde
-        field_minigame_phases = ['FIELD_MINIGAME_SELECTION_PENDING', 'FIELD_MINIGAME_TRIGGERED', 'FIELD_MINIGAME_COMPLETED']
-        if active_session.current_phase in field_minigame_phases:
-            # Field-Minigame wurde gestartet - normale Team-Turn-Logik überspringen
-            current_app.logger.info(f"Field-Minigame wurde gestartet (Phase: {active_session.current_phase}) - überspringe normale Turn-Logik")
-        elif current_team_index_in_order < len(dice_order_ids_int) - 1:
-            active_session.current_team_turn_id = dice_order_ids_int[current_team_index_in_order + 1]
-        else:
-            active_session.current_phase = 'ROUND_OVER'
-            active_session.current_team_turn_id = None 
-            all_teams_in_db = Team.query.all()
-            for t_obj in all_teams_in_db:
-                t_obj.bonus_dice_sides = 0
-                t_obj.minigame_placement = None
-            
-            round_over_event = GameEvent(
-                game_session_id=active_session.id,
-                event_type="dice_round_finished",
-                description="Admin beendete die Würfelrunde über Legacy-Route."
-            )
-            db.session.add(round_over_event)
-
-        db.session.commit()
-
-        # ZIELFELD: Victory automatisch auslösen wenn gewonnen
-        if victory_triggered:
-            try:
-                # Speichere Victory Event
-                victory_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="game_victory",
-                    description=f"Team {team.name} hat das Spiel gewonnen!",
-                    related_team_id=team.id,
-                    data_json=json.dumps({
-                        "winning_team_id": team.id,
-                        "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
-                        "final_position": team.current_position,
-                        "final_dice_roll": total_roll
-                    })
-                )
-                db.session.add(victory_event)
-                
-                # Setze Spiel auf beendet
-                active_session.current_phase = 'GAME_FINISHED'
-                db.session.commit()
-                
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
-                
-            except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
-                db.session.rollback()
-
         # Response zusammenstellen
         response_data = {
             "success": True,
@@ -535,7 +410,7 @@ def roll_dice_action_admin_only():
             "next_team_id": active_session.current_team_turn_id,
             "new_phase": active_session.current_phase,
             "victory_triggered": victory_triggered,
-            "needs_final_roll": team.current_position == 72 and total_roll < 6
+            "needs_final_roll": roll_result["needs_final_roll"]
         }
 
         # SONDERFELD: Füge Sonderfeld-Informationen hinzu wenn verfügbar
@@ -559,7 +434,7 @@ def roll_dice_action_admin_only():
 def special_field_status():
     """API für Sonderfeld-Status aller Teams"""
     try:
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         active_session = get_active_session()
         
         special_field_data = []
@@ -598,13 +473,14 @@ def special_field_status():
         return jsonify({"success": False, "error": str(e)}), 500
 
 @main_bp.route('/api/field-types')
+@cached_response(FIELD_CONFIG)
 def field_types():
     """API für verfügbare Feldtypen und ihre Positionen"""
     try:
-        from app.game_logic.special_fields import get_all_special_field_positions
+        from app.game_logic.special_fields import get_all_special_field_positions, get_board_size
         
         # Hole alle Sonderfeld-Positionen
-        max_fields = current_app.config.get('MAX_BOARD_FIELDS', 72) + 1  # 0-72 = 73 Felder
+        max_fields = get_board_size()
         special_positions = get_all_special_field_positions(max_fields)
         
         # Feldtyp-Informationen
@@ -652,6 +528,11 @@ def field_types():
         current_app.logger.error(f"Fehler in field-types: {e}", exc_info=True)
         return jsonify({"success": False, "error": str(e)}), 500
 
+@main_bp.route('/media/minigame-videos/<path:filename>', methods=['GET', 'HEAD'])
+def minigame_video(filename):
+    """Minispiel-Video mit Range-Requests (Spulen ohne Neuladen ab Byte 0)"""
+    return send_media(current_app.config['MINIGAME_VIDEO_FOLDER'], filename)
+
 # WELCOME-SYSTEM API ENDPUNKTE
 
 @main_bp.route('/welcome')
@@ -762,7 +643,7 @@ def debug_welcome_session():
                         "start_time": s.start_time.isoformat(),
                         "teams_created": s.teams_created
                     }
-                    for s in WelcomeSession.query.all()
+                    for s in WelcomeSession.in_game().all()
                 ]
             })
         
@@ -802,6 +683,7 @@ def welcome_status():
             
             if registration.profile_image_path:
                 player_data["image_path"] = registration.profile_image_path
+                player_data["image_variants"] = registration.get_profile_image_variants()
             else:
                 # Deterministisches Emoji basierend auf Spielername
                 # So bleibt das Emoji immer gleich für jeden Spieler
@@ -993,7 +875,7 @@ def goodbye():
         
         if not victory_data:
             # Fallback: Hole letztes beendetes Spiel
-            last_finished_session = GameSession.query.filter_by(
+            last_finished_session = GameSession.in_game().filter_by(
                 current_phase='GAME_FINISHED'
             ).order_by(GameSession.id.desc()).first()
             
@@ -1012,7 +894,7 @@ def goodbye():
                         victory_data = None
         
         # Hole alle Teams und ihre Statistiken
-        teams = Team.query.order_by(Team.current_position.desc()).all()
+        teams = Team.in_game().order_by(Team.current_position.desc()).all()
         teams_stats = []
         
         winning_team = None
@@ -1099,7 +981,7 @@ def calculate_minigame_statistics(game_session_id):
     
     try:
         # Hole alle Teams
-        teams = Team.query.all()
+        teams = Team.in_game().all()
         current_app.logger.info(f"📊 Found {len(teams)} teams total")
         
         team_stats = {}
@@ -1191,22 +1073,43 @@ def test_upload():
         current_app.logger.error(f"JSON parsing failed: {e}")
         return jsonify({"success": False, "error": str(e)}), 400
 
+def _store_registration_image(registration_id, player_name, image_data=None, image_file=None):
+    """Worker-Job: Bild dekodieren, Varianten speichern und Registrierung/Team aktualisieren."""
+    if image_file:
+        result = process_image_file(image_file, ALLOWED_UPLOAD_FORMATS)
+    else:
+        result = process_base64_image(image_data, ALLOWED_UPLOAD_FORMATS)
+
+    registration = PlayerRegistration.query.get(registration_id)
+    if not registration:
+        raise ValueError("Spieler nicht gefunden")
+
+    remove_legacy_image(registration.profile_image_path)
+    registration.set_profile_image(result['image_path'], result['image_variants'])
+
+    # Falls Spieler bereits einem Team zugeordnet ist, aktualisiere auch Team-Profilbilder
+    if registration.assigned_team_id:
+        team = Team.query.get(registration.assigned_team_id)
+        if team:
+            team.set_profile_image(player_name, result['image_path'], result['image_variants'])
+
+    db.session.commit()
+    current_app.logger.info(f"Profilbild für Spieler '{player_name}' gespeichert: {result['image_path']}")
+    return result
+
+
 @main_bp.route('/api/upload-profile-image', methods=['POST'])
 @csrf.exempt
 def upload_profile_image():
-    """Upload eines Profilbildes für einen Spieler"""
-    current_app.logger.info("=== UPLOAD PROFILE IMAGE ROUTE REACHED ===")
+    """
+    Upload eines Profilbildes für einen Spieler.
+
+    Die Bildverarbeitung läuft im Worker-Pool (app/services/image_jobs.py).
+    Die Antwort enthält nur die Job-ID; das fertige Bild wird per
+    `welcome_state`-Event (`profile_image_ready`) im Stream gemeldet und ist
+    zusätzlich über `/api/profile-image-jobs/<job_id>` abfragbar.
+    """
     try:
-        import base64
-        import binascii
-        import os
-        from PIL import Image
-        import io
-        
-        # Debug: Log the request data
-        current_app.logger.info(f"Upload request content-type: {request.content_type}")
-        current_app.logger.info(f"Upload request data length: {len(request.data) if request.data else 0}")
-        
         try:
             data = request.get_json()
         except Exception as e:
@@ -1220,108 +1123,123 @@ def upload_profile_image():
         player_name = data.get('player_name', '').strip()
         image_data = data.get('image_data', '')  # Base64-encoded image
         
-        current_app.logger.info(f"Upload request for player: {player_name}")
-        current_app.logger.info(f"Image data length: {len(image_data) if image_data else 0}")
-        
         if not player_name:
             return jsonify({"success": False, "error": "Spielername ist erforderlich"}), 400
         
         if not image_data:
             return jsonify({"success": False, "error": "Bilddaten fehlen"}), 400
         
-        # Entferne data:image/...;base64, prefix falls vorhanden
-        if 'base64,' in image_data:
-            image_data = image_data.split('base64,')[1]
-        elif image_data.startswith('data:'):
-            # Fallback: Remove any data: prefix even without base64,
-            parts = image_data.split(',', 1)
-            if len(parts) > 1:
-                image_data = parts[1]
-        
-        # Prüfe ob aktive Welcome-Session existiert
-        welcome_session = WelcomeSession.get_active_session()
-        if not welcome_session:
-            return jsonify({"success": False, "error": "Keine aktive Registrierung"}), 400
-        
-        # Prüfe ob Spieler existiert
-        registration = PlayerRegistration.query.filter_by(
-            welcome_session_id=welcome_session.id,
-            player_name=player_name
-        ).first()
+        registration, error_response = _find_welcome_registration(player_name)
+        if error_response:
+            return error_response
         
-        if not registration:
-            return jsonify({"success": False, "error": "Spieler nicht gefunden"}), 404
+        return _enqueue_registration_image(registration, player_name, image_data=image_data)
         
-        # Dekodiere Base64-Bild
-        try:
-            # Bereinige Base64-String (entferne Whitespace)
-            image_data = image_data.strip().replace(' ', '').replace('\n', '').replace('\r', '')
-            
-            # Fixe Base64-Padding falls nötig
-            if not image_data:
-                return jsonify({"success": False, "error": "Leere Bilddaten"}), 400
-            
-            padding_needed = len(image_data) % 4
-            if padding_needed:
-                image_data += '=' * (4 - padding_needed)
-            
-            image_bytes = base64.b64decode(image_data, validate=True)
-            image = Image.open(io.BytesIO(image_bytes))
-        except binascii.Error as e:
-            current_app.logger.error(f"Base64 decode error: {e}")
-            return jsonify({"success": False, "error": "Ungültige Base64-Bilddaten"}), 400
-        except Exception as e:
-            current_app.logger.error(f"Image processing error: {e}")
-            return jsonify({"success": False, "error": "Ungültige Bilddaten"}), 400
-        
-        # Validiere Bildformat
-        if image.format not in ['JPEG', 'PNG', 'WEBP']:
-            return jsonify({"success": False, "error": "Ungültiges Bildformat (nur JPEG, PNG, WEBP erlaubt)"}), 400
-        
-        # Resize auf 150x150px
-        image = image.resize((150, 150), Image.Resampling.LANCZOS)
-        
-        # Konvertiere zu RGB falls nötig (für JPEG)
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Erstelle Dateinamen
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_player_name = "".join(c for c in player_name if c.isalnum() or c in ['_', '-'])
-        filename = f"{welcome_session.id}_{safe_player_name}_{timestamp}.jpg"
-        
-        # Speichere Bild
-        profile_images_dir = os.path.join(current_app.static_folder, 'profile_images')
-        os.makedirs(profile_images_dir, exist_ok=True)
-        
-        file_path = os.path.join(profile_images_dir, filename)
-        image.save(file_path, 'JPEG', quality=85)
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Fehler beim Upload des Profilbildes: {e}", exc_info=True)
+        return jsonify({"success": False, "error": "Ein Fehler ist aufgetreten"}), 500
+
+
+@main_bp.route('/api/upload-profile-image/binary', methods=['POST'])
+@csrf.exempt
+def upload_profile_image_binary():
+    """
+    Binärer Upload eines Profilbildes (ohne Base64/JSON).
+
+    Akzeptiert entweder multipart/form-data mit den Feldern `player_name` und
+    `image` oder den Bildinhalt direkt als Request-Body (`Content-Type: image/*`,
+    Spielername als Query-Parameter `player_name`). Die Daten werden blockweise
+    in eine temporäre Datei geschrieben und im Worker-Pool verarbeitet; die
+    Antwort entspricht `/api/upload-profile-image`.
+    """
+    temp_path = None
+    try:
+        if request.mimetype == 'multipart/form-data':
+            player_name = request.form.get('player_name', '').strip()
+            upload = request.files.get('image')
+            stream = upload.stream if upload else None
+        else:
+            player_name = request.args.get('player_name', '').strip()
+            stream = request.stream if request.content_length else None
         
-        # Speichere Pfad in Datenbank (relativer Pfad für static files)
-        relative_path = f"profile_images/{filename}"
-        registration.profile_image_path = relative_path
+        if not player_name:
+            return jsonify({"success": False, "error": "Spielername ist erforderlich"}), 400
         
-        # Falls Spieler bereits einem Team zugeordnet ist, aktualisiere auch Team-Profilbilder
-        if registration.assigned_team_id:
-            team = Team.query.get(registration.assigned_team_id)
-            if team:
-                team.set_profile_image(player_name, relative_path)
+        if stream is None:
+            return jsonify({"success": False, "error": "Bilddaten fehlen"}), 400
         
-        db.session.commit()
+        registration, error_response = _find_welcome_registration(player_name)
+        if error_response:
+            return error_response
         
-        current_app.logger.info(f"Profilbild für Spieler '{player_name}' gespeichert: {relative_path}")
+        try:
+            temp_path = spool_upload(stream, current_app.config.get('PROFILE_IMAGE_MAX_BYTES'))
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
         
-        return jsonify({
-            "success": True,
-            "message": f"Profilbild für '{player_name}' erfolgreich gespeichert",
-            "image_path": relative_path
-        })
+        response = _enqueue_registration_image(registration, player_name, image_file=temp_path)
+        if response[1] == 202:
+            temp_path = None  # gehört jetzt dem Worker-Job
+        return response
         
     except Exception as e:
         db.session.rollback()
         current_app.logger.error(f"Fehler beim Upload des Profilbildes: {e}", exc_info=True)
         return jsonify({"success": False, "error": "Ein Fehler ist aufgetreten"}), 500
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _find_welcome_registration(player_name):
+    """Registrierung eines Spielers in der aktiven Welcome-Session (oder Fehlerantwort)."""
+    # Prüfe ob aktive Welcome-Session existiert
+    welcome_session = WelcomeSession.get_active_session()
+    if not welcome_session:
+        return None, (jsonify({"success": False, "error": "Keine aktive Registrierung"}), 400)
+    
+    # Prüfe ob Spieler existiert
+    registration = PlayerRegistration.query.filter_by(
+        welcome_session_id=welcome_session.id,
+        player_name=player_name
+    ).first()
+    
+    if not registration:
+        return None, (jsonify({"success": False, "error": "Spieler nicht gefunden"}), 404)
+    return registration, None
+
+
+def _enqueue_registration_image(registration, player_name, image_data=None, image_file=None):
+    """Reiht die Verarbeitung ein und antwortet mit der Job-ID (202) bzw. 503 bei voller Warteschlange."""
+    try:
+        job = submit_image_job(
+            _store_registration_image,
+            (registration.id, player_name),
+            {"image_data": image_data, "image_file": image_file},
+            context={"player_name": player_name, "registration_id": registration.id},
+        )
+    except ImageQueueFullError as e:
+        return jsonify({"success": False, "error": str(e)}), 503
+    
+    current_app.logger.info(f"Profilbild-Job {job.id} für Spieler '{player_name}' eingereiht")
+    
+    return jsonify({
+        "success": True,
+        "message": f"Profilbild für '{player_name}' wird verarbeitet",
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": url_for('main.profile_image_job_status', job_id=job.id)
+    }), 202
+
+
+@main_bp.route('/api/profile-image-jobs/<job_id>')
+def profile_image_job_status(job_id):
+    """Status eines Profilbild-Jobs (Fallback für Clients ohne Event-Stream)"""
+    job = get_image_job(job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Job nicht gefunden"}), 404
+    return jsonify({"success": True, **job.to_dict()})
 
 @main_bp.route('/api/get-player-faces')
 def get_player_faces():
@@ -1364,6 +1282,8 @@ def get_player_faces():
         if is_field_minigame:
             return get_field_minigame_player_faces(active_session)
         
+        manifest = get_avatar_manifest()
+        
         # Für normale Minigames: Hole ausgewählte Spieler aus der Session
         selected_players = active_session.get_selected_players()
         
@@ -1371,27 +1291,15 @@ def get_player_faces():
         if not selected_players:
             current_app.logger.info("Keine Spieler explizit ausgewählt - verwende alle verfügbaren Teams")
             
-            # Hole alle Teams und deren Spieler als Fallback
-            all_teams = Team.query.all()
-            if not all_teams:
+            if not manifest.teams:
                 return jsonify({
                     "success": True, 
                     "show_faces": False,
                     "message": "Keine Teams gefunden"
                 })
             
-            # Baue selected_players Dictionary mit allen verfügbaren Spielern auf
-            selected_players = {}
-            for team in all_teams:
-                if team.members:
-                    # Hole alle Spieler die ausgewählt werden können
-                    selectable_players = team.get_selectable_players()
-                    if selectable_players:
-                        selected_players[str(team.id)] = selectable_players
-                    else:
-                        # Fallback: alle Teammitglieder wenn keine speziell ausgewählt
-                        all_members = [m.strip() for m in team.members.split(',') if m.strip()]
-                        selected_players[str(team.id)] = all_members
+            # Auslosbare Spieler je Team (Fallback: alle Teammitglieder)
+            selected_players = manifest.default_selection()
             
             if not selected_players:
                 return jsonify({
@@ -1402,78 +1310,21 @@ def get_player_faces():
             
             current_app.logger.info(f"Fallback: {len(selected_players)} Teams mit Spielern gefunden")
         
-        # Sammle Profilbilder der ausgewählten Spieler
-        player_faces = []
-        
-        for team_id_str, player_names in selected_players.items():
-            team = Team.query.get(int(team_id_str))
-            if not team:
-                current_app.logger.warning(f"Team mit ID {team_id_str} nicht gefunden")
-                continue
-                
-            team_name = team.name
-            team_color = team.character.color if team.character else '#CCCCCC'
-            
-            # Hole gespeicherte Player-Konfiguration (enthält gespeicherte Emojis)
-            player_config = team.get_player_config()
-            current_app.logger.debug(f"Team {team_name}: player_config = {player_config}")
-            
-            for player_name in player_names:
-                # Versuche zuerst vollständige Spieler-Info zu bekommen
-                player_info = team.get_player_by_name(player_name)
-                
-                if player_info and player_info.get('profile_image'):
-                    # Hat Profilbild
-                    player_faces.append({
-                        "player_name": player_name,
-                        "team_name": team_name,
-                        "team_id": team.id,
-                        "team_color": team_color,
-                        "image_path": player_info['profile_image'],
-                        "has_photo": True,
-                        "emoji": player_info.get('emoji')  # Emoji als Backup auch bei Foto
-                    })
-                    current_app.logger.debug(f"Spieler {player_name}: Profilbild gefunden")
-                else:
-                    # Kein Profilbild - verwende Emoji
-                    saved_emoji = None
-                    
-                    # Prüfe player_info für Emoji (modernere Methode)
-                    if player_info and player_info.get('emoji'):
-                        saved_emoji = player_info['emoji']
-                        current_app.logger.debug(f"Spieler {player_name}: Emoji aus player_info = {saved_emoji}")
-                    # Fallback: direkt aus player_config
-                    elif player_config and player_name in player_config:
-                        saved_emoji = player_config[player_name].get('emoji')
-                        current_app.logger.debug(f"Spieler {player_name}: Emoji aus player_config = {saved_emoji}")
-                    
-                    # Letzter Fallback: deterministisches Emoji generieren
-                    final_emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(player_name)
-                    current_app.logger.debug(f"Spieler {player_name}: Final emoji = {final_emoji}")
-                    
-                    player_faces.append({
-                        "player_name": player_name,
-                        "team_name": team_name,
-                        "team_id": team.id,
-                        "team_color": team_color,
-                        "emoji": final_emoji,
-                        "has_photo": False
-                    })
+        # Gesichter der ausgewählten Spieler aus dem Manifest (pro Auswahl gecacht)
+        player_faces = manifest.faces_for_selection(selected_players)
         
         # Zeige Gesichter auch wenn nur Emojis vorhanden sind
         show_faces = len(player_faces) > 0
         
-        # Debug-Logging
-        current_app.logger.info(f"Player faces generiert: {len(player_faces)} Spieler, Phase: {active_session.current_phase}")
-        for face in player_faces:
-            img_type = "Foto" if face.get("has_photo") else f"Emoji({face.get('emoji', 'N/A')})"
-            current_app.logger.debug(f"  - {face.get('player_name')} ({face.get('team_name')}): {img_type}")
+        current_app.logger.debug(f"Player faces: {len(player_faces)} Spieler, Phase: {active_session.current_phase}, Manifest {manifest.version}")
         
         result = {
             "success": True,
             "show_faces": show_faces,
             "player_faces": player_faces,
             "total_players": len(player_faces),
+            # Sprite mit allen Fotos (None, solange er im Hintergrund gebaut wird)
+            "face_atlas": get_face_atlas(player_faces),
             "debug_info": {
                 "phase": active_session.current_phase,
                 "minigame_name": active_session.current_minigame_name,
@@ -1481,7 +1332,6 @@ def get_player_faces():
             }
         }
         
-        current_app.logger.info(f"API Response: show_faces={show_faces}, total_players={len(player_faces)}")
         return jsonify(result)
         
     except Exception as e:
@@ -1489,12 +1339,16 @@ def get_player_faces():
         return jsonify({"success": False, "error": "Ein Fehler ist aufgetreten"}), 500
 
 
+def _sample_roster(roster, count, role):
+    """Wählt zufällige Spieler aus einem Manifest-Roster und ergänzt die Rolle (auf Kopien)."""
+    selected = random.sample(roster, min(count, len(roster)))
+    return [{**player, "role": role} for player in selected]
+
+
 def get_field_minigame_player_faces(active_session):
     """Holt Spieler-Gesichter für Feld-Minigames"""
     try:
         import os
-        import json
-        import random
         
         # Hole das aktuelle Feld-Minigame
         if not active_session.field_minigame_content_id:
@@ -1527,210 +1381,31 @@ def get_field_minigame_player_faces(active_session):
         player_count = minigame_data.get('player_count', 1)
         
         # Hole die beteiligten Teams
-        landing_team = active_session.field_minigame_landing_team
-        opponent_team = active_session.field_minigame_opponent_team if active_session.field_minigame_opponent_team_id else None
+        landing_team_id = active_session.field_minigame_landing_team_id
+        opponent_team_id = active_session.field_minigame_opponent_team_id
         
-        if not landing_team:
+        manifest = get_avatar_manifest()
+        if not landing_team_id or landing_team_id not in manifest.teams:
             return jsonify({
                 "success": True,
                 "show_faces": False,
                 "message": "Kein landendes Team gefunden"
             })
         
-        player_faces = []
-        
-        # Hole Spieler vom landenden Team
-        landing_team_profiles = landing_team.get_profile_images()
-        
-        # Alle Teammitglieder des landenden Teams
-        all_landing_players = []
-        if landing_team_profiles:
-            # Spieler mit Profilbildern
-            for player_name, image_path in landing_team_profiles.items():
-                all_landing_players.append({
-                    "name": player_name,
-                    "image_path": image_path,
-                    "has_photo": True
-                })
-        
-        # Zusätzliche Spieler ohne Profilbilder (falls das Team mehr Mitglieder hat)
-        # Diese Information sollte aus der Team-Konfiguration kommen
-        try:
-            # Versuche Team-Mitglieder zu finden (falls in der Datenbank gespeichert)
-            if hasattr(landing_team, 'members') and landing_team.members:
-                team_member_names = landing_team.members.split(',') if isinstance(landing_team.members, str) else landing_team.members
-                for member_name in team_member_names:
-                    member_name = member_name.strip()
-                    if not any(p["name"] == member_name for p in all_landing_players):
-                        all_landing_players.append({
-                            "name": member_name,
-                            "image_path": None,
-                            "has_photo": False
-                        })
-        except:
-            pass
-        
-        # Wähle zufällige Spieler aus dem landenden Team
-        selected_from_landing = random.sample(all_landing_players, min(player_count, len(all_landing_players)))
-        
-        for player_data in selected_from_landing:
-            if player_data["has_photo"]:
-                player_faces.append({
-                    "player_name": player_data["name"],
-                    "team_name": landing_team.name,
-                    "team_id": landing_team.id,
-                    "team_color": landing_team.character.color if landing_team.character else '#CCCCCC',
-                    "image_path": player_data["image_path"],
-                    "role": "landing_team",
-                    "has_photo": True
-                })
-            else:
-                # Prüfe zuerst nach gespeichertem Emoji in player_config
-                player_config = landing_team.get_player_config()
-                saved_emoji = None
-                if player_config and player_data["name"] in player_config:
-                    saved_emoji = player_config[player_data["name"]].get('emoji')
-                
-                # Verwende gespeichertes Emoji oder falle zurück auf deterministisches
-                emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(player_data["name"])
-                
-                player_faces.append({
-                    "player_name": player_data["name"],
-                    "team_name": landing_team.name,
-                    "team_id": landing_team.id,
-                    "team_color": landing_team.character.color if landing_team.character else '#CCCCCC',
-                    "emoji": emoji,
-                    "role": "landing_team",
-                    "has_photo": False
-                })
+        # Wähle zufällige Spieler aus dem landenden Team (mit und ohne Fotos)
+        player_faces = _sample_roster(manifest.roster(landing_team_id), player_count, "landing_team")
         
         # Für Team vs Team Modus: Hole auch Spieler vom Gegner-Team
-        if mode == 'team_vs_team' and opponent_team:
-            opponent_team_profiles = opponent_team.get_profile_images()
-            
-            all_opponent_players = []
-            if opponent_team_profiles:
-                for player_name, image_path in opponent_team_profiles.items():
-                    all_opponent_players.append({
-                        "name": player_name,
-                        "image_path": image_path,
-                        "has_photo": True
-                    })
-            
-            # Zusätzliche Gegner-Spieler ohne Profilbilder
-            try:
-                if hasattr(opponent_team, 'members') and opponent_team.members:
-                    team_member_names = opponent_team.members.split(',') if isinstance(opponent_team.members, str) else opponent_team.members
-                    for member_name in team_member_names:
-                        member_name = member_name.strip()
-                        if not any(p["name"] == member_name for p in all_opponent_players):
-                            all_opponent_players.append({
-                                "name": member_name,
-                                "image_path": None,
-                                "has_photo": False
-                            })
-            except:
-                pass
-            
-            if all_opponent_players:
-                selected_from_opponent = random.sample(all_opponent_players, min(player_count, len(all_opponent_players)))
-                
-                for player_data in selected_from_opponent:
-                    if player_data["has_photo"]:
-                        player_faces.append({
-                            "player_name": player_data["name"],
-                            "team_name": opponent_team.name,
-                            "team_id": opponent_team.id,
-                            "team_color": opponent_team.character.color if opponent_team.character else '#CCCCCC',
-                            "image_path": player_data["image_path"],
-                            "role": "opponent_team",
-                            "has_photo": True
-                        })
-                    else:
-                        # Prüfe zuerst nach gespeichertem Emoji in player_config
-                        player_config = opponent_team.get_player_config()
-                        saved_emoji = None
-                        if player_config and player_data["name"] in player_config:
-                            saved_emoji = player_config[player_data["name"]].get('emoji')
-                        
-                        # Verwende gespeichertes Emoji oder falle zurück auf deterministisches
-                        emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(player_data["name"])
-                        
-                        player_faces.append({
-                            "player_name": player_data["name"],
-                            "team_name": opponent_team.name,
-                            "team_id": opponent_team.id,
-                            "team_color": opponent_team.character.color if opponent_team.character else '#CCCCCC',
-                            "emoji": emoji,
-                            "role": "opponent_team",
-                            "has_photo": False
-                        })
+        if mode == 'team_vs_team' and opponent_team_id:
+            player_faces.extend(_sample_roster(manifest.roster(opponent_team_id), player_count, "opponent_team"))
         
         # Für Team vs All Modus: Hole zufällige Spieler von anderen Teams
         elif mode == 'team_vs_all':
-            all_teams = Team.query.filter(Team.id != landing_team.id, Team.is_active == True).all()
+            other_team_ids = [team_id for team_id in manifest.teams if team_id != landing_team_id]
             
-            for team in all_teams[:min(3, len(all_teams))]:  # Max 3 andere Teams zeigen
-                team_profiles = team.get_profile_images()
-                
-                # Sammle alle Teammitglieder (mit und ohne Fotos)
-                all_team_players = []
-                if team_profiles:
-                    for player_name, image_path in team_profiles.items():
-                        all_team_players.append({
-                            "name": player_name,
-                            "image_path": image_path,
-                            "has_photo": True
-                        })
-                
-                # Zusätzliche Spieler ohne Profilbilder
-                try:
-                    if hasattr(team, 'members') and team.members:
-                        team_member_names = team.members.split(',') if isinstance(team.members, str) else team.members
-                        for member_name in team_member_names:
-                            member_name = member_name.strip()
-                            if not any(p["name"] == member_name for p in all_team_players):
-                                all_team_players.append({
-                                    "name": member_name,
-                                    "image_path": None,
-                                    "has_photo": False
-                                })
-                except:
-                    pass
-                
-                if all_team_players:
-                    # Ein zufälliger Spieler pro Team
-                    selected_player = random.choice(all_team_players)
-                    
-                    if selected_player["has_photo"]:
-                        player_faces.append({
-                            "player_name": selected_player["name"],
-                            "team_name": team.name,
-                            "team_id": team.id,
-                            "team_color": team.character.color if team.character else '#CCCCCC',
-                            "image_path": selected_player["image_path"],
-                            "role": "opponent_team",
-                            "has_photo": True
-                        })
-                    else:
-                        # Prüfe zuerst nach gespeichertem Emoji in player_config
-                        player_config = team.get_player_config()
-                        saved_emoji = None
-                        if player_config and selected_player["name"] in player_config:
-                            saved_emoji = player_config[selected_player["name"]].get('emoji')
-                        
-                        # Verwende gespeichertes Emoji oder falle zurück auf deterministisches
-                        emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(selected_player["name"])
-                        
-                        player_faces.append({
-                            "player_name": selected_player["name"],
-                            "team_name": team.name,
-                            "team_id": team.id,
-                            "team_color": team.character.color if team.character else '#CCCCCC',
-                            "emoji": emoji,
-                            "role": "opponent_team",
-                            "has_photo": False
-                        })
+            for team_id in other_team_ids[:3]:  # Max 3 andere Teams zeigen
+                # Ein zufälliger Spieler pro Team
+                player_faces.extend(_sample_roster(manifest.roster(team_id), 1, "opponent_team"))
         
         show_faces = len(player_faces) > 0
         
@@ -1739,6 +1414,8 @@ def get_field_minigame_player_faces(active_session):
             "show_faces": show_faces,
             "player_faces": player_faces,
             "total_players": len(player_faces),
+            # Zufallsauswahl pro Abruf: nur vorhandene Atlanten nutzen, keine neuen bauen
+            "face_atlas": get_face_atlas(player_faces, build=False),
             "minigame_title": minigame_data.get('title', 'Feld-Minigame'),
             "mode": mode
         })
@@ -1748,68 +1425,13 @@ def get_field_minigame_player_faces(active_session):
         return jsonify({"success": False, "error": f"Fehler: {str(e)}"}), 500
 
 @main_bp.route('/api/get-all-player-images')
+@cached_response(AVATARS)
 def get_all_player_images():
     """Gibt alle verfügbaren Spieler mit ihren Profilbildern oder Emojis zurück"""
     try:
-        teams = Team.query.all()
-        all_players = []
+        all_players = get_avatar_manifest().players
         
-        current_app.logger.info(f"API get-all-player-images: Lade {len(teams)} Teams")
-        
-        
-        for team in teams:
-            # Hole Team-Farbe
-            team_color = team.character.color if team.character else '#CCCCCC'
-            
-            # Hole alle Profilbilder des Teams
-            profile_images = team.get_profile_images()
-            
-            # Hole gespeicherte Player-Konfiguration (enthält gespeicherte Emojis)
-            player_config = team.get_player_config()
-            
-            # Spieler mit Profilbildern
-            for player_name, image_path in profile_images.items():
-                if image_path and image_path.strip():
-                    all_players.append({
-                        "player_name": player_name,
-                        "team_name": team.name,
-                        "team_id": team.id,
-                        "team_color": team_color,
-                        "image_path": image_path,
-                        "has_photo": True
-                    })
-            
-            # Spieler ohne Profilbilder (falls Team mehr Mitglieder hat)
-            try:
-                if hasattr(team, 'members') and team.members:
-                    team_member_names = team.members.split(',') if isinstance(team.members, str) else team.members
-                    for member_name in team_member_names:
-                        member_name = member_name.strip()
-                        # Prüfe ob bereits mit Profilbild hinzugefügt
-                        if not any(p["player_name"] == member_name for p in all_players):
-                            # Prüfe zuerst nach gespeichertem Emoji in player_config
-                            saved_emoji = None
-                            if player_config and member_name in player_config:
-                                saved_emoji = player_config[member_name].get('emoji')
-                            
-                            # Verwende gespeichertes Emoji oder falle zurück auf deterministisches
-                            emoji = saved_emoji if saved_emoji else get_consistent_emoji_for_player(member_name)
-                            
-                            all_players.append({  
-                                "player_name": member_name,
-                                "team_name": team.name,
-                                "team_id": team.id,
-                                "team_color": team_color,
-                                "emoji": emoji,
-                                "has_photo": False
-                            })
-            except:
-                pass
-        
-        current_app.logger.info(f"API get-all-player-images: Gebe {len(all_players)} Spieler zurück")
-        for player in all_players:
-            img_type = "Foto" if player.get("has_photo") else f"Emoji({player.get('emoji', 'N/A')})"
-            current_app.logger.debug(f"  - {player.get('player_name')} ({player.get('team_name')}): {img_type}")
+        current_app.logger.debug(f"API get-all-player-images: Gebe {len(all_players)} Spieler zurück")
         
         return jsonify({
             "success": True,
@@ -1894,15 +1516,10 @@ def remove_player():
         # Lösche Profilbild falls vorhanden
         deleted_image = False
         if registration.profile_image_path:
-            try:
-                import os
-                image_path = os.path.join(current_app.static_folder, registration.profile_image_path)
-                if os.path.exists(image_path):
-                    os.remove(image_path)
-                    deleted_image = True
-                    current_app.logger.info(f"Profilbild gelöscht: {image_path}")
-            except Exception as e:
-                current_app.logger.warning(f"Fehler beim Löschen des Profilbildes: {e}")
+            # Gehashte Varianten können von anderen Spielern geteilt sein und bleiben liegen
+            remove_legacy_image(registration.profile_image_path)
+            deleted_image = True
+            current_app.logger.info(f"Profilbild entfernt: {registration.profile_image_path}")
         
         # Entferne Registrierung aus Datenbank
         db.session.delete(registration)
@@ -1938,27 +1555,12 @@ def advance_field_minigame_phase():
         active_session.current_minigame_name = None
         active_session.current_minigame_description = None
         
-        # Bestimme nächste Phase basierend auf Würfelreihenfolge
-        if active_session.dice_roll_order and active_session.current_team_turn_id:
-            # Prüfe ob noch weitere Teams nach dem aktuellen Team dran sind
-            try:
-                dice_order_ids = [int(tid_str) for tid_str in active_session.dice_roll_order.split(',') if tid_str.strip().isdigit()]
-                current_team_index = dice_order_ids.index(active_session.current_team_turn_id)
-                
-                if current_team_index < len(dice_order_ids) - 1:
-                    # Es gibt noch weitere Teams - bleibe in DICE_ROLLING
-                    active_session.current_phase = 'DICE_ROLLING'
-                    current_app.logger.info(f"Field Minigame beendet - zurück zu DICE_ROLLING für Team {active_session.current_team_turn_id} (Index {current_team_index} von {len(dice_order_ids)})")
-                else:
-                    # Das war das letzte Team - Runde beendet
-                    active_session.current_phase = 'ROUND_OVER'
-                    active_session.current_team_turn_id = None
-                    current_app.logger.info("Field Minigame beendet - war letztes Team, Runde abgeschlossen (ROUND_OVER)")
-            except (ValueError, IndexError) as e:
-                current_app.logger.error(f"Fehler beim Verarbeiten der Würfelreihenfolge: {e}")
-                # Fallback: Runde beenden
-                active_session.current_phase = 'ROUND_OVER'
-                active_session.current_team_turn_id = None
+        # Bestimme nächste Phase basierend auf Würfelreihenfolge: der Zug wurde nach dem
+        # Wurf schon weitergegeben, das Team am Zug hat also noch nicht gewürfelt
+        turn_order = active_session.turn_order
+        if turn_order.current is not None:
+            active_session.current_phase = 'DICE_ROLLING'
+            current_app.logger.info(f"Field Minigame beendet - zurück zu DICE_ROLLING für Team {turn_order.current} (Index {turn_order.index} von {len(turn_order)})")
         else:
             # Keine Teams mehr oder Runde schon beendet
             active_session.current_phase = 'ROUND_OVER'
@@ -5,6 +5,19 @@ from datetime import datetime
 import json
 
 from . import db
+from app.services.game_rng import new_seed
+from app.services.game_scope import current_game_key, default_game_key
+
+
+class GameScoped:
+    """Zeilen, die zu einem Spiel gehören (siehe app/services/game_scope.py)"""
+    game_key = db.Column(db.String(50), default=current_game_key, nullable=False)
+
+    @classmethod
+    def in_game(cls, game_key=None):
+        """Abfrage auf die Zeilen eines Spiels (Standard: Spiel des aktuellen Requests)"""
+        return cls.query.filter_by(game_key=game_key or current_game_key())
+
 
 class Admin(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -32,7 +45,9 @@ class Admin(UserMixin, db.Model):
     def __repr__(self):
         return f'<Admin {self.username}>'
 
-class Team(UserMixin, db.Model):
+class Team(GameScoped, UserMixin, db.Model):
+    __table_args__ = (db.Index('ix_team_game_key', 'game_key'),)
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     password_hash = db.Column(db.String(256), nullable=True)
@@ -43,6 +58,7 @@ class Team(UserMixin, db.Model):
     player_config = db.Column(db.Text, nullable=True)  # JSON mit Spieler-Einstellungen
     # Profilbilder für Team-Mitglieder (JSON: {"player_name": "path/to/image.jpg", ...})
     profile_images = db.Column(db.Text, nullable=True)  # JSON mit Profilbild-Pfaden
+    profile_image_variants = db.Column(db.Text, nullable=True)  # JSON {Spieler: {Größe: {Format: Pfad}}}
 
     character_name = db.Column(db.String(100), nullable=True)
     character_id = db.Column(db.Integer, db.ForeignKey('character.id'), nullable=True)
@@ -298,17 +314,33 @@ class Team(UserMixin, db.Model):
         except (json.JSONDecodeError, TypeError):
             return {}
 
-    def set_profile_image(self, player_name, image_path):
-        """Setzt Profilbild für einen Spieler"""
+    def set_profile_image(self, player_name, image_path, variants=None):
+        """Setzt Profilbild (und optional die Größenvarianten) für einen Spieler"""
         images = self.get_profile_images()
         images[player_name] = image_path
         self.profile_images = json.dumps(images)
 
+        all_variants = self.get_profile_image_variants()
+        if variants:
+            all_variants[player_name] = variants
+        else:
+            all_variants.pop(player_name, None)
+        self.profile_image_variants = json.dumps(all_variants) if all_variants else None
+
     def get_profile_image(self, player_name):
         """Gibt Profilbild-Pfad für einen Spieler zurück"""
         images = self.get_profile_images()
         return images.get(player_name)
 
+    def get_profile_image_variants(self):
+        """Gibt die Größenvarianten aller Profilbilder als Dictionary zurück"""
+        if not self.profile_image_variants:
+            return {}
+        try:
+            return json.loads(self.profile_image_variants)
+        except (json.JSONDecodeError, TypeError):
+            return {}
+
     def remove_profile_image(self, player_name):
         """Entfernt Profilbild eines Spielers"""
         images = self.get_profile_images()
@@ -316,6 +348,11 @@ class Team(UserMixin, db.Model):
             del images[player_name]
             self.profile_images = json.dumps(images)
 
+        all_variants = self.get_profile_image_variants()
+        if player_name in all_variants:
+            del all_variants[player_name]
+            self.profile_image_variants = json.dumps(all_variants) if all_variants else None
+
     def get_player_by_name(self, player_name):
         """Gibt vollständige Spielerinformationen für einen Spieler zurück"""
         if not player_name:
@@ -350,10 +387,12 @@ class Team(UserMixin, db.Model):
     def __repr__(self):
         return f'<Team {self.name}>'
 
-class FieldConfiguration(db.Model):
-    """Konfiguration für Spielfeld-Typen und deren Häufigkeiten"""
+class FieldConfiguration(GameScoped, db.Model):
+    """Konfiguration für Spielfeld-Typen und deren Häufigkeiten (aktives Layout eines Spiels)"""
+    __table_args__ = (db.UniqueConstraint('game_key', 'field_type', name='unique_game_field_config'),)
+
     id = db.Column(db.Integer, primary_key=True)
-    field_type = db.Column(db.String(50), unique=True, nullable=False)
+    field_type = db.Column(db.String(50), nullable=False)
     display_name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(500), nullable=True)
     
@@ -396,19 +435,54 @@ class FieldConfiguration(db.Model):
         else:
             self.config_data = json.dumps(value)
 
+    # Spalten, die beim Anlegen der Konfiguration eines neuen Spiels kopiert werden
+    COPIED_COLUMNS = ('field_type', 'display_name', 'description', 'is_enabled', 'frequency_type',
+                      'frequency_value', 'color_hex', 'emission_hex', 'icon', 'config_data')
+
+    @classmethod
+    def in_game(cls, game_key=None):
+        """
+        Konfiguration eines Spiels; Spiele ohne eigene Zeilen nutzen die des Standardspiels.
+        Vor Änderungen `ensure_game_configs()` aufrufen, sonst träfen sie das Standardspiel.
+        """
+        game_key = game_key or current_game_key()
+        if game_key != default_game_key() and not cls.has_own_configs(game_key):
+            game_key = default_game_key()
+        return cls.query.filter_by(game_key=game_key)
+
+    @classmethod
+    def has_own_configs(cls, game_key=None):
+        """Prüft, ob ein Spiel eigene Feld-Konfigurationen hat"""
+        return db.session.query(cls.query.filter_by(game_key=game_key or current_game_key()).exists()).scalar()
+
+    @classmethod
+    def ensure_game_configs(cls, game_key=None):
+        """
+        Legt für ein Spiel ohne eigene Zeilen eine Kopie der Konfiguration des
+        Standardspiels an (ohne Commit). Gibt True zurück, wenn kopiert wurde.
+        """
+        game_key = game_key or current_game_key()
+        if game_key == default_game_key() or cls.has_own_configs(game_key):
+            return False
+        for template in cls.query.filter_by(game_key=default_game_key()).all():
+            db.session.add(cls(game_key=game_key, **{column: getattr(template, column) for column in cls.COPIED_COLUMNS}))
+        db.session.flush()
+        return True
+
     @staticmethod
     def get_config_for_field(field_type):
         """Gibt die Konfiguration für einen bestimmten Feldtyp zurück"""
-        return FieldConfiguration.query.filter_by(field_type=field_type).first()
+        return FieldConfiguration.in_game().filter_by(field_type=field_type).first()
     
     @staticmethod
     def get_all_enabled():
         """Gibt alle aktivierten Feld-Konfigurationen zurück"""
-        return FieldConfiguration.query.filter_by(is_enabled=True).all()
+        return FieldConfiguration.in_game().filter_by(is_enabled=True).all()
     
     @staticmethod
-    def initialize_default_configs():
-        """Erstellt Standard-Feld-Konfigurationen falls sie nicht existieren"""
+    def initialize_default_configs(game_key=None):
+        """Erstellt Standard-Feld-Konfigurationen eines Spiels falls sie nicht existieren"""
+        game_key = game_key or current_game_key()
         default_configs = [
             {
                 'field_type': 'start',
@@ -519,9 +593,10 @@ class FieldConfiguration(db.Model):
         ]
         
         for config in default_configs:
-            existing = FieldConfiguration.query.filter_by(field_type=config['field_type']).first()
+            existing = FieldConfiguration.query.filter_by(game_key=game_key, field_type=config['field_type']).first()
             if not existing:
                 field_config = FieldConfiguration(
+                    game_key=game_key,
                     field_type=config['field_type'],
                     display_name=config['display_name'],
                     description=config['description'],
@@ -685,8 +760,10 @@ class MinigameSequence(db.Model):
     def __repr__(self):
         return f'<MinigameSequence for Folder {self.minigame_folder_id}>'
 
-class GameRound(db.Model):
+class GameRound(GameScoped, db.Model):
     """Verwaltet Spielrunden mit zugewiesenem Minigame-Ordner"""
+    __table_args__ = (db.Index('ix_game_round_game_active', 'game_key', 'is_active'),)
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.String(500), nullable=True)
@@ -698,15 +775,20 @@ class GameRound(db.Model):
     round_field_configs = db.relationship('RoundFieldConfiguration', backref='game_round', lazy='dynamic', cascade="all, delete-orphan")
 
     def activate(self):
-        """Aktiviert diese Runde und deaktiviert alle anderen"""
-        GameRound.query.update({'is_active': False})
+        """Aktiviert diese Runde und deaktiviert alle anderen Runden desselben Spiels"""
+        GameRound.in_game(self.game_key).update({'is_active': False})
         self.is_active = True
         
-        # Lade rundenspezifische Konfigurationen
+        # Lade rundenspezifische Konfigurationen in die Feld-Konfiguration dieses Spiels
+        FieldConfiguration.ensure_game_configs(self.game_key)
         self._load_round_configurations()
         
         db.session.commit()
         
+        # Nur Feld-Verteilung und gecachte Feld-Antworten dieses Spiels verwerfen
+        from app.game_logic.special_fields import clear_field_distribution_cache
+        clear_field_distribution_cache(self.game_key)
+        
         # Automatisches Backup nach Aktivierung
         try:
             from app.admin.minigame_utils import save_round_to_filesystem
@@ -716,13 +798,14 @@ class GameRound(db.Model):
             logging.warning(f"Backup der aktivierten Runde '{self.name}' fehlgeschlagen: {backup_e}")
 
     def _load_round_configurations(self):
-        """Lädt die rundenspezifischen Konfigurationen in die globale FieldConfiguration"""
+        """Lädt die rundenspezifischen Konfigurationen in die FieldConfiguration dieses Spiels"""
         # Sichere aktuelle Konfigurationen der vorherigen Runde
         self._save_current_configurations()
         
         # Lade Konfigurationen für diese Runde
+        game_configs = {config.field_type: config for config in FieldConfiguration.in_game(self.game_key).all()}
         for round_config in self.round_field_configs:
-            global_config = FieldConfiguration.query.filter_by(field_type=round_config.field_type).first()
+            global_config = game_configs.get(round_config.field_type)
             if global_config:
                 global_config.is_enabled = round_config.is_enabled
                 global_config.frequency_type = round_config.frequency_type
@@ -733,13 +816,13 @@ class GameRound(db.Model):
                 global_config.config_data = round_config.config_data
     
     def _save_current_configurations(self):
-        """Speichert die aktuellen globalen Konfigurationen für die vorherige Runde"""
-        previous_round = GameRound.query.filter_by(is_active=True).first()
+        """Speichert die aktuellen Konfigurationen dieses Spiels für die vorherige Runde"""
+        previous_round = GameRound.in_game(self.game_key).filter_by(is_active=True).first()
         if not previous_round or previous_round.id == self.id:
             return
         
         # Aktualisiere die Konfigurationen der vorherigen Runde
-        global_configs = FieldConfiguration.query.all()
+        global_configs = FieldConfiguration.in_game(self.game_key).all()
         for global_config in global_configs:
             round_config = RoundFieldConfiguration.query.filter_by(
                 game_round_id=previous_round.id,
@@ -778,7 +861,7 @@ class GameRound(db.Model):
     
     def ensure_round_configurations(self):
         """Stellt sicher, dass alle Feld-Konfigurationen für diese Runde existieren"""
-        global_configs = FieldConfiguration.query.all()
+        global_configs = FieldConfiguration.in_game(self.game_key).all()
         for global_config in global_configs:
             round_config = RoundFieldConfiguration.query.filter_by(
                 game_round_id=self.id,
@@ -806,8 +889,13 @@ class GameRound(db.Model):
 
     @classmethod
     def get_active_round(cls):
-        """Gibt die aktuell aktive Runde zurück"""
-        return cls.query.filter_by(is_active=True).first()
+        """Gibt die aktive Runde des aktuellen Spiels zurück (innerhalb eines Requests gemerkt)"""
+        from app.services.request_context import ACTIVE_ROUND, is_active_instance, memoized
+        return memoized(
+            ACTIVE_ROUND,
+            lambda: cls.in_game().filter_by(is_active=True).first(),
+            is_active_instance,
+        )
 
     def __repr__(self):
         return f'<GameRound {self.name} (Active: {self.is_active})>'
@@ -1148,6 +1236,12 @@ class CharacterPart(db.Model):
     
     def is_compatible_with(self, body_type="normal", face_shape="oval"):
         """Check if this part is compatible with given body type and face shape"""
+        # Fast path: precomputed compatibility index of the character catalog
+        from app.services.character_catalog import is_part_compatible
+        indexed = is_part_compatible(self.id, body_type, face_shape) if self.id else None
+        if indexed is not None:
+            return indexed
+        
         if body_type not in self.get_compatible_body_types():
             return False
         if face_shape not in self.get_compatible_face_shapes():
@@ -1183,7 +1277,9 @@ class CharacterPart(db.Model):
     def __repr__(self):
         return f'<CharacterPart {self.name} ({self.category})>'
 
-class GameSession(db.Model):
+class GameSession(GameScoped, db.Model):
+    __table_args__ = (db.Index('ix_game_session_game_active', 'game_key', 'is_active'),)
+
     id = db.Column(db.Integer, primary_key=True)
     start_time = db.Column(db.DateTime, default=datetime.utcnow)
     end_time = db.Column(db.DateTime, nullable=True)
@@ -1206,7 +1302,7 @@ class GameSession(db.Model):
 
     # Tracking für bereits gespielte Inhalte
     played_content_ids = db.Column(db.Text, nullable=True, default='')  # Komma-separierte Liste von gespielten IDs
-    player_rotation_data = db.Column(db.Text, nullable=True)  # JSON mit Spieleinsatz-Tracking pro Team
+    player_rotation_data = db.Column(db.Text, nullable=True)  # Alt: JSON-Tracking, jetzt Tabelle player_rotation
 
     # Feld-Minigame spezifische Felder
     field_minigame_mode = db.Column(db.String(50), nullable=True)  # 'team_vs_all', 'team_vs_team'
@@ -1225,6 +1321,7 @@ class GameSession(db.Model):
     # Mögliche Phasen: SETUP_MINIGAME, MINIGAME_ANNOUNCED, QUESTION_ACTIVE, QUESTION_COMPLETED, DICE_ROLLING, ROUND_OVER, FIELD_ACTION, FIELD_MINIGAME_SELECTION_PENDING, FIELD_MINIGAME_TRIGGERED, FIELD_MINIGAME_ACTIVE, FIELD_MINIGAME_COMPLETED
     
     dice_roll_order = db.Column(db.String(255), nullable=True)
+    turn_index = db.Column(db.Integer, default=0, nullable=True)  # Index des Teams am Zug in dice_roll_order
     current_team_turn_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=True)
     current_team_turn = db.relationship('Team', foreign_keys=[current_team_turn_id])
     
@@ -1233,8 +1330,54 @@ class GameSession(db.Model):
     volcano_active = db.Column(db.Boolean, default=False, nullable=False)  # Vulkan bereit für Ausbruch
     volcano_last_triggered = db.Column(db.DateTime, nullable=True)  # Letzter Ausbruch
 
+    # Reproduzierbarer Zufall (siehe app/services/game_rng.py)
+    rng_seed = db.Column(db.BigInteger, default=new_seed, nullable=True)  # Seed der Sitzung
+    rng_draws = db.Column(db.Integer, default=0, nullable=True)  # Anzahl bisheriger Ziehungen
+
     events = db.relationship('GameEvent', backref='game_session', lazy='dynamic', cascade="all, delete-orphan")
 
+    @property
+    def turn_order(self):
+        """
+        Würfelreihenfolge als `TurnOrder` (app/game_logic/turn_order.py).
+        Wird nur neu geparst, wenn sich dice_roll_order ändert; der Index folgt
+        current_team_turn_id (None = Runde abgeschlossen).
+        """
+        from app.game_logic.turn_order import TurnOrder
+
+        cached = getattr(self, '_turn_order_cache', None)
+        if cached is None or cached[0] != self.dice_roll_order:
+            cached = (self.dice_roll_order, TurnOrder.parse(self.dice_roll_order))
+            self._turn_order_cache = cached
+        order = cached[1]
+
+        current_team_id = self.current_team_turn_id
+        order.index = self.turn_index or 0
+        if current_team_id is None:
+            order.index = len(order)
+        elif order.current != current_team_id:
+            # Altdaten oder direkt gesetztes current_team_turn_id
+            position = order.position(current_team_id)
+            order.index = position if position is not None else len(order)
+        return order
+
+    def set_turn_order(self, team_ids):
+        """Setzt eine neue Würfelreihenfolge; das erste Team ist am Zug"""
+        from app.game_logic.turn_order import TurnOrder
+
+        order = TurnOrder(team_ids)
+        self.dice_roll_order = order.serialize()
+        self.turn_index = 0
+        self.current_team_turn_id = order.current
+
+    def advance_turn(self, skip=None):
+        """Gibt den Zug an das nächste Team weiter (None = Runde vorbei)"""
+        order = self.turn_order
+        next_team_id = order.advance(skip)
+        self.turn_index = order.index
+        self.current_team_turn_id = next_team_id
+        return next_team_id
+
     def get_played_content_ids(self):
         """Gibt eine Liste der bereits gespielten Content-IDs zurück"""
         if not self.played_content_ids:
@@ -1291,8 +1434,11 @@ class GameSession(db.Model):
 
     def select_random_players(self, teams, count_per_team):
         """Wählt faire rotierend Spieler aus jedem Team aus"""
-        import random
+        from app.services.player_rotation import RotationLedger
+
         selected = {}
+        # Zähler aller Teams mit einer Abfrage laden, Einsätze am Ende gesammelt schreiben
+        rotation = RotationLedger(self, [team.id for team in teams if team.members])
         
         for team in teams:
             if not team.members:
@@ -1311,7 +1457,7 @@ class GameSession(db.Model):
                         continue
                     selected[str(team.id)] = all_members
                     # Tracking für alle Spieler
-                    self._update_player_rotation_tracking(str(team.id), all_members)
+                    rotation.record(team.id, all_members)
                 else:
                     # Bei normaler Auswahl nur auslosbare Spieler verwenden
                     selectable_members = team.get_selectable_players()
@@ -1322,97 +1468,46 @@ class GameSession(db.Model):
                     
                     # Faire Auswahl basierend auf Rotation aus auslosbaren Spielern
                     selected_count = min(int(count_per_team), len(selectable_members))
-                    selected_members = self._select_fair_rotation(str(team.id), selectable_members, selected_count)
+                    selected_members = rotation.select(team.id, selectable_members, selected_count)
                     selected[str(team.id)] = selected_members
                     # Tracking aktualisieren
-                    self._update_player_rotation_tracking(str(team.id), selected_members)
+                    rotation.record(team.id, selected_members)
                 
             except (ValueError, AttributeError):
                 # Fallback bei Parsing-Fehlern
                 selected[str(team.id)] = [team.name]
         
+        rotation.flush()
         self.set_selected_players(selected)
         return selected
 
     def get_player_rotation_data(self):
-        """Gibt die Spieler-Rotations-Daten als Dictionary zurück"""
-        if not self.player_rotation_data:
-            return {}
-        try:
-            return json.loads(self.player_rotation_data)
-        except (json.JSONDecodeError, TypeError):
-            return {}
+        """Gibt die Einsatz-Zähler als Dictionary {team_id: {spieler: einsätze}} zurück"""
+        from app.services.player_rotation import rotation_counts
+        return rotation_counts(self)
 
     def set_player_rotation_data(self, rotation_dict):
-        """Setzt die Spieler-Rotations-Daten aus Dictionary"""
-        if rotation_dict is None:
-            self.player_rotation_data = None
-        else:
-            self.player_rotation_data = json.dumps(rotation_dict)
+        """Ersetzt die Einsatz-Zähler aus Dictionary {team_id: {spieler: einsätze}} (Import)"""
+        from app.services.player_rotation import replace_rotation_counts
+        replace_rotation_counts(self, rotation_dict or {})
+        self.player_rotation_data = None
 
     def _select_fair_rotation(self, team_id, members, count_needed):
-        """Wählt Spieler basierend auf fairer Rotation aus"""
-        import random
-        
-        rotation_data = self.get_player_rotation_data()
-        team_data = rotation_data.get(team_id, {})
-        
-        # Initialisiere Spieler-Zähler falls noch nicht vorhanden
-        player_counts = {}
-        for member in members:
-            player_counts[member] = team_data.get(member, 0)
-        
-        # Sortiere Spieler nach Anzahl gespielter Spiele (aufsteigend)
-        sorted_players = sorted(player_counts.items(), key=lambda x: x[1])
-        
-        # Bestimme minimale Anzahl gespielter Spiele
-        min_games = sorted_players[0][1] if sorted_players else 0
-        
-        # Finde alle Spieler mit minimaler Anzahl Spiele
-        available_players = [player for player, count in sorted_players if count == min_games]
-        
-        selected_players = []
-        
-        # Wähle aus Spielern mit wenigsten Spielen
-        if len(available_players) >= count_needed:
-            # Genug Spieler mit minimalen Spielen verfügbar
-            selected_players = random.sample(available_players, count_needed)
-        else:
-            # Nicht genug Spieler mit minimalen Spielen - fülle mit nächst-besten auf
-            selected_players.extend(available_players)
-            remaining_needed = count_needed - len(selected_players)
-            
-            # Finde Spieler mit zweit-wenigsten Spielen
-            remaining_players = [player for player, count in sorted_players 
-                               if count > min_games and player not in selected_players]
-            
-            if remaining_players and remaining_needed > 0:
-                # Sortiere nach Anzahl Spiele und fülle auf
-                remaining_players_sorted = sorted(remaining_players, 
-                                                key=lambda p: player_counts[p])
-                
-                additional_players = remaining_players_sorted[:remaining_needed]
-                selected_players.extend(additional_players)
-        
-        return selected_players
+        """Wählt die Spieler mit den wenigsten Einsätzen aus (Gleichstand: Zufall der Sitzung)"""
+        from app.services.player_rotation import RotationLedger
+        return RotationLedger(self, [team_id]).select(team_id, members, count_needed)
 
     def _update_player_rotation_tracking(self, team_id, selected_players):
         """Aktualisiert das Tracking für die ausgewählten Spieler"""
-        rotation_data = self.get_player_rotation_data()
-        
-        if team_id not in rotation_data:
-            rotation_data[team_id] = {}
-        
-        # Erhöhe Zähler für ausgewählte Spieler
-        for player in selected_players:
-            if player not in rotation_data[team_id]:
-                rotation_data[team_id][player] = 0
-            rotation_data[team_id][player] += 1
-        
-        self.set_player_rotation_data(rotation_data)
+        from app.services.player_rotation import RotationLedger
+        rotation = RotationLedger(self, [team_id])
+        rotation.record(team_id, selected_players)
+        rotation.flush()
 
     def reset_player_rotation(self):
         """Setzt die Spieler-Rotation zurück"""
+        from app.services.player_rotation import reset_rotation
+        reset_rotation(self)
         self.player_rotation_data = None
 
     def get_player_statistics(self):
@@ -1455,6 +1550,9 @@ class GameSession(db.Model):
         return f'<GameSession {self.id} Round: {self.game_round_id} Active: {self.is_active} Phase: {self.current_phase}>'
 
 class GameEvent(db.Model):
+    # Event-Stream je Spiel: Events einer Sitzung ab einer ID
+    __table_args__ = (db.Index('ix_game_event_session_id', 'game_session_id', 'id'),)
+
     id = db.Column(db.Integer, primary_key=True)
     game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1492,8 +1590,27 @@ class GameEvent(db.Model):
     def __repr__(self):
         return f'<GameEvent {self.id} Type: {self.event_type} Session: {self.game_session_id}>'
 
-class WelcomeSession(db.Model):
+class PlayerRotation(db.Model):
+    """Einsatz-Zähler eines Spielers für die faire Rotation (je Sitzung und Team)"""
+    __tablename__ = 'player_rotation'
+    # Zähler eines Teams in einer Sitzung werden gemeinsam geladen
+    __table_args__ = (db.UniqueConstraint('game_session_id', 'team_id', 'player_name',
+                                          name='unique_player_rotation'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    game_session_id = db.Column(db.Integer, db.ForeignKey('game_session.id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
+    player_name = db.Column(db.String(100), nullable=False)
+    plays = db.Column(db.Integer, default=0, nullable=False)
+    last_played_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<PlayerRotation {self.player_name} Team: {self.team_id} Session: {self.game_session_id} Plays: {self.plays}>'
+
+class WelcomeSession(GameScoped, db.Model):
     """Verwaltet Willkommensmodus und Spielerregistrierung"""
+    __table_args__ = (db.Index('ix_welcome_session_game_active', 'game_key', 'is_active'),)
+
     id = db.Column(db.Integer, primary_key=True)
     is_active = db.Column(db.Boolean, default=False, nullable=False)
     start_time = db.Column(db.DateTime, default=datetime.utcnow)
@@ -1508,12 +1625,12 @@ class WelcomeSession(db.Model):
     
     @classmethod
     def get_active_session(cls):
-        """Gibt die aktuelle aktive Welcome-Session zurück"""
-        return cls.query.filter_by(is_active=True).first()
+        """Gibt die aktive Welcome-Session des aktuellen Spiels zurück"""
+        return cls.in_game().filter_by(is_active=True).first()
     
     def activate(self):
-        """Aktiviert diese Session und deaktiviert alle anderen"""
-        WelcomeSession.query.update({'is_active': False})
+        """Aktiviert diese Session und deaktiviert alle anderen Sessions desselben Spiels"""
+        WelcomeSession.in_game(self.game_key).update({'is_active': False})
         self.is_active = True
         db.session.commit()
     
@@ -1538,11 +1655,26 @@ class PlayerRegistration(db.Model):
     registration_time = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Profilbild-Funktionalität
-    profile_image_path = db.Column(db.String(300), nullable=True)  # Pfad zum Profilbild
+    profile_image_path = db.Column(db.String(300), nullable=True)  # Pfad zum Profilbild (150px-JPEG)
+    profile_image_variants = db.Column(db.Text, nullable=True)  # JSON {Größe: {Format: Pfad}}
     
     # Team-Zuordnung (wird nach Teamaufteilung gesetzt)
     assigned_team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=True)
     assigned_team = db.relationship('Team', backref='player_registrations')
     
+    def get_profile_image_variants(self):
+        """Gibt die Größenvarianten des Profilbildes zurück"""
+        if not self.profile_image_variants:
+            return {}
+        try:
+            return json.loads(self.profile_image_variants)
+        except (json.JSONDecodeError, TypeError):
+            return {}
+
+    def set_profile_image(self, image_path, variants=None):
+        """Setzt Profilbild-Pfad und Größenvarianten (None entfernt das Bild)"""
+        self.profile_image_path = image_path
+        self.profile_image_variants = json.dumps(variants) if variants else None
+
     def __repr__(self):
         return f'<PlayerRegistration {self.player_name} Session: {self.welcome_session_id}>'
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Versionierte Asset-Bundles für die großen Seiten-Templates.
+
+Die Skripte und Styles von Spielbrett, Team-Dashboard und Admin-Panel liegen
+unter `static/js/pages/` bzw. `static/css/pages/`. `build_assets.py build`
+erzeugt daraus minifizierte, inhalts-gehashte Kopien in `static/dist/` und
+schreibt `static/dist/manifest.json` (logischer Name -> gehashter Pfad).
+
+Templates binden die Dateien über `asset_url('js/pages/game_board.js')` ein:
+- Mit Manifest-Eintrag zeigt die URL auf das gehashte Bundle, das mit
+  `immutable` und einem Jahr `max-age` ausgeliefert wird.
+- Ohne Build (Entwicklung) wird die Quelldatei mit `?v=<Inhalts-Hash>`
+  verlinkt und normal per ETag revalidiert.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, request, url_for
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+_IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_lock = threading.Lock()
+# (Pfad, mtime) -> Manifest bzw. Inhalts-Hash, damit Änderungen im Debug-Modus greifen
+_manifest_cache: Optional[Tuple[float, Dict[str, str]]] = None
+_source_hashes: Dict[str, Tuple[float, str]] = {}
+
+
+def _manifest_path() -> str:
+    return os.path.join(current_app.static_folder, DIST_DIR, MANIFEST_NAME)
+
+
+def load_manifest() -> Dict[str, str]:
+    """Liest `static/dist/manifest.json` (gecacht, neu geladen bei Änderung)."""
+    global _manifest_cache
+    path = _manifest_path()
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+
+    cached = _manifest_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f).get('assets', {})
+    except (OSError, ValueError) as e:
+        current_app.logger.warning(f"Asset-Manifest konnte nicht gelesen werden: {e}")
+        manifest = {}
+
+    with _lock:
+        _manifest_cache = (mtime, manifest)
+    return manifest
+
+
+def _source_hash(filename: str) -> Optional[str]:
+    path = os.path.join(current_app.static_folder, filename)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    cached = _source_hashes.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:10]
+    with _lock:
+        _source_hashes[filename] = (mtime, digest)
+    return digest
+
+
+def asset_url(filename: str) -> str:
+    """
+    `url_for('static', ...)`-Variante für Seiten-Bundles.
+
+    Args:
+        filename: Logischer Name relativ zu `static/`, z. B. 'js/pages/admin.js'.
+    """
+    hashed = load_manifest().get(filename)
+    if hashed:
+        return url_for('static', filename=hashed)
+
+    digest = _source_hash(filename)
+    if digest:
+        return url_for('static', filename=filename, v=digest)
+    return url_for('static', filename=filename)
+
+
+def _add_bundle_cache_headers(response):
+    if request.endpoint == 'static' and request.view_args \
+            and request.view_args.get('filename', '').startswith(DIST_DIR + '/') \
+            and response.status_code in (200, 206, 304):
+        response.headers['Cache-Control'] = _IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def init_app(app):
+    """Registriert `asset_url` als Jinja-Global und die Cache-Header für Bundles."""
+    app.jinja_env.globals.update(asset_url=asset_url)
+    app.after_request(_add_bundle_cache_headers)
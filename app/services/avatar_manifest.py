@@ -0,0 +1,255 @@
+"""
+Avatar-Manifest für Gesichts-Overlays auf dem Spielbrett.
+
+Das Board pollt `/api/get-player-faces` und ruft `/api/get-all-player-images`
+wiederholt auf. Statt bei jedem Aufruf alle Teams zu laden, `profile_images`
+und `player_config` zu parsen und Mitglieder linear zu durchsuchen, wird hier
+einmal ein Manifest Spieler -> (Team, Farbe, Bildpfad oder Emoji) aufgebaut.
+
+Je Spiel (`game_scope.current_game_key`) gibt es ein eigenes Manifest.
+Die Manifeste werden nur verworfen, wenn sich Profilbilder, Emojis,
+Teammitglieder, Teamname oder Charakter (Farbe) eines Teams ändern.
+Die Erkennung erfolgt über SQLAlchemy-Events; invalidiert wird erst nach
+dem Commit, damit kein Manifest aus halb geschriebenen Daten entsteht.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.models import Character, Team
+from app.services.game_scope import current_game_key
+from app.services.response_cache import bump_version, get_version
+
+AVATARS = 'avatars'
+
+DEFAULT_TEAM_COLOR = '#CCCCCC'
+
+_WATCHED_TEAM_ATTRS = ('name', 'members', 'player_config', 'profile_images', 'profile_image_variants', 'character_id')
+_SESSION_DIRTY_KEY = 'avatar_manifest_dirty'
+_MAX_SELECTION_SLICES = 16
+
+
+def get_consistent_emoji_for_player(player_name):
+    """
+    Generiert ein deterministisches Emoji für einen Spieler basierend auf seinem Namen.
+    Verwendet die gleiche Hashing-Logik wie das JavaScript Frontend.
+    """
+    available_emojis = [
+        "😀", "😃", "😄", "😁", "😆", "😅", "🤣", "😂", "🙂", "🙃",
+        "😉", "😊", "😇", "🥰", "😍", "🤩", "😘", "😗", "😚", "😙",
+        "😋", "😛", "😜", "🤪", "😝", "🤑", "🤗", "🤭", "🤫", "🤔",
+        "🤓", "😎", "🤡", "🥳", "😏", "😒", "😞", "😔", "😟", "😕",
+        "🙁", "☹️", "😣", "😖", "😫", "😩", "🥺", "😢", "😭", "😤",
+        "😠", "😡", "🤬", "🤯", "😳", "🥵", "🥶", "😱", "😨", "😰"
+    ]
+
+    # Verwende die gleiche Hash-Funktion wie JavaScript
+    hash_value = 0
+    for char in player_name:
+        char_code = ord(char)
+        hash_value = ((hash_value << 5) - hash_value) + char_code
+        hash_value = hash_value & 0xFFFFFFFF  # Convert to 32bit integer (JavaScript behavior)
+        if hash_value > 0x7FFFFFFF:  # Handle negative values like JavaScript does
+            hash_value -= 0x100000000
+
+    return available_emojis[abs(hash_value) % len(available_emojis)]
+
+
+class AvatarManifest:
+    """Unveränderlicher Schnappschuss aller Spieler-Avatare."""
+
+    __slots__ = ('version', 'teams', 'players', '_selection_slices', '_slice_lock')
+
+    def __init__(self, version: str, teams: Dict[int, dict], players: List[dict]):
+        self.version = version
+        self.teams = teams
+        self.players = players
+        self._selection_slices: "OrderedDict[str, List[dict]]" = OrderedDict()
+        self._slice_lock = threading.Lock()
+
+    def face(self, team_id: int, player_name: str) -> Optional[dict]:
+        """
+        Gesichts-Eintrag eines Spielers für Overlays.
+
+        Spieler mit Foto erhalten zusätzlich ihr gespeichertes Emoji als Backup;
+        ohne Foto wird das gespeicherte oder ein deterministisches Emoji geliefert.
+        """
+        team = self.teams.get(team_id)
+        if not team:
+            return None
+
+        face = {
+            "player_name": player_name,
+            "team_name": team['team_name'],
+            "team_id": team_id,
+            "team_color": team['team_color'],
+        }
+        saved_emoji = team['emojis'].get(player_name)
+        image_path = team['photos'].get(player_name) if player_name in team['members'] else None
+        if image_path:
+            face.update({"image_path": image_path, "has_photo": True, "emoji": saved_emoji})
+            if player_name in team['variants']:
+                face["image_variants"] = team['variants'][player_name]
+        else:
+            face.update({
+                "emoji": saved_emoji or get_consistent_emoji_for_player(player_name),
+                "has_photo": False
+            })
+        return face
+
+    def roster(self, team_id: int) -> List[dict]:
+        """Alle Spieler eines Teams (erst mit Foto, dann übrige Mitglieder)."""
+        team = self.teams.get(team_id)
+        return team['roster'] if team else []
+
+    def default_selection(self) -> Dict[str, List[str]]:
+        """Fallback-Auswahl: auslosbare Spieler (sonst alle Mitglieder) je Team."""
+        return {
+            str(team_id): team['selectable'] or team['member_list']
+            for team_id, team in self.teams.items()
+            if team['member_list']
+        }
+
+    def faces_for_selection(self, selected_players: Dict[str, List[str]]) -> List[dict]:
+        """Gesichter für eine Spielerauswahl {team_id: [namen]}; pro Auswahl gecacht."""
+        cache_key = json.dumps(selected_players, sort_keys=True)
+        with self._slice_lock:
+            cached = self._selection_slices.get(cache_key)
+        if cached is not None:
+            return cached
+
+        faces = []
+        for team_id_str, player_names in selected_players.items():
+            try:
+                team_id = int(team_id_str)
+            except (TypeError, ValueError):
+                continue
+            if team_id not in self.teams:
+                continue
+            for player_name in player_names:
+                faces.append(self.face(team_id, player_name))
+
+        with self._slice_lock:
+            self._selection_slices[cache_key] = faces
+            while len(self._selection_slices) > _MAX_SELECTION_SLICES:
+                self._selection_slices.popitem(last=False)
+        return faces
+
+
+_lock = threading.Lock()
+_manifests: Dict[str, AvatarManifest] = {}
+
+
+def build_manifest(game_key: Optional[str] = None) -> AvatarManifest:
+    """Lädt alle Teams eines Spiels einmal und baut das Manifest auf."""
+    version = get_version(AVATARS)
+    teams: Dict[int, dict] = {}
+    players: List[dict] = []
+
+    for team in Team.in_game(game_key).order_by(Team.id).all():
+        team_color = team.character.color if team.character else DEFAULT_TEAM_COLOR
+        member_list = [m.strip() for m in team.members.split(',') if m.strip()] if team.members else []
+        player_config = team.get_player_config()
+        photos = {
+            name: path for name, path in team.get_profile_images().items()
+            if path and path.strip()
+        }
+        variants = team.get_profile_image_variants()
+        emojis = {
+            name: settings.get('emoji')
+            for name, settings in player_config.items()
+            if isinstance(settings, dict) and settings.get('emoji')
+        }
+
+        base = {"team_name": team.name, "team_id": team.id, "team_color": team_color}
+        roster = []
+        for player_name, image_path in photos.items():
+            entry = {"player_name": player_name, **base, "image_path": image_path, "has_photo": True}
+            if player_name in variants:
+                entry["image_variants"] = variants[player_name]
+            roster.append(entry)
+        for member_name in member_list:
+            if member_name not in photos:
+                emoji = emojis.get(member_name) or get_consistent_emoji_for_player(member_name)
+                roster.append({"player_name": member_name, **base, "emoji": emoji, "has_photo": False})
+
+        teams[team.id] = {
+            "team_name": team.name,
+            "team_color": team_color,
+            "members": frozenset(member_list),
+            "member_list": member_list,
+            "selectable": team.get_selectable_players(),
+            "photos": photos,
+            "variants": variants,
+            "emojis": emojis,
+            "roster": roster,
+        }
+        players.extend(roster)
+
+    return AvatarManifest(version, teams, players)
+
+
+def get_avatar_manifest() -> AvatarManifest:
+    """Gibt das Manifest des aktuellen Spiels zurück und baut es bei Bedarf auf."""
+    game_key = current_game_key()
+    manifest = _manifests.get(game_key)
+    if manifest is None:
+        with _lock:
+            manifest = _manifests.get(game_key)
+            if manifest is None:
+                manifest = _manifests[game_key] = build_manifest(game_key)
+    return manifest
+
+
+def invalidate_avatar_manifest():
+    """Verwirft die Manifeste aller Spiele; der nächste Zugriff baut sie neu auf."""
+    with _lock:
+        _manifests.clear()
+    bump_version(AVATARS)
+
+
+def _mark_dirty(target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_SESSION_DIRTY_KEY] = True
+
+
+def _team_changed(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in _WATCHED_TEAM_ATTRS):
+        _mark_dirty(target)
+
+
+def _team_inserted_or_deleted(mapper, connection, target):
+    _mark_dirty(target)
+
+
+def _character_changed(mapper, connection, target):
+    if inspect(target).attrs['color'].history.has_changes():
+        _mark_dirty(target)
+
+
+def _after_commit(session):
+    if session.info.pop(_SESSION_DIRTY_KEY, False):
+        invalidate_avatar_manifest()
+
+
+def _after_rollback(session):
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def register_invalidation_hooks():
+    """Registriert die SQLAlchemy-Events für die Manifest-Invalidierung (einmalig)."""
+    if event.contains(Team, 'after_update', _team_changed):
+        return
+    event.listen(Team, 'after_update', _team_changed)
+    event.listen(Team, 'after_insert', _team_inserted_or_deleted)
+    event.listen(Team, 'after_delete', _team_inserted_or_deleted)
+    event.listen(Character, 'after_update', _character_changed)
+    event.listen(Session, 'after_commit', _after_commit)
+    event.listen(Session, 'after_rollback', _after_rollback)
@@ -0,0 +1,111 @@
+"""
+Start-Payload für das Spielbrett (`/api/v1/board/bootstrap`): alle Daten,
+die `game_board.html` vor dem ersten Zeichnen braucht, in einer Antwort:
+
+- `layout`/`colors`: wie `/admin/api/field_data` (Brettgröße aus `MAX_BOARD_FIELDS`) bzw.
+  `/admin/api/field_colors` (Domäne `FIELD_CONFIG`),
+- `snapshot`: Teams und Session aus dem Board-Schnappschuss (`BOARD`),
+- `avatars`: Spieler aus dem Avatar-Manifest (`AVATARS`),
+- `question`: wie `/api/question-status` (aus dem Board-Schnappschuss).
+
+Die serialisierte Antwort wird gecacht, solange sich keine der drei
+Versionen ändert und der Board-Schnappschuss derselbe ist. Live-Updates
+(Würfelergebnisse, Sonderfeld-Events) liefert `/api/board-status`.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Tuple
+
+from app.services.avatar_manifest import AVATARS, get_avatar_manifest
+from app.services.board_snapshot import BoardSnapshot, get_board_snapshot
+from app.services.game_scope import current_game_key
+from app.services.response_cache import FIELD_CONFIG, get_version
+
+_lock = threading.Lock()
+_cached: Dict[str, Tuple[tuple, bytes, str]] = {}
+
+
+def serialize_question(question_id, question_data: dict) -> dict:
+    """Fragen-Payload für das Banner (unterschiedliche Feldnamen der Fragedateien)."""
+    question_text = (question_data.get('question_text') or
+                     question_data.get('question') or
+                     question_data.get('text') or
+                     question_data.get('content') or
+                     question_data.get('description') or '')
+    question_title = question_data.get('name') or question_data.get('title') or 'Aktuelle Frage'
+    answers = question_data.get('options') or question_data.get('answers') or question_data.get('choices') or []
+    return {
+        'question_active': True,
+        'question': {
+            'id': question_id,
+            'title': question_title,
+            'text': question_text,
+            'type': question_data.get('question_type', 'multiple_choice'),
+        },
+        'answers': answers,
+    }
+
+
+def _question(snapshot: BoardSnapshot) -> dict:
+    session = snapshot.session
+    if not session or session['current_phase'] != 'QUESTION_ACTIVE' or not session['current_question_id']:
+        return {'question_active': False}
+    if not snapshot.current_question_data:
+        return {'question_active': False}
+    return serialize_question(session['current_question_id'], snapshot.current_question_data)
+
+
+def build_bootstrap(snapshot: BoardSnapshot, versions: dict) -> dict:
+    from app.admin.field_config import get_field_preview_data, get_field_type_color_mapping
+    from app.game_logic.special_fields import get_all_special_field_positions, get_board_size
+
+    max_fields = get_board_size()
+    return {
+        'versions': versions,
+        'layout': {
+            'preview_data': get_field_preview_data(max_fields),
+            'special_positions': get_all_special_field_positions(max_fields),
+            'max_fields': max_fields,
+        },
+        'colors': get_field_type_color_mapping(),
+        'snapshot': {
+            'teams': snapshot.teams,
+            'session': snapshot.session,
+            'dice_roll_order': snapshot.dice_roll_order,
+        },
+        'avatars': get_avatar_manifest().players,
+        'question': _question(snapshot),
+    }
+
+
+def get_bootstrap() -> Tuple[bytes, str]:
+    """Serialisierter Bootstrap-Payload und sein ETag (gecacht pro Spiel und Versions-Kombination)."""
+    game_key = current_game_key()
+    snapshot = get_board_snapshot()
+    versions = {
+        FIELD_CONFIG: get_version(FIELD_CONFIG),
+        AVATARS: get_version(AVATARS),
+        'board': snapshot.version,
+    }
+    key = (tuple(versions.values()), snapshot.built_at)
+
+    cached = _cached.get(game_key)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    payload = {
+        'success': True,
+        'data': build_bootstrap(snapshot, versions),
+        'meta': {'version': 'v1', 'ts': int(time.time())},
+    }
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    etag = hashlib.sha1(body).hexdigest()[:20]
+
+    # Nur übernehmen, wenn sich keine Version während des Aufbaus geändert hat
+    if get_version(FIELD_CONFIG) == versions[FIELD_CONFIG] and get_version(AVATARS) == versions[AVATARS]:
+        with _lock:
+            _cached[game_key] = (key, body, etag)
+    return body, etag
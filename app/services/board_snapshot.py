@@ -0,0 +1,271 @@
+"""
+Gemeinsamer Board-Schnappschuss für Team-Dashboards.
+
+Jedes Team-Dashboard pollt `/teams/api/dashboard-status`. Bisher wurden dabei
+für jedes Team Rangliste, Würfelreihenfolge (ein `Team.query.get` pro ID),
+Spielstatus und Fragedaten (JSON aus dem Minigame-Ordner) komplett neu
+berechnet, obwohl sich nur Rang, Felder bis zum Ziel und der Antwortstatus
+zwischen den Teams unterscheiden.
+
+Der Schnappschuss enthält alle team-unabhängigen Daten als fertige Dicts und
+wird einmal pro Board-Version gebaut. `overlay()` ergänzt pro Team nur noch
+die wenigen abweichenden Werte.
+
+Jedes Spiel (`game_scope.current_game_key`) hat einen eigenen Schnappschuss
+mit eigener Board-Version (`board_domain`) und eigener Sperre; parallele
+Spiele bauen unabhängig voneinander. Die Board-Version eines Spiels wird nach
+Commits erhöht, die seine Teams, Spielsitzungen oder Runden ändern;
+Charakter-Änderungen betreffen alle Spiele. Zusätzlich begrenzt `SNAPSHOT_MAX_AGE` die
+Lebensdauer, damit Änderungen außerhalb dieses Prozesses (Skripte,
+bearbeitete Fragedateien) spätestens nach kurzer Zeit sichtbar werden.
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload, object_session
+
+from app.models import Character, GameRound, GameSession, Team
+from app.services.game_scope import current_game_key
+from app.services.response_cache import bump_version, get_version
+from app.services.session_service import get_active_folder, get_active_session
+
+BOARD = 'board'
+
+SNAPSHOT_MAX_AGE = 30.0
+
+_WATCHED_MODELS = (Team, GameSession, GameRound, Character)
+_SESSION_DIRTY_KEY = 'board_snapshot_dirty'
+
+
+class BoardSnapshot:
+    """Unveränderlicher, team-unabhängiger Zustand des Spielbretts."""
+
+    __slots__ = (
+        'version', 'built_at', 'teams', 'teams_by_id', '_ranks', '_positions_asc',
+        'session', 'current_team_turn_id', 'current_team_turn_name',
+        'dice_roll_order', 'dice_roll_order_names', 'current_question_data', 'board_size',
+    )
+
+    def __init__(self, version: str, teams: List[dict], session: Optional[dict],
+                 dice_roll_order: List[int], current_question_data: Optional[dict], board_size: int):
+        self.version = version
+        self.board_size = board_size
+        self.built_at = time.monotonic()
+        self.teams = teams
+        self.teams_by_id: Dict[int, dict] = {team['id']: team for team in teams}
+        self._ranks: Dict[int, int] = {team['id']: index + 1 for index, team in enumerate(teams)}
+        self._positions_asc = sorted(team['position'] or 0 for team in teams)
+        self.session = session
+        self.current_team_turn_id = session['current_team_turn_id'] if session else None
+        self.current_team_turn_name = None
+        if self.current_team_turn_id:
+            turn_team = self.teams_by_id.get(self.current_team_turn_id)
+            self.current_team_turn_name = turn_team['name'] if turn_team else "Unbekannt"
+        self.dice_roll_order = dice_roll_order
+        self.dice_roll_order_names = [
+            self.teams_by_id[team_id]['name'] for team_id in dice_roll_order if team_id in self.teams_by_id
+        ]
+        self.current_question_data = current_question_data
+
+    @property
+    def leading_team(self) -> Optional[dict]:
+        return self.teams[0] if self.teams else None
+
+    def rank_of(self, team_id: int) -> int:
+        """Rang eines Teams (1-basiert, Reihenfolge wie Rangliste)."""
+        return self._ranks.get(team_id, 1)
+
+    def teams_ahead_of(self, position: int) -> int:
+        """Anzahl Teams mit größerer Position (binäre Suche statt Scan)."""
+        return len(self._positions_asc) - bisect_right(self._positions_asc, position or 0)
+
+    def game_status(self, team_name: str, question_answered: bool) -> Tuple[str, str]:
+        """Status-Text und -Klasse aus Sicht eines Teams."""
+        if not self.session:
+            return "Kein aktives Spiel", "danger"
+
+        phase = self.session['current_phase']
+        if phase == 'SETUP_MINIGAME':
+            return "Admin wählt nächsten Inhalt aus", "warning"
+        if phase == 'MINIGAME_ANNOUNCED':
+            return "Minispiel wurde angekündigt - Warte auf Platzierungen", "info"
+        if phase == 'QUESTION_ACTIVE':
+            if self.current_question_data:
+                if question_answered:
+                    return f"Frage '{self.current_question_data['name']}' beantwortet - Warte auf andere Teams", "success"
+                return f"Frage '{self.current_question_data['name']}' läuft - Beantworte die Frage!", "primary"
+            return "Frage läuft", "primary"
+        if phase == 'DICE_ROLLING':
+            if self.current_team_turn_name:
+                if self.current_team_turn_name == team_name:
+                    return "Du bist am Zug! Klicke auf 'Würfeln' um zu würfeln", "success"
+                return f"{self.current_team_turn_name} ist am Zug", "primary"
+            return "Würfelrunde läuft", "primary"
+        if phase == 'ROUND_OVER':
+            return "Runde beendet - Nächster Inhalt wird vorbereitet", "secondary"
+        return f"Spielphase: {phase}", "info"
+
+    def overlay(self, team_id: int, team_name: str, position: int, question_answered: bool) -> dict:
+        """Die wenigen team-spezifischen Werte über dem gemeinsamen Schnappschuss."""
+        game_status, game_status_class = self.game_status(team_name, question_answered)
+        return {
+            'current_team_rank': self.rank_of(team_id),
+            'teams_ahead': self.teams_ahead_of(position),
+            'fields_to_goal': self.board_size - 1 - (position or 0),
+            'question_answered': question_answered,
+            'game_status': game_status,
+            'game_status_class': game_status_class,
+        }
+
+
+_locks_guard = threading.Lock()
+_locks: Dict[str, threading.Lock] = {}
+_snapshots: Dict[str, BoardSnapshot] = {}
+
+# Markierung für Änderungen, die alle Spiele betreffen (Charaktere)
+_ALL_GAMES = '*'
+
+
+def board_domain(game_key: str) -> str:
+    """Versions-Domäne des Schnappschusses eines Spiels."""
+    return f"{BOARD}:{game_key}"
+
+
+def _lock_for(game_key: str) -> threading.Lock:
+    lock = _locks.get(game_key)
+    if lock is None:
+        with _locks_guard:
+            lock = _locks.setdefault(game_key, threading.Lock())
+    return lock
+
+
+def _serialize_team(team: Team) -> dict:
+    character = None
+    if team.character:
+        character = {
+            'id': team.character.id,
+            'name': team.character.name,
+            'color': team.character.color,
+            'js_file': team.character.js_file,
+            'image_file': team.character.image_file,
+            'preview_image': team.character.preview_image,
+            'thumbnail': team.character.thumbnail
+        }
+    return {
+        'id': team.id,
+        'name': team.name,
+        'position': team.current_position,
+        'minigame_placement': team.minigame_placement,
+        'bonus_dice_sides': team.bonus_dice_sides,
+        'character_name': team.character.name if team.character else None,
+        'character': character,
+        'character_customization': team.get_character_customization(),
+    }
+
+
+def _serialize_session(active_session: GameSession) -> dict:
+    current_team_turn_id = active_session.current_team_turn_id
+    if current_team_turn_id is not None:
+        try:
+            current_team_turn_id = int(current_team_turn_id)
+        except (TypeError, ValueError):
+            current_team_turn_id = None
+    return {
+        'id': active_session.id,
+        'current_phase': active_session.current_phase,
+        'current_minigame_name': active_session.current_minigame_name,
+        'current_minigame_description': active_session.current_minigame_description,
+        'current_question_id': active_session.current_question_id,
+        'current_player_count': active_session.current_player_count,
+        'current_team_turn_id': current_team_turn_id,
+        'selected_players': active_session.get_selected_players(),
+    }
+
+
+def build_snapshot() -> BoardSnapshot:
+    """Baut den Schnappschuss des aktuellen Spiels mit einer Team-Abfrage und ohne Einzel-Lookups."""
+    from app.admin.minigame_utils import get_question_from_folder
+    from app.game_logic.special_fields import get_board_size
+
+    version = get_version(board_domain(current_game_key()))
+    teams = [
+        _serialize_team(team)
+        for team in Team.in_game().options(joinedload(Team.character))
+            .order_by(Team.current_position.desc(), Team.name).all()
+    ]
+
+    active_session = get_active_session()
+    session_data = _serialize_session(active_session) if active_session else None
+
+    dice_roll_order: List[int] = list(active_session.turn_order) if active_session else []
+
+    current_question_data = None
+    if session_data and session_data['current_question_id']:
+        active_folder = get_active_folder()
+        if active_folder:
+            current_question_data = get_question_from_folder(active_folder.folder_path, session_data['current_question_id'])
+
+    return BoardSnapshot(version, teams, session_data, dice_roll_order, current_question_data, get_board_size())
+
+
+def get_board_snapshot() -> BoardSnapshot:
+    """Gibt den Schnappschuss des aktuellen Spiels zurück und baut ihn bei Bedarf neu."""
+    game_key = current_game_key()
+    domain = board_domain(game_key)
+    snapshot = _snapshots.get(game_key)
+    if snapshot is not None and snapshot.version == get_version(domain) \
+            and time.monotonic() - snapshot.built_at < SNAPSHOT_MAX_AGE:
+        return snapshot
+
+    with _lock_for(game_key):
+        snapshot = _snapshots.get(game_key)
+        if snapshot is None or snapshot.version != get_version(domain) \
+                or time.monotonic() - snapshot.built_at >= SNAPSHOT_MAX_AGE:
+            snapshot = build_snapshot()
+            # Nur übernehmen, wenn sich die Version während des Aufbaus nicht geändert hat
+            if snapshot.version == get_version(domain):
+                _snapshots[game_key] = snapshot
+    return snapshot
+
+
+def invalidate_board_snapshot(game_key: Optional[str] = None):
+    """Erhöht die Board-Version eines Spiels (Standard: aktuelles Spiel)."""
+    bump_version(board_domain(game_key or current_game_key()))
+
+
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        # Ohne Nachladen lesen (gelöschte/abgelaufene Zeilen); unbekannt = alle Spiele
+        game_key = target.__dict__.get('game_key') or _ALL_GAMES
+        session.info.setdefault(_SESSION_DIRTY_KEY, set()).add(game_key)
+
+
+def _after_commit(session):
+    game_keys = session.info.pop(_SESSION_DIRTY_KEY, None)
+    if not game_keys:
+        return
+    if _ALL_GAMES in game_keys:
+        game_keys = set(game_keys) | set(_snapshots)
+        game_keys.discard(_ALL_GAMES)
+    for game_key in game_keys:
+        invalidate_board_snapshot(game_key)
+
+
+def _after_rollback(session):
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def register_invalidation_hooks():
+    """Registriert die SQLAlchemy-Events für die Board-Version (einmalig)."""
+    if event.contains(Session, 'after_commit', _after_commit):
+        return
+    for model in _WATCHED_MODELS:
+        for event_name in ('after_insert', 'after_update', 'after_delete'):
+            event.listen(model, event_name, _mark_dirty)
+    event.listen(Session, 'after_commit', _after_commit)
+    event.listen(Session, 'after_rollback', _after_rollback)
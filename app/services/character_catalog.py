@@ -0,0 +1,174 @@
+"""
+In-Memory-Katalog für Charaktere und Charakter-Teile.
+
+`Character` und `CharacterPart` speichern Stats, Anpassungsoptionen,
+Kompatibilitäten und Effekte als JSON-Text. Der Katalog dekodiert diese
+Spalten einmal und hält fertige Dicts sowie einen Kompatibilitäts-Index
+(body_type, face_shape) -> Teil-IDs vor, damit Filter im Team-Setup ein
+Lookup statt eines Scans sind.
+
+Der Katalog wird beim App-Start und nach Charakter-Änderungen
+(`initialize_characters`, `/admin/init_chars`) neu aufgebaut.
+"""
+
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from app.models import Character, CharacterPart
+from app.services.response_cache import bump_version, CHARACTERS
+
+
+class CharacterCatalog:
+    """Unveränderlicher Schnappschuss der Charakterdaten."""
+
+    __slots__ = ('characters', 'parts', 'parts_by_id', 'parts_by_category', 'compatibility_index')
+
+    def __init__(self, characters, parts, parts_by_id, parts_by_category, compatibility_index):
+        self.characters: List[dict] = characters
+        self.parts: List[dict] = parts
+        self.parts_by_id: Dict[int, dict] = parts_by_id
+        self.parts_by_category: Dict[Tuple[str, Optional[str]], List[dict]] = parts_by_category
+        self.compatibility_index: Dict[Tuple[str, str], FrozenSet[int]] = compatibility_index
+
+    def get_parts(self, category=None, subcategory=None, body_type=None, face_shape=None) -> List[dict]:
+        """
+        Liefert Teile gefiltert nach Kategorie und optional nach Kompatibilität.
+
+        Ohne `subcategory` werden alle Teile der Kategorie geliefert
+        (wie `CharacterPart.get_parts_by_category`).
+        """
+        if category:
+            parts = self.parts_by_category.get((category, subcategory or None), [])
+        else:
+            parts = self.parts
+
+        if body_type or face_shape:
+            compatible = self.compatible_part_ids(body_type or 'normal', face_shape or 'oval')
+            parts = [part for part in parts if part['id'] in compatible]
+        return parts
+
+    def compatible_part_ids(self, body_type='normal', face_shape='oval') -> FrozenSet[int]:
+        return self.compatibility_index.get((body_type, face_shape), frozenset())
+
+    def available_characters(self, selected_ids) -> List[dict]:
+        """Charaktere, die noch kein Team gewählt hat (`selected_ids`: vergebene Charakter-IDs)."""
+        return [char for char in self.characters if char['id'] not in selected_ids]
+
+
+_lock = threading.Lock()
+_catalog: Optional[CharacterCatalog] = None
+
+
+def _serialize_character(char: Character) -> dict:
+    return {
+        'id': char.id,
+        'name': char.name,
+        'description': char.description,
+        'category': char.category,
+        'rarity': char.rarity,
+        'color': char.color,
+        'is_unlocked': char.is_unlocked,
+        # Verfügbarkeit hängt aktuell nicht vom Team ab (siehe is_available_for_team)
+        'is_available': char.is_available_for_team(None),
+        'stats': char.get_stats(),
+        'customization_options': char.get_customization_options(),
+        'preview_image': char.preview_image,
+        'thumbnail': char.thumbnail
+    }
+
+
+def _serialize_part(part: CharacterPart) -> dict:
+    return {
+        'id': part.id,
+        'name': part.name,
+        'category': part.category,
+        'subcategory': part.subcategory,
+        'rarity': part.rarity,
+        'is_unlocked': part.is_unlocked,
+        'is_available': part.is_available_for_team(None),
+        'asset_path': part.asset_path,
+        'icon_path': part.icon_path,
+        'color_customizable': part.color_customizable,
+        'default_color': part.default_color,
+        'description': part.description,
+        'compatible_body_types': part.get_compatible_body_types(),
+        'compatible_face_shapes': part.get_compatible_face_shapes(),
+        'stats_modifier': part.get_stats_modifier(),
+        'special_effects': part.get_special_effects()
+    }
+
+
+def build_catalog() -> CharacterCatalog:
+    """Lädt alle Charaktere und Teile einmal aus der DB und baut die Indizes."""
+    characters = [_serialize_character(char) for char in Character.query.order_by(Character.id).all()]
+    parts = [_serialize_part(part) for part in CharacterPart.query.order_by(CharacterPart.id).all()]
+
+    parts_by_id = {part['id']: part for part in parts}
+
+    parts_by_category: Dict[Tuple[str, Optional[str]], List[dict]] = {}
+    for part in parts:
+        parts_by_category.setdefault((part['category'], None), []).append(part)
+        if part['subcategory']:
+            parts_by_category.setdefault((part['category'], part['subcategory']), []).append(part)
+
+    body_types = {body for part in parts for body in part['compatible_body_types']}
+    face_shapes = {face for part in parts for face in part['compatible_face_shapes']}
+    compatibility_index = {}
+    for body in body_types:
+        for face in face_shapes:
+            compatibility_index[(body, face)] = frozenset(
+                part['id'] for part in parts
+                if body in part['compatible_body_types'] and face in part['compatible_face_shapes']
+            )
+
+    return CharacterCatalog(characters, parts, parts_by_id, parts_by_category, compatibility_index)
+
+
+def get_catalog() -> CharacterCatalog:
+    """Gibt den aktuellen Katalog zurück und baut ihn bei Bedarf auf."""
+    global _catalog
+    catalog = _catalog
+    if catalog is None:
+        with _lock:
+            if _catalog is None:
+                _catalog = build_catalog()
+            catalog = _catalog
+    return catalog
+
+
+def rebuild_catalog() -> CharacterCatalog:
+    """Baut den Katalog sofort neu auf (z. B. nach `/admin/init_chars`)."""
+    global _catalog
+    catalog = build_catalog()
+    with _lock:
+        _catalog = catalog
+    bump_version(CHARACTERS)
+    return catalog
+
+
+def selected_character_ids() -> FrozenSet[int]:
+    """IDs der vergebenen Charaktere (nur die ID-Spalte, die Daten kommen aus dem Katalog)."""
+    from app import db
+    return frozenset(char_id for (char_id,) in
+                     db.session.query(Character.id).filter(Character.is_selected.is_(True)))
+
+
+def invalidate_catalog():
+    """Verwirft den Katalog; der nächste Zugriff baut ihn neu auf."""
+    global _catalog
+    with _lock:
+        _catalog = None
+    bump_version(CHARACTERS)
+
+
+def is_part_compatible(part_id, body_type='normal', face_shape='oval') -> Optional[bool]:
+    """
+    Prüft die Kompatibilität eines Teils über den Index.
+
+    Gibt None zurück, wenn das Teil nicht im Katalog ist (z. B. noch nicht
+    gespeichert); der Aufrufer entscheidet dann selbst.
+    """
+    catalog = get_catalog()
+    if part_id not in catalog.parts_by_id:
+        return None
+    return part_id in catalog.compatible_part_ids(body_type, face_shape)
@@ -0,0 +1,132 @@
+"""
+Kompression für statische Dateien und JSON-Antworten.
+
+- Statische Dateien: `build_assets.py build` legt neben JS/CSS-Dateien
+  vorkomprimierte `.gz`- (und mit `brotli` auch `.br`-) Varianten ab. Ein
+  `before_request`-Hook liefert diese aus, wenn der Client sie per
+  `Accept-Encoding` akzeptiert; ohne Varianten greift der normale Static-View.
+- JSON: Antworten ab `COMPRESS_MIN_SIZE` Bytes werden on-the-fly komprimiert.
+  Streams (`text/event-stream`) und bereits kodierte Antworten bleiben
+  unangetastet.
+
+Brotli ist optional; ohne das Paket wird nur gzip verwendet.
+"""
+
+import gzip
+import mimetypes
+import os
+from typing import Optional
+
+from flask import current_app, request, send_from_directory
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_STATIC_EXTENSIONS = ('.js', '.css', '.json', '.svg', '.html', '.txt')
+COMPRESSIBLE_MIMETYPES = frozenset({'application/json'})
+
+DEFAULT_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Dateiendung der vorkomprimierten Variante je Encoding (Reihenfolge = Präferenz)
+_STATIC_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def _accepted_encoding(candidates) -> Optional[str]:
+    accept = request.accept_encodings
+    for encoding in candidates:
+        if accept[encoding]:
+            return encoding
+    return None
+
+
+def compress_bytes(data: bytes, encoding: str) -> bytes:
+    """Komprimiert Bytes mit 'br' oder 'gzip'."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def _serve_precompressed_static():
+    if request.endpoint != 'static' or request.method not in ('GET', 'HEAD'):
+        return None
+
+    filename = (request.view_args or {}).get('filename', '')
+    if not filename.endswith(COMPRESSIBLE_STATIC_EXTENSIONS):
+        return None
+
+    static_folder = current_app.static_folder
+    try:
+        source_mtime = os.path.getmtime(os.path.join(static_folder, filename))
+    except OSError:
+        return None
+
+    # Nur Varianten verwenden, die nicht älter als die Quelldatei sind
+    available = []
+    for encoding, suffix in _STATIC_ENCODINGS:
+        try:
+            if os.path.getmtime(os.path.join(static_folder, filename + suffix)) >= source_mtime:
+                available.append((encoding, suffix))
+        except OSError:
+            continue
+    if not available:
+        return None
+
+    encoding = _accepted_encoding([encoding for encoding, _ in available])
+    if not encoding:
+        return None
+
+    suffix = dict(available)[encoding]
+    # Mimetype des Originals, nicht der .gz/.br-Datei
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    response = send_from_directory(
+        static_folder,
+        filename + suffix,
+        mimetype=mimetype,
+        max_age=current_app.get_send_file_max_age(filename),
+    )
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def _compress_json_response(response):
+    min_size = current_app.config.get('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE)
+    if (
+        request.method == 'HEAD'
+        or response.status_code != 200
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or response.mimetype == 'text/event-stream'
+        or response.is_streamed
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+    ):
+        return response
+
+    # Vary auch bei kleinen Antworten, damit Caches die Varianten trennen
+    response.vary.add('Accept-Encoding')
+    if (response.content_length or 0) < min_size:
+        return response
+
+    encoding = _accepted_encoding(('br', 'gzip') if brotli is not None else ('gzip',))
+    if not encoding:
+        return response
+
+    response.set_data(compress_bytes(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+
+    # Kodierte Variante bekommt ein schwaches ETag (Inhalt semantisch gleich)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_app(app):
+    """Registriert Static-Negotiation und JSON-Kompression."""
+    app.before_request(_serve_precompressed_static)
+    app.after_request(_compress_json_response)
@@ -1,124 +1,395 @@
-import random
-from typing import Dict, Any
+"""
+Persistenz-Adapter für die Spiel-Engine (`app/game_logic/engine.py`).
+
+Lädt Teams und Feld-Regeln in den kompakten Engine-Zustand, lässt die Engine
+würfeln, schreibt Positionen und Sperren zurück auf die Team-Objekte und
+übersetzt die Domain-Events in `GameEvent`s (gleiche Typen und Daten wie
+zuvor). Minispiel-Felder werden an `handle_minigame_field` delegiert.
+
+Zugreihenfolge, Rundenende und Bonuswürfel-Verbrauch übernimmt die
+Würfel-Pipeline (`roll_pipeline.py`); ein Commit wird hier nie durchgeführt. Würfel und Sonderfelder ziehen
+aus dem Zufall der Sitzung (`game_rng`), Seed und Zählerstand stehen im
+Würfel-Event.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from flask import current_app
 
-from app import db
+from app.game_logic import engine
 from app.models import Team
 from app.services.event_service import create_event
+from app.services.game_rng import get_session_rng
+from app.services.game_scope import current_game_key
+from app.services.session_service import get_active_session
+from app.services.response_cache import FIELD_CONFIG, get_version
+
+# rolled_by -> (Event-Typ, Beschreibung des Würfelwurfs)
+ROLL_SOURCES = {
+    'admin': ('admin_dice_roll', "Admin würfelte für Team {name}"),
+    'team': ('team_dice_roll', "Team {name} würfelte selbst"),
+    'admin_legacy_route': ('admin_dice_roll_legacy', "Admin würfelte für Team {name}"),
+}
+
+# game_key -> ((Version, Felder, Layout-Seed), FieldRules)
+_rules_cache: Dict[str, tuple] = {}
 
 
-def admin_roll_for_team(active_session, team: Team) -> Dict[str, Any]:
+def get_engine_rules(game_session=None) -> engine.FieldRules:
     """
-    Führt einen Admin-Wurf für das gegebene Team aus:
-    - Berechnet Standard- und Bonuswürfel
-    - Bewegt das Team (inkl. Blockadeprüfung)
-    - Triggert ggf. Spezialfelder
-    - Erzeugt ein Dice-Event (garantiert JSON)
-
-    Gibt ein Ergebnis-Dict zurück (Rollwerte, Positionen, Flags).
-    Commit wird NICHT durchgeführt – der Aufrufer ist verantwortlich.
+    Feld-Regeln der Engine je Spiel, gecacht bis zur nächsten
+    Feld-Konfigurationsänderung oder neuen Sitzung (neues Brett).
     """
-    # Würfel
-    standard_dice_roll = random.randint(1, 6)
-    bonus_dice_roll = 0
-    if team.bonus_dice_sides and team.bonus_dice_sides > 0:
-        bonus_dice_roll = random.randint(1, team.bonus_dice_sides)
+    from app.game_logic.special_fields import get_field_rules
 
-    total_roll = standard_dice_roll + bonus_dice_roll
-    max_field_index = current_app.config.get('MAX_BOARD_FIELDS', 72)
+    if game_session is None:
+        game_session = get_active_session()
+    max_field = current_app.config.get('MAX_BOARD_FIELDS', engine.DEFAULT_MAX_FIELD)
+    key = (get_version(FIELD_CONFIG), max_field, game_session.rng_seed if game_session else None)
+    game_key = current_game_key()
+    cached = _rules_cache.get(game_key)
+    if cached is None or cached[0] != key:
+        cached = _rules_cache[game_key] = (key, get_field_rules(max_field))
+    return cached[1]
 
-    old_position = team.current_position or 0
-    new_position = old_position
 
-    # Sonderfelder-Logik
+def _barrier_config(team: Team):
+    if not team.is_blocked:
+        return None
     try:
-        from app.game_logic.special_fields import (
-            handle_special_field_action,
-            check_barrier_release,
-        )
-        special_fields_available = True
-    except Exception:
-        special_fields_available = False
+        if team.blocked_config:
+            return json.loads(team.blocked_config)
+    except (TypeError, ValueError):
+        pass
+    return engine.fallback_barrier_config(team.blocked_target_number)
 
-    special_field_result = None
-    barrier_check_result = None
 
-    if special_fields_available and getattr(team, 'is_blocked', False):
-        # Team ist blockiert – prüfe Befreiung
-        barrier_check_result = check_barrier_release(team, standard_dice_roll, active_session, bonus_dice_roll)
-        if barrier_check_result.get('released'):
-            new_position = min(old_position + total_roll, max_field_index)
-            team.current_position = new_position
-            # Spezialfeld nach der Bewegung prüfen
-            all_teams = Team.query.all()
-            special_field_result = handle_special_field_action(team, all_teams, active_session)
-        else:
-            # bleibt blockiert, keine Bewegung
-            new_position = old_position
+def load_game_state(teams: List[Team]) -> engine.GameState:
+    """Baut den Engine-Zustand aus Team-Objekten (Index = Position in `teams`)."""
+    return engine.GameState(
+        team_ids=[team.id for team in teams],
+        positions=[team.current_position or 0 for team in teams],
+        blocked=[bool(team.is_blocked) for team in teams],
+        barrier_configs=[_barrier_config(team) for team in teams],
+        bonus_sides=[team.bonus_dice_sides or 0 for team in teams],
+    )
+
+
+def store_game_state(state: engine.GameState, teams: List[Team]):
+    """Schreibt geänderte Positionen und Sperren zurück auf die Team-Objekte."""
+    for index, team in enumerate(teams):
+        if (team.current_position or 0) != state.positions[index]:
+            team.current_position = state.positions[index]
+        if bool(team.is_blocked) != state.blocked[index]:
+            barrier_config = state.barrier_configs[index]
+            team.is_blocked = state.blocked[index]
+            team.blocked_target_number = barrier_config['min_number'] if barrier_config else None
+            team.blocked_config = json.dumps(barrier_config) if barrier_config else None
+
+
+def _dice_description(result: engine.RollResult) -> str:
+    description = f"{result.standard_roll}"
+    if result.bonus_roll > 0:
+        description += f" + {result.bonus_roll} (Bonus) = {result.total_roll}"
+    return description
+
+
+def _barrier_checked(active_session, team, result, data) -> Dict[str, Any]:
+    barrier_config = data['barrier_config']
+    released = data['released']
+    dice_description = _dice_description(result)
+    current_app.logger.info(f"[BARRIER] Team {team.name}: Würfel {result.total_roll} vs. Konfiguration → "
+                            f"{'BEFREIT' if released else 'BLOCKIERT'}")
+
+    event_description = f"Team {team.name} versuchte Befreiung mit Würfel {dice_description}"
+    if released:
+        event_description += " - Befreit durch total!"
+    create_event(
+        game_session_id=active_session.id,
+        event_type="special_field_barrier_released" if released else "special_field_barrier_blocked",
+        related_team_id=team.id,
+        description=event_description,
+        data={
+            'action': 'check_barrier_release',
+            'field_type': 'barrier',
+            'dice_roll': result.standard_roll,
+            'bonus_roll': result.bonus_roll,
+            'total_roll': result.total_roll,
+            'barrier_config': barrier_config,
+            'released': released,
+            'release_method': "total" if released else None
+        }
+    )
+
+    check_result = {
+        "released": released,
+        "dice_roll": result.standard_roll,
+        "bonus_roll": result.bonus_roll,
+        "total_roll": result.total_roll,
+        "barrier_config": barrier_config,
+    }
+    if released:
+        check_result["release_method"] = "total"
+        check_result["message"] = f"🎉 Befreit! {team.name} hat {dice_description} gewürfelt!"
     else:
-        # Normale Bewegung
-        new_position = min(old_position + total_roll, max_field_index)
-        team.current_position = new_position
-        if special_fields_available:
-            all_teams = Team.query.all()
-            special_field_result = handle_special_field_action(team, all_teams, active_session)
-
-    # Zielfeld-/Sieg-Logik
-    victory_triggered = False
-    needs_final_roll = False
-    if old_position == 72 and total_roll >= 6:
-        victory_triggered = True
-    elif old_position == 72 and total_roll < 6:
-        needs_final_roll = True
-
-    # Event-Beschreibung
-    event_description = f"Admin würfelte für Team {team.name}: {standard_dice_roll}"
-    if bonus_dice_roll > 0:
-        event_description += f" (Bonus: {bonus_dice_roll}, Gesamt: {total_roll})"
-
-    if getattr(team, 'is_blocked', False) and barrier_check_result and not barrier_check_result.get('released', False):
-        event_description += " - BLOCKIERT: Konnte sich nicht befreien."
+        check_result["message"] = (f"🚧 Noch blockiert! {team.name} hat {dice_description} gewürfelt. "
+                                   f"{barrier_config['display_text']}")
+    return check_result
+
+
+def _catapulted(active_session, team, result, kind, data) -> Dict[str, Any]:
+    distance = data['distance']
+    forward = kind == engine.CATAPULT_FORWARD
+    direction = "vorne" if forward else "hinten"
+    create_event(
+        game_session_id=active_session.id,
+        event_type=f"special_field_{kind}",
+        related_team_id=team.id,
+        description=f"Team {team.name} wurde {distance} Felder nach {direction} katapultiert "
+                    f"(von Feld {data['old_position']} zu Feld {data['new_position']})!",
+        data={
+            "field_type": kind,
+            "catapult_distance": distance,
+            "old_position": data['old_position'],
+            "new_position": data['new_position'],
+            # Original Würfel-Bewegung für Banner
+            "dice_old_position": result.old_position,
+            "dice_new_position": result.new_position,
+            "dice_roll": result.standard_roll,
+            "bonus_roll": result.bonus_roll,
+            "total_roll": result.total_roll
+        }
+    )
+    if forward:
+        message = f"🚀 Katapult! {team.name} fliegt {distance} Felder nach vorne!"
     else:
-        event_description += f" und bewegte sich von Feld {old_position} zu Feld {new_position}."
+        message = f"💥 Rückschlag! {team.name} wird {distance} Felder zurück geschleudert!"
+    return {
+        "success": True,
+        "action": kind,
+        "catapult_distance": distance,
+        "old_position": data['old_position'],
+        "new_position": data['new_position'],
+        "dice_old_position": result.old_position,
+        "dice_new_position": result.new_position,
+        "message": message
+    }
+
 
-    if victory_triggered:
-        event_description += f" 🏆 SIEG! Team war auf Zielfeld und würfelte {total_roll}!"
-    elif old_position == 72 and total_roll < 6:
-        event_description += f" 🎯 War auf Zielfeld - braucht mindestens 6 zum Gewinnen (gewürfelt: {total_roll})"
-    elif new_position == 72:
-        event_description += f" 🎯 Erreichte Zielfeld - braucht nächste Runde mindestens 6 zum Gewinnen"
+def _swapped(active_session, team, teams, data) -> Dict[str, Any]:
+    if data['swap_team'] is None:
+        return {
+            "success": False,
+            "action": "player_swap",
+            "message": "🔄 Kein anderes Team zum Tauschen verfügbar!"
+        }
 
-    # Dice-Event erzeugen (JSON)
+    swap_team = teams[data['swap_team']]
+    old_position = data['old_position']
+    swap_old_position = data['swap_old_position']
+    shared = {
+        "field_type": "player_swap",
+        "current_team_id": team.id,
+        "current_team_old_position": old_position,
+        "current_team_new_position": swap_old_position,
+        "swap_team_id": swap_team.id,
+        "swap_team_old_position": swap_old_position,
+        "swap_team_new_position": old_position,
+    }
     create_event(
         game_session_id=active_session.id,
-        event_type="admin_dice_roll_legacy",
+        event_type="special_field_player_swap",
         related_team_id=team.id,
-        description=event_description,
+        description=f"Team {team.name} (Feld {old_position}) tauschte Positionen mit "
+                    f"Team {swap_team.name} (Feld {swap_old_position})!",
+        data=dict(shared, swap_team_name=swap_team.name, is_initiating_team=True)
+    )
+    create_event(
+        game_session_id=active_session.id,
+        event_type="special_field_player_swap",
+        related_team_id=swap_team.id,
+        description=f"Team {swap_team.name} (Feld {swap_old_position}) wurde mit "
+                    f"Team {team.name} (Feld {old_position}) getauscht!",
+        data=dict(shared, current_team_name=team.name, is_initiating_team=False)
+    )
+    return {
+        "success": True,
+        "action": "player_swap",
+        "current_team_old_position": old_position,
+        "current_team_new_position": swap_old_position,
+        "swap_team_name": swap_team.name,
+        "swap_team_old_position": swap_old_position,
+        "swap_team_new_position": old_position,
+        "message": f"🔄 Positionstausch! {team.name} tauscht mit {swap_team.name}!"
+    }
+
+
+def _barrier_set(active_session, team, data) -> Dict[str, Any]:
+    barrier_config = data['barrier_config']
+    create_event(
+        game_session_id=active_session.id,
+        event_type="special_field_barrier_set",
+        related_team_id=team.id,
+        description=f"Team {team.name} wurde auf Sperren-Feld blockiert",
         data={
-            "standard_roll": standard_dice_roll,
-            "bonus_roll": bonus_dice_roll,
-            "total_roll": total_roll,
-            "old_position": old_position,
-            "new_position": new_position,
-            "rolled_by": "admin_legacy_route",
-            "was_blocked": getattr(team, 'is_blocked', False) if barrier_check_result else False,
-            "barrier_released": barrier_check_result.get('released', False) if barrier_check_result else False,
-            "victory_triggered": victory_triggered,
-            "needs_final_roll": needs_final_roll,
-        },
+            'action': 'barrier',
+            'field_type': 'barrier',
+            'barrier_set': True,
+            'target_config': barrier_config,
+            'required_number': barrier_config['min_number'],
+            'display_text': barrier_config['display_text']
+        }
+    )
+    return {
+        "success": True,
+        "action": "barrier_set",
+        "target_config": barrier_config,
+        "target_number": barrier_config['min_number'],
+        "display_text": barrier_config['display_text'],
+        "message": f"🚧 Blockiert! {team.name} - {barrier_config['display_text']}"
+    }
+
+
+def _dice_rolled(active_session, team, state, result, rolled_by, checkpoint, goal, pacing=None):
+    event_type, description_template = ROLL_SOURCES[rolled_by]
+    description = f"{description_template.format(name=team.name)}: {result.standard_roll}"
+    if result.bonus_roll > 0:
+        description += f" (Bonus: {result.bonus_roll}, Gesamt: {result.total_roll})"
+
+    if result.stayed_blocked:
+        description += " - BLOCKIERT: Konnte sich nicht befreien."
+    else:
+        description += f" und bewegte sich von Feld {result.old_position} zu Feld {result.new_position}."
+
+    if result.victory_triggered:
+        description += f" 🏆 SIEG! Team war auf Zielfeld und würfelte {result.total_roll}!"
+    elif result.needs_final_roll:
+        description += f" 🎯 War auf Zielfeld - braucht mindestens 6 zum Gewinnen (gewürfelt: {result.total_roll})"
+    elif result.new_position == goal:
+        description += " 🎯 Erreichte Zielfeld - braucht nächste Runde mindestens 6 zum Gewinnen"
+
+    data = {
+        "standard_roll": result.standard_roll,
+        "bonus_roll": result.bonus_roll,
+        "total_roll": result.total_roll,
+        "old_position": result.old_position,
+        "new_position": result.new_position,
+        "rolled_by": rolled_by,
+        "was_blocked": result.was_blocked,
+        "barrier_released": result.barrier_released,
+        "victory_triggered": result.victory_triggered,
+        "needs_final_roll": result.needs_final_roll,
+        # Seed und Zählerstand vor dem Wurf: replay_rng(rng) + Zustand ergibt denselben Wurf
+        "rng": checkpoint,
+    }
+    # Sperren-Text für Banner, solange das Team (weiter oder neu) blockiert ist
+    barrier_config = state.barrier_configs[result.team] if state.blocked[result.team] else None
+    if barrier_config:
+        data["barrier_config"] = barrier_config
+        data["barrier_display_text"] = barrier_config.get('display_text', 'Höhere Zahl benötigt')
+    # Runden-Wurf: Position im Stapel und Verzögerung, damit das Brett jeden Wurf einzeln animiert
+    if pacing:
+        data["pacing"] = pacing
+
+    create_event(
+        game_session_id=active_session.id,
+        event_type=event_type,
+        related_team_id=team.id,
+        description=description,
+        data=data,
     )
 
-    result = {
-        "standard_roll": standard_dice_roll,
-        "bonus_roll": bonus_dice_roll,
-        "total_roll": total_roll,
-        "old_position": old_position,
-        "new_position": new_position,
-        "victory_triggered": victory_triggered,
-        "needs_final_roll": needs_final_roll,
+
+def roll_for_team(active_session, team: Team, rolled_by: str = 'admin', rng=None,
+                  teams: Optional[List[Team]] = None, pacing: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Führt einen Wurf für `team` über die Engine aus und speichert Zustand und Events.
+
+    Args:
+        rolled_by: Schlüssel aus `ROLL_SOURCES` (bestimmt Event-Typ und Beschreibung)
+        rng: Zufallsquelle für Würfel und Sonderfelder (Standard: Zufall der Sitzung,
+            siehe `app/services/game_rng.py`)
+        teams: bereits geladene Teams (sonst eine eigene Abfrage)
+        pacing: optionale Animations-Daten für das Würfel-Event (Runden-Wurf)
+
+    Returns:
+        Rollwerte, Positionen (`new_position` nach dem Würfeln, `final_position`
+        nach Sonderfeldern), Flags sowie `barrier_check_result` und
+        `special_field_result` im bisherigen Format.
+        Commit wird NICHT durchgeführt – der Aufrufer ist verantwortlich.
+    """
+    teams = list(teams) if teams is not None else Team.in_game().all()
+    if team not in teams:
+        teams.append(team)
+    state = load_game_state(teams)
+    index = teams.index(team)
+
+    rng = rng or get_session_rng(active_session)
+    checkpoint = rng.checkpoint() if hasattr(rng, 'checkpoint') else None
+    rules = get_engine_rules(active_session)
+    result = engine.roll(state, rules, index, rng)
+    store_game_state(state, teams)
+    current_app.logger.info(f"Team {team.name} würfelt ({rolled_by}): {result.standard_roll} + Bonus "
+                            f"{result.bonus_roll} (1-{state.bonus_sides[index]}), Feld {result.old_position} "
+                            f"-> {result.new_position} -> {result.final_position}")
+
+    barrier_check_result = None
+    special_field_result = None
+    for event in result.events:
+        kind, data = event.kind, event.data
+        if kind == engine.BARRIER_CHECKED:
+            barrier_check_result = _barrier_checked(active_session, team, result, data)
+        elif kind in (engine.CATAPULT_FORWARD, engine.CATAPULT_BACKWARD):
+            special_field_result = _catapulted(active_session, team, result, kind, data)
+        elif kind == engine.PLAYER_SWAP:
+            special_field_result = _swapped(active_session, team, teams, data)
+        elif kind == engine.BARRIER_SET:
+            special_field_result = _barrier_set(active_session, team, data)
+        elif kind == engine.MINIGAME_FIELD:
+            from app.game_logic.special_fields import handle_minigame_field
+            special_field_result = handle_minigame_field(team, teams, active_session)
+        elif kind == engine.DICE_ROLLED:
+            _dice_rolled(active_session, team, state, result, rolled_by, checkpoint, rules.max_field, pacing)
+        elif kind == engine.VICTORY:
+            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position {rules.max_field} "
+                                    f"und würfelte {result.total_roll} (>= {engine.VICTORY_MIN_ROLL}) - SIEG!")
+
+    if special_field_result is None and not result.stayed_blocked:
+        special_field_result = {"success": False, "action": "none"}
+
+    return {
+        "standard_roll": result.standard_roll,
+        "bonus_roll": result.bonus_roll,
+        "total_roll": result.total_roll,
+        "old_position": result.old_position,
+        "new_position": result.new_position,
+        "final_position": result.final_position,
+        "was_blocked": result.was_blocked,
+        "barrier_released": result.barrier_released,
+        "victory_triggered": result.victory_triggered,
+        "needs_final_roll": result.needs_final_roll,
         "barrier_check_result": barrier_check_result,
         "special_field_result": special_field_result,
     }
-    return result
+
+
+def record_victory(active_session, team: Team, total_roll: int):
+    """Speichert das Sieg-Event und beendet das Spiel (nach der Zuglogik aufrufen)."""
+    create_event(
+        game_session_id=active_session.id,
+        event_type="game_victory",
+        related_team_id=team.id,
+        description=f"Team {team.name} hat das Spiel gewonnen!",
+        data={
+            "winning_team_id": team.id,
+            "winning_team_name": team.name,
+            "victory_timestamp": datetime.utcnow().isoformat(),
+            "final_position": team.current_position,
+            "final_dice_roll": total_roll
+        }
+    )
+    active_session.current_phase = 'GAME_FINISHED'
+    current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
 
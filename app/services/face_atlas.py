@@ -0,0 +1,236 @@
+"""
+Sprite-Atlas für die Gesichter-Overlays auf dem Spielbrett.
+
+Bei Minispiel-Ankündigungen zeigt das Board die Gesichter aller ausgewählten
+Spieler (`/api/get-player-faces`). Statt dutzender Einzelbilder genau in dem
+Moment, in dem der Beamer flüssig animieren soll, wird ein einziges
+Sprite-Bild geladen.
+
+- Der Atlas-Schlüssel ist der Hash über die sortierten Bildpfade. Neue
+  Profilbilder sind inhalts-gehasht (`profile_images.py`), der Schlüssel
+  ändert sich also genau dann, wenn sich die Gesichter ändern.
+- Die Koordinaten ergeben sich deterministisch aus der sortierten Pfadliste
+  und werden ohne Bildarbeit berechnet; fertig ist ein Atlas, sobald seine
+  Datei unter `static/face_atlases/` existiert.
+- Fehlt die Datei, wird sie im Bild-Worker-Pool gebaut und die Antwort
+  kommt ohne Atlas (der Client lädt dann wie bisher Einzelbilder).
+- Ändern sich Spielerauswahl oder Profilbilder, wird der Atlas der aktuellen
+  Auswahl nach dem Commit im Hintergrund vorgebaut.
+"""
+
+import hashlib
+import math
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+from flask import current_app, request, url_for
+from PIL import Image, ImageOps
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.models import GameSession, Team
+from app.services.game_scope import default_game_key, use_game
+from app.services.image_jobs import ImageQueueFullError, submit_image_job
+from app.services.profile_images import pick_variant
+
+ATLAS_DIR = 'face_atlases'
+CELL_SIZE = 150
+MAX_ATLASES = 20
+JPEG_QUALITY = 85
+
+_ATLAS_FILE_RE = re.compile(rf'^{ATLAS_DIR}/[0-9a-f]{{16}}\.jpg$')
+_IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_WATCHED_ATTRS = {
+    GameSession: ('selected_players', 'field_minigame_selected_players'),
+    Team: ('profile_images', 'profile_image_variants'),
+}
+_SESSION_DIRTY_KEY = 'face_atlas_dirty'
+
+_lock = threading.Lock()
+_pending: set = set()
+
+
+def _source_paths(faces: List[dict]) -> Dict[str, str]:
+    """Bildpfad je Gesicht -> Quelldatei für die Zelle (150px-Variante, sonst Originalpfad)."""
+    sources = {}
+    for face in faces:
+        image_path = face.get('image_path')
+        if face.get('has_photo') and image_path:
+            sources[image_path] = pick_variant(face.get('image_variants'), CELL_SIZE, image_path)
+    return sources
+
+
+def atlas_key(image_paths) -> str:
+    return hashlib.sha256('\n'.join(sorted(image_paths)).encode('utf-8')).hexdigest()[:16]
+
+
+def _layout(image_paths) -> dict:
+    ordered = sorted(image_paths)
+    cols = max(1, math.ceil(math.sqrt(len(ordered))))
+    rows = max(1, math.ceil(len(ordered) / cols))
+    return {
+        'cols': cols,
+        'rows': rows,
+        'cell': CELL_SIZE,
+        'frames': {path: [index % cols, index // cols] for index, path in enumerate(ordered)},
+    }
+
+
+def _atlas_file(key: str) -> str:
+    return os.path.join(current_app.static_folder, ATLAS_DIR, f'{key}.jpg')
+
+
+def build_atlas(key: str, sources: Dict[str, str]):
+    """Packt alle Gesichter in ein Raster-Bild (Job für den Worker-Pool)."""
+    target = _atlas_file(key)
+    try:
+        if os.path.exists(target):
+            return {}
+
+        layout = _layout(sources)
+        atlas = Image.new('RGB', (layout['cols'] * CELL_SIZE, layout['rows'] * CELL_SIZE), (240, 240, 240))
+        for image_path, (col, row) in layout['frames'].items():
+            try:
+                with Image.open(os.path.join(current_app.static_folder, sources[image_path])) as face:
+                    cell = ImageOps.fit(face.convert('RGB'), (CELL_SIZE, CELL_SIZE), Image.Resampling.LANCZOS)
+            except OSError as e:
+                current_app.logger.warning(f"Gesicht für Atlas nicht lesbar ({image_path}): {e}")
+                continue
+            atlas.paste(cell, (col * CELL_SIZE, row * CELL_SIZE))
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp_path = f'{target}.{os.getpid()}.tmp'
+        atlas.save(tmp_path, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+        os.replace(tmp_path, target)
+        _prune_atlases()
+        return {}
+    finally:
+        with _lock:
+            _pending.discard(key)
+
+
+def _prune_atlases():
+    directory = os.path.join(current_app.static_folder, ATLAS_DIR)
+    entries = sorted(
+        (entry for entry in os.scandir(directory) if entry.name.endswith('.jpg')),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in entries[MAX_ATLASES:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _schedule_build(key: str, sources: Dict[str, str]):
+    with _lock:
+        if key in _pending:
+            return
+        _pending.add(key)
+    try:
+        submit_image_job(build_atlas, (key, sources), publish=False)
+    except ImageQueueFullError:
+        # Uploads haben Vorrang; der nächste Abruf versucht es erneut
+        with _lock:
+            _pending.discard(key)
+
+
+def get_face_atlas(faces: List[dict], build: bool = True) -> Optional[dict]:
+    """
+    Atlas-Beschreibung für eine Gesichterliste oder None, solange er nicht gebaut ist.
+
+    Returns:
+        {'url', 'cols', 'rows', 'cell', 'frames': {image_path: [spalte, zeile]}}
+    """
+    sources = _source_paths(faces)
+    if len(sources) < 2:
+        return None
+
+    key = atlas_key(sources)
+    if not os.path.exists(_atlas_file(key)):
+        if build:
+            _schedule_build(key, sources)
+        return None
+
+    atlas = _layout(sources)
+    atlas['url'] = url_for('static', filename=f'{ATLAS_DIR}/{key}.jpg')
+    return atlas
+
+
+def prewarm_active_selection(game_key):
+    """Worker-Job: baut den Atlas der aktuellen Spielerauswahl eines Spiels vor."""
+    from app.services.avatar_manifest import get_avatar_manifest
+    from app.services.session_service import get_active_session
+
+    with use_game(game_key):
+        active_session = get_active_session()
+        if not active_session:
+            return {}
+        manifest = get_avatar_manifest()
+    selected_players = active_session.get_selected_players() or manifest.default_selection()
+    sources = _source_paths(manifest.faces_for_selection(selected_players)) if selected_players else {}
+    if len(sources) < 2:
+        return {}
+
+    key = atlas_key(sources)
+    with _lock:
+        if key in _pending:
+            return {}
+        _pending.add(key)
+    return build_atlas(key, sources)
+
+
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in _WATCHED_ATTRS[mapper.class_]):
+        session.info.setdefault(_SESSION_DIRTY_KEY, set()).add(target.__dict__.get('game_key') or default_game_key())
+
+
+def schedule_prewarm(game_key: str) -> bool:
+    """Plant das Vorbauen des Atlas eines Spiels im Worker-Pool; False, wenn das nicht möglich ist."""
+    try:
+        submit_image_job(prewarm_active_selection, (game_key,), publish=False)
+    except (ImageQueueFullError, RuntimeError):
+        # Volle Warteschlange oder kein App-Kontext: der nächste Abruf baut bei Bedarf
+        return False
+    return True
+
+
+def _after_commit(session):
+    game_keys = session.info.pop(_SESSION_DIRTY_KEY, None)
+    if not game_keys:
+        return
+    # Nach dem Commit darf diese Session kein SQL mehr ausführen -> eigener Job im Worker-Pool
+    for game_key in game_keys:
+        if not schedule_prewarm(game_key):
+            break
+
+
+def _after_rollback(session):
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def _add_atlas_cache_headers(response):
+    if request.endpoint == 'static' and request.view_args \
+            and _ATLAS_FILE_RE.match(request.view_args.get('filename', '')) \
+            and response.status_code in (200, 206, 304):
+        response.headers['Cache-Control'] = _IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def init_app(app):
+    """Registriert Vorwärm-Hooks und Cache-Header für Atlas-Dateien."""
+    app.after_request(_add_atlas_cache_headers)
+    if event.contains(Session, 'after_commit', _after_commit):
+        return
+    for model in _WATCHED_ATTRS:
+        event.listen(model, 'after_update', _mark_dirty)
+    event.listen(Session, 'after_commit', _after_commit)
+    event.listen(Session, 'after_rollback', _after_rollback)
@@ -0,0 +1,108 @@
+"""
+Reproduzierbarer Zufall pro Spielsitzung.
+
+Jede `GameSession` bekommt beim Anlegen einen Seed (`rng_seed`) und zählt
+ihre Ziehungen (`rng_draws`). Ziehung Nr. n verwendet einen eigenen, nur aus
+(Seed, n) abgeleiteten Zufallsstrom - egal ob dafür `randint`, `choice` oder
+`sample` aufgerufen wird. Damit reichen Seed und Zählerstand, um jeden Wurf
+später exakt nachzuspielen; Würfel-Events speichern beides unter `rng`
+(siehe `dice_service._dice_rolled`).
+
+- `get_session_rng(session)`: Zufallsquelle der Sitzung; jede Ziehung erhöht
+  `session.rng_draws` und wird mit der Spielaktion committet,
+- `get_layout_rng(session)`: eigener Strom für die Feld-Verteilung
+  (Wahrscheinlichkeitsfelder, Konflikte), beginnt immer bei 0 - gleiche
+  Konfiguration + gleicher Seed ergibt dasselbe Brett,
+- `replay_rng(checkpoint)`: ungebundene Quelle ab einem gespeicherten Stand.
+
+Ohne Sitzung (Vorschau, Skripte) liefern beide eine frisch geseedete Quelle.
+"""
+
+import random
+import secrets
+
+SEED_BITS = 62  # passt in SQLite INTEGER (signed 64 bit)
+
+GAME_STREAM = 'game'
+LAYOUT_STREAM = 'layout'
+
+
+def new_seed() -> int:
+    """Neuer, nicht vorhersagbarer Sitzungs-Seed."""
+    return secrets.randbits(SEED_BITS)
+
+
+class GameRng:
+    """
+    Zählerbasierte Zufallsquelle mit der Schnittstelle von `random`
+    (`random`, `randint`, `choice`, `sample`, `shuffle`).
+
+    Ist eine Sitzung gebunden, wird der Zählerstand bei jeder Ziehung aus der
+    Sitzung gelesen und zurückgeschrieben, so dass mehrere Instanzen innerhalb
+    eines Requests denselben Zähler fortsetzen.
+    """
+
+    __slots__ = ('seed', 'draws', 'stream', '_session')
+
+    def __init__(self, seed: int, draws: int = 0, stream: str = GAME_STREAM, session=None):
+        self.seed = seed
+        self.draws = draws
+        self.stream = stream
+        self._session = session
+
+    def _next(self) -> random.Random:
+        if self._session is not None:
+            self.draws = self._session.rng_draws or 0
+        generator = random.Random(f"{self.stream}:{self.seed}:{self.draws}")
+        self.draws += 1
+        if self._session is not None:
+            self._session.rng_draws = self.draws
+        return generator
+
+    def random(self) -> float:
+        return self._next().random()
+
+    def randint(self, a: int, b: int) -> int:
+        return self._next().randint(a, b)
+
+    def choice(self, seq):
+        return self._next().choice(seq)
+
+    def sample(self, population, k: int) -> list:
+        return self._next().sample(population, k)
+
+    def shuffle(self, x) -> None:
+        self._next().shuffle(x)
+
+    def checkpoint(self) -> dict:
+        """Aktueller Stand für Event-Daten: die nächste Ziehung hat Index `draw`."""
+        if self._session is not None:
+            self.draws = self._session.rng_draws or 0
+        return {'seed': self.seed, 'draw': self.draws}
+
+
+def _ensure_seed(game_session) -> int:
+    if game_session.rng_seed is None:
+        # Altdaten vor der Migration: Seed nachträglich vergeben
+        game_session.rng_seed = new_seed()
+        game_session.rng_draws = 0
+    return game_session.rng_seed
+
+
+def get_session_rng(game_session) -> GameRng:
+    """Zufallsquelle der Sitzung (ohne Sitzung: frisch geseedet, nicht gespeichert)."""
+    if game_session is None:
+        return GameRng(new_seed())
+    return GameRng(_ensure_seed(game_session), game_session.rng_draws or 0, session=game_session)
+
+
+def get_layout_rng(game_session) -> GameRng:
+    """Zufallsquelle für die Feld-Verteilung; unabhängig vom Spiel-Zähler."""
+    seed = game_session.rng_seed if game_session is not None else None
+    return GameRng(seed if seed is not None else new_seed(), stream=LAYOUT_STREAM)
+
+
+def replay_rng(checkpoint: dict, stream: str = GAME_STREAM) -> GameRng:
+    """Ungebundene Quelle ab einem gespeicherten Stand (`{'seed': ..., 'draw': ...}`)."""
+    return GameRng(checkpoint['seed'], checkpoint.get('draw', 0), stream)
+
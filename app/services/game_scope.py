@@ -0,0 +1,123 @@
+"""
+Mehrere Spiele parallel auf einer Instanz (z.B. verschiedene Jugendgruppen).
+
+Jedes Spiel hat einen Schlüssel (`game_key`, Standard 'default'). Teams,
+Spielsitzungen, Runden, Willkommens-Sessions und Feld-Konfigurationen (das
+aktive Brett-Layout) tragen ihn als Spalte; die aktive Sitzung/Runde wird je
+Spiel über den Index (game_key, is_active) gefunden, Aktivieren deaktiviert
+nur Zeilen desselben Spiels.
+
+Das Spiel eines Requests (`current_game_key()`, einmal pro Request ermittelt):
+
+- angemeldetes Team: das Spiel des Teams (nicht umschaltbar),
+- sonst `?game=<key>` bzw. Header `X-Game-Key`; die Auswahl wird in der
+  Flask-Session gemerkt, damit Board-Seite, Polls und Stream desselben
+  Browsers beim Spiel bleiben,
+- sonst die gemerkte Auswahl (Admin: `/admin/select_game`),
+- sonst `DEFAULT_GAME_KEY` aus der Konfiguration.
+
+Außerhalb eines Requests (Skripte, CLI) gilt `use_game()` bzw. das
+Standardspiel. Neue Zeilen übernehmen das aktuelle Spiel als Spalten-Default.
+"""
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from flask import current_app, g, has_app_context, has_request_context, request, session
+
+DEFAULT_GAME = 'default'
+GAME_ARG = 'game'
+GAME_HEADER = 'X-Game-Key'
+SESSION_KEY = 'game_key'
+
+_KEY_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]{0,49}$')
+_G_ATTR = '_game_key'
+_override: ContextVar = ContextVar('game_key_override', default=None)
+
+
+def normalize_game_key(value) -> Optional[str]:
+    """Kleingeschriebener Schlüssel (a-z, 0-9, '-', '_', max. 50 Zeichen) oder None."""
+    if value is None:
+        return None
+    key = str(value).strip().lower()
+    return key if _KEY_PATTERN.match(key) else None
+
+
+def default_game_key() -> str:
+    if has_app_context():
+        return current_app.config.get('DEFAULT_GAME_KEY', DEFAULT_GAME)
+    return DEFAULT_GAME
+
+
+def _team_game_key() -> Optional[str]:
+    from flask_login import current_user
+    from app.models import Team
+
+    user = current_user._get_current_object() if current_user else None
+    if isinstance(user, Team):
+        return user.game_key or default_game_key()
+    return None
+
+
+def _resolve_request_game() -> str:
+    team_game = _team_game_key()
+    if team_game:
+        return team_game
+
+    explicit = normalize_game_key(request.args.get(GAME_ARG) or request.headers.get(GAME_HEADER))
+    if explicit:
+        if session.get(SESSION_KEY) != explicit:
+            session[SESSION_KEY] = explicit
+        return explicit
+    return normalize_game_key(session.get(SESSION_KEY)) or default_game_key()
+
+
+def current_game_key() -> str:
+    """Schlüssel des Spiels, auf das sich der aktuelle Request (oder Block) bezieht."""
+    override = _override.get()
+    if override:
+        return override
+    if not has_request_context():
+        return default_game_key()
+    key = g.get(_G_ATTR)
+    if key is None:
+        key = _resolve_request_game()
+        setattr(g, _G_ATTR, key)
+    return key
+
+
+def select_game(game_key: str) -> str:
+    """Merkt die Spielauswahl in der Flask-Session (Admin, Board-Anzeige)."""
+    key = normalize_game_key(game_key)
+    if key is None:
+        raise ValueError(f"Ungültiger Spiel-Schlüssel: {game_key!r}")
+    session[SESSION_KEY] = key
+    if has_request_context():
+        setattr(g, _G_ATTR, key)
+    return key
+
+
+@contextmanager
+def use_game(game_key: str) -> Iterator[str]:
+    """Bindet einen Block (Skript, Hintergrund-Job) an ein Spiel."""
+    key = normalize_game_key(game_key)
+    if key is None:
+        raise ValueError(f"Ungültiger Spiel-Schlüssel: {game_key!r}")
+    token = _override.set(key)
+    try:
+        yield key
+    finally:
+        _override.reset(token)
+
+
+def known_game_keys() -> List[str]:
+    """Alle Spiele mit Teams, Sitzungen oder Runden (für die Admin-Auswahl)."""
+    from app import db
+    from app.models import GameRound, GameSession, Team
+
+    keys = {default_game_key()}
+    for model in (Team, GameSession, GameRound):
+        keys.update(key for (key,) in db.session.query(model.game_key).distinct() if key)
+    return sorted(keys)
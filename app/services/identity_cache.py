@@ -0,0 +1,110 @@
+"""
+Kurzlebiger Identitäts-Cache für `load_user`.
+
+Flask-Login lädt den angemeldeten Benutzer bei jedem Request neu
+(`Admin.query.get` / `Team.query.get`). Board, Dashboard und Moderationsmodus
+pollen im Sekundentakt, daher werden hier die Spaltenwerte des Benutzers für
+wenige Sekunden vorgehalten und per `Session.merge(load=False)` ohne Abfrage
+wieder an die aktuelle DB-Session gehängt.
+
+Einträge werden nach dem Commit verworfen, sobald der Benutzer innerhalb
+dieses Prozesses geändert oder gelöscht wurde; zwischen Prozessen begrenzt
+die TTL die Veraltung.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.services.request_context import count_lookup
+
+IDENTITY_TTL_SECONDS = 5.0
+_MAX_ENTRIES = 256
+
+_SESSION_DIRTY_KEY = 'identity_cache_dirty'
+_LOOKUP_KEY = 'load_user'
+
+_lock = threading.Lock()
+_entries: Dict[Tuple[str, int], Tuple[float, dict]] = {}
+
+
+def _snapshot(obj) -> dict:
+    mapper = inspect(obj).mapper
+    return {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+
+def _restore(model: Type, values: dict, session):
+    instance = inspect(model).class_manager.new_instance()
+    for key, value in values.items():
+        setattr(instance, key, value)
+    make_transient_to_detached(instance)
+    return session.merge(instance, load=False)
+
+
+def load_identity(model: Type, identity: int, session):
+    """
+    Lädt Admin/Team über den Cache; bei Fehlschlag per Primärschlüssel.
+
+    Gibt None zurück, wenn der Benutzer nicht existiert.
+    """
+    key = (model.__name__, identity)
+    now = time.monotonic()
+
+    with _lock:
+        entry = _entries.get(key)
+    if entry and now - entry[0] < IDENTITY_TTL_SECONDS:
+        # Bereits in dieser DB-Session geladen -> Identity-Map-Objekt verwenden
+        existing = session.identity_map.get(session.identity_key(model, identity))
+        count_lookup(_LOOKUP_KEY, True)
+        return existing if existing is not None else _restore(model, entry[1], session)
+
+    count_lookup(_LOOKUP_KEY, False)
+    obj = session.get(model, identity)
+    with _lock:
+        if obj is None:
+            _entries.pop(key, None)
+        else:
+            _entries[key] = (now, _snapshot(obj))
+            if len(_entries) > _MAX_ENTRIES:
+                oldest = min(_entries, key=lambda k: _entries[k][0])
+                _entries.pop(oldest, None)
+    return obj
+
+
+def evict(model_name: str, identity: Optional[int] = None):
+    """Verwirft Cache-Einträge (ein Benutzer oder alle eines Modells)."""
+    with _lock:
+        if identity is not None:
+            _entries.pop((model_name, identity), None)
+        else:
+            for key in [k for k in _entries if k[0] == model_name]:
+                _entries.pop(key, None)
+
+
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_SESSION_DIRTY_KEY, set()).add((type(target).__name__, target.id))
+
+
+def _after_commit(session):
+    for model_name, identity in session.info.pop(_SESSION_DIRTY_KEY, ()):
+        evict(model_name, identity)
+
+
+def _after_rollback(session):
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def register_invalidation_hooks(*models: Type):
+    """Registriert Update-/Delete-Events der Benutzer-Modelle (einmalig)."""
+    for model in models:
+        if not event.contains(model, 'after_update', _mark_dirty):
+            event.listen(model, 'after_update', _mark_dirty)
+            event.listen(model, 'after_delete', _mark_dirty)
+    if not event.contains(Session, 'after_commit', _after_commit):
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_rollback', _after_rollback)
@@ -0,0 +1,208 @@
+"""
+Hintergrund-Verarbeitung für Profilbild-Uploads.
+
+Beim Welcome-Screen laden viele Spieler innerhalb kurzer Zeit Selfies hoch.
+Base64-Dekodierung, Validierung, Skalierung und Kodierung der Varianten
+(siehe `profile_images.save_profile_image`) blockierten dabei jeweils einen
+Request-Worker und bremsten die Board-Polls aus.
+
+Uploads werden deshalb als Job an einen begrenzten Thread-Pool übergeben:
+- `submit_image_job()` gibt sofort einen Job zurück; die Route antwortet mit
+  der Job-ID (HTTP 202).
+- Der Job läuft in einem eigenen App-Kontext unter dem Spiel des einreichenden
+  Requests (`game_scope.use_game`), speichert das Bild und schreibt
+  anschließend ein `welcome_state`-Event (`profile_image_ready` bzw.
+  `profile_image_failed`) in den Event-Stream der aktiven Session.
+- Admin-Routen, die das Ergebnis direkt anzeigen, nutzen `run_image_job()`:
+  die Arbeit läuft ebenfalls im Pool (und zählt gegen dessen Grenze), die
+  Route wartet aber auf das Ergebnis und es wird kein Event geschrieben.
+- Ist die Warteschlange voll, wird `ImageQueueFullError` ausgelöst, damit die
+  Route mit 503 antworten kann, statt unbegrenzt Bilder im Speicher zu halten.
+
+Pillow gibt beim Skalieren und Kodieren den GIL frei, daher genügen Threads.
+Der Job-Status liegt nur im Speicher dieses Prozesses und wird nach
+`JOB_RETENTION` Sekunden verworfen.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app
+
+from app import db
+from app.services.game_scope import current_game_key, use_game
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 32
+JOB_RETENTION = 600.0
+JOB_WAIT_TIMEOUT = 30.0
+
+STREAM_EVENT_TYPE = 'welcome_state'
+
+PENDING = 'pending'
+PROCESSING = 'processing'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class ImageQueueFullError(RuntimeError):
+    """Alle Plätze der Bildverarbeitungs-Warteschlange sind belegt."""
+
+
+class ImageJob:
+    """Status eines Bildverarbeitungs-Jobs."""
+
+    __slots__ = ('id', 'status', 'context', 'publish', 'result', 'error', 'created_at', 'finished_at', '_done')
+
+    def __init__(self, context: Dict[str, Any], publish: bool):
+        self.id = uuid.uuid4().hex
+        self.status = PENDING
+        self.context = context
+        self.publish = publish
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blockiert bis der Job fertig ist; True, wenn er innerhalb von `timeout` endete."""
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = {'job_id': self.id, 'status': self.status, **self.context}
+        if self.result:
+            payload.update(self.result)
+        if self.error:
+            payload['error'] = self.error
+        return payload
+
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+_jobs: Dict[str, ImageJob] = {}
+
+
+def _prune_jobs():
+    now = time.monotonic()
+    expired = [
+        job_id for job_id, job in _jobs.items()
+        if job.finished_at is not None and now - job.finished_at > JOB_RETENTION
+    ]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def _publish_job_event(job: ImageJob):
+    from app.services.event_service import create_event
+    from app.services.session_service import get_or_create_active_session
+
+    action = 'profile_image_ready' if job.status == DONE else 'profile_image_failed'
+    session = get_or_create_active_session()
+    create_event(session.id, event_type=STREAM_EVENT_TYPE,
+                 data={'scope': 'welcome', 'action': action, **job.to_dict()})
+    db.session.commit()
+
+
+def _run_job(app, game_key: str, job: ImageJob, func: Callable[..., Dict[str, Any]], args, kwargs):
+    try:
+        with app.app_context(), use_game(game_key):
+            job.status = PROCESSING
+            try:
+                job.result = func(*args, **kwargs) or {}
+                job.status = DONE
+            except ValueError as e:
+                # Erwartete Fehler (ungültige Bilddaten, Spieler entfernt) mit Meldung für den Client
+                db.session.rollback()
+                job.error = str(e)
+                job.status = FAILED
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f"Bildverarbeitung für Job {job.id} fehlgeschlagen: {e}", exc_info=True)
+                job.error = 'Bild konnte nicht verarbeitet werden'
+                job.status = FAILED
+
+            if job.publish:
+                try:
+                    _publish_job_event(job)
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.warning(f"Stream-Event für Bild-Job {job.id} fehlgeschlagen: {e}")
+    finally:
+        job.finished_at = time.monotonic()
+        job._done.set()
+        _slots.release()
+
+
+def submit_image_job(func: Callable[..., Dict[str, Any]], args=(), kwargs=None,
+                     context: Optional[Dict[str, Any]] = None, publish: bool = True) -> ImageJob:
+    """
+    Reiht eine Bildverarbeitung in den Worker-Pool ein.
+
+    `func` läuft im App-Kontext eines Worker-Threads unter dem Spiel des
+    aufrufenden Requests, committet selbst und gibt
+    ein Dict mit Ergebnisdaten (z. B. `image_path`, `image_variants`) zurück.
+    `ValueError` gilt als erwarteter Fehler; seine Meldung erreicht den Client.
+    `context` (z. B. Spielername) wird in Status und Stream-Event übernommen.
+
+    Raises:
+        ImageQueueFullError: Wenn bereits `IMAGE_JOB_QUEUE_SIZE` Jobs offen sind.
+    """
+    if _executor is None:
+        raise RuntimeError("image_jobs.init_app() wurde nicht aufgerufen")
+    if not _slots.acquire(blocking=False):
+        raise ImageQueueFullError("Zu viele Bilder in Bearbeitung, bitte gleich nochmal versuchen")
+
+    # Der Worker hat keinen Request-Kontext: Spiel jetzt festhalten
+    game_key = current_game_key()
+    job = ImageJob(context or {}, publish)
+    with _lock:
+        _prune_jobs()
+        _jobs[job.id] = job
+
+    try:
+        _executor.submit(_run_job, current_app._get_current_object(), game_key, job, func, args, kwargs or {})
+    except Exception:
+        _slots.release()
+        with _lock:
+            _jobs.pop(job.id, None)
+        raise
+    return job
+
+
+def run_image_job(func: Callable[..., Dict[str, Any]], args=(), kwargs=None,
+                  timeout: float = JOB_WAIT_TIMEOUT) -> Dict[str, Any]:
+    """
+    Führt `func` im Worker-Pool aus und wartet auf das Ergebnis.
+
+    Raises:
+        ImageQueueFullError: Wenn die Warteschlange voll ist.
+        ValueError: Wenn der Job fehlschlägt oder nicht rechtzeitig fertig wird.
+    """
+    job = submit_image_job(func, args, kwargs, publish=False)
+    if not job.wait(timeout):
+        raise ValueError('Zeitüberschreitung bei der Bildverarbeitung')
+    if job.status != DONE:
+        raise ValueError(job.error or 'Bild konnte nicht verarbeitet werden')
+    return job.result
+
+
+def get_image_job(job_id: str) -> Optional[ImageJob]:
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def init_app(app):
+    """Legt den Worker-Pool nach `IMAGE_WORKERS`/`IMAGE_JOB_QUEUE_SIZE` an (einmal pro Prozess)."""
+    global _executor, _slots
+    with _lock:
+        if _executor is not None:
+            return
+        workers = max(1, int(app.config.get('IMAGE_WORKERS', DEFAULT_WORKERS)))
+        queue_size = max(workers, int(app.config.get('IMAGE_JOB_QUEUE_SIZE', DEFAULT_QUEUE_SIZE)))
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-worker')
+        _slots = threading.BoundedSemaphore(queue_size)
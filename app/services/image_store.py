@@ -0,0 +1,245 @@
+"""
+Verwaltung der hochgeladenen Spielerbilder auf der Festplatte.
+
+Profilbilder liegen inhalts-adressiert unter `static/profile_images/<hh>/`
+(siehe `profile_images.py`); gleiche Fotos teilen sich dieselben Dateien.
+Ältere Uploads mit Zeitstempel-Namen liegen noch direkt in
+`static/profile_images/` bzw. `static/team_images/`.
+
+Referenzen:
+    `collect_reference_counts()` zählt, wie oft jeder Pfad aus
+    `Team.profile_images`/`profile_image_variants` und
+    `PlayerRegistration.profile_image_path`/`profile_image_variants`
+    referenziert wird. Die Zählung wird bei jedem GC-Lauf aus der Datenbank
+    gebildet und kann daher nicht auseinanderlaufen.
+
+Garbage Collection:
+    Nach Commits, die Bildspalten ändern oder Spieler/Teams löschen, wird ein
+    GC-Lauf mit `GC_DELAY` Sekunden Verzögerung eingeplant (mehrere Änderungen
+    werden zusammengefasst). Er entfernt alle Dateien ohne Referenz, die älter
+    als `GC_MIN_AGE` sind. Die Altersgrenze schützt Uploads, deren Datei schon
+    geschrieben, der Datenbank-Eintrag aber noch nicht committet ist.
+
+Reset:
+    `reset_image_store()` tauscht die Bildordner gegen leere aus (zwei
+    `rename`-Aufrufe statt Löschen Datei für Datei) und entfernt die alten
+    Ordner in einem Hintergrund-Thread.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Iterable, Optional
+
+from flask import current_app
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app import db
+from app.models import PlayerRegistration, Team
+
+STORE_DIRS = ('profile_images', 'team_images')
+TRASH_DIR = '.image_trash'
+
+GC_DELAY = 30.0
+GC_MIN_AGE = 600.0
+
+_IMAGE_ATTRS = {
+    Team: ('profile_images', 'profile_image_variants'),
+    PlayerRegistration: ('profile_image_path', 'profile_image_variants'),
+}
+_SESSION_DIRTY_KEY = 'image_store_dirty'
+
+_lock = threading.Lock()
+_gc_timer: Optional[threading.Timer] = None
+
+
+def _load_json(value) -> dict:
+    if not value:
+        return {}
+    try:
+        loaded = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def _variant_paths(variants: dict) -> Iterable[str]:
+    for formats in variants.values():
+        if isinstance(formats, dict):
+            yield from (path for path in formats.values() if path)
+
+
+def collect_reference_counts() -> Counter:
+    """Referenzen je Bildpfad (relativ zu `static/`) aus Teams und Registrierungen."""
+    counts: Counter = Counter()
+
+    for profile_images, profile_image_variants in db.session.query(
+            Team.profile_images, Team.profile_image_variants):
+        counts.update(path for path in _load_json(profile_images).values() if path)
+        for variants in _load_json(profile_image_variants).values():
+            if isinstance(variants, dict):
+                counts.update(_variant_paths(variants))
+
+    for image_path, profile_image_variants in db.session.query(
+            PlayerRegistration.profile_image_path, PlayerRegistration.profile_image_variants):
+        if image_path:
+            counts[image_path] += 1
+        counts.update(_variant_paths(_load_json(profile_image_variants)))
+
+    return counts
+
+
+def collect_garbage(min_age: float = GC_MIN_AGE) -> Dict[str, int]:
+    """
+    Entfernt unreferenzierte Bilddateien, die älter als `min_age` Sekunden sind.
+
+    Returns:
+        Statistik mit `scanned`, `removed` und `freed_bytes`.
+    """
+    references = collect_reference_counts()
+    static_folder = current_app.static_folder
+    cutoff = time.time() - min_age
+    stats = {'scanned': 0, 'removed': 0, 'freed_bytes': 0}
+
+    for store_dir in STORE_DIRS:
+        root = os.path.join(static_folder, store_dir)
+        for dirpath, _, filenames in os.walk(root, topdown=False):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                relative = os.path.relpath(file_path, static_folder).replace(os.sep, '/')
+                stats['scanned'] += 1
+                if references[relative]:
+                    continue
+                try:
+                    stat = os.stat(file_path)
+                    if stat.st_mtime > cutoff:
+                        continue
+                    os.remove(file_path)
+                except OSError:
+                    continue
+                stats['removed'] += 1
+                stats['freed_bytes'] += stat.st_size
+            # Leere Hash-Unterordner aufräumen (Wurzelordner bleibt bestehen)
+            if dirpath != root:
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
+
+    if stats['removed']:
+        current_app.logger.info(
+            f"Bild-GC: {stats['removed']} von {stats['scanned']} Dateien entfernt "
+            f"({stats['freed_bytes'] // 1024} KB)"
+        )
+    return stats
+
+
+def _run_scheduled_gc(app):
+    global _gc_timer
+    with _lock:
+        _gc_timer = None
+    with app.app_context():
+        try:
+            collect_garbage()
+        except Exception as e:
+            app.logger.warning(f"Bild-GC fehlgeschlagen: {e}", exc_info=True)
+
+
+def schedule_gc(app=None, delay: float = GC_DELAY):
+    """Plant einen GC-Lauf im Hintergrund; bereits geplante Läufe werden zusammengefasst."""
+    global _gc_timer
+    app = app or current_app._get_current_object()
+    with _lock:
+        if _gc_timer is not None:
+            return
+        _gc_timer = threading.Timer(delay, _run_scheduled_gc, args=(app,))
+        _gc_timer.daemon = True
+        _gc_timer.start()
+
+
+def _trash_root() -> str:
+    # Außerhalb von static/, damit verschobene Bilder nicht mehr ausgeliefert werden
+    return os.path.join(os.path.dirname(current_app.root_path), TRASH_DIR)
+
+
+def reset_image_store():
+    """
+    Leert alle Bildordner durch Austausch gegen leere Ordner.
+
+    Jeder Ordner wird zunächst leer neben dem alten angelegt und dann per
+    `rename` getauscht; die alten Inhalte werden im Hintergrund gelöscht.
+    Liegt der Papierkorb auf einem anderen Dateisystem, wird der alte Ordner
+    stattdessen innerhalb von `static/` umbenannt.
+    """
+    trash_root = _trash_root()
+    os.makedirs(trash_root, exist_ok=True)
+    discarded = []
+
+    for store_dir in STORE_DIRS:
+        target = os.path.join(current_app.static_folder, store_dir)
+        token = uuid.uuid4().hex[:8]
+        fresh = f'{target}.{token}.new'
+        os.makedirs(fresh)
+
+        if os.path.isdir(target):
+            trashed = os.path.join(trash_root, f'{store_dir}.{token}')
+            try:
+                os.rename(target, trashed)
+            except OSError:
+                # Anderes Dateisystem (z. B. Volume für static/): vor Ort umbenennen
+                trashed = f'{target}.{token}.old'
+                os.rename(target, trashed)
+            discarded.append(trashed)
+        os.rename(fresh, target)
+
+    threading.Thread(
+        target=lambda: [shutil.rmtree(path, ignore_errors=True) for path in discarded],
+        name='image-store-reset', daemon=True,
+    ).start()
+    current_app.logger.info(f"Bildordner zurückgesetzt: {', '.join(STORE_DIRS)}")
+
+
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        return
+    attrs = _IMAGE_ATTRS.get(mapper.class_, ())
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in attrs):
+        session.info[_SESSION_DIRTY_KEY] = True
+
+
+def _mark_deleted(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[_SESSION_DIRTY_KEY] = True
+
+
+def _after_commit(session):
+    if session.info.pop(_SESSION_DIRTY_KEY, False):
+        try:
+            schedule_gc()
+        except RuntimeError:
+            # Commit außerhalb eines App-Kontexts (z. B. Skripte): nächster Lauf räumt auf
+            pass
+
+
+def _after_rollback(session):
+    session.info.pop(_SESSION_DIRTY_KEY, None)
+
+
+def init_app(app):
+    """Registriert die GC-Auslöser und plant einen ersten Lauf nach dem Start."""
+    if not event.contains(Session, 'after_commit', _after_commit):
+        for model in _IMAGE_ATTRS:
+            event.listen(model, 'after_insert', _mark_dirty)
+            event.listen(model, 'after_update', _mark_dirty)
+            event.listen(model, 'after_delete', _mark_deleted)
+        event.listen(Session, 'after_commit', _after_commit)
+        event.listen(Session, 'after_rollback', _after_rollback)
+    schedule_gc(app)
@@ -0,0 +1,171 @@
+"""
+Auslieferung großer Mediendateien (Minispiel-Videos, Audio) mit Range-Support.
+
+Flasks Static-View liefert Videos zwar aus, beim Spulen auf dem Beamer wurde
+die Datei aber vom Worker durch Python-Iteration gestreamt. `send_media()`:
+
+- beantwortet `If-None-Match`/`If-Modified-Since` mit 304,
+- unterstützt genau einen Byte-Bereich (`Range`, inkl. `If-Range`) mit 206
+  bzw. 416; mehrere Bereiche werden ignoriert und die ganze Datei geliefert,
+- gibt den Body als `wsgi.file_wrapper` des Servers zurück (gunicorn, uWSGI
+  und waitress senden per `sendfile` ab der aktuellen Dateiposition und
+  begrenzen auf `Content-Length`). Ohne File-Wrapper (Entwicklungsserver)
+  wird nur der angefragte Bereich in Blöcken gelesen.
+- delegiert mit `MEDIA_ACCEL_MODE` die Übertragung ganz an einen lokalen
+  Reverse-Proxy: `x-accel` (nginx, `X-Accel-Redirect` auf
+  `MEDIA_ACCEL_PREFIX` + Pfad relativ zu `static/`) oder `x-sendfile`
+  (Apache/lighttpd, absoluter Pfad). Range und Übertragung übernimmt dann
+  der Proxy, der Python-Worker ist sofort wieder frei.
+
+Beispiel für nginx:
+
+    location /protected-static/ {
+        internal;
+        alias /app/app/static/;
+    }
+
+Statische Dateien mit Medien-Endung laufen über einen `before_request`-Hook
+ebenfalls durch `send_media()`; Videos außerhalb von `static/` sind über die
+Route `main.minigame_video` erreichbar.
+"""
+
+import mimetypes
+import os
+import stat
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from flask import abort, current_app, request
+from werkzeug.datastructures import ContentRange
+from werkzeug.http import is_resource_modified
+from werkzeug.security import safe_join
+
+MEDIA_EXTENSIONS = ('.mp4', '.m4v', '.webm', '.mov', '.ogv', '.mp3', '.m4a', '.ogg', '.oga', '.wav')
+ACCEL_MODES = ('x-accel', 'x-sendfile')
+
+BLOCK_SIZE = 256 * 1024
+DEFAULT_MAX_AGE = 3600
+DEFAULT_ACCEL_PREFIX = '/protected-static/'
+
+
+class _FileRange:
+    """Iteriert `length` Bytes ab der aktuellen Dateiposition und schließt die Datei."""
+
+    def __init__(self, file, length: int):
+        self.file = file
+        self.remaining = length
+
+    def __iter__(self):
+        while self.remaining > 0:
+            chunk = self.file.read(min(BLOCK_SIZE, self.remaining))
+            if not chunk:
+                break
+            self.remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        self.file.close()
+
+
+def _if_range_matches(etag: str, last_modified: datetime) -> bool:
+    if_range = request.if_range
+    if if_range.etag:
+        return if_range.etag == etag
+    if if_range.date:
+        return if_range.date == last_modified
+    return True
+
+
+def _accel_headers(mode: str, path: str):
+    """Header für die Übergabe an den Proxy oder None, wenn die Datei dafür ungeeignet ist."""
+    if mode == 'x-sendfile':
+        return {'X-Sendfile': path}
+
+    relative = os.path.relpath(path, current_app.static_folder)
+    if relative.startswith(os.pardir):
+        return None
+    prefix = current_app.config.get('MEDIA_ACCEL_PREFIX', DEFAULT_ACCEL_PREFIX).rstrip('/')
+    return {'X-Accel-Redirect': f"{prefix}/{quote(relative.replace(os.sep, '/'))}"}
+
+
+def send_media(directory: str, filename: str, max_age: int = None):
+    """
+    Liefert `filename` aus `directory` mit Conditional-, Range- und Zero-Copy-Support.
+
+    Raises:
+        NotFound: Wenn der Pfad aus `directory` herausführt oder keine Datei ist.
+    """
+    path = safe_join(directory, filename)
+    if path is None:
+        abort(404)
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        abort(404)
+    if not stat.S_ISREG(file_stat.st_mode):
+        abort(404)
+
+    size = file_stat.st_size
+    etag = f'{file_stat.st_mtime_ns:x}-{size:x}'
+    last_modified = datetime.fromtimestamp(int(file_stat.st_mtime), tz=timezone.utc)
+    mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    if max_age is None:
+        max_age = current_app.config.get('MEDIA_MAX_AGE', DEFAULT_MAX_AGE)
+
+    response = current_app.response_class(mimetype=mimetype, direct_passthrough=True)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.accept_ranges = 'bytes'
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response.status_code = 304
+        return response
+
+    mode = current_app.config.get('MEDIA_ACCEL_MODE')
+    if mode in ACCEL_MODES:
+        accel_headers = _accel_headers(mode, path)
+        if accel_headers:
+            response.headers.update(accel_headers)
+            return response
+
+    start, stop = 0, size
+    byte_range = request.range
+    if byte_range is not None and len(byte_range.ranges) == 1 and _if_range_matches(etag, last_modified):
+        requested = byte_range.range_for_length(size)
+        if requested is None:
+            response.status_code = 416
+            response.content_range = ContentRange('bytes', None, None, size)
+            return response
+        start, stop = requested
+        response.status_code = 206
+        response.content_range = ContentRange('bytes', start, stop, size)
+
+    response.content_length = stop - start
+    if request.method == 'HEAD':
+        return response
+
+    file = open(path, 'rb')
+    file.seek(start)
+    file_wrapper = request.environ.get('wsgi.file_wrapper')
+    # Server-Wrapper senden ab der Dateiposition per sendfile und kappen bei Content-Length
+    response.response = file_wrapper(file, BLOCK_SIZE) if file_wrapper else _FileRange(file, stop - start)
+    return response
+
+
+def _serve_static_media():
+    if request.endpoint != 'static' or request.method not in ('GET', 'HEAD'):
+        return None
+    filename = (request.view_args or {}).get('filename', '')
+    if not filename.lower().endswith(MEDIA_EXTENSIONS):
+        return None
+    return send_media(current_app.static_folder, filename)
+
+
+def init_app(app):
+    """Leitet Medien unter `static/` über `send_media()` und prüft `MEDIA_ACCEL_MODE`."""
+    mode = app.config.get('MEDIA_ACCEL_MODE')
+    if mode and mode not in ACCEL_MODES:
+        app.logger.warning(f"Unbekannter MEDIA_ACCEL_MODE '{mode}', Medien werden direkt ausgeliefert")
+    app.before_request(_serve_static_media)
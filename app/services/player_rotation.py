@@ -0,0 +1,145 @@
+"""
+Einsatz-Zähler der fairen Spieler-Rotation (Tabelle `player_rotation`).
+
+Je Spieler eine Zeile (Sitzung, Team, Spieler, Einsätze, zuletzt gespielt):
+
+- `RotationLedger` lädt die Zähler aller beteiligten Teams mit einer
+  Abfrage über den Index (game_session_id, team_id, player_name),
+- wählt je Team per Min-Heap (`game_logic.player_rotation.select_fair`),
+- und schreibt alle Einsätze einer Auslosung in `flush()` mit einem
+  Sammel-UPDATE zurück (plus einem Sammel-INSERT für neue Spieler).
+
+Commit übernimmt der Aufrufer.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app import db
+from app.game_logic.player_rotation import select_fair
+from app.models import PlayerRotation
+from app.services.game_rng import get_session_rng
+
+
+class RotationLedger:
+    """Zähler einer Sitzung für die geladenen Teams, mit gesammelten Einsätzen."""
+
+    def __init__(self, game_session, team_ids: Iterable[int] = ()):
+        self.game_session = game_session
+        # team_id -> {spieler: (zeilen-id oder None, einsätze)}
+        self._rows: Dict[int, Dict[str, Tuple[Optional[int], int]]] = {}
+        # (team_id, spieler) -> noch nicht geschriebene Einsätze
+        self._pending: Dict[Tuple[int, str], int] = {}
+        self.load(team_ids)
+
+    def load(self, team_ids: Iterable[int]) -> None:
+        """Lädt die Zähler noch nicht geladener Teams (eine Abfrage)."""
+        missing = list(dict.fromkeys(int(team_id) for team_id in team_ids if int(team_id) not in self._rows))
+        if not missing:
+            return
+        for team_id in missing:
+            self._rows[team_id] = {}
+        if self.game_session.id is None:
+            return
+        rows = db.session.query(
+            PlayerRotation.id, PlayerRotation.team_id, PlayerRotation.player_name, PlayerRotation.plays
+        ).filter(
+            PlayerRotation.game_session_id == self.game_session.id,
+            PlayerRotation.team_id.in_(missing),
+        )
+        for row_id, team_id, player_name, plays in rows:
+            self._rows[team_id][player_name] = (row_id, plays or 0)
+
+    def plays(self, team_id: int) -> Dict[str, int]:
+        """{spieler: einsätze} eines Teams inkl. noch nicht geschriebener Einsätze."""
+        team_id = int(team_id)
+        self.load([team_id])
+        return {player: plays for player, (_, plays) in self._rows[team_id].items()}
+
+    def select(self, team_id: int, members: Iterable[str], count: int, rng=None) -> List[str]:
+        """Wählt `count` Spieler mit den wenigsten Einsätzen (Gleichstand: Zufall der Sitzung)."""
+        return select_fair(members, self.plays(team_id), count, rng or get_session_rng(self.game_session))
+
+    def record(self, team_id: int, players: Iterable[str]) -> None:
+        """Merkt je Spieler einen Einsatz vor (geschrieben wird in `flush`)."""
+        team_id = int(team_id)
+        self.load([team_id])
+        team_rows = self._rows[team_id]
+        for player in players:
+            row_id, plays = team_rows.get(player, (None, 0))
+            team_rows[player] = (row_id, plays + 1)
+            self._pending[(team_id, player)] = self._pending.get((team_id, player), 0) + 1
+
+    def flush(self) -> None:
+        """Schreibt vorgemerkte Einsätze: ein UPDATE je Schrittweite, ein INSERT für neue Spieler."""
+        if not self._pending:
+            return
+        if self.game_session.id is None:
+            db.session.flush()
+
+        now = datetime.utcnow()
+        updates: Dict[int, List[int]] = {}
+        inserts = []
+        for (team_id, player), increment in self._pending.items():
+            row_id, plays = self._rows[team_id][player]
+            if row_id is None:
+                inserts.append({
+                    'game_session_id': self.game_session.id,
+                    'team_id': team_id,
+                    'player_name': player,
+                    'plays': plays,
+                    'last_played_at': now,
+                })
+            else:
+                updates.setdefault(increment, []).append(row_id)
+
+        # Pro Auslosung spielt jeder Spieler einmal: praktisch genau ein UPDATE
+        for increment, row_ids in updates.items():
+            PlayerRotation.query.filter(PlayerRotation.id.in_(row_ids)).update({
+                PlayerRotation.plays: PlayerRotation.plays + increment,
+                PlayerRotation.last_played_at: now,
+            }, synchronize_session=False)
+        if inserts:
+            db.session.bulk_insert_mappings(PlayerRotation, inserts)
+            # Neue Zeilen-IDs sind unbekannt: betroffene Teams beim nächsten Zugriff neu laden
+            for team_id in {row['team_id'] for row in inserts}:
+                self._rows.pop(team_id, None)
+        self._pending.clear()
+
+
+def rotation_counts(game_session) -> Dict[str, Dict[str, int]]:
+    """Alle Zähler einer Sitzung als {team_id (str): {spieler: einsätze}} (Statistik, Export)."""
+    counts: Dict[str, Dict[str, int]] = {}
+    if game_session.id is None:
+        return counts
+    rows = db.session.query(
+        PlayerRotation.team_id, PlayerRotation.player_name, PlayerRotation.plays
+    ).filter(PlayerRotation.game_session_id == game_session.id).order_by(PlayerRotation.id)
+    for team_id, player_name, plays in rows:
+        counts.setdefault(str(team_id), {})[player_name] = plays or 0
+    return counts
+
+
+def reset_rotation(game_session) -> None:
+    """Löscht alle Zähler einer Sitzung."""
+    if game_session.id is not None:
+        PlayerRotation.query.filter_by(game_session_id=game_session.id).delete(synchronize_session=False)
+
+
+def replace_rotation_counts(game_session, counts: Dict[str, Dict[str, int]]) -> None:
+    """Ersetzt die Zähler einer Sitzung durch {team_id: {spieler: einsätze}} (Import, Migration)."""
+    if game_session.id is None:
+        db.session.flush()
+    reset_rotation(game_session)
+    rows = [
+        {
+            'game_session_id': game_session.id,
+            'team_id': int(team_id),
+            'player_name': player,
+            'plays': int(plays),
+        }
+        for team_id, players in counts.items() if str(team_id).isdigit()
+        for player, plays in players.items()
+    ]
+    if rows:
+        db.session.bulk_insert_mappings(PlayerRotation, rows)
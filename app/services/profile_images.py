@@ -0,0 +1,293 @@
+"""
+Profilbilder als inhalts-gehashte Größenvarianten.
+
+`save_profile_image()` normalisiert ein hochgeladenes Bild und legt daraus
+mehrere Größen (`DERIVATIVE_SIZES`) als JPEG und - falls Pillow es kann -
+WebP ab. Der Dateiname ist der Hash des normalisierten Bildinhalts:
+
+    profile_images/<hh>/<hash>_<größe>.<jpg|webp>
+
+Gleiche Fotos landen so auf denselben Dateien, und die URLs ändern sich nie,
+weshalb sie mit `immutable` ausgeliefert werden.
+
+Pro Spieler wird eine Varianten-Map gespeichert:
+
+    {"48": {"jpg": "...", "webp": "..."}, "96": {...}, "150": {...}}
+
+Nicht mehr referenzierte Dateien entfernt der Bild-GC (`image_store.py`).
+
+Der Einzelpfad (`profile_image_path` bzw. `Team.profile_images`) zeigt auf
+das 150px-JPEG.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import os
+import re
+import tempfile
+from typing import Dict, Optional, Tuple
+
+from flask import current_app, request
+from PIL import Image, ImageOps, features
+
+PROFILE_IMAGE_DIR = 'profile_images'
+
+DERIVATIVE_SIZES = (48, 96, 150)
+DEFAULT_SIZE = 150
+
+ALLOWED_UPLOAD_FORMATS = ('JPEG', 'PNG', 'WEBP')
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Dateiendung -> (Pillow-Format, Speicheroptionen)
+_FORMATS = (
+    ('jpg', 'JPEG', {'quality': 85, 'optimize': True, 'progressive': True}),
+    ('webp', 'WEBP', {'quality': 80, 'method': 6}),
+)
+
+_HASH_LENGTH = 20
+_HASHED_PATH_RE = re.compile(
+    rf'^{PROFILE_IMAGE_DIR}/[0-9a-f]{{2}}/[0-9a-f]{{{_HASH_LENGTH}}}_\d+\.(?:jpg|webp)$'
+)
+_IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+ImageVariants = Dict[str, Dict[str, str]]
+
+
+def _enabled_formats():
+    for extension, pil_format, options in _FORMATS:
+        if pil_format == 'WEBP' and not features.check('webp'):
+            continue
+        yield extension, pil_format, options
+
+
+def normalize_image(image: Image.Image) -> Image.Image:
+    """
+    Bringt ein hochgeladenes Bild in eine einheitliche Form.
+
+    EXIF-Drehung wird angewendet, Transparenz auf weißen Hintergrund gelegt
+    und das Bild wie bisher auf ein Quadrat der größten Variante skaliert.
+    """
+    image = ImageOps.exif_transpose(image)
+
+    if image.mode in ('RGBA', 'LA', 'P'):
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    largest = max(DERIVATIVE_SIZES)
+    return image.resize((largest, largest), Image.Resampling.LANCZOS)
+
+
+def content_hash(image: Image.Image) -> str:
+    """Hash über Pixeldaten und Größe des normalisierten Bildes."""
+    digest = hashlib.sha256()
+    digest.update(f'{image.width}x{image.height}'.encode('ascii'))
+    digest.update(image.tobytes())
+    return digest.hexdigest()[:_HASH_LENGTH]
+
+
+def _write_atomic(image: Image.Image, target: str, pil_format: str, options: dict):
+    # Eigene Temp-Datei je Aufruf: Worker-Threads können denselben Hash gleichzeitig schreiben
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            image.save(handle, pil_format, **options)
+        # mkstemp legt 0600 an; ausgelieferte Bilder müssen lesbar sein wie bisher
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def save_profile_image(image: Image.Image) -> Tuple[str, ImageVariants]:
+    """
+    Erzeugt alle Größenvarianten eines Profilbildes.
+
+    Bereits vorhandene Dateien (gleicher Inhalt) werden nicht neu geschrieben.
+
+    Returns:
+        Tuple (Pfad des Standard-JPEGs relativ zu `static/`, Varianten-Map)
+    """
+    normalized = normalize_image(image)
+    digest = content_hash(normalized)
+
+    relative_dir = f'{PROFILE_IMAGE_DIR}/{digest[:2]}'
+    absolute_dir = os.path.join(current_app.static_folder, relative_dir)
+    os.makedirs(absolute_dir, exist_ok=True)
+
+    variants: ImageVariants = {}
+    for size in sorted(DERIVATIVE_SIZES, reverse=True):
+        resized = normalized if size == normalized.width else \
+            normalized.resize((size, size), Image.Resampling.LANCZOS)
+        entry = {}
+        for extension, pil_format, options in _enabled_formats():
+            filename = f'{digest}_{size}.{extension}'
+            target = os.path.join(absolute_dir, filename)
+            if os.path.exists(target):
+                # Erneut verwendet: mtime auffrischen, damit der Bild-GC sie nicht als alt einstuft
+                os.utime(target)
+            else:
+                _write_atomic(resized, target, pil_format, options)
+            entry[extension] = f'{relative_dir}/{filename}'
+        variants[str(size)] = entry
+
+    return variants[str(DEFAULT_SIZE)]['jpg'], variants
+
+
+def decode_base64_image(image_data: str, allowed_formats=None) -> Image.Image:
+    """
+    Dekodiert Base64- bzw. Data-URL-Bilddaten und öffnet sie mit Pillow.
+
+    Raises:
+        ValueError: Mit Fehlermeldung für den Client bei ungültigen Daten.
+    """
+    # Entferne data:image/...;base64, prefix falls vorhanden
+    if 'base64,' in image_data:
+        image_data = image_data.split('base64,', 1)[1]
+    elif image_data.startswith('data:'):
+        image_data = image_data.split(',', 1)[-1]
+
+    image_data = ''.join(image_data.split())
+    if not image_data:
+        raise ValueError("Leere Bilddaten")
+    padding_needed = len(image_data) % 4
+    if padding_needed:
+        image_data += '=' * (4 - padding_needed)
+
+    try:
+        image_bytes = base64.b64decode(image_data, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Ungültige Base64-Bilddaten")
+
+    return open_upload_image(io.BytesIO(image_bytes), allowed_formats)
+
+
+def open_upload_image(fp, allowed_formats=None) -> Image.Image:
+    """
+    Öffnet ein hochgeladenes Bild aus Pfad oder Dateiobjekt.
+
+    JPEGs werden per `draft()` bereits beim Dekodieren verkleinert (DCT-Skalierung),
+    sodass ein 5-MB-Handyfoto nicht in voller Auflösung im Speicher landet.
+
+    Raises:
+        ValueError: Bei unlesbaren Daten oder nicht erlaubtem Format.
+    """
+    try:
+        image = Image.open(fp)
+        if allowed_formats and image.format not in allowed_formats:
+            raise ValueError("Ungültiges Bildformat (nur JPEG, PNG, WEBP erlaubt)")
+        if image.format == 'JPEG':
+            largest = max(DERIVATIVE_SIZES)
+            image.draft('RGB', (largest * 2, largest * 2))
+        image.load()
+    except ValueError:
+        raise
+    except Exception:
+        raise ValueError("Ungültige Bilddaten")
+    return image
+
+
+def spool_upload(stream, max_bytes: Optional[int] = None) -> str:
+    """
+    Schreibt einen Upload-Stream blockweise in eine temporäre Datei.
+
+    Returns:
+        Pfad der Datei; der Aufrufer (bzw. `process_image_file`) löscht sie.
+
+    Raises:
+        ValueError: Bei leerem Upload oder Überschreitung von `max_bytes`.
+    """
+    fd, path = tempfile.mkstemp(prefix='profile_upload_')
+    written = 0
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if max_bytes and written > max_bytes:
+                    raise ValueError("Bild ist zu groß")
+                out.write(chunk)
+        if not written:
+            raise ValueError("Leere Bilddaten")
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def process_base64_image(image_data: str, allowed_formats=None) -> Dict[str, object]:
+    """Dekodiert, prüft und speichert ein Upload-Bild (Einstieg für den Worker-Pool)."""
+    image_path, variants = save_profile_image(decode_base64_image(image_data, allowed_formats))
+    return {'image_path': image_path, 'image_variants': variants}
+
+
+def process_image_file(path: str, allowed_formats=None) -> Dict[str, object]:
+    """Wie `process_base64_image`, aber für eine per `spool_upload` geschriebene Datei (wird gelöscht)."""
+    try:
+        with open(path, 'rb') as f:
+            image_path, variants = save_profile_image(open_upload_image(f, allowed_formats))
+    finally:
+        os.remove(path)
+    return {'image_path': image_path, 'image_variants': variants}
+
+
+def pick_variant(variants: Optional[ImageVariants], size: int, fallback: Optional[str] = None,
+                 prefer_webp: bool = False) -> Optional[str]:
+    """Kleinste Variante, die mindestens `size` Pixel groß ist (sonst die größte)."""
+    if not variants:
+        return fallback
+
+    available = sorted(int(key) for key in variants if key.isdigit())
+    if not available:
+        return fallback
+    chosen = next((candidate for candidate in available if candidate >= size), available[-1])
+
+    entry = variants[str(chosen)]
+    if prefer_webp and entry.get('webp'):
+        return entry['webp']
+    return entry.get('jpg') or fallback
+
+
+def is_hashed_profile_image(path: Optional[str]) -> bool:
+    """True für inhalts-gehashte Varianten (werden ggf. von mehreren Spielern geteilt)."""
+    return bool(path) and bool(_HASHED_PATH_RE.match(path))
+
+
+def remove_legacy_image(path: Optional[str]):
+    """
+    Löscht ein altes Einzelbild mit Zeitstempel-Namen.
+
+    Gehashte Varianten bleiben liegen, da dasselbe Foto von mehreren Spielern
+    verwendet werden kann.
+    """
+    if not path or is_hashed_profile_image(path):
+        return
+    file_path = os.path.join(current_app.static_folder, path)
+    if os.path.exists(file_path):
+        try:
+            os.remove(file_path)
+        except OSError as e:
+            current_app.logger.warning(f"Altes Profilbild konnte nicht gelöscht werden: {e}")
+
+
+def _add_profile_image_cache_headers(response):
+    if request.endpoint == 'static' and request.view_args \
+            and is_hashed_profile_image(request.view_args.get('filename', '')) \
+            and response.status_code in (200, 206, 304):
+        response.headers['Cache-Control'] = _IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def init_app(app):
+    """Registriert `profile_image_variant` als Jinja-Global und die Cache-Header für gehashte Profilbilder."""
+    app.jinja_env.globals.update(profile_image_variant=pick_variant)
+    app.after_request(_add_profile_image_cache_headers)
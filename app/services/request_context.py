@@ -0,0 +1,140 @@
+"""
+Request-lokaler Kontext für häufige Lookups.
+
+Innerhalb eines Requests werden aktive Spielsitzung, aktive Runde und deren
+Minigame-Ordner mehrfach abgefragt (z. B. in `board_status` direkt und erneut
+in `get_active_session_events`). Die Ergebnisse werden hier auf `flask.g`
+gemerkt, sodass pro Request nur noch eine Abfrage je Objekt anfällt.
+
+- Gemerkte ORM-Objekte werden vor jeder Wiederverwendung geprüft
+  (noch persistent und `is_active`), damit Änderungen innerhalb des
+  Requests nicht übersehen werden.
+- Nach jedem Commit/Rollback wird der Kontext verworfen.
+- Außerhalb eines Requests (CLI, Skripte) wird nichts gemerkt.
+- Im Debug-Modus werden Treffer/Fehlschläge pro Request gezählt und als
+  `X-Request-Lookups`-Header ausgegeben.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from flask import current_app, g, has_request_context
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+ACTIVE_SESSION = 'active_session'
+ACTIVE_ROUND = 'active_round'
+ACTIVE_FOLDER = 'active_folder'
+
+_MEMO_ATTR = '_request_memo'
+_COUNTER_ATTR = '_request_lookup_counts'
+
+_MISSING = object()
+
+
+def _memo() -> Optional[Dict[str, Any]]:
+    if not has_request_context():
+        return None
+    memo = g.get(_MEMO_ATTR)
+    if memo is None:
+        memo = {}
+        setattr(g, _MEMO_ATTR, memo)
+    return memo
+
+
+def count_lookup(key: str, hit: bool):
+    """Zählt einen Lookup (nur im Debug-Modus)."""
+    if not has_request_context() or not current_app.debug:
+        return
+    counts = g.get(_COUNTER_ATTR)
+    if counts is None:
+        counts = {}
+        setattr(g, _COUNTER_ATTR, counts)
+    entry = counts.setdefault(key, {'hits': 0, 'misses': 0})
+    entry['hits' if hit else 'misses'] += 1
+
+
+def is_active_instance(obj) -> bool:
+    """Prüft, ob ein gemerktes ORM-Objekt noch aktiv ist (ohne neue Abfrage, sofern geladen)."""
+    if obj is None:
+        return True
+    try:
+        return inspect(obj).persistent and bool(obj.is_active)
+    except InvalidRequestError:
+        # z. B. ObjectDeletedError beim Nachladen einer gelöschten Zeile
+        return False
+
+
+def memoized(key: str, loader: Callable[[], Any], is_valid: Callable[[Any], bool] = None) -> Any:
+    """
+    Gibt den für diesen Request gemerkten Wert zurück oder lädt ihn.
+
+    Args:
+        key: Schlüssel im Request-Kontext.
+        loader: Lädt den Wert bei einem Fehlschlag.
+        is_valid: Optionaler Check, ob der gemerkte Wert noch gültig ist.
+    """
+    memo = _memo()
+    if memo is None:
+        return loader()
+
+    value = memo.get(key, _MISSING)
+    if value is not _MISSING and (is_valid is None or is_valid(value)):
+        count_lookup(key, True)
+        return value
+
+    count_lookup(key, False)
+    value = loader()
+    memo[key] = value
+    return value
+
+
+def remember(key: str, value: Any):
+    """Setzt einen Wert im Request-Kontext (z. B. nach dem Anlegen einer Session)."""
+    memo = _memo()
+    if memo is not None:
+        memo[key] = value
+
+
+def forget(*keys: str):
+    """Verwirft gemerkte Werte; ohne Argumente den gesamten Kontext."""
+    if not has_request_context():
+        return
+    memo = g.get(_MEMO_ATTR)
+    if not memo:
+        return
+    if keys:
+        for key in keys:
+            memo.pop(key, None)
+    else:
+        memo.clear()
+
+
+def get_lookup_counts() -> Dict[str, Dict[str, int]]:
+    """Lookup-Zähler des aktuellen Requests (leer außerhalb des Debug-Modus)."""
+    if not has_request_context():
+        return {}
+    return dict(g.get(_COUNTER_ATTR) or {})
+
+
+def _clear_after_transaction(session):
+    forget()
+
+
+def _add_lookup_header(response):
+    counts = get_lookup_counts()
+    if counts:
+        response.headers['X-Request-Lookups'] = ';'.join(
+            f"{key}={entry['misses']}/{entry['hits'] + entry['misses']}"
+            for key, entry in sorted(counts.items())
+        )
+    return response
+
+
+def init_app(app):
+    """Registriert Transaktions-Hooks und (im Debug-Modus) den Zähler-Header."""
+    if not event.contains(Session, 'after_commit', _clear_after_transaction):
+        event.listen(Session, 'after_commit', _clear_after_transaction)
+        event.listen(Session, 'after_rollback', _clear_after_transaction)
+    if app.debug:
+        app.after_request(_add_lookup_header)
@@ -0,0 +1,195 @@
+"""
+Versionierter Response-Cache für öffentliche, lesende Referenz-Endpunkte.
+
+Feld-Layout, Feld-Farben und Charakterdaten ändern sich nur, wenn ein Admin
+die Konfiguration bearbeitet. Statt die Antworten bei jedem Aufruf neu aus
+DB und JSON-Spalten aufzubauen, werden sie hier einmal serialisiert und als
+Bytes vorgehalten.
+
+- Schlüssel: Endpoint + Query-Argumente + Spiel (`game_scope`) + Version
+  der Domäne - das Feld-Layout hängt vom Seed der Sitzung des Spiels ab.
+- Jede Domäne (z. B. Feld-Konfiguration, Charaktere) hat eine eigene Version,
+  die bei Änderungen über `bump_version` erhöht wird. Domänen in
+  `GAME_DOMAINS` (Feld-Konfiguration) sind spielweise: jedes Spiel hat eine
+  eigene Version, Änderungen eines Spiels verwerfen nur dessen Antworten.
+- Anfragen mit `?v=<aktuelle Version>` erhalten langlebige, unveränderliche
+  Cache-Header; Anfragen ohne Version werden per ETag revalidiert.
+
+Die Versionen sind prozesslokal. Der Prozess-Start fließt in die Version ein,
+damit nach einem Neustart keine alten, unveränderlich gecachten URLs wieder
+gültig werden.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from flask import Response, current_app, request, url_for
+
+from app.services.game_scope import GAME_ARG, current_game_key, default_game_key
+
+FIELD_CONFIG = 'fields'
+CHARACTERS = 'characters'
+
+# Domänen mit eigener Version je Spiel
+GAME_DOMAINS = frozenset({FIELD_CONFIG})
+
+# Query-Parameter, die nicht in den Cache-Schlüssel eingehen
+# (v = Versions-Token, t = Cache-Buster der alten Frontend-Aufrufe,
+# game = Spielauswahl, steckt bereits als aufgelöstes Spiel im Schlüssel)
+_IGNORED_ARGS = frozenset({'v', 't', 'game'})
+
+_MAX_ENTRIES_PER_DOMAIN = 64
+_IMMUTABLE_MAX_AGE = 31536000  # 1 Jahr
+
+_boot_token = format(int(time.time()), 'x')
+_lock = threading.Lock()
+_versions: Dict[str, int] = {}
+_entries: Dict[str, "OrderedDict[Tuple, Tuple[bytes, str, str]]"] = {}
+
+
+def _scoped(domain: str, game_key: Optional[str] = None) -> str:
+    if domain in GAME_DOMAINS:
+        return f"{domain}:{game_key or current_game_key()}"
+    return domain
+
+
+def get_version(domain: str, game_key: Optional[str] = None) -> str:
+    """Gibt das aktuelle Versions-Token einer Domäne zurück (spielweise Domänen: des Spiels)."""
+    domain = _scoped(domain, game_key)
+    with _lock:
+        # Ausgegebene Versionen merken, damit `game_keys_with_version` das Spiel kennt
+        counter = _versions.setdefault(domain, 1)
+    return f"{_boot_token}.{counter}"
+
+
+def bump_version(domain: str, game_key: Optional[str] = None) -> str:
+    """
+    Erhöht die Version einer Domäne und verwirft alle gecachten Antworten.
+
+    Muss nach jeder Änderung aufgerufen werden, die den Inhalt der
+    Domäne beeinflusst (z. B. Feld-Konfiguration bearbeitet). Spielweise
+    Domänen werden nur für `game_key` (Standard: aktuelles Spiel) erhöht.
+    """
+    domain = _scoped(domain, game_key)
+    with _lock:
+        _versions[domain] = _versions.get(domain, 1) + 1
+        _entries.pop(domain, None)
+        counter = _versions[domain]
+    return f"{_boot_token}.{counter}"
+
+
+def game_keys_with_version(domain: str) -> Set[str]:
+    """Spiele, für die eine spielweise Domäne bereits Versionen ausgegeben oder Antworten gecacht hat."""
+    prefix = f"{domain}:"
+    with _lock:
+        return {key[len(prefix):] for key in (*_versions, *_entries) if key.startswith(prefix)}
+
+
+def clear_all():
+    """Verwirft alle gecachten Antworten aller Domänen (Versionen bleiben)."""
+    with _lock:
+        _entries.clear()
+
+
+def versioned_url(endpoint: str, domain: str, **values) -> str:
+    """
+    `url_for`-Variante, die das aktuelle Versions-Token als `v` anhängt.
+
+    Solche URLs ändern sich mit jeder Konfigurationsänderung und dürfen
+    deshalb vom Browser unbegrenzt gecacht werden. Außerhalb des
+    Standardspiels wird das Spiel angehängt, damit parallele Spiele
+    verschiedene URLs haben.
+    """
+    values['v'] = get_version(domain)
+    game_key = current_game_key()
+    if game_key != default_game_key():
+        values.setdefault(GAME_ARG, game_key)
+    return url_for(endpoint, **values)
+
+
+def _request_key() -> Tuple:
+    args = tuple(sorted(
+        (key, tuple(request.args.getlist(key)))
+        for key in request.args.keys()
+        if key not in _IGNORED_ARGS
+    ))
+    return (request.endpoint, current_game_key(), args)
+
+
+def _lookup(domain: str, key: Tuple) -> Optional[Tuple[bytes, str, str]]:
+    with _lock:
+        domain_entries = _entries.get(domain)
+        if not domain_entries or key not in domain_entries:
+            return None
+        domain_entries.move_to_end(key)
+        return domain_entries[key]
+
+
+def _store(domain: str, key: Tuple, entry: Tuple[bytes, str, str]):
+    with _lock:
+        domain_entries = _entries.setdefault(domain, OrderedDict())
+        domain_entries[key] = entry
+        while len(domain_entries) > _MAX_ENTRIES_PER_DOMAIN:
+            domain_entries.popitem(last=False)
+
+
+def _build_response(entry: Tuple[bytes, str, str], version: str, *, private: bool) -> Response:
+    body, mimetype, etag = entry
+    scope = 'private' if private else 'public'
+
+    # Schwacher Vergleich: komprimierte Varianten tragen ein W/-ETag
+    if request.if_none_match and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype=mimetype)
+
+    response.set_etag(etag)
+    if request.args.get('v') == version:
+        response.headers['Cache-Control'] = f"{scope}, max-age={_IMMUTABLE_MAX_AGE}, immutable"
+    else:
+        response.headers['Cache-Control'] = f"{scope}, no-cache"
+    response.headers['X-Cache-Version'] = version
+    return response
+
+
+def cached_response(domain: str, *, private: bool = False) -> Callable:
+    """
+    Decorator für lesende JSON-Endpunkte, deren Inhalt nur von der
+    Domänen-Version und den Query-Argumenten abhängt.
+
+    Nur erfolgreiche Antworten (Status 200) werden gecacht; Fehlerantworten
+    werden unverändert durchgereicht.
+
+    Args:
+        domain: Cache-Domäne (`FIELD_CONFIG`, `CHARACTERS`, ...).
+        private: Für Endpunkte hinter Login (`Cache-Control: private`).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(*args, **kwargs):
+            scoped = _scoped(domain)
+            version = get_version(scoped)
+            key = _request_key()
+
+            entry = _lookup(scoped, key)
+            if entry is None:
+                rv = current_app.make_response(view_func(*args, **kwargs))
+                if rv.status_code != 200 or rv.is_streamed:
+                    return rv
+
+                body = rv.get_data()
+                etag = hashlib.sha1(body).hexdigest()[:20]
+                entry = (body, rv.mimetype, etag)
+
+                # Nur speichern, wenn sich die Version während des Aufbaus
+                # nicht geändert hat (sonst wäre der Eintrag bereits veraltet)
+                if get_version(scoped) == version:
+                    _store(scoped, key, entry)
+
+            return _build_response(entry, version, private=private)
+        return wrapper
+    return decorator
@@ -0,0 +1,272 @@
+"""
+Würfel-Pipeline für alle Einstiegspunkte (Admin-Wurf, Team-Wurf, Legacy-Route).
+
+Ein Wurf läuft in festen Stufen ab:
+
+    Zug prüfen → würfeln → bewegen → Feld auflösen → Zug weitergeben → Events
+
+Würfeln, Bewegen und Feld-Auflösung übernimmt die Engine über
+`dice_service.roll_for_team`; die Pipeline ergänzt Zugprüfung,
+Bonuswürfel-Verbrauch, Zugweitergabe, Rundenende und Sieg.
+
+Gelesen wird die aktive Sitzung (request-lokal gemerkt) und alle Teams in
+einer einzigen Abfrage; Feld-Regeln kommen aus dem Versions-Cache. Die
+früheren COUNT-Abfragen über Würfel-Events entfallen - maßgeblich ist die
+Würfelreihenfolge der Sitzung (`GameSession.turn_order`), jeder Zugwechsel
+erzeugt ein `turn_changed`-Event. Alle Änderungen landen in genau
+einer Transaktion, committet wird einmal am Ende (bei Fehlern Rollback).
+
+`execute_round_roll` würfelt nacheinander für alle restlichen Teams der
+Runde in derselben Transaktion - Stufen und Events wie bei Einzelwürfen,
+in Zugreihenfolge. Der Stapel endet mit der Runde oder vorher, sobald die
+Phase die Würfelphase verlässt (Minigame-Feld wartet auf Admin, Sieg).
+Jedes Würfel-Event trägt `pacing` (Stapel-ID, Schritt, Verzögerung), damit
+das Brett die Würfe weiter einzeln animieren kann.
+"""
+
+import uuid
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+
+from app import db
+from app.models import Team
+from app.services.dice_service import ROLL_SOURCES, record_victory, roll_for_team
+from app.services.event_service import create_event
+from app.services.session_service import get_active_session
+
+# rolled_by -> Events bei Rundenende (Typ, Beschreibung), wie bisher je Route
+ROUND_END_EVENTS = {
+    'admin': (
+        ("dice_round_ended", "Würfelrunde beendet (Admin) - alle Teams haben gewürfelt"),
+        ("dice_round_finished", "Admin beendete die Würfelrunde. Alle Teams haben gewürfelt."),
+    ),
+    'team': (
+        ("dice_round_ended", "Würfelrunde beendet - alle Teams haben gewürfelt"),
+    ),
+    'admin_legacy_route': (
+        ("dice_round_finished", "Admin beendete die Würfelrunde über Legacy-Route."),
+    ),
+}
+
+# Obergrenze für den Abstand zweier Würfe beim Runden-Wurf (Animation)
+MAX_PACE_MS = 10000
+
+
+class RollRejected(Exception):
+    """Wurf nicht erlaubt (falsche Phase, falsches Team, ...); `status` ist der HTTP-Status."""
+
+    def __init__(self, message: str, status: int = 403):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _validate_turn(active_session, teams_by_id: Dict[int, Team], team_id: Optional[int], rolled_by: str):
+    """Stufe 1: Phase, Team am Zug und Würfelreihenfolge prüfen."""
+    if active_session.current_phase != 'DICE_ROLLING':
+        raise RollRejected("Es ist nicht die Würfelphase.", 403)
+
+    current_team_id = active_session.current_team_turn_id
+    current_team = teams_by_id.get(current_team_id) if current_team_id else None
+    if team_id is not None and team_id != current_team_id:
+        current_name = current_team.name if current_team else "Unbekannt"
+        if rolled_by == 'team':
+            raise RollRejected(f"Du bist nicht am Zug. Aktuell ist {current_name} am Zug.", 403)
+        raise RollRejected(f"Nicht Zug von Team-ID {team_id}. {current_name} "
+                           f"(ID: {current_team_id}) ist dran.", 403)
+    if not current_team_id:
+        raise RollRejected("Kein Team für aktuellen Zug festgelegt.", 404)
+    if not current_team:
+        raise RollRejected("Aktuelles Team nicht gefunden.", 404)
+
+    order = active_session.turn_order
+    if not order:
+        raise RollRejected("Fehler: Würfelreihenfolge nicht gesetzt.", 500)
+    if current_team.id not in order:
+        current_app.logger.error(f"Team {current_team.id} nicht in Würfelreihenfolge {list(order)} gefunden.")
+        raise RollRejected("Fehler in der Würfelreihenfolge (Team nicht gefunden).", 500)
+    return current_team
+
+
+def _finish_round(active_session, teams: List[Team], rolled_by: str):
+    """Rundenende: Phase ROUND_OVER, Bonuswürfel zurücksetzen (Platzierungen bleiben)."""
+    active_session.current_phase = 'ROUND_OVER'
+    for team in teams:
+        team.bonus_dice_sides = 0
+    for event_type, description in ROUND_END_EVENTS[rolled_by]:
+        create_event(game_session_id=active_session.id, event_type=event_type, description=description)
+
+
+def _advance_turn(active_session, team: Team, teams: List[Team],
+                  teams_by_id: Dict[int, Team], rolled_by: str) -> Optional[Team]:
+    """Stufe 5: nächstes Team am Zug oder Rundenende; gibt das nächste Team zurück."""
+    # Gelöschte Teams in der Reihenfolge überspringen
+    next_team_id = active_session.advance_turn(skip=lambda team_id: team_id not in teams_by_id)
+    create_event(
+        game_session_id=active_session.id,
+        event_type="turn_changed",
+        related_team_id=next_team_id,
+        description=f"Team {teams_by_id[next_team_id].name} ist am Zug" if next_team_id
+                    else "Alle Teams haben gewürfelt",
+        data={
+            "previous_team_id": team.id,
+            "team_id": next_team_id,
+            "turn_index": active_session.turn_index,
+            "round_complete": next_team_id is None,
+        }
+    )
+    if next_team_id is not None:
+        return teams_by_id[next_team_id]
+
+    if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
+        # Letztes Team landete auf Minigame-Feld - Runde wartet auf das Feld-Minigame
+        current_app.logger.info(f"Letztes Team {team.name} landete auf Minigame-Feld - "
+                                f"Runde wartet auf Feld-Minigame")
+    else:
+        _finish_round(active_session, teams, rolled_by)
+        current_app.logger.info(f"Letztes Team ({team.name}) hat gewürfelt - Runde beendet")
+    return None
+
+
+def _roll_step(active_session, team: Team, teams: List[Team], teams_by_id: Dict[int, Team],
+               rolled_by: str, rng, pacing: Optional[Dict[str, Any]] = None):
+    """Stufen 2-5 für ein geprüftes Team (ohne Commit); gibt (nächstes Team, Wurf) zurück."""
+    # Stufen 2-4: würfeln, bewegen, Feld auflösen (inkl. Events)
+    roll_result = roll_for_team(active_session, team, rolled_by, rng, teams=teams, pacing=pacing)
+    team.bonus_dice_sides = 0  # Bonuswürfel ist mit dem Wurf verbraucht
+
+    next_team = _advance_turn(active_session, team, teams, teams_by_id, rolled_by)
+
+    # ZIELFELD: Sieg nach der Zuglogik speichern (überschreibt ROUND_OVER)
+    if roll_result["victory_triggered"]:
+        record_victory(active_session, team, roll_result["total_roll"])
+    return next_team, roll_result
+
+
+def _load_turn(rolled_by: str, team_id: Optional[int] = None):
+    """Aktive Sitzung und alle Teams laden, Zug prüfen (wirft RollRejected)."""
+    if rolled_by not in ROLL_SOURCES:
+        raise ValueError(f"Unbekannte Wurf-Quelle: {rolled_by}")
+
+    active_session = get_active_session()
+    if not active_session:
+        raise RollRejected("Keine aktive Spielsitzung.", 404)
+
+    teams = Team.in_game().all()
+    teams_by_id = {team.id: team for team in teams}
+    team = _validate_turn(active_session, teams_by_id, team_id, rolled_by)
+    return active_session, teams, teams_by_id, team
+
+
+def execute_roll(rolled_by: str, team_id: Optional[int] = None, rng=None) -> Dict[str, Any]:
+    """
+    Führt einen kompletten Wurf für das Team am Zug aus und committet einmal.
+
+    Args:
+        rolled_by: Schlüssel aus `ROLL_SOURCES` ('admin', 'team', 'admin_legacy_route')
+        team_id: Team, das würfeln will (None = Team am Zug)
+        rng: Zufallsquelle (Standard: Zufall der Sitzung)
+
+    Returns:
+        dict mit `team`, `next_team`, `session` und `roll` (Ergebnis von
+        `roll_for_team`: Rollwerte, Positionen, Flags, Sonderfeld-Infos).
+
+    Raises:
+        RollRejected: wenn der Wurf nicht erlaubt ist (nichts wurde geändert).
+    """
+    active_session, teams, teams_by_id, team = _load_turn(rolled_by, team_id)
+
+    try:
+        next_team, roll_result = _roll_step(active_session, team, teams, teams_by_id, rolled_by, rng)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {
+        "team": team,
+        "next_team": next_team,
+        "session": active_session,
+        "roll": roll_result,
+    }
+
+
+def execute_round_roll(rolled_by: str = 'admin', rng=None, pace_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Würfelt für alle restlichen Teams der Runde in Zugreihenfolge und committet einmal.
+
+    Args:
+        rolled_by: Schlüssel aus `ROLL_SOURCES` (Standard 'admin')
+        rng: Zufallsquelle (Standard: Zufall der Sitzung)
+        pace_ms: optionaler Abstand zweier Würfe für die Animation; landet als
+            `pacing.delay_ms` (Schritt * pace_ms) in den Würfel-Events
+
+    Returns:
+        dict mit `session`, `batch_id`, `rolls` (je Wurf `team`, `roll`, `pacing`),
+        `next_team` und `stopped` ('round_over', 'field_minigame', 'victory').
+
+    Raises:
+        RollRejected: wenn nicht gewürfelt werden darf (nichts wurde geändert).
+    """
+    active_session, teams, teams_by_id, team = _load_turn(rolled_by)
+    if pace_ms is not None:
+        pace_ms = min(max(int(pace_ms), 0), MAX_PACE_MS)
+
+    order = active_session.turn_order
+    pending_ids = [team_id for team_id in order.team_ids[order.index:] if team_id in teams_by_id]
+    batch_id = uuid.uuid4().hex[:12]
+    rolls: List[Dict[str, Any]] = []
+    next_team = None
+
+    try:
+        create_event(
+            game_session_id=active_session.id,
+            event_type="round_roll_started",
+            description=f"Admin würfelt die Runde für {len(pending_ids)} Team(s)",
+            data={"batch_id": batch_id, "team_ids": pending_ids, "pace_ms": pace_ms},
+        )
+
+        while team is not None:
+            pacing = {"batch_id": batch_id, "step": len(rolls), "steps": len(pending_ids)}
+            if pace_ms is not None:
+                pacing["delay_ms"] = len(rolls) * pace_ms
+            next_team, roll_result = _roll_step(active_session, team, teams, teams_by_id,
+                                                rolled_by, rng, pacing)
+            rolls.append({"team": team, "roll": roll_result, "pacing": pacing})
+            if active_session.current_phase != 'DICE_ROLLING':
+                break
+            team = next_team
+
+        if active_session.current_phase == 'GAME_FINISHED':
+            stopped = 'victory'
+        elif active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
+            stopped = 'field_minigame'
+        else:
+            stopped = 'round_over'
+
+        create_event(
+            game_session_id=active_session.id,
+            event_type="round_roll_finished",
+            description=f"Runden-Wurf beendet: {len(rolls)} Wurf/Würfe",
+            data={
+                "batch_id": batch_id,
+                "rolls": len(rolls),
+                "stopped": stopped,
+                "phase": active_session.current_phase,
+                "next_team_id": active_session.current_team_turn_id,
+            },
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    current_app.logger.info(f"Runden-Wurf {batch_id}: {len(rolls)} Würfe, beendet ({stopped})")
+    return {
+        "session": active_session,
+        "batch_id": batch_id,
+        "rolls": rolls,
+        "next_team": next_team,
+        "stopped": stopped,
+    }
@@ -1,19 +1,48 @@
 from typing import Optional, Sequence, List, Dict, Any
 
 from app import db
-from app.models import GameEvent, GameRound, GameSession
+from app.models import (
+    FieldConfiguration, GameEvent, GameRound, GameSession, MinigameFolder, PlayerRotation, QuestionResponse,
+)
+from app.services.game_scope import current_game_key
 from app.services.event_service import fetch_recent_events_for_session
+from app.services.request_context import (
+    ACTIVE_FOLDER, ACTIVE_SESSION, is_active_instance, memoized, remember,
+)
 
 
 def get_active_session() -> Optional[GameSession]:
     """
-    Liefert die aktuell aktive GameSession oder None.
+    Liefert die aktive GameSession des aktuellen Spiels oder None
+    (siehe `game_scope.current_game_key`).
 
-    Zentralisiert die Abfrage, damit künftige Anpassungen
-    (z. B. Caching, Prefetch) nicht an allen Aufrufstellen
-    dupliziert werden müssen.
+    Innerhalb eines Requests wird das Ergebnis auf `flask.g` gemerkt
+    (siehe `request_context`), weitere Aufrufe kosten keine Abfrage.
     """
-    return GameSession.query.filter_by(is_active=True).first()
+    return memoized(
+        ACTIVE_SESSION,
+        lambda: GameSession.in_game().filter_by(is_active=True).first(),
+        is_active_instance,
+    )
+
+
+def get_active_round() -> Optional[GameRound]:
+    """Liefert die aktive Spielrunde oder None (request-lokal gemerkt)."""
+    return GameRound.get_active_round()
+
+
+def get_active_folder() -> Optional[MinigameFolder]:
+    """Liefert den Minigame-Ordner der aktiven Runde oder None (request-lokal gemerkt)."""
+    active_round = get_active_round()
+    if not active_round:
+        return None
+    round_id = active_round.id
+    _, folder = memoized(
+        ACTIVE_FOLDER,
+        lambda: (round_id, active_round.minigame_folder),
+        lambda cached: cached[0] == round_id,
+    )
+    return folder
 
 
 def require_active_session() -> GameSession:
@@ -32,12 +61,15 @@ def get_or_create_active_session() -> GameSession:
     Liefert die aktive Session oder legt eine neue an, falls keine existiert.
 
     Beinhaltet die Initialisierung einer neuen Session inklusive
-    Eventprotokollierung, genau wie bislang in den Admin-Routen.
+    Eventprotokollierung, genau wie bislang in den Admin-Routen. Ein Spiel
+    ohne eigene Feld-Konfiguration bekommt dabei eine Kopie der des
+    Standardspiels, damit spätere Änderungen dort sein Brett nicht verändern.
     """
     session = get_active_session()
     if session:
         return session
 
+    FieldConfiguration.ensure_game_configs()
     active_round = GameRound.get_active_round()
     session = GameSession(
         is_active=True,
@@ -59,9 +91,26 @@ def get_or_create_active_session() -> GameSession:
     )
     db.session.add(event)
     db.session.commit()
+    remember(ACTIVE_SESSION, session)
     return session
 
 
+def delete_game_sessions(game_key: Optional[str] = None) -> int:
+    """
+    Löscht alle Sitzungen eines Spiels (Standard: aktuelles Spiel) samt
+    Events, Fragen-Antworten und Rotations-Zählern; andere Spiele bleiben
+    unberührt.
+    Committet nicht - das übernimmt der Aufrufer. Gibt die Anzahl der
+    gelöschten Sitzungen zurück.
+    """
+    game_key = game_key or current_game_key()
+    session_ids = db.session.query(GameSession.id).filter(GameSession.game_key == game_key)
+    GameEvent.query.filter(GameEvent.game_session_id.in_(session_ids)).delete(synchronize_session=False)
+    QuestionResponse.query.filter(QuestionResponse.game_session_id.in_(session_ids)).delete(synchronize_session=False)
+    PlayerRotation.query.filter(PlayerRotation.game_session_id.in_(session_ids)).delete(synchronize_session=False)
+    return GameSession.in_game(game_key).delete()
+
+
 def get_active_session_events(
     *,
     since_id: Optional[int] = None,
@@ -0,0 +1,130 @@
+"""
+Feldauswahl (`?fields=`) und kompakte Kodierung für Polling-Endpunkte.
+
+`fields` ist eine Komma-Liste von Pfaden mit Punkt-Notation:
+
+    fields=teams.id,teams.position,game_status     nur diese Felder
+    fields=-teams.character_customization          alles außer diesem Feld
+    fields=teams,-teams.character                  Mischung aus beidem
+
+Pfade wirken auf Listen elementweise (`teams.position` bei einer Team-Liste).
+Unbekannte Pfade werden ignoriert.
+
+`encoding=compact` kodiert jede Liste von Objekten spaltenweise als
+`{"columns": [...], "rows": [[...], ...]}`; die Schlüssel stehen so nur einmal
+statt pro Team im Payload.
+
+Routen fragen teure Teile vorab mit `wants()` ab und berechnen sie nur, wenn
+sie ausgeliefert werden.
+"""
+
+from typing import Any, Dict, Optional
+
+from flask import request
+
+FIELDS_ARG = 'fields'
+ENCODING_ARG = 'encoding'
+COMPACT_ENCODING = 'compact'
+
+# Blatt im Pfad-Baum: ganzer Teilbaum
+_LEAF = True
+
+
+def _add_path(tree: Dict[str, Any], path: str):
+    parts = [part for part in path.split('.') if part]
+    if not parts:
+        return
+    node = tree
+    for part in parts[:-1]:
+        child = node.get(part)
+        if child is _LEAF:
+            return
+        node = node.setdefault(part, {})
+    node[parts[-1]] = _LEAF
+
+
+def parse_fields(spec: Optional[str]):
+    """Zerlegt eine `fields`-Angabe in (Einschluss-Baum oder None, Ausschluss-Baum)."""
+    include: Optional[Dict[str, Any]] = None
+    exclude: Dict[str, Any] = {}
+    for token in (spec or '').split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if token.startswith('-'):
+            _add_path(exclude, token[1:])
+        else:
+            if include is None:
+                include = {}
+            _add_path(include, token)
+    return include, exclude
+
+
+def _select(value, include, exclude):
+    if isinstance(value, list):
+        return [_select(item, include, exclude) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    selected = {}
+    for key, item in value.items():
+        if include is not None and key not in include:
+            continue
+        sub_exclude = exclude.get(key) if exclude else None
+        if sub_exclude is _LEAF:
+            continue
+        sub_include = include.get(key) if include is not None else None
+        if sub_include is _LEAF:
+            sub_include = None
+        if sub_include is None and not sub_exclude:
+            selected[key] = item
+        else:
+            selected[key] = _select(item, sub_include, sub_exclude)
+    return selected
+
+
+def compact(value):
+    """Kodiert Listen von Objekten spaltenweise (rekursiv)."""
+    if isinstance(value, dict):
+        return {key: compact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(item, dict) for item in value):
+            columns = list(dict.fromkeys(key for item in value for key in item))
+            return {
+                'columns': columns,
+                'rows': [[compact(item.get(column)) for column in columns] for item in value],
+            }
+        return [compact(item) for item in value]
+    return value
+
+
+class FieldSelection:
+    """Feldauswahl und Kodierung eines Requests."""
+
+    __slots__ = ('include', 'exclude', 'compact')
+
+    def __init__(self, spec: Optional[str] = None, encoding: Optional[str] = None):
+        self.include, self.exclude = parse_fields(spec)
+        self.compact = encoding == COMPACT_ENCODING
+
+    @classmethod
+    def from_request(cls) -> 'FieldSelection':
+        return cls(request.args.get(FIELDS_ARG), request.args.get(ENCODING_ARG))
+
+    @property
+    def is_default(self) -> bool:
+        return self.include is None and not self.exclude and not self.compact
+
+    def wants(self, key: str) -> bool:
+        """True, wenn der Top-Level-Schlüssel (ganz oder teilweise) ausgeliefert wird."""
+        if self.exclude.get(key) is _LEAF:
+            return False
+        return self.include is None or key in self.include
+
+    def apply(self, data):
+        """Wendet Auswahl und Kodierung auf einen fertigen Payload an."""
+        if self.is_default:
+            return data
+        if self.include is not None or self.exclude:
+            data = _select(data, self.include, self.exclude)
+        return compact(data) if self.compact else data
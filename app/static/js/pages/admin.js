@@ -0,0 +1,2009 @@
+// Global CSRF Token
+const csrfToken = ADMIN_DATA.csrfToken;
+
+// Minigame abbrechen Funktion - global verfügbar
+function abortCurrentMinigame() {
+    if (!confirm('⚠️ Aktuelles Minigame/Frage abbrechen und zurück zur Auswahl?')) {
+        return;
+    }
+
+    // Finde den Button (kann verschiedene IDs haben)
+    const abortBtn = document.getElementById('admin-abort-minigame-control') || 
+                    document.getElementById('admin-abort-minigame');
+    if (!abortBtn) {
+        alert('Button nicht gefunden');
+        return;
+    }
+    const originalContent = abortBtn.innerHTML;
+    
+    // Button deaktivieren und Loading anzeigen
+    abortBtn.disabled = true;
+    abortBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Wird abgebrochen...';
+    
+    fetch('/admin/abort-minigame', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken
+        },
+        body: JSON.stringify({})
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            alert('✅ Minigame wurde abgebrochen! Zurück zur Auswahl.');
+            // Seite neu laden um aktuellen Status zu zeigen
+            window.location.reload();
+        } else {
+            alert('❌ Fehler beim Abbrechen: ' + (data.error || 'Unbekannter Fehler'));
+            // Button wieder aktivieren
+            abortBtn.disabled = false;
+            abortBtn.innerHTML = originalContent;
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('❌ Netzwerkfehler beim Abbrechen des Minigames');
+        // Button wieder aktivieren
+        abortBtn.disabled = false;
+        abortBtn.innerHTML = originalContent;
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const rollDiceBtn = document.getElementById('admin-roll-dice');
+    const rollRoundBtn = document.getElementById('admin-roll-round');
+    const ROUND_ROLL_PACE_MS = 1500;
+    let isRollingDice = false;
+    let questionResponsesInterval = null;
+    let currentPhase = ADMIN_DATA.currentPhase;
+    let lastResponseCount = 0;
+    let adminEventSource = null;
+    let adminStreamRetryTimer = null;
+    let adminFallbackInterval = null;
+    let adminRefreshTimer = null;
+    let adminPendingRefresh = false;
+    const ADMIN_STREAM_EVENTS = [
+        'dice_roll',
+        'team_dice_roll',
+        'admin_dice_roll',
+        'special_field_catapult_forward',
+        'special_field_catapult_backward',
+        'special_field_player_swap',
+        'special_field_barrier_set',
+        'special_field_barrier_released',
+        'special_field_barrier_blocked',
+    'field_update',
+    'field_minigame_completed',
+    'question_started',
+    'question_completed',
+    'phase_change',
+    'game_session_started',
+    'welcome_state',
+    'sequence_state'
+];
+    const ADMIN_STREAM_URL = ADMIN_DATA.urls.eventStream + "?event_types=" + encodeURIComponent(ADMIN_STREAM_EVENTS.join(',')) + "&poll=0.5&keepalive=5";
+    const ADMIN_POLL_INTERVAL_MS = 4000;
+    
+    // Minigame abbrechen Button Event Listener
+    const abortMinigameBtn = document.getElementById('admin-abort-minigame-control');
+    if (abortMinigameBtn) {
+        abortMinigameBtn.addEventListener('click', function() {
+            abortCurrentMinigame();
+        });
+    }
+    
+    // Minigame-Source Auswahl
+    const sourceRadios = document.querySelectorAll('input[name="minigame_source"]');
+    const sections = document.querySelectorAll('.minigame-section');
+    
+    function showMinigameSection(selectedValue) {
+        sections.forEach(section => section.style.display = 'none');
+        const targetSection = document.getElementById(selectedValue + '-section');
+        if (targetSection) targetSection.style.display = 'block';
+        
+        localStorage.setItem('adminMinigameSource', selectedValue);
+    }
+    
+    sourceRadios.forEach(radio => {
+        radio.addEventListener('change', function() {
+            if (this.checked) showMinigameSection(this.value);
+        });
+    });
+    
+    const savedSource = localStorage.getItem('adminMinigameSource');
+    if (savedSource) {
+        const savedRadio = document.getElementById('source_' + savedSource);
+        if (savedRadio) {
+            savedRadio.checked = true;
+            showMinigameSection(savedSource);
+        }
+    } else {
+        const checkedRadio = document.querySelector('input[name="minigame_source"]:checked');
+        if (checkedRadio) showMinigameSection(checkedRadio.value);
+    }
+    
+    // Direkte Fragen-Erstellung
+    const directQuestionType = document.getElementById('direct-question-type');
+    const mcOptions = document.getElementById('direct-mc-options');
+    const textAnswer = document.getElementById('direct-text-answer');
+    
+    function toggleDirectQuestionType() {
+        if (directQuestionType) {
+            const selectedType = directQuestionType.value;
+            if (mcOptions && textAnswer) {
+                if (selectedType === 'multiple_choice') {
+                    mcOptions.style.display = 'block';
+                    textAnswer.style.display = 'none';
+                } else {
+                    mcOptions.style.display = 'none';
+                    textAnswer.style.display = 'block';
+                }
+            }
+        }
+    }
+    
+    if (directQuestionType) {
+        directQuestionType.addEventListener('change', toggleDirectQuestionType);
+        toggleDirectQuestionType();
+    }
+    
+    function scheduleSequenceRefresh(reason = 'stream') {
+        if (document.hidden) {
+            sequencePendingRefresh = true;
+            return;
+        }
+        if (sequenceRefreshTimer) {
+            return;
+        }
+        sequenceRefreshTimer = setTimeout(() => {
+            sequenceRefreshTimer = null;
+            if (!document.hidden) {
+                updateSequenceStatus();
+                checkMinigameFieldStatus();
+            } else {
+                sequencePendingRefresh = true;
+            }
+        }, 200);
+    }
+
+    function startSequenceFallback(initialDelay = 0) {
+        if (sequenceFallbackInterval) {
+            return;
+        }
+        console.warn('[ADMIN] Sequence fallback aktiv.');
+        sequenceFallbackInterval = setInterval(() => {
+            if (!document.hidden) {
+                updateSequenceStatus();
+                checkMinigameFieldStatus();
+            } else {
+                sequencePendingRefresh = true;
+            }
+        }, SEQUENCE_POLL_INTERVAL_MS);
+        if (initialDelay === 0) {
+            scheduleSequenceRefresh('seq-fallback');
+        } else {
+            setTimeout(() => scheduleSequenceRefresh('seq-fallback'), initialDelay);
+        }
+    }
+
+    function stopSequenceFallback() {
+        if (sequenceFallbackInterval) {
+            clearInterval(sequenceFallbackInterval);
+            sequenceFallbackInterval = null;
+        }
+    }
+
+    function scheduleWelcomeRefresh(reason = 'stream') {
+        if (document.hidden) {
+            welcomePendingRefresh = true;
+            return;
+        }
+        if (welcomeRefreshTimer) {
+            return;
+        }
+        welcomeRefreshTimer = setTimeout(() => {
+            welcomeRefreshTimer = null;
+            if (!document.hidden) {
+                updateWelcomeStatus();
+            } else {
+                welcomePendingRefresh = true;
+            }
+        }, 250);
+    }
+
+    function startWelcomeFallback(initialDelay = 0) {
+        if (welcomeFallbackInterval) {
+            return;
+        }
+        console.warn('[ADMIN] Welcome fallback aktiv.');
+        welcomeFallbackInterval = setInterval(() => {
+            if (!document.hidden) {
+                updateWelcomeStatus();
+            } else {
+                welcomePendingRefresh = true;
+            }
+        }, WELCOME_POLL_INTERVAL_MS);
+        if (initialDelay === 0) {
+            scheduleWelcomeRefresh('welcome-fallback');
+        } else {
+            setTimeout(() => scheduleWelcomeRefresh('welcome-fallback'), initialDelay);
+        }
+    }
+
+    function stopWelcomeFallback() {
+        if (welcomeFallbackInterval) {
+            clearInterval(welcomeFallbackInterval);
+            welcomeFallbackInterval = null;
+        }
+    }
+
+    function scheduleAdminRefresh(reason = 'stream') {
+        if (document.hidden) {
+            adminPendingRefresh = true;
+            return;
+        }
+        if (adminRefreshTimer) {
+            return;
+        }
+        adminRefreshTimer = setTimeout(() => {
+            adminRefreshTimer = null;
+            if (!document.hidden) {
+                updateGameStatus();
+            } else {
+                adminPendingRefresh = true;
+            }
+        }, 200);
+    }
+
+    function cleanupAdminStream() {
+        if (adminEventSource) {
+            try {
+                adminEventSource.close();
+            } catch (error) {
+                console.debug('[ADMIN] SSE close error', error);
+            }
+        }
+        adminEventSource = null;
+        if (adminStreamRetryTimer) {
+            clearTimeout(adminStreamRetryTimer);
+            adminStreamRetryTimer = null;
+        }
+    }
+
+    function startAdminPollingFallback(initialDelay = 0) {
+        if (adminFallbackInterval) {
+            return;
+        }
+        console.warn('[ADMIN] Starte Polling-Fallback.');
+        adminFallbackInterval = setInterval(() => {
+            if (!document.hidden) {
+                updateGameStatus();
+            } else {
+                adminPendingRefresh = true;
+            }
+        }, ADMIN_POLL_INTERVAL_MS);
+        if (initialDelay === 0) {
+            scheduleAdminRefresh('poll-start');
+        } else {
+            setTimeout(() => scheduleAdminRefresh('poll-start'), initialDelay);
+        }
+    }
+
+    function stopAdminPollingFallback() {
+        if (adminFallbackInterval) {
+            clearInterval(adminFallbackInterval);
+            adminFallbackInterval = null;
+        }
+    }
+
+    function initAdminEventStream() {
+        if (!window.EventSource) {
+            console.warn('[ADMIN] EventSource nicht verfügbar – nutze Polling-Fallback.');
+            startAdminPollingFallback(0);
+            return;
+        }
+
+        cleanupAdminStream();
+        stopAdminPollingFallback();
+
+        try {
+            adminEventSource = new EventSource(ADMIN_STREAM_URL);
+        } catch (error) {
+            console.error('[ADMIN] SSE konnte nicht gestartet werden:', error);
+            startAdminPollingFallback(0);
+            return;
+        }
+
+        adminEventSource.addEventListener('open', () => {
+            console.log('[ADMIN] SSE verbunden.');
+            stopSequenceFallback();
+            stopWelcomeFallback();
+            scheduleAdminRefresh('sse-open');
+        });
+
+        adminEventSource.addEventListener('control', (event) => {
+            try {
+                console.debug('[ADMIN] SSE control', JSON.parse(event.data));
+            } catch (error) {
+                console.debug('[ADMIN] SSE control parse failed', error);
+            }
+        });
+
+        adminEventSource.addEventListener('keepalive', () => {
+            console.debug('[ADMIN] SSE keepalive');
+        });
+
+        ADMIN_STREAM_EVENTS.forEach(evtName => {
+        adminEventSource.addEventListener(evtName, (event) => {
+            try {
+                console.debug(`[ADMIN] SSE ${evtName}`, JSON.parse(event.data));
+            } catch (error) {
+                console.debug(`[ADMIN] SSE ${evtName} parse failed`, error);
+            }
+            scheduleAdminRefresh(evtName);
+            if (SEQUENCE_EVENT_TRIGGERS.includes(evtName)) {
+                scheduleSequenceRefresh(evtName);
+            }
+            if (evtName === 'phase_change' || evtName === 'game_session_started' || evtName === 'question_started' || evtName === 'question_completed' || evtName === 'welcome_state') {
+                scheduleWelcomeRefresh(evtName);
+            }
+        });
+        });
+
+        adminEventSource.addEventListener('error', (event) => {
+            console.error('[ADMIN] SSE Fehler, aktiviere Polling-Fallback.', event);
+            cleanupAdminStream();
+            startAdminPollingFallback(2000);
+            startSequenceFallback(2000);
+            startWelcomeFallback(5000);
+            if (!adminStreamRetryTimer) {
+                adminStreamRetryTimer = setTimeout(() => {
+                    adminStreamRetryTimer = null;
+                    initAdminEventStream();
+                }, 5000);
+            }
+        });
+    }
+
+    // Fragen-Antworten automatisch laden
+    function loadQuestionResponses() {
+        if (currentPhase !== 'QUESTION_ACTIVE') return;
+        
+        fetch('/admin/api/question-responses')
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    displayQuestionResponses(data.responses, data.total_teams);
+                    
+                    // Update response count
+                    const responseCount = document.getElementById('question-response-count');
+                    if (responseCount) {
+                        const count = data.responses.length;
+                        const total = data.total_teams;
+                        responseCount.innerHTML = `${count}/${total} Teams haben geantwortet`;
+                        
+                        if (count === total && count > 0) {
+                            responseCount.innerHTML += ' <span class="badge badge-success">Alle</span>';
+                        }
+                    }
+                }
+            })
+            .catch(error => {
+                console.warn('Fehler beim Laden der Antworten:', error);
+            });
+    }
+
+    function displayQuestionResponses(responses, totalTeams) {
+        const responsesList = document.getElementById('question-responses-list');
+        if (!responsesList) return;
+        
+        if (responses.length === 0) {
+            responsesList.innerHTML = '<div class="text-center text-muted"><i class="fas fa-clock"></i> Warte auf Antworten...</div>';
+            return;
+        }
+        
+        let html = '<div class="row">';
+        responses.forEach((response, index) => {
+            const statusIcon = response.is_correct ? '<i class="fas fa-check text-success"></i>' : '<i class="fas fa-times text-danger"></i>';
+            const statusClass = response.is_correct ? 'correct' : 'incorrect';
+            const isNew = index >= lastResponseCount;
+            
+            html += `
+                <div class="col-md-6 mb-2">
+                    <div class="response-item ${statusClass} ${isNew ? 'new' : ''}">
+                        <div class="d-flex justify-content-between align-items-center">
+                            <div>
+                                <strong>${response.team_name}</strong>
+                                <small class="d-block text-muted">${response.answer_preview}</small>
+                                ${response.answered_at ? `<small class="text-muted">${response.answered_at}</small>` : ''}
+                            </div>
+                            <span>${statusIcon}</span>
+                        </div>
+                    </div>
+                </div>
+            `;
+        });
+        html += '</div>';
+        
+        if (responses.length === totalTeams && totalTeams > 0) {
+            html += '<div class="alert alert-success mt-3 mb-0"><i class="fas fa-check-circle"></i> Alle Teams haben geantwortet!</div>';
+        }
+        
+        responsesList.innerHTML = html;
+        lastResponseCount = responses.length;
+    }
+    
+    // Würfel-Funktionalität
+    if (rollDiceBtn) {
+        rollDiceBtn.addEventListener('click', adminRollDice);
+        
+        // Initiale Button-State-Prüfung beim Laden
+        fetch(ADMIN_DATA.urls.boardStatus)
+            .then(response => response.json())
+            .then(data => {
+                console.log('Initiale Admin-Status geladen:', data.game_session?.current_phase);
+                updateDiceButtonState(data.game_session);
+            })
+            .catch(error => console.warn('Initiale Status-Prüfung fehlgeschlagen:', error));
+    }
+    
+    function adminRollDice() {
+        if (isRollingDice) return;
+        isRollingDice = true;
+        
+        rollDiceBtn.disabled = true;
+        rollDiceBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Würfeln...';
+        
+        fetch(ADMIN_DATA.urls.rollDice, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken 
+            },
+            body: JSON.stringify({})
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                showDiceResult(data);
+                // SOFORTIGE Updates für bessere Responsivität
+                console.log('✅ [ADMIN] Dice rolled successfully, triggering immediate updates');
+                
+                // Mehrfache Updates in kurzen Abständen für zuverlässigere Aktualisierung
+                setTimeout(updateGameStatus, 200);  // Sehr schnell
+                setTimeout(updateGameStatus, 500);  // Original
+                setTimeout(updateGameStatus, 1000); // Backup
+                setTimeout(updateGameStatus, 2000); // Final backup
+            } else {
+                alert('Fehler: ' + (data.error || 'Unbekannter Fehler'));
+                resetDiceButton();
+            }
+        })
+        .catch(error => {
+            alert('Netzwerkfehler beim Würfeln.');
+            resetDiceButton();
+        });
+    }
+    
+    // Ganze Runde würfeln: ein Request, eine Transaktion; Ergebnisse im Takt von pacing.delay_ms anzeigen
+    if (rollRoundBtn) {
+        rollRoundBtn.addEventListener('click', adminRollRound);
+    }
+    
+    function adminRollRound() {
+        if (isRollingDice) return;
+        if (!confirm('Für alle Teams würfeln, die in dieser Runde noch dran sind?')) return;
+        isRollingDice = true;
+        
+        rollDiceBtn.disabled = true;
+        rollRoundBtn.disabled = true;
+        rollRoundBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Würfeln...';
+        
+        fetch(ADMIN_DATA.urls.rollRound, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken 
+            },
+            body: JSON.stringify({ pace_ms: ROUND_ROLL_PACE_MS })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                alert('Fehler: ' + (data.error || 'Unbekannter Fehler'));
+                resetRoundButton();
+                resetDiceButton();
+                return;
+            }
+            let lastDelay = 0;
+            data.rolls.forEach(roll => {
+                const delay = (roll.pacing && roll.pacing.delay_ms) || 0;
+                lastDelay = Math.max(lastDelay, delay);
+                setTimeout(() => showDiceResult(roll), delay);
+            });
+            setTimeout(() => {
+                resetRoundButton();
+                isRollingDice = false;
+                updateGameStatus();
+            }, lastDelay + 500);
+        })
+        .catch(error => {
+            alert('Netzwerkfehler beim Würfeln.');
+            resetRoundButton();
+            resetDiceButton();
+        });
+    }
+    
+    function resetRoundButton() {
+        if (rollRoundBtn) {
+            rollRoundBtn.disabled = false;
+            rollRoundBtn.innerHTML = '<i class="fas fa-forward"></i> Ganze Runde würfeln';
+        }
+    }
+    
+    function resetDiceButton() {
+        isRollingDice = false;
+        if (rollDiceBtn) {
+            rollDiceBtn.disabled = false;
+            rollDiceBtn.innerHTML = '<i class="fas fa-dice"></i> Für aktuelles Team würfeln';
+            rollDiceBtn.classList.remove('btn-secondary');
+            rollDiceBtn.classList.add('btn-success');
+        }
+    }
+    
+    // Robuste Button-State-Prüfung beim Laden und bei Updates
+    function updateDiceButtonState(gameData) {
+        if (!rollDiceBtn) return;
+        
+        // Button sollte nur aktiviert sein wenn:
+        // 1. Phase ist DICE_ROLLING
+        // 2. Es gibt ein current_team_turn_id
+        // 3. Button ist nicht gerade am Würfeln
+        const canRoll = gameData && 
+                       gameData.current_phase === 'DICE_ROLLING' && 
+                       gameData.current_team_turn_id && 
+                       !isRollingDice;
+        if (rollRoundBtn && !isRollingDice) {
+            rollRoundBtn.disabled = !canRoll;
+        }
+        
+        console.log('📊 [ADMIN] Button state update:', {
+            phase: gameData?.current_phase,
+            teamId: gameData?.current_team_turn_id, 
+            isRolling: isRollingDice,
+            canRoll: canRoll
+        });
+        
+        if (canRoll) {
+            rollDiceBtn.disabled = false;
+            rollDiceBtn.classList.remove('btn-secondary');
+            rollDiceBtn.classList.add('btn-success');
+            if (!isRollingDice) {
+                rollDiceBtn.innerHTML = '<i class="fas fa-dice"></i> Für aktuelles Team würfeln';
+            }
+        } else if (!isRollingDice) {
+            rollDiceBtn.disabled = true;
+            rollDiceBtn.classList.remove('btn-success');
+            rollDiceBtn.classList.add('btn-secondary');
+            rollDiceBtn.innerHTML = '<i class="fas fa-dice"></i> Warte auf Team...';
+        }
+    }
+    
+    function showDiceResult(data) {
+        document.getElementById('admin-standard-roll').textContent = data.standard_roll;
+        document.getElementById('admin-total-roll').textContent = data.total_roll;
+        
+        const bonusSection = document.getElementById('admin-bonus-section');
+        if (data.bonus_roll > 0) {
+            document.getElementById('admin-bonus-roll').textContent = data.bonus_roll;
+            bonusSection.style.display = 'block';
+        } else {
+            bonusSection.style.display = 'none';
+        }
+        
+        const diceResultDiv = document.getElementById('dice-result-admin');
+        diceResultDiv.style.display = 'block';
+        
+        setTimeout(() => diceResultDiv.style.display = 'none', 4000);
+    }
+    
+    function updateGameStatus() {
+        fetch(ADMIN_DATA.urls.boardStatus + "?t=" + new Date().getTime())
+            .then(response => response.json())
+            .then(data => {
+                if (data.game_session) {
+                    const newPhase = data.game_session.current_phase;
+                    
+                    // WICHTIG: Reset rolling state wenn neues Team dran ist
+                    if (newPhase === 'DICE_ROLLING' && data.game_session.current_team_turn_id) {
+                        // Wenn neues Team am Zug ist, reset den rolling state
+                        if (isRollingDice) {
+                            console.log('🔄 [ADMIN] Resetting rolling state for new team turn');
+                            isRollingDice = false;
+                        }
+                    }
+                    
+                    // Phase hat sich geändert - Update UI
+                    if (newPhase !== currentPhase) {
+                        currentPhase = newPhase;
+                        updatePhaseDisplay(newPhase);
+                        updateSectionVisibility(newPhase);
+                        
+                        // Question responses polling starten/stoppen
+                        if (newPhase === 'QUESTION_ACTIVE') {
+                            startQuestionResponsesPolling();
+                        } else {
+                            stopQuestionResponsesPolling();
+                        }
+                        
+                        // Minigame Interface Status bei Phase-Wechsel prüfen
+                        if (newPhase === 'FIELD_MINIGAME_SELECTION_PENDING' || 
+                            newPhase === 'FIELD_MINIGAME_TRIGGERED' || 
+                            newPhase === 'FIELD_MINIGAME_COMPLETED') {
+                            // Sofortiges Update des Minigame Interface
+                            setTimeout(() => checkMinigameFieldStatus(), 100);
+                        }
+                    }
+                    
+                    // Würfel-spezifische Updates
+                    if (newPhase === 'DICE_ROLLING') {
+                        const newTeamId = data.game_session.current_team_turn_id;
+                        console.log('🎯 [ADMIN] DICE_ROLLING phase detected, team:', newTeamId);
+                        updateCurrentTeamDisplay(data.teams, newTeamId);
+                        // Verwende robuste Button-State-Prüfung statt nur reset
+                        updateDiceButtonState(data.game_session);
+                    } else {
+                        console.log('🚫 [ADMIN] Not in DICE_ROLLING phase:', newPhase);
+                        // Wenn nicht DICE_ROLLING, deaktiviere Button
+                        updateDiceButtonState(null);
+                    }
+                    
+                    // Update current content info
+                    updateContentInfo(data.game_session);
+                }
+            })
+            .catch(error => console.warn('Status-Update fehlgeschlagen:', error));
+    }
+    
+    function updatePhaseDisplay(phase) {
+        const phaseDisplay = document.getElementById('current-phase-display');
+        if (phaseDisplay) {
+            let phaseText = '';
+            switch(phase) {
+                case 'SETUP_MINIGAME':
+                    phaseText = 'Inhalt festlegen';
+                    break;
+                case 'MINIGAME_ANNOUNCED':
+                    phaseText = 'Minispiel angekündigt - Warte auf Platzierungen';
+                    break;
+                case 'QUESTION_ACTIVE':
+                    phaseText = 'Frage läuft - Teams antworten';
+                    break;
+                case 'DICE_ROLLING':
+                    phaseText = 'Würfelrunde aktiv';
+                    break;
+                case 'ROUND_OVER':
+                    phaseText = 'Runde beendet - Nächsten Inhalt festlegen';
+                    break;
+                case 'FIELD_MINIGAME_SELECTION_PENDING':
+                    phaseText = 'Minigame-Feld - Warte auf Admin-Auswahl';
+                    break;
+                case 'FIELD_MINIGAME_TRIGGERED':
+                    phaseText = 'Feld-Minigame läuft - Warte auf Ergebnis';
+                    break;
+                case 'FIELD_MINIGAME_COMPLETED':
+                    phaseText = 'Feld-Minigame beendet - Banner wird angezeigt';
+                    break;
+                default:
+                    // JavaScript equivalent of Python's .title()
+                    phaseText = phase.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
+            }
+            phaseDisplay.textContent = phaseText;
+            phaseDisplay.setAttribute('data-phase', phase);
+        }
+    }
+    
+    function updateSectionVisibility(phase) {
+        // Alle Sektionen ausblenden
+        const sections = [
+            'question-control-section',
+            'dice-control-section', 
+            'content-selection-section',
+            'placement-section'
+        ];
+        
+        sections.forEach(sectionId => {
+            const section = document.getElementById(sectionId);
+            if (section) section.style.display = 'none';
+        });
+        
+        // Richtige Sektion anzeigen
+        let targetSection = null;
+        switch(phase) {
+            case 'QUESTION_ACTIVE':
+                targetSection = 'question-control-section';
+                break;
+            case 'DICE_ROLLING':
+                targetSection = 'dice-control-section';
+                break;
+            case 'SETUP_MINIGAME':
+            case 'ROUND_OVER':
+                targetSection = 'content-selection-section';
+                break;
+            case 'MINIGAME_ANNOUNCED':
+                targetSection = 'placement-section';
+                break;
+            case 'FIELD_MINIGAME_SELECTION_PENDING':
+            case 'FIELD_MINIGAME_TRIGGERED':
+            case 'FIELD_MINIGAME_COMPLETED':
+                // Field-Minigames verwenden das separate Interface
+                // Aber zeige weiterhin die Dice-Sektion für Kontext
+                targetSection = 'dice-control-section';
+                break;
+        }
+        
+        if (targetSection) {
+            const section = document.getElementById(targetSection);
+            if (section) section.style.display = 'block';
+        }
+    }
+    
+    function updateCurrentTeamDisplay(teams, currentTeamId) {
+        const currentTurnInfo = document.getElementById('current-turn-info');
+        if (!currentTurnInfo) return;
+        
+        if (!currentTeamId) {
+            currentTurnInfo.innerHTML = '<span class="text-muted">Runde beendet</span>';
+            return;
+        }
+        
+        const currentTeam = teams.find(t => t.id === currentTeamId);
+        if (currentTeam) {
+            let bonusText = 'Standard';
+            if (currentTeam.bonus_dice_sides === 6) bonusText = '1-6';
+            else if (currentTeam.bonus_dice_sides === 4) bonusText = '1-4';
+            else if (currentTeam.bonus_dice_sides === 2) bonusText = '1-2';
+            
+            currentTurnInfo.innerHTML = `
+                <span class="badge badge-primary" style="font-size: 1.1em;">
+                    ${currentTeam.name}
+                </span>
+                <small class="d-block mt-1">
+                    Position: ${currentTeam.position} | Bonus: ${bonusText}
+                </small>
+            `;
+        }
+    }
+    
+    function updateContentInfo(gameSession) {
+        const contentInfo = document.getElementById('current-content-info');
+        const minigameName = document.getElementById('current-minigame-name');
+        
+        if (contentInfo) {
+            if (gameSession.current_minigame_name) {
+                const isQuestion = gameSession.current_phase === 'QUESTION_ACTIVE';
+                const icon = isQuestion ? '❓' : '🎮';
+                const type = isQuestion ? 'Frage' : 'Minispiel';
+                
+                contentInfo.innerHTML = `
+                    <p><strong>Aktueller Inhalt:</strong> ${icon} ${type}: ${gameSession.current_minigame_name}</p>
+                    ${gameSession.current_minigame_description ? `<p><em>Beschreibung: ${gameSession.current_minigame_description}</em></p>` : ''}
+                `;
+            } else {
+                contentInfo.innerHTML = '<p>Noch kein Inhalt für diese Runde festgelegt.</p>';
+            }
+        }
+        
+        if (minigameName) {
+            minigameName.textContent = gameSession.current_minigame_name || '';
+        }
+    }
+    
+    function startQuestionResponsesPolling() {
+        if (questionResponsesInterval) clearInterval(questionResponsesInterval);
+        
+        // Sofort laden
+        loadQuestionResponses();
+        
+        // Alle 2 Sekunden aktualisieren
+        questionResponsesInterval = setInterval(loadQuestionResponses, 2000);
+    }
+    
+    function stopQuestionResponsesPolling() {
+        if (questionResponsesInterval) {
+            clearInterval(questionResponsesInterval);
+            questionResponsesInterval = null;
+        }
+        lastResponseCount = 0;
+    }
+    
+    // Initial setup basierend auf aktueller Phase
+    if (currentPhase === 'QUESTION_ACTIVE') {
+        startQuestionResponsesPolling();
+    }
+    
+    // Event-Stream oder Fallback initialisieren
+    initAdminEventStream();
+    updateGameStatus();
+
+    // Welcome-System initialisierung
+    updateWelcomeStatus();
+    startWelcomeFallback(15000);
+
+    // Welcome-System Event Listeners (mit Event-Delegation da Button dynamisch ersetzt wird)
+    // Event-Listener werden jetzt direkt in updateWelcomeStatus() gesetzt
+    
+    // Entferne alten Event-Listener Code da er durch dynamischen HTML ersetzt wird
+    /*document.getElementById('start-welcome-btn').addEventListener('click', function() {
+        fetch('/admin/api/start-welcome', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({})  // Leerer Body, aber als JSON
+        })
+        .then(response => {
+            if (!response.ok) {
+                return response.text().then(text => {
+                    console.error('Response error:', text);
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                });
+            }
+            return response.json();
+        })
+        .then(data => {
+            if (data.success) {
+                updateWelcomeStatus();
+                // Öffne Welcome-Seite in neuem Tab
+                window.open('/welcome', '_blank');
+            } else {
+                alert('Fehler beim Starten des Welcome-Systems: ' + data.error);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Ein Fehler ist aufgetreten: ' + error.message);
+        });
+    });*/
+
+    document.addEventListener('visibilitychange', function() {
+        if (document.hidden) {
+            stopAdminPollingFallback();
+            stopSequenceFallback();
+            stopWelcomeFallback();
+        } else {
+            if (!adminEventSource || adminEventSource.readyState === EventSource.CLOSED) {
+                initAdminEventStream();
+            }
+            if (!adminEventSource && adminFallbackInterval === null) {
+                startAdminPollingFallback(0);
+            }
+            if (!sequenceFallbackInterval) {
+                startSequenceFallback(2000);
+            }
+            if (!welcomeFallbackInterval) {
+                startWelcomeFallback(5000);
+            }
+            if (adminPendingRefresh) {
+                adminPendingRefresh = false;
+                updateGameStatus();
+            }
+            if (sequencePendingRefresh) {
+                sequencePendingRefresh = false;
+                updateSequenceStatus();
+                checkMinigameFieldStatus();
+            }
+            if (welcomePendingRefresh) {
+                welcomePendingRefresh = false;
+                updateWelcomeStatus();
+            }
+        }
+    });
+
+    window.addEventListener('beforeunload', function() {
+        cleanupAdminStream();
+        stopAdminPollingFallback();
+        stopSequenceFallback();
+        stopWelcomeFallback();
+        if (sequenceRefreshTimer) {
+            clearTimeout(sequenceRefreshTimer);
+            sequenceRefreshTimer = null;
+        }
+        if (welcomeRefreshTimer) {
+            clearTimeout(welcomeRefreshTimer);
+            welcomeRefreshTimer = null;
+        }
+    });
+});
+
+function updateWelcomeStatus() {
+    fetch('/api/welcome-admin-status')
+        .then(response => response.json())
+        .then(data => {
+            const statusCard = document.getElementById('welcome-status-card');
+            const startBtn = document.getElementById('start-welcome-btn');
+            
+            if (data.active) {
+                let teamsDisplay = '';
+                if (data.teams_created && data.teams && data.teams.length > 0) {
+                    teamsDisplay = `
+                        <div class="mt-3">
+                            <small class="text-info"><strong>Teams & Passwörter:</strong></small>
+                            <div class="mt-2">
+                                ${data.teams.map(team => `
+                                    <div class="card card-body p-2 mb-2" style="font-size: 0.85em;">
+                                        <div class="d-flex justify-content-between align-items-center">
+                                            <strong>Team ${team.name}</strong>
+                                            <div class="d-flex align-items-center gap-2">
+                                                <span class="badge badge-dark" style="font-family: monospace;">🔑 ${team.password}</span>
+                                                <button class="btn btn-sm btn-outline-secondary copy-password-btn" 
+                                                        data-password="${team.password}" 
+                                                        data-team-name="Team ${team.name}"
+                                                        title="Passwort kopieren"
+                                                        style="padding: 2px 6px; font-size: 0.7rem;">
+                                                    📋
+                                                </button>
+                                            </div>
+                                        </div>
+                                        <div style="font-size: 0.75em; color: #666;">
+                                            ${team.members.join(', ')}
+                                        </div>
+                                    </div>
+                                `).join('')}
+                            </div>
+                        </div>
+                    `;
+                }
+                
+                statusCard.innerHTML = `
+                    <div class="text-success">
+                        <i class="fas fa-check-circle"></i> <strong>Aktiv</strong>
+                    </div>
+                    <div class="mt-2">
+                        <small class="text-muted">Spieler registriert: <strong>${data.player_count || 0}</strong></small>
+                    </div>
+                    ${data.teams_created ? `
+                        <div class="mt-2">
+                            <small class="text-info">Teams erstellt: <strong>${data.team_count || 0}</strong></small>
+                        </div>
+                        <div class="mt-2">
+                            <span class="badge badge-success">Bereit zum Spielstart</span>
+                        </div>
+                        ${teamsDisplay}
+                    ` : `
+                        <div class="mt-2">
+                            <span class="badge badge-warning">Warten auf Teamaufteilung</span>
+                        </div>
+                    `}
+                `;
+                
+                // Aktualisiere Team-Optionen basierend auf Spieleranzahl
+                updateTeamOptions(data.player_count || 0);
+                startBtn.innerHTML = '<i class="fas fa-stop"></i> Beenden';
+                startBtn.className = 'btn btn-danger btn-sm';
+                startBtn.onclick = function() {
+                    if (confirm('Welcome-System wirklich beenden?')) {
+                        fetch('/admin/api/end-registration', {
+                            method: 'POST',
+                            headers: { 
+                                'Content-Type': 'application/json',
+                                'X-Requested-With': 'XMLHttpRequest',
+                                'X-CSRFToken': csrfToken
+                            },
+                            credentials: 'same-origin',
+                            body: JSON.stringify({})
+                        })
+                        .then(response => response.json())
+                        .then(data => {
+                            if (data.success) {
+                                updateWelcomeStatus();
+                                alert('Welcome-System erfolgreich beendet.');
+                            } else {
+                                alert('Fehler beim Beenden: ' + data.error);
+                            }
+                        })
+                        .catch(error => {
+                            console.error('Error:', error);
+                            alert('Ein Fehler ist aufgetreten beim Beenden des Welcome-Systems');
+                        });
+                    }
+                };
+                
+                // Zeige Team-Management-Controls wenn aktiv aber noch keine Teams erstellt
+                const teamControls = document.getElementById('team-management-controls');
+                if (data.teams_created) {
+                    teamControls.style.display = 'none';
+                } else {
+                    teamControls.style.display = 'block';
+                }
+            } else {
+                statusCard.innerHTML = `
+                    <div class="text-muted">
+                        <i class="fas fa-pause-circle"></i> <strong>Inaktiv</strong>
+                    </div>
+                    <div class="mt-2">
+                        <small class="text-muted">Welcome-System ist nicht aktiv</small>
+                    </div>
+                `;
+                startBtn.innerHTML = '<i class="fas fa-play"></i> Starten';
+                startBtn.className = 'btn btn-success btn-sm';
+                startBtn.onclick = function() {
+                    fetch('/admin/api/start-welcome', {
+                        method: 'POST',
+                        headers: { 
+                            'Content-Type': 'application/json',
+                            'X-Requested-With': 'XMLHttpRequest',
+                            'X-CSRFToken': csrfToken
+                        },
+                        credentials: 'same-origin',
+                        body: JSON.stringify({})
+                    }).then(response => {
+                        if (!response.ok) {
+                            return response.json().then(errorData => {
+                                // Spezielle Behandlung für GAME_ACTIVE Fehler
+                                if (errorData.error === 'GAME_ACTIVE') {
+                                    return { gameActive: true, data: errorData };
+                                }
+                                throw new Error(errorData.error || `HTTP error! status: ${response.status}`);
+                            });
+                        }
+                        return response.json();
+                    })
+                    .then(result => {
+                        // Behandlung von GAME_ACTIVE Konflikt
+                        if (result.gameActive) {
+                            const errorData = result.data;
+                            
+                            // Befülle das Custom Modal mit Daten
+                            document.getElementById('customGameResetMessage').textContent = errorData.message;
+                            
+                            const existingTeamsDiv = document.getElementById('customExistingTeams');
+                            if (errorData.details.team_names.length > 0) {
+                                existingTeamsDiv.innerHTML = `
+                                    <div style="background: rgba(52, 152, 219, 0.25); padding: 1.5rem; border-radius: 10px; border-left: 4px solid #3498db; margin-top: 1rem;">
+                                        <strong style="font-size: 1.1rem;"><i class="fas fa-users"></i> Vorhandene Teams (${errorData.details.teams_count}):</strong><br>
+                                        <span style="color: #a8d8ea; font-size: 1.1rem; margin-top: 0.5rem; display: block;">${errorData.details.team_names.join(', ')}${errorData.details.teams_count > 5 ? '...' : ''}</span>
+                                    </div>
+                                `;
+                            } else {
+                                existingTeamsDiv.innerHTML = '';
+                            }
+                            
+                            // Speichere errorData für die Funktionen
+                            window.currentGameResetData = errorData;
+                            
+                            // Zeige Custom Modal
+                            showCustomModal();
+                            
+                            return; // Beende Funktion hier
+                        }
+                        
+                        // Normaler Success-Fall
+                        if (result.success) {
+                            updateWelcomeStatus();
+                            // Admin bleibt im Dashboard - kein automatisches Öffnen der Welcome-Seite
+                            alert('Welcome-System erfolgreich gestartet! Welcome-Seite ist jetzt aktiv.');
+                        } else {
+                            alert('Fehler beim Starten: ' + result.error);
+                            // Aktualisiere Status da etwas nicht stimmt
+                            updateWelcomeStatus();
+                        }
+                    })
+                    .catch(error => {
+                        console.error('Error:', error);
+                        alert('Ein Fehler ist aufgetreten: ' + error.message);
+                        // Aktualisiere Status da etwas nicht stimmt
+                        updateWelcomeStatus();
+                    });
+                };
+                
+                // Verstecke Team-Management-Controls wenn inaktiv
+                const teamControls = document.getElementById('team-management-controls');
+                teamControls.style.display = 'none';
+            }
+        })
+        .catch(error => {
+            console.error('Error updating welcome status:', error);
+            const statusCard = document.getElementById('welcome-status-card');
+            statusCard.innerHTML = `
+                <div class="text-danger">
+                    <i class="fas fa-exclamation-triangle"></i> Fehler beim Laden
+                </div>
+            `;
+        });
+}
+
+// Funktion zum Aktualisieren der Team-Optionen basierend auf Spieleranzahl
+function updateTeamOptions(playerCount) {
+    const select = document.getElementById('team-count-select');
+    const options = select.querySelectorAll('option[value]'); // Alle Optionen mit Werten
+    
+    options.forEach(option => {
+        const teamCount = parseInt(option.value);
+        
+        // Überspringe ungültige Werte
+        if (isNaN(teamCount) || teamCount <= 0) {
+            return;
+        }
+        
+        if (teamCount > playerCount) {
+            // Nicht genügend Spieler für diese Team-Anzahl
+            option.classList.add('insufficient-players');
+            option.disabled = true;
+            const needed = teamCount - playerCount;
+            option.textContent = `${teamCount} Teams ❌ (${needed} Spieler fehlen)`;
+        } else {
+            // Genügend Spieler vorhanden
+            option.classList.remove('insufficient-players');
+            option.disabled = false;
+            option.textContent = `${teamCount} Teams ✅`;
+        }
+    });
+    
+    // Wenn die aktuell ausgewählte Option nicht mehr gültig ist, zurücksetzen
+    const selectedValue = parseInt(select.value);
+    if (selectedValue && selectedValue > playerCount) {
+        select.value = '';
+        document.getElementById('create-teams-admin-btn').disabled = true;
+    }
+}
+
+// Team-Management-Controls Event-Listener
+document.getElementById('team-count-select').addEventListener('change', function() {
+    const createBtn = document.getElementById('create-teams-admin-btn');
+    createBtn.disabled = this.value === '';
+});
+
+document.getElementById('create-teams-admin-btn').addEventListener('click', function() {
+    const teamCount = document.getElementById('team-count-select').value;
+    if (!teamCount) {
+        alert('Bitte wähle zuerst die Anzahl der Teams!');
+        return;
+    }
+    
+    if (confirm(`${teamCount} Teams erstellen? Dies teilt die registrierten Spieler automatisch auf.`)) {
+        fetch('/admin/api/create-teams', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            },
+            body: JSON.stringify({ team_count: parseInt(teamCount) })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                updateWelcomeStatus();
+                alert('Teams erfolgreich erstellt! Passwörter sind im Admin-Dashboard sichtbar.');
+            } else {
+                alert('Fehler beim Erstellen der Teams: ' + data.error);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Ein Fehler ist aufgetreten beim Erstellen der Teams');
+        });
+    }
+});
+
+// Vollbild-Spielstart Button
+document.getElementById('start-fullscreen-game-btn').addEventListener('click', function() {
+    // Öffne Spielbrett in neuem Fenster/Tab
+    const gameWindow = window.open('/admin/open-board', '_blank');
+    
+    // Warte kurz, dann aktiviere Vollbild
+    setTimeout(() => {
+        if (gameWindow) {
+            // Versuche Vollbild zu aktivieren
+            gameWindow.postMessage({action: 'requestFullscreen'}, '*');
+            
+            // Falls postMessage nicht funktioniert, öffne Dialog
+            if (!gameWindow.document.fullscreenElement) {
+                gameWindow.alert('Für die beste Erfahrung drücke F11 für Vollbild!');
+            }
+        }
+    }, 1000);
+});
+
+// Spieler-Rotation Management
+function showRotationStats() {
+    fetch('/admin/player_rotation_stats')
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                let statsHtml = '<h5>Spieler-Rotation Statistiken</h5>';
+                
+                if (Object.keys(data.stats).length === 0) {
+                    statsHtml += '<p class="text-muted">Noch keine Rotations-Daten verfügbar.</p>';
+                } else {
+                    statsHtml += '<div class="row">';
+                    for (const [teamName, stats] of Object.entries(data.stats)) {
+                        statsHtml += `
+                            <div class="col-md-6 mb-3">
+                                <div class="card">
+                                    <div class="card-header">
+                                        <strong>${teamName}</strong>
+                                        <small class="text-muted">(${stats.total_games} Spiele gesamt)</small>
+                                    </div>
+                                    <div class="card-body">
+                                        <div class="player-stats">
+                        `;
+                        
+                        for (const [playerName, gameCount] of Object.entries(stats.players)) {
+                            const isEqual = gameCount === stats.least_played && gameCount === stats.most_played;
+                            const isLeast = gameCount === stats.least_played && !isEqual;
+                            const isMost = gameCount === stats.most_played && !isEqual;
+                            
+                            let badgeClass = 'badge-secondary';
+                            if (isLeast) badgeClass = 'badge-success';
+                            if (isMost) badgeClass = 'badge-warning';
+                            
+                            statsHtml += `<span class="badge ${badgeClass} mr-1">${playerName}: ${gameCount}</span>`;
+                        }
+                        
+                        statsHtml += `
+                                        </div>
+                                    </div>
+                                </div>
+                            </div>
+                        `;
+                    }
+                    statsHtml += '</div>';
+                }
+                
+                // Zeige Modal
+                document.getElementById('rotationModalBody').innerHTML = statsHtml;
+                $('#rotationModal').modal('show');
+            } else {
+                alert('Fehler beim Laden der Statistiken: ' + data.error);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Ein Fehler ist aufgetreten beim Laden der Statistiken');
+        });
+}
+
+function resetRotation() {
+    if (confirm('Spieler-Rotation zurücksetzen? Alle Spieler starten wieder mit 0 Einsätzen.')) {
+        fetch('/admin/reset_player_rotation', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRFToken': csrfToken
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                alert('Spieler-Rotation erfolgreich zurückgesetzt!');
+                location.reload(); // Seite neu laden
+            } else {
+                alert('Fehler beim Zurücksetzen: ' + data.error);
+            }
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            alert('Ein Fehler ist aufgetreten beim Zurücksetzen');
+        });
+    }
+}
+
+// Live-Updates für Sequence-Status
+let sequenceFallbackInterval = null;
+let sequenceRefreshTimer = null;
+let sequencePendingRefresh = false;
+const SEQUENCE_POLL_INTERVAL_MS = 6000;
+const SEQUENCE_EVENT_TRIGGERS = [
+    'field_update',
+    'field_minigame_completed',
+    'special_field_catapult_forward',
+    'special_field_catapult_backward',
+    'special_field_player_swap',
+    'special_field_barrier_set',
+    'special_field_barrier_released',
+    'special_field_barrier_blocked',
+    'question_started',
+    'question_completed',
+    'phase_change',
+    'sequence_state'
+];
+let welcomeFallbackInterval = null;
+let welcomeRefreshTimer = null;
+let welcomePendingRefresh = false;
+const WELCOME_POLL_INTERVAL_MS = 15000;
+
+function updateSequenceStatus() {
+    fetch('/admin/api/sequence_status')
+        .then(response => response.json())
+        .then(data => {
+            updateSequenceUI(data);
+        })
+        .catch(error => {
+            console.error('Fehler beim Laden der Sequence-Daten:', error);
+        });
+}
+
+function updateSequenceUI(data) {
+    // Update der Radio Button Verfügbarkeit
+    const folderPlannedRadio = document.querySelector('input[value="folder_planned"]');
+    const folderPlannedContainer = folderPlannedRadio ? folderPlannedRadio.closest('.col-md-6, .col-lg-3') : null;
+    
+    if (folderPlannedContainer) {
+        const hasActivePlan = data.has_sequence && data.is_active && data.has_items;
+        
+        if (hasActivePlan) {
+            // Option verfügbar machen - Container anzeigen
+            folderPlannedContainer.style.display = 'block';
+            folderPlannedRadio.disabled = false;
+        } else {
+            // Option verstecken wenn kein aktiver Plan
+            folderPlannedContainer.style.display = 'none';
+            folderPlannedRadio.disabled = true;
+            
+            // Falls diese Option aktuell ausgewählt ist, wechsle zu einer anderen
+            if (folderPlannedRadio.checked) {
+                const firstEnabledRadio = document.querySelector('input[name="minigame_source"]:not([disabled]):not([value="folder_planned"])');
+                if (firstEnabledRadio) {
+                    firstEnabledRadio.checked = true;
+                    // Trigger change event um section zu wechseln
+                    firstEnabledRadio.dispatchEvent(new Event('change'));
+                }
+            }
+        }
+    }
+    
+    // Update der folder_planned Section falls sichtbar
+    const folderPlannedSection = document.getElementById('folder_planned-section');
+    if (folderPlannedSection) {
+        if (data.has_sequence && data.has_items) {
+            updateFolderPlannedSection(folderPlannedSection, data);
+        }
+    }
+}
+
+function updateFolderPlannedSection(section, data) {
+    // Status Badge aktualisieren (in der Card Header)
+    const statusBadge = section.querySelector('.card-header .badge');
+    if (statusBadge) {
+        if (data.is_active) {
+            statusBadge.className = 'badge badge-success ml-2';
+            statusBadge.textContent = 'Aktiv';
+        } else {
+            statusBadge.className = 'badge badge-secondary ml-2';
+            statusBadge.textContent = 'Inaktiv';
+        }
+    }
+    
+    // Progress Bar aktualisieren
+    const progressBar = section.querySelector('.progress-bar');
+    if (progressBar) {
+        progressBar.style.width = data.progress_percentage + '%';
+        progressBar.textContent = data.progress_percentage + '%';
+    }
+    
+    // Position Text aktualisieren (kleiner Text unter Progress Bar)  
+    const progressContainer = section.querySelector('.progress').parentElement;
+    const positionText = progressContainer ? progressContainer.querySelector('small') : null;
+    if (positionText) {
+        positionText.textContent = `${data.current_position + 1} / ${data.total_items} abgeschlossen`;
+    }
+    
+    // Aktuelles Item aktualisieren (alert-warning)
+    if (data.current_item) {
+        updateCurrentItemAlert(section, data.current_item);
+    } else {
+        // Alle Items abgeschlossen
+        updateCurrentItemAlert(section, null);
+    }
+    
+    // Nächstes Item aktualisieren (alert-light)
+    if (data.next_item) {
+        updateNextItemAlert(section, data.next_item);
+    } else {
+        // Kein nächstes Item, verstecke die Vorschau
+        const nextAlert = section.querySelector('.alert-light');
+        if (nextAlert) {
+            nextAlert.style.display = 'none';
+        }
+    }
+}
+
+function updateCurrentItemAlert(section, currentItem) {
+    const currentAlert = section.querySelector('.alert-warning');
+    
+    if (!currentItem) {
+        // Alle Items abgeschlossen - zeige success alert
+        if (currentAlert) {
+            currentAlert.className = 'alert alert-success';
+            currentAlert.innerHTML = `
+                <i class="fas fa-check-circle"></i> 
+                Alle Items des Ablaufplans wurden abgeschlossen!
+            `;
+        }
+        return;
+    }
+    
+    if (currentAlert) {
+        const icon = currentItem.type === 'minigame' ? 
+            '<i class="fas fa-gamepad text-primary"></i>' : 
+            '<i class="fas fa-question-circle text-info"></i>';
+        
+        let html = `
+            <h6><i class="fas fa-arrow-right"></i> Nächstes Item:</h6>
+            <strong>
+                ${icon}
+                ${currentItem.name}
+            </strong>
+        `;
+        
+        if (currentItem.description) {
+            html += `<p class="mb-0 mt-1">${currentItem.description}</p>`;
+        }
+        
+        currentAlert.innerHTML = html;
+        currentAlert.className = 'alert alert-warning';
+        currentAlert.style.display = 'block';
+    }
+}
+
+function updateNextItemAlert(section, nextItem) {
+    const nextAlert = section.querySelector('.alert-light');
+    
+    if (nextAlert && nextItem) {
+        const icon = nextItem.type === 'minigame' ? 
+            '<i class="fas fa-gamepad text-primary"></i>' : 
+            '<i class="fas fa-question-circle text-info"></i>';
+        
+        nextAlert.innerHTML = `
+            <h6><i class="fas fa-clock"></i> Danach:</h6>
+            <small>
+                ${icon}
+                ${nextItem.name}
+            </small>
+        `;
+        nextAlert.style.display = 'block';
+    }
+}
+
+// NEU: Minigame-Feld Admin Auswahl Functions
+let selectedMinigameId = null;
+let selectedWinnerTeamId = null;
+
+function checkMinigameFieldStatus() {
+    fetch('/admin/check_minigame_field_status', {
+        method: 'GET',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        const selectionCard = document.getElementById('minigame-field-selection');
+        
+        if (data.selection_pending) {
+            // Zeige Minispiel-Auswahl Interface
+            selectionCard.style.display = 'block';
+            displayMinigameSelection(data);
+        } else if (data.result_pending) {
+            // NEU: Zeige Ergebnis-Eingabe Interface
+            selectionCard.style.display = 'block';
+            displayMinigameResult(data);
+        } else {
+            // Verstecke Interface
+            selectionCard.style.display = 'none';
+        }
+    })
+    .catch(error => {
+        console.error('Fehler beim Prüfen des Minigame-Status:', error);
+    });
+}
+
+function displayMinigameSelection(data) {
+    const infoDiv = document.getElementById('minigame-selection-info');
+    const interfaceDiv = document.getElementById('minigame-selection-interface');
+    const matchInfoDiv = document.getElementById('minigame-match-info');
+    const minigamesListDiv = document.getElementById('available-minigames-list');
+    
+    // Zeige Team-Info mit Admin-Modus-Auswahl
+    matchInfoDiv.innerHTML = `
+        <div class="text-center">
+            <h5 class="text-primary">Team <strong>${data.landing_team}</strong> ist auf einem Minigame-Feld gelandet!</h5>
+            <small class="text-muted">Wähle Modus und Minispiel aus:</small>
+        </div>
+    `;
+    
+    // Verfügbare Minispiele nach Modi gruppiert anzeigen
+    if (data.available_minigames) {
+        let minigamesHtml = '';
+        
+        // Team vs All Modus
+        if (data.available_minigames.team_vs_all && data.available_minigames.team_vs_all.length > 0) {
+            minigamesHtml += `
+                <div class="card mb-3">
+                    <div class="card-header bg-success text-white">
+                        <h6 class="mb-0"><i class="fas fa-users"></i> Team vs Alle (${data.landing_team} gegen alle anderen)</h6>
+                    </div>
+                    <div class="card-body">
+                        <div class="list-group">
+            `;
+            
+            data.available_minigames.team_vs_all.forEach(minigame => {
+                minigamesHtml += `
+                    <div class="list-group-item list-group-item-action minigame-option field-minigame-item" data-id="${minigame.id}">
+                        <div class="d-flex justify-content-between">
+                            <div>
+                                <h6 class="mb-1">
+                                    🎮 ${minigame.title}
+                                    <span class="badge badge-info ml-2" title="Dieses Spiel wird für Feld-Minispiele verwendet">
+                                        <i class="fas fa-map-marker-alt"></i> Feld-Minigame
+                                    </span>
+                                </h6>
+                                <small class="text-muted">Spieler pro Team: ${minigame.player_count}</small>
+                            </div>
+                            <div class="text-right">
+                                <input type="radio" name="minigame-selection" value="${minigame.id}" class="minigame-radio">
+                            </div>
+                        </div>
+                        ${minigame.instructions ? `<p class="mb-1 small text-muted">${minigame.instructions}</p>` : ''}
+                    </div>
+                `;
+            });
+            
+            minigamesHtml += `
+                        </div>
+                    </div>
+                </div>
+            `;
+        }
+        
+        // Team vs Team Modus
+        if (data.available_minigames.team_vs_team && data.available_minigames.team_vs_team.length > 0) {
+            minigamesHtml += `
+                <div class="card mb-3">
+                    <div class="card-header bg-primary text-white">
+                        <h6 class="mb-0"><i class="fas fa-user-friends"></i> Team vs Team (${data.landing_team} gegen ein anderes Team)</h6>
+                    </div>
+                    <div class="card-body">
+                        <div class="list-group">
+            `;
+            
+            data.available_minigames.team_vs_team.forEach(minigame => {
+                minigamesHtml += `
+                    <div class="list-group-item list-group-item-action minigame-option field-minigame-item" data-id="${minigame.id}">
+                        <div class="d-flex justify-content-between">
+                            <div>
+                                <h6 class="mb-1">
+                                    🎮 ${minigame.title}
+                                    <span class="badge badge-info ml-2" title="Dieses Spiel wird für Feld-Minispiele verwendet">
+                                        <i class="fas fa-map-marker-alt"></i> Feld-Minigame
+                                    </span>
+                                </h6>
+                                <small class="text-muted">Spieler pro Team: ${minigame.player_count}</small>
+                            </div>
+                            <div class="text-right">
+                                <input type="radio" name="minigame-selection" value="${minigame.id}" class="minigame-radio">
+                            </div>
+                        </div>
+                        ${minigame.instructions ? `<p class="mb-1 small text-muted">${minigame.instructions}</p>` : ''}
+                    </div>
+                `;
+            });
+            
+            minigamesHtml += `
+                        </div>
+                    </div>
+                </div>
+            `;
+        }
+        
+        // Füge den Start-Button unter die Modi hinzu
+        minigamesHtml += `
+            <div class="mt-3 text-center">
+                <button id="start-selected-minigame" class="btn btn-success btn-lg" disabled>
+                    <i class="fas fa-play"></i> Ausgewähltes Minispiel starten
+                </button>
+            </div>
+        `;
+        
+        minigamesListDiv.innerHTML = minigamesHtml;
+        
+        // Event Listeners für Auswahl
+        document.querySelectorAll('.minigame-option').forEach(option => {
+            option.addEventListener('click', function() {
+                // Deselektiere alle anderen
+                document.querySelectorAll('.minigame-option').forEach(opt => {
+                    opt.classList.remove('active');
+                });
+                document.querySelectorAll('.minigame-radio').forEach(radio => {
+                    radio.checked = false;
+                });
+                
+                // Selektiere das aktuelle
+                this.classList.add('active');
+                this.querySelector('.minigame-radio').checked = true;
+                selectedMinigameId = this.dataset.id;
+                
+                console.log('✅ Minigame ausgewählt:', selectedMinigameId);
+                console.log('✅ Element data-id:', this.dataset.id);
+                
+                // Aktiviere Start-Button
+                const startButton = document.getElementById('start-selected-minigame');
+                if (startButton) {
+                    startButton.disabled = false;
+                    console.log('✅ Start-Button aktiviert');
+                } else {
+                    console.error('❌ Start-Button nicht gefunden beim Aktivieren');
+                }
+            });
+        });
+        
+        // Event Listener für Start-Button (neu hinzufügen)
+        const startButton = document.getElementById('start-selected-minigame');
+        if (startButton) {
+            startButton.addEventListener('click', startSelectedMinigame);
+        }
+        
+        interfaceDiv.style.display = 'block';
+    } else {
+        minigamesListDiv.innerHTML = '<div class="alert alert-warning">Keine verfügbaren Minispiele gefunden!</div>';
+        interfaceDiv.style.display = 'block';
+    }
+}
+
+function startSelectedMinigame() {
+    if (!selectedMinigameId) {
+        alert('Bitte wähle ein Minispiel aus!');
+        return;
+    }
+    
+    console.log('🎮 Starte Feld-Minigame mit ID:', selectedMinigameId);
+    
+    const startButton = document.getElementById('start-selected-minigame');
+    if (!startButton) {
+        console.error('❌ Start-Button nicht gefunden!');
+        return;
+    }
+    
+    startButton.disabled = true;
+    startButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Starte...';
+    
+    const requestData = {
+        minigame_id: selectedMinigameId
+    };
+    
+    console.log('📤 Sende Request:', requestData);
+    
+    fetch('/admin/start_field_minigame', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken
+        },
+        body: JSON.stringify(requestData)
+    })
+    .then(response => {
+        console.log('📥 Response Status:', response.status);
+        return response.json();
+    })
+    .then(data => {
+        console.log('📥 Response Data:', data);
+        if (data.success) {
+            // Verstecke Auswahl-Interface
+            document.getElementById('minigame-field-selection').style.display = 'none';
+            selectedMinigameId = null;
+            
+            // Zeige Erfolg-Nachricht
+            showAlert('success', `Minispiel "${data.minigame_name}" wurde gestartet!`);
+            
+            // Aktualisiere Spielstatus
+            location.reload(); // Einfache Lösung - Seite neu laden
+        } else {
+            showAlert('danger', 'Fehler: ' + data.message);
+            startButton.disabled = false;
+            startButton.innerHTML = '<i class="fas fa-play"></i> Ausgewähltes Minispiel starten';
+        }
+    })
+    .catch(error => {
+        console.error('❌ Fehler beim Starten des Minispiels:', error);
+        showAlert('danger', 'Fehler beim Starten des Minispiels');
+        const startButton = document.getElementById('start-selected-minigame');
+        if (startButton) {
+            startButton.disabled = false;
+            startButton.innerHTML = '<i class="fas fa-play"></i> Ausgewähltes Minispiel starten';
+        }
+    });
+}
+
+// NEU: Ergebnis-Eingabe Interface (vereinfacht)
+function displayMinigameResult(data) {
+    const interfaceDiv = document.getElementById('minigame-selection-interface');
+    const resultInterfaceDiv = document.getElementById('minigame-result-interface');
+    const runningInfoDiv = document.getElementById('running-minigame-info');
+    
+    // Verstecke Auswahl-Interface, zeige Ergebnis-Interface
+    interfaceDiv.style.display = 'none';
+    resultInterfaceDiv.style.display = 'block';
+    
+    // Zeige laufendes Minispiel Info
+    let modeText = '';
+    let challengerTeam = data.landing_team;
+    
+    if (data.mode === 'team_vs_team') {
+        modeText = `<strong>${data.landing_team}</strong> vs <strong>${data.opponent_team}</strong>`;
+    } else {
+        modeText = `<strong>${data.landing_team}</strong> vs <strong>alle anderen Teams</strong>`;
+    }
+    
+    runningInfoDiv.innerHTML = `
+        <div class="text-center">
+            <h6 class="text-primary">🎮 ${data.minigame_name}</h6>
+            <div>${modeText}</div>
+            <div class="mt-2">
+                <span class="badge badge-info">Herausforderer: <strong>${challengerTeam}</strong></span>
+            </div>
+        </div>
+    `;
+    
+    // Reset Auswahl
+    selectedResult = null;
+    document.getElementById('submit-simple-result').disabled = true;
+}
+
+// NEU: Vereinfachte Ergebnis-Auswahl
+let selectedResult = null;
+
+function selectSimpleResult(result) {
+    selectedResult = result;
+    document.getElementById('submit-simple-result').disabled = false;
+    
+    // Visuelles Feedback
+    document.querySelectorAll('.btn-group label').forEach(label => {
+        label.classList.remove('active');
+    });
+    event.target.closest('label').classList.add('active');
+}
+
+function submitMinigameResult() {
+    if (!selectedResult) {
+        alert('Bitte wähle das Ergebnis aus!');
+        return;
+    }
+    
+    const submitButton = document.getElementById('submit-simple-result');
+    submitButton.disabled = true;
+    submitButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Verarbeite Ergebnis...';
+    
+    fetch('/admin/submit_field_minigame_result', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': csrfToken
+        },
+        body: JSON.stringify({
+            result: selectedResult
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            // Verstecke Ergebnis-Interface
+            document.getElementById('minigame-field-selection').style.display = 'none';
+            selectedWinnerTeamId = null;
+            
+            // Zeige Erfolg-Nachricht
+            showAlert('success', data.message);
+            
+            // Aktualisiere Spielstatus
+            location.reload(); // Einfache Lösung - Seite neu laden
+        } else {
+            showAlert('danger', 'Fehler: ' + data.message);
+            submitButton.disabled = false;
+            submitButton.innerHTML = '<i class="fas fa-check"></i> Ergebnis bestätigen & Belohnung anwenden';
+        }
+    })
+    .catch(error => {
+        console.error('Fehler beim Übermitteln des Ergebnisses:', error);
+        showAlert('danger', 'Fehler beim Übermitteln des Ergebnisses');
+        submitButton.disabled = false;
+        submitButton.innerHTML = '<i class="fas fa-check"></i> Ergebnis bestätigen & Belohnung anwenden';
+    });
+}
+
+function showAlert(type, message) {
+    // Füge Alert am Anfang der Container hinzu
+    const container = document.querySelector('.container');
+    const alertDiv = document.createElement('div');
+    alertDiv.className = `alert alert-${type} alert-dismissible fade show`;
+    alertDiv.innerHTML = `
+        ${message}
+        <button type="button" class="close" data-dismiss="alert">
+            <span>&times;</span>
+        </button>
+    `;
+    container.insertBefore(alertDiv, container.firstChild);
+    
+    // Auto-remove nach 5 Sekunden
+    setTimeout(() => {
+        if (alertDiv.parentNode) {
+            alertDiv.remove();
+        }
+    }, 5000);
+}
+
+// Live-Updates starten wenn Admin Dashboard geladen wird
+document.addEventListener('DOMContentLoaded', function() {
+    // Initiales Update für Sequenzen/Minigames
+    updateSequenceStatus();
+    checkMinigameFieldStatus(); // NEU: Prüfe Minigame-Feld Status
+    startSequenceFallback(8000);
+    
+    // Event Listeners für Minigame-Auswahl Interface
+    document.getElementById('refresh-minigame-status').addEventListener('click', checkMinigameFieldStatus);
+    // start-selected-minigame wird dynamisch gesetzt
+    document.getElementById('submit-simple-result').addEventListener('click', submitMinigameResult);
+    
+    // Pause Updates wenn Tab nicht aktiv ist (Performance)
+    document.addEventListener('visibilitychange', function() {
+        if (document.hidden) {
+            stopSequenceFallback();
+        } else {
+            // Resume updates wenn Tab wieder aktiv
+            updateSequenceStatus();
+            checkMinigameFieldStatus(); // NEU
+            startSequenceFallback(8000);
+        }
+    });
+
+    // Copy Password Functionality - Event Delegation für dynamische Buttons
+    document.addEventListener('click', function(e) {
+        if (e.target.classList.contains('copy-password-btn')) {
+            const password = e.target.getAttribute('data-password');
+            const teamName = e.target.getAttribute('data-team-name');
+            
+            // Modern Clipboard API
+            if (navigator.clipboard && window.isSecureContext) {
+                navigator.clipboard.writeText(password).then(function() {
+                    // Success feedback
+                    const originalContent = e.target.innerHTML;
+                    e.target.innerHTML = '✅';
+                    e.target.title = 'Kopiert!';
+                    e.target.classList.remove('btn-outline-secondary');
+                    e.target.classList.add('btn-success');
+                    
+                    // Reset nach 2 Sekunden
+                    setTimeout(function() {
+                        e.target.innerHTML = originalContent;
+                        e.target.title = 'Passwort kopieren';
+                        e.target.classList.remove('btn-success');
+                        e.target.classList.add('btn-outline-secondary');
+                    }, 2000);
+                    
+                    // Optional: Toast notification
+                    console.log(`Passwort für ${teamName} kopiert: ${password}`);
+                }).catch(function(err) {
+                    console.error('Fehler beim Kopieren:', err);
+                    alert('Fehler beim Kopieren des Passworts');
+                });
+            } else {
+                // Fallback für ältere Browser
+                const textArea = document.createElement('textarea');
+                textArea.value = password;
+                textArea.style.position = 'fixed';
+                textArea.style.left = '-999999px';
+                textArea.style.top = '-999999px';
+                document.body.appendChild(textArea);
+                textArea.focus();
+                textArea.select();
+                
+                try {
+                    document.execCommand('copy');
+                    textArea.remove();
+                    
+                    // Success feedback
+                    const originalContent = e.target.innerHTML;
+                    e.target.innerHTML = '✅';
+                    e.target.classList.remove('btn-outline-secondary');
+                    e.target.classList.add('btn-success');
+                    
+                    setTimeout(function() {
+                        e.target.innerHTML = originalContent;
+                        e.target.classList.remove('btn-success');
+                        e.target.classList.add('btn-outline-secondary');
+                    }, 2000);
+                } catch (copyErr) {
+                    textArea.remove();
+                    console.error('Fallback copy failed:', copyErr);
+                    alert('Fehler beim Kopieren des Passworts');
+                }
+            }
+        }
+    });
+
+    // Custom Modal Functions
+    window.showCustomModal = function() {
+        console.log('🔧 Showing custom modal');
+        document.getElementById('customGameResetModal').style.display = 'block';
+    };
+
+    window.hideCustomModal = function() {
+        console.log('🔧 Hiding custom modal');
+        document.getElementById('customGameResetModal').style.display = 'none';
+    };
+
+    window.showFinalConfirmModal = function() {
+        console.log('🗑️ Showing final confirm modal');
+        hideCustomModal();
+        setTimeout(function() {
+            document.getElementById('customFinalResetModal').style.display = 'block';
+        }, 200);
+    };
+
+    window.hideFinalConfirmModal = function() {
+        console.log('🔧 Hiding final confirm modal');
+        document.getElementById('customFinalResetModal').style.display = 'none';
+    };
+
+    window.executeGameReset = function() {
+        console.log('💣 Executing game reset');
+        const executeBtn = document.getElementById('customExecuteResetBtn');
+        
+        // Verstecke Modal
+        hideFinalConfirmModal();
+        
+        // Zeige Loading-Feedback
+        executeBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Wird gelöscht...';
+        executeBtn.disabled = true;
+        
+        fetch('/admin/api/reset-game-complete', {
+            method: 'POST',
+            headers: { 
+                'Content-Type': 'application/json',
+                'X-Requested-With': 'XMLHttpRequest',
+                'X-CSRFToken': csrfToken
+            },
+            credentials: 'same-origin',
+            body: JSON.stringify({})
+        })
+        .then(response => response.json())
+        .then(resetData => {
+            if (resetData.success) {
+                // Erfolgsmeldung mit Welcome-System Status
+                let successMsg = `✅ ${resetData.message}`;
+                if (resetData.welcome_started) {
+                    successMsg += `\\n\\n🎉 Das Welcome-System wurde automatisch gestartet!`;
+                } else {
+                    successMsg += `\\n\\n⚠️ Das Welcome-System muss manuell gestartet werden.`;
+                }
+                alert(successMsg);
+                updateWelcomeStatus();
+                window.location.reload(); // Full-Refresh für komplette Aktualisierung
+            } else {
+                alert('❌ Fehler beim Reset: ' + resetData.error);
+                executeBtn.innerHTML = '<i class="fas fa-bomb"></i> JA, ALLES LÖSCHEN!';
+                executeBtn.disabled = false;
+            }
+        })
+        .catch(resetError => {
+            console.error('Reset Error:', resetError);
+            alert('❌ Ein Fehler ist beim Reset aufgetreten. Bitte versuche es erneut.');
+            executeBtn.innerHTML = '<i class="fas fa-bomb"></i> JA, ALLES LÖSCHEN!';
+            executeBtn.disabled = false;
+        });
+    };
+
+    // Schließe Modal bei Klick außerhalb
+    window.addEventListener('click', function(e) {
+        if (e.target.id === 'customGameResetModal') {
+            hideCustomModal();
+        }
+        if (e.target.id === 'customFinalResetModal') {
+            hideFinalConfirmModal();
+        }
+    });
+});
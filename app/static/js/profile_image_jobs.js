@@ -0,0 +1,92 @@
+// Profilbild-Upload und Warten auf den Verarbeitungs-Job (siehe app/services/image_jobs.py).
+// Hochgeladen wird binär als multipart/form-data; gewartet wird primär über den
+// Event-Stream (welcome_state / profile_image_ready|failed), ohne EventSource
+// oder bei Stream-Fehlern per Status-Abfrage.
+(function () {
+    // Vom Template per url_for gesetzt (PROFILE_IMAGE_URLS)
+    const UPLOAD_URL = PROFILE_IMAGE_URLS.upload;
+    const STREAM_URL = PROFILE_IMAGE_URLS.stream;
+    const POLL_INTERVAL_MS = 700;
+    const TIMEOUT_MS = 30000;
+
+    function pollJobStatus(statusUrl, resolve, reject, deadline) {
+        fetch(statusUrl)
+            .then(response => response.json())
+            .then(job => {
+                if (job.status === 'done') {
+                    resolve(job);
+                } else if (job.status === 'failed' || !job.success) {
+                    reject(new Error(job.error || 'Bild konnte nicht verarbeitet werden'));
+                } else if (Date.now() > deadline) {
+                    reject(new Error('Zeitüberschreitung bei der Bildverarbeitung'));
+                } else {
+                    setTimeout(() => pollJobStatus(statusUrl, resolve, reject, deadline), POLL_INTERVAL_MS);
+                }
+            })
+            .catch(reject);
+    }
+
+    // Data-URL (z. B. aus canvas.toDataURL) als Datei hochladen, ohne Base64 im JSON
+    window.uploadProfileImageBinary = async function (playerName, dataUrl) {
+        const blob = await (await fetch(dataUrl)).blob();
+        const formData = new FormData();
+        formData.append('player_name', playerName);
+        formData.append('image', blob, 'profile.jpg');
+
+        const response = await fetch(UPLOAD_URL, { method: 'POST', body: formData });
+        return response.json();
+    };
+
+    window.waitForProfileImageJob = function (uploadResult) {
+        const jobId = uploadResult.job_id;
+        const statusUrl = uploadResult.status_url || `/api/profile-image-jobs/${jobId}`;
+        const deadline = Date.now() + TIMEOUT_MS;
+
+        return new Promise((resolve, reject) => {
+            if (!window.EventSource) {
+                pollJobStatus(statusUrl, resolve, reject, deadline);
+                return;
+            }
+
+            const source = new EventSource(STREAM_URL);
+            let settled = false;
+            const finish = (callback) => {
+                if (settled) return;
+                settled = true;
+                clearTimeout(timer);
+                source.close();
+                callback();
+            };
+            // Ohne Event bis zum Timeout: Status ein letztes Mal direkt abfragen
+            const timer = setTimeout(() => finish(() => pollJobStatus(statusUrl, resolve, reject, Date.now())), TIMEOUT_MS);
+
+            source.addEventListener('welcome_state', (event) => {
+                let payload;
+                try {
+                    payload = JSON.parse(event.data).data || {};
+                } catch (e) {
+                    return;
+                }
+                if (payload.job_id !== jobId) return;
+                if (payload.action === 'profile_image_ready') {
+                    finish(() => resolve(payload));
+                } else if (payload.action === 'profile_image_failed') {
+                    finish(() => reject(new Error(payload.error || 'Bild konnte nicht verarbeitet werden')));
+                }
+            });
+            // Das Event kann vor dem Verbindungsaufbau geschrieben worden sein
+            source.addEventListener('open', () => {
+                fetch(statusUrl)
+                    .then(response => response.json())
+                    .then(job => {
+                        if (job.status === 'done') finish(() => resolve(job));
+                        else if (job.status === 'failed') finish(() => reject(new Error(job.error)));
+                    })
+                    .catch(() => {});
+            });
+            source.addEventListener('error', () => {
+                finish(() => pollJobStatus(statusUrl, resolve, reject, deadline));
+            });
+        });
+    };
+})();
@@ -1,13 +1,17 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_user, logout_user, login_required, current_user
-from app.models import Team, db, Admin, GameSession, GameRound, QuestionResponse, GameEvent, Character, CharacterPart
+from app.models import Team, db, Admin, GameSession, GameRound, QuestionResponse, GameEvent
 from flask import current_app
 from app.forms import TeamLoginForm, QuestionAnswerForm
 from app.admin.minigame_utils import get_question_from_folder
 from app import csrf
 import json
 from datetime import datetime, timedelta
-from app.services.session_service import get_active_session
+from app.services.session_service import get_active_session, get_active_round
+from app.services.response_cache import cached_response, FIELD_CONFIG, CHARACTERS
+from app.services.character_catalog import get_catalog, invalidate_catalog, selected_character_ids
+from app.services.board_snapshot import get_board_snapshot
+from app.services.sparse_fields import FieldSelection
 
 teams_bp = Blueprint('teams', __name__, url_prefix='/teams')
 
@@ -197,146 +201,51 @@ def _get_last_dice_result(team_user, active_session):
     
     return None
 
+def _get_team_question_response(team_user, snapshot):
+    """Antwort dieses Teams auf die aktuelle Frage (oder None)"""
+    if not snapshot.session or not snapshot.current_question_data:
+        return None
+    return QuestionResponse.query.filter_by(
+        team_id=team_user.id,
+        game_session_id=snapshot.session['id'],
+        question_id=snapshot.session['current_question_id']
+    ).first()
+
 def _get_dashboard_data(team_user):
-    """Hilfsfunktion um Dashboard-Daten zu sammeln"""
-    # Alle Teams für Vergleich/Rangliste
-    all_teams = Team.query.order_by(Team.current_position.desc(), Team.name).all()
+    """Hilfsfunktion um Dashboard-Daten zu sammeln (für das Template)"""
+    # Team-unabhängige Daten aus dem gemeinsamen Schnappschuss
+    snapshot = get_board_snapshot()
     
-    # Aktive Spielsitzung
+    # Das Template arbeitet mit ORM-Objekten (Charakter, Session-Methoden)
+    all_teams = Team.in_game().order_by(Team.current_position.desc(), Team.name).all()
     active_session = get_active_session()
+    active_round = get_active_round()
     
-    # Aktive Spielrunde
-    active_round = GameRound.get_active_round()
+    current_team_turn = Team.query.get(snapshot.current_team_turn_id) if snapshot.current_team_turn_id else None
     
     # Fragen-Daten falls aktiv
-    current_question_data = None
-    question_response = None
-    question_answered = False
-    
-    if active_session and active_session.current_question_id and active_round and active_round.minigame_folder:
-        current_question_data = get_question_from_folder(active_round.minigame_folder.folder_path, active_session.current_question_id)
-        if current_question_data:
-            # Hole bereits gegebene Antwort dieses Teams für diese Frage
-            question_response = QuestionResponse.query.filter_by(
-                team_id=team_user.id,
-                game_session_id=active_session.id,
-                question_id=active_session.current_question_id
-            ).first()
-            
-            question_answered = question_response is not None
-    
-    # Spielbrett-Informationen
-    max_board_fields = 73
-    
-    # Aktuelles Team beim Würfeln (falls Würfelphase aktiv)
-    current_team_turn = None
-    current_team_turn_name = None
-    dice_roll_order = []
-    dice_roll_order_names = []
-    
-    if active_session:
-        if active_session.current_team_turn_id:
-            current_team_turn = Team.query.get(active_session.current_team_turn_id)
-            current_team_turn_name = current_team_turn.name if current_team_turn else "Unbekannt"
-        
-        # Würfelreihenfolge verarbeiten
-        if active_session.dice_roll_order:
-            try:
-                dice_roll_order = [int(tid) for tid in active_session.dice_roll_order.split(',') if tid.strip().isdigit()]
-                dice_roll_order_names = []
-                for team_id in dice_roll_order:
-                    team = Team.query.get(team_id)
-                    if team:
-                        dice_roll_order_names.append(team.name)
-            except ValueError:
-                dice_roll_order = []
-                dice_roll_order_names = []
-    
-    # Statistiken berechnen
-    teams_count = len(all_teams)
-    
-    # Position des aktuellen Teams in der Rangliste ermitteln
-    current_team_rank = 1
-    for i, team in enumerate(all_teams):
-        if team.id == team_user.id:
-            current_team_rank = i + 1
-            break
-    
-    # Führendes Team
-    leading_team = all_teams[0] if all_teams else None
-    
-    # Teams die vor dem aktuellen Team sind
-    teams_ahead = sum(1 for team in all_teams if team.current_position > team_user.current_position)
-    
-    # Verbleibendes Feld bis zum Ziel
-    fields_to_goal = max_board_fields - 1 - team_user.current_position
-    
-    # Spielstatus-Text generieren
-    if active_session:
-        if active_session.current_phase == 'SETUP_MINIGAME':
-            game_status = "Admin wählt nächsten Inhalt aus"
-            game_status_class = "warning"
-        elif active_session.current_phase == 'MINIGAME_ANNOUNCED':
-            game_status = "Minispiel wurde angekündigt - Warte auf Platzierungen"
-            game_status_class = "info"
-        elif active_session.current_phase == 'QUESTION_ACTIVE':
-            if current_question_data:
-                if question_answered:
-                    game_status = f"Frage '{current_question_data['name']}' beantwortet - Warte auf andere Teams"
-                    game_status_class = "success"
-                else:
-                    game_status = f"Frage '{current_question_data['name']}' läuft - Beantworte die Frage!"
-                    game_status_class = "primary"
-            else:
-                game_status = "Frage läuft"
-                game_status_class = "primary"
-        elif active_session.current_phase == 'DICE_ROLLING':
-            if current_team_turn_name:
-                if current_team_turn_name == team_user.name:
-                    game_status = f"Du bist am Zug! Klicke auf 'Würfeln' um zu würfeln"
-                    game_status_class = "success"
-                else:
-                    game_status = f"{current_team_turn_name} ist am Zug"
-                    game_status_class = "primary"
-            else:
-                game_status = "Würfelrunde läuft"
-                game_status_class = "primary"
-        elif active_session.current_phase == 'ROUND_OVER':
-            game_status = "Runde beendet - Nächster Inhalt wird vorbereitet"
-            game_status_class = "secondary"
-        else:
-            game_status = f"Spielphase: {active_session.current_phase}"
-            game_status_class = "info"
-    else:
-        game_status = "Kein aktives Spiel"
-        game_status_class = "danger"
-    
-    # NEU: Spielverlauf-Daten
-    game_progress = _get_team_game_progress(team_user)
+    question_response = _get_team_question_response(team_user, snapshot)
+    overlay = snapshot.overlay(team_user.id, team_user.name, team_user.current_position, question_response is not None)
     
     return {
         'all_teams': all_teams,
         'active_session': active_session,
         'active_round': active_round,
-        'max_board_fields': max_board_fields,
+        'max_board_fields': snapshot.board_size,
         'current_team_turn': current_team_turn,
-        'current_team_turn_name': current_team_turn_name,
-        'dice_roll_order': dice_roll_order,
-        'dice_roll_order_names': dice_roll_order_names,
-        'teams_count': teams_count,
-        'current_team_rank': current_team_rank,
-        'leading_team': leading_team,
-        'teams_ahead': teams_ahead,
-        'fields_to_goal': fields_to_goal,
-        'game_status': game_status,
-        'game_status_class': game_status_class,
+        'current_team_turn_name': snapshot.current_team_turn_name,
+        'dice_roll_order': snapshot.dice_roll_order,
+        'dice_roll_order_names': snapshot.dice_roll_order_names,
+        'teams_count': len(snapshot.teams),
+        'leading_team': all_teams[0] if all_teams else None,
         'title': f'Dashboard Team {team_user.name}',
         # Fragen-Daten
-        'current_question_data': current_question_data,
+        'current_question_data': snapshot.current_question_data,
         'question_response': question_response,
-        'question_answered': question_answered,
+        # Team-spezifisch: Rang, Teams davor, Felder bis zum Ziel, Status
+        **overlay,
         # NEU: Spielverlauf
-        'game_progress': game_progress,
+        'game_progress': _get_team_game_progress(team_user),
         # NEU: Letztes Würfelergebnis
         'last_dice_result': _get_last_dice_result(team_user, active_session)
     }
@@ -368,9 +277,7 @@ def team_setup():
         flash('Team-Setup ist nicht erforderlich.', 'info')
         return redirect(url_for('teams.team_dashboard'))
     
-    # Hole verfügbare Charaktere
     from app.models import Character
-    available_characters = Character.query.filter_by(is_selected=False).all()
     
     if request.method == 'POST':
         try:
@@ -456,6 +363,7 @@ def team_setup():
             
             # Erstelle oder finde Default-Charakter für alle Teams
             character = None
+            created_character = False
             if not character_id:
                 character_id = 1  # Default auf Default-Charakter setzen
                 
@@ -477,6 +385,7 @@ def team_setup():
                             )
                             db.session.add(character)
                             db.session.flush()  # Um ID zu bekommen
+                            created_character = True
                     else:
                         # Für andere Charaktere normale Verfügbarkeitsprüfung
                         character = Character.query.filter_by(id=character_id, is_selected=False).first()
@@ -510,6 +419,9 @@ def team_setup():
             current_user.set_character_customization(character_customization)
             
             db.session.commit()
+            if created_character:
+                # Neuer Default-Charakter: Katalog und Charakter-Caches neu aufbauen
+                invalidate_catalog()
             
             current_app.logger.info(f"Team-Setup abgeschlossen: {current_user.id} -> {new_team_name}, Charakter: {character.name if character else 'None'}")
             
@@ -531,91 +443,39 @@ def team_setup():
                 return jsonify({"success": False, "error": "Ein Fehler ist aufgetreten"}), 500
             flash('Ein Fehler ist aufgetreten. Versuche es nochmal.', 'danger')
     
+    # Verfügbare Charaktere aus dem Katalog, vergebene nur als ID-Abfrage
+    available_characters = get_catalog().available_characters(selected_character_ids())
     return render_template('team_setup.html', 
                          team=current_user, 
                          available_characters=available_characters)
 
 @teams_bp.route('/api/characters')
+@cached_response(CHARACTERS, private=True)
 def api_characters():
     """API endpoint für Charakterdaten"""
     try:
-        # Hole alle verfügbaren Charaktere
-        characters = Character.query.all()
-        
-        character_data = []
-        for char in characters:
-            # Prüfe ob Charakter für aktuelles Team verfügbar ist
-            is_available = True
-            current_team = current_user if isinstance(current_user, Team) else None
-            
-            if not char.is_available_for_team(current_team):
-                is_available = False
-            
-            char_info = {
-                'id': char.id,
-                'name': char.name,
-                'description': char.description,
-                'category': char.category,
-                'rarity': char.rarity,
-                'color': char.color,
-                'is_unlocked': char.is_unlocked,
-                'is_available': is_available,
-                'stats': char.get_stats(),
-                'customization_options': char.get_customization_options(),
-                'preview_image': char.preview_image,
-                'thumbnail': char.thumbnail
-            }
-            
-            character_data.append(char_info)
-        
-        return jsonify(character_data)
+        # Charakterdaten kommen vorab dekodiert aus dem In-Memory-Katalog
+        return jsonify(get_catalog().characters)
     
     except Exception as e:
         current_app.logger.error(f"Fehler beim Laden der Charakterdaten: {e}")
         return jsonify({'error': 'Fehler beim Laden der Charakterdaten'}), 500
 
 @teams_bp.route('/api/character-parts')
+@cached_response(CHARACTERS, private=True)
 def api_character_parts():
-    """API endpoint für Charakter-Teile"""
+    """API endpoint für Charakter-Teile
+
+    Optionale Filter: category, subcategory sowie body_type/face_shape
+    (Kompatibilitäts-Lookup über den Katalog-Index).
+    """
     try:
-        category = request.args.get('category')
-        subcategory = request.args.get('subcategory')
-        
-        if category:
-            parts = CharacterPart.get_parts_by_category(category, subcategory)
-        else:
-            parts = CharacterPart.query.all()
-        
-        parts_data = []
-        for part in parts:
-            # Prüfe ob Teil für aktuelles Team verfügbar ist
-            is_available = True
-            current_team = current_user if isinstance(current_user, Team) else None
-            
-            if not part.is_available_for_team(current_team):
-                is_available = False
-            
-            part_info = {
-                'id': part.id,
-                'name': part.name,
-                'category': part.category,
-                'subcategory': part.subcategory,
-                'rarity': part.rarity,
-                'is_unlocked': part.is_unlocked,
-                'is_available': is_available,
-                'asset_path': part.asset_path,
-                'icon_path': part.icon_path,
-                'color_customizable': part.color_customizable,
-                'default_color': part.default_color,
-                'description': part.description,
-                'compatible_body_types': part.get_compatible_body_types(),
-                'compatible_face_shapes': part.get_compatible_face_shapes(),
-                'stats_modifier': part.get_stats_modifier(),
-                'special_effects': part.get_special_effects()
-            }
-            
-            parts_data.append(part_info)
-        
+        parts_data = get_catalog().get_parts(
+            category=request.args.get('category'),
+            subcategory=request.args.get('subcategory'),
+            body_type=request.args.get('body_type'),
+            face_shape=request.args.get('face_shape'),
+        )
         return jsonify(parts_data)
     
     except Exception as e:
@@ -625,124 +485,94 @@ def api_character_parts():
 @teams_bp.route('/api/dashboard-status')
 @login_required
 def dashboard_status_api():
-    """API für Live-Updates des Team Dashboards"""
+    """API für Live-Updates des Team Dashboards (unterstützt ?fields= und ?encoding=compact)"""
     if not isinstance(current_user, Team):
         return {'error': 'Unauthorized'}, 403
     
     try:
-        # Hole aktuelle Daten
-        data = _get_dashboard_data(current_user)
+        selection = FieldSelection.from_request()
         
-        # DEBUG: Minigame-Daten aus Session prüfen
-        if data['active_session']:
-            current_app.logger.info(f"DEBUG dashboard_status_api: session.current_minigame_name='{data['active_session'].current_minigame_name}', session.current_minigame_description='{data['active_session'].current_minigame_description}', session.current_phase='{data['active_session'].current_phase}'")
+        # Gemeinsamer Schnappschuss (einmal pro Board-Version) + dünnes Team-Overlay
+        snapshot = get_board_snapshot()
+        session_data = snapshot.session
+        active_session = get_active_session() if session_data else None
         
-        # Konvertiere Teams zu JSON-freundlichem Format
-        teams_data = []
-        for team in data['all_teams']:
-            team_data = {
-                'id': team.id,
-                'name': team.name,
-                'position': team.current_position,
-                'minigame_placement': team.minigame_placement,
-                'bonus_dice_sides': team.bonus_dice_sides,
-                'character_name': team.character.name if team.character else None,
-                'is_current_user': team.id == current_user.id
-            }
-            
-            # Füge vollständige Charakter-Daten hinzu wenn verfügbar
-            if team.character:
-                team_data['character'] = {
-                    'id': team.character.id,
-                    'name': team.character.name,
-                    'color': team.character.color,
-                    'js_file': team.character.js_file,
-                    'image_file': team.character.image_file,
-                    'preview_image': team.character.preview_image,
-                    'thumbnail': team.character.thumbnail
-                }
-            else:
-                team_data['character'] = None
-            
-            # Füge Charakter-Anpassungen hinzu wenn verfügbar
-            if hasattr(team, 'get_character_customization'):
-                team_data['character_customization'] = team.get_character_customization()
-            else:
-                team_data['character_customization'] = None
-                
-            teams_data.append(team_data)
+        question_response = _get_team_question_response(current_user, snapshot)
+        overlay = snapshot.overlay(current_user.id, current_user.name, current_user.current_position, question_response is not None)
+        
+        # Teams sind im Schnappschuss bereits JSON-fertig; nur das eigene Team markieren
+        teams_data = [{**team, 'is_current_user': team['id'] == current_user.id} for team in snapshot.teams]
         
         # Würfelreihenfolge für JSON
         dice_order_data = []
-        if data['dice_roll_order_names']:
-            for i, team_name in enumerate(data['dice_roll_order_names']):
-                dice_order_data.append({
-                    'position': i + 1,
-                    'name': team_name,
-                    'is_current_turn': team_name == data['current_team_turn_name'],
-                    'is_current_user': team_name == current_user.name
-                })
+        for i, team_name in enumerate(snapshot.dice_roll_order_names):
+            dice_order_data.append({
+                'position': i + 1,
+                'name': team_name,
+                'is_current_turn': team_name == snapshot.current_team_turn_name,
+                'is_current_user': team_name == current_user.name
+            })
         
         # Fragen-Daten für JSON
         question_data = None
-        if data['current_question_data']:
-            # Hole die Antwort des Teams für diese Frage
-            question_response = data.get('question_response')
+        if snapshot.current_question_data:
             is_correct = question_response.is_correct if question_response else None
             
             question_data = {
-                'id': data['current_question_data']['id'],
-                'name': data['current_question_data']['name'],
-                'description': data['current_question_data'].get('description', ''),
-                'question_text': data['current_question_data'].get('question_text', ''),
-                'question_type': data['current_question_data'].get('question_type', 'multiple_choice'),
-                'options': data['current_question_data'].get('options', []),
-                'answered': data['question_answered'],
+                'id': snapshot.current_question_data['id'],
+                'name': snapshot.current_question_data['name'],
+                'description': snapshot.current_question_data.get('description', ''),
+                'question_text': snapshot.current_question_data.get('question_text', ''),
+                'question_type': snapshot.current_question_data.get('question_type', 'multiple_choice'),
+                'options': snapshot.current_question_data.get('options', []),
+                'answered': overlay['question_answered'],
                 'is_correct': is_correct
             }
         
-        return {
-            'success': True,
-            'data': {
-                'teams': teams_data,
-                'game_status': data['game_status'],
-                'game_status_class': data['game_status_class'],
-                'current_phase': data['active_session'].current_phase if data['active_session'] else None,
-                'current_team_turn_name': data['current_team_turn_name'],
-                'current_minigame_name': data['active_session'].current_minigame_name if data['active_session'] else None,
-                'current_minigame_description': data['active_session'].current_minigame_description if data['active_session'] else None,
-                'dice_roll_order': dice_order_data,
-                'question_data': question_data,
-                'current_user': {
-                    'id': current_user.id,
-                    'name': current_user.name,
-                    'position': current_user.current_position,
-                    'rank': data['current_team_rank'],
-                    'fields_to_goal': data['fields_to_goal'],
-                    'teams_ahead': data['teams_ahead'],
-                    'bonus_dice_sides': current_user.bonus_dice_sides,
-                    'minigame_placement': current_user.minigame_placement,
-                    'is_current_turn': data['current_team_turn_name'] == current_user.name,
-                    'is_blocked': current_user.is_blocked,
-                    'blocked_target_number': current_user.blocked_target_number,
-                    'blocked_config': current_user.blocked_config if hasattr(current_user, 'blocked_config') else None
-                },
-                'stats': {
-                    'max_board_fields': data['max_board_fields'],
-                    'teams_count': data['teams_count']
-                },
-                # NEU: Spielverlauf für Updates
-                'game_progress': data['game_progress'],
-                # NEU: Letztes Würfelergebnis
-                'last_dice_result': data['last_dice_result'],
-                # Special field event (für Barrier-Felder)
-                'special_field_event': _get_recent_special_field_event(current_user, data['active_session']),
-                # NEU: Ausgewählte Spieler für Minispiele
-                'selected_players': data['active_session'].get_selected_players() if data['active_session'] else None,
-                'current_player_count': data['active_session'].current_player_count if data['active_session'] else None
-            }
+        data = {
+            'teams': teams_data,
+            'game_status': overlay['game_status'],
+            'game_status_class': overlay['game_status_class'],
+            'current_phase': session_data['current_phase'] if session_data else None,
+            'current_team_turn_name': snapshot.current_team_turn_name,
+            'current_minigame_name': session_data['current_minigame_name'] if session_data else None,
+            'current_minigame_description': session_data['current_minigame_description'] if session_data else None,
+            'dice_roll_order': dice_order_data,
+            'question_data': question_data,
+            'current_user': {
+                'id': current_user.id,
+                'name': current_user.name,
+                'position': current_user.current_position,
+                'rank': overlay['current_team_rank'],
+                'fields_to_goal': overlay['fields_to_goal'],
+                'teams_ahead': overlay['teams_ahead'],
+                'bonus_dice_sides': current_user.bonus_dice_sides,
+                'minigame_placement': current_user.minigame_placement,
+                'is_current_turn': snapshot.current_team_turn_name == current_user.name,
+                'is_blocked': current_user.is_blocked,
+                'blocked_target_number': current_user.blocked_target_number,
+                'blocked_config': current_user.blocked_config if hasattr(current_user, 'blocked_config') else None
+            },
+            'stats': {
+                'max_board_fields': snapshot.board_size,
+                'teams_count': len(snapshot.teams)
+            },
+            # NEU: Ausgewählte Spieler für Minispiele
+            'selected_players': session_data['selected_players'] if session_data else None,
+            'current_player_count': session_data['current_player_count'] if session_data else None
         }
         
+        # Abfragen für Spielverlauf und Events nur, wenn die Felder angefordert sind
+        if selection.wants('game_progress'):
+            data['game_progress'] = _get_team_game_progress(current_user)
+        if selection.wants('last_dice_result'):
+            data['last_dice_result'] = _get_last_dice_result(current_user, active_session)
+        if selection.wants('special_field_event'):
+            # Special field event (für Barrier-Felder)
+            data['special_field_event'] = _get_recent_special_field_event(current_user, active_session)
+        
+        return {'success': True, 'data': selection.apply(data)}
+        
     except Exception as e:
         return {'error': str(e)}, 500
 
@@ -831,7 +661,7 @@ def submit_question_answer():
         db.session.commit()
         
         # Prüfe ob alle Teams geantwortet haben
-        total_teams = Team.query.count()
+        total_teams = Team.in_game().count()
         total_responses = QuestionResponse.query.filter_by(
             game_session_id=active_session.id,
             question_id=question_id
@@ -1059,352 +889,27 @@ def team_roll_dice():
         return jsonify({"success": False, "error": "Nur Teams können würfeln."}), 403
     
     try:
-        # Importiere die notwendigen Funktionen
-        import random
-        import json
-        from app.models import GameEvent
-        
         current_app.logger.info(f"Team {current_user.name} (ID: {current_user.id}) versucht zu würfeln")
         
-        # Prüfe Spielsitzung
-        active_session = get_active_session()
-        if not active_session:
-            return jsonify({"success": False, "error": "Keine aktive Spielsitzung."}), 404
-        
-        if active_session.current_phase != 'DICE_ROLLING':
-            return jsonify({"success": False, "error": "Es ist nicht die Würfelphase."}), 403
-        
-        # EINFACHE ABER ROBUSTE LÖSUNG: Zähle aktuelle Würfel-Events in der Runde
-        if active_session.dice_roll_order:
-            try:
-                # Parse die Würfelreihenfolge
-                dice_order_team_ids = [int(tid) for tid in active_session.dice_roll_order.split(',') if tid.strip().isdigit()]
-                total_teams = len(dice_order_team_ids)
-                
-                # Zähle ALLE Würfel-Events in dieser Session
-                all_dice_events_in_session = GameEvent.query.filter_by(
-                    game_session_id=active_session.id
-                ).filter(
-                    GameEvent.event_type.in_(['team_dice_roll', 'admin_dice_roll'])
-                ).count()
-                
-                # Zähle Würfel-Events für dieses spezifische Team
-                team_dice_events = GameEvent.query.filter_by(
-                    game_session_id=active_session.id,
-                    related_team_id=current_user.id
-                ).filter(
-                    GameEvent.event_type.in_(['team_dice_roll', 'admin_dice_roll'])
-                ).count()
-                
-                # Ermittle welche "Runde" wir sind (wie oft jedes Team gewürfelt haben sollte)
-                expected_round = (all_dice_events_in_session // total_teams) + 1
-                
-                # Wenn das Team bereits in dieser Runde gewürfelt hat, verweigern
-                if team_dice_events >= expected_round:
-                    if current_user.id != active_session.current_team_turn_id:
-                        return jsonify({"success": False, "error": "Du hast bereits in dieser Runde gewürfelt."}), 403
-                        
-            except (ValueError, ZeroDivisionError) as e:
-                current_app.logger.warning(f"Fehler bei Würfel-Validierung: {e}")
-                pass  # Bei Fehlern in der Logik, erlaube Würfeln
-
-        # Prüfe ob das Team am Zug ist
-        if active_session.current_team_turn_id != current_user.id:
-            current_team = Team.query.get(active_session.current_team_turn_id) if active_session.current_team_turn_id else None
-            current_team_name = current_team.name if current_team else "Unbekannt"
-            return jsonify({"success": False, "error": f"Du bist nicht am Zug. Aktuell ist {current_team_name} am Zug."}), 403
-        
-        team = current_user
-        
-        # Würfeln
-        standard_dice_roll = random.randint(1, 6)
-        bonus_dice_roll = 0
-        
-        current_app.logger.info(f"Team {team.name} würfelt selbst - Bonus-Würfel-Seiten: {team.bonus_dice_sides}")
-        
-        if team.bonus_dice_sides and team.bonus_dice_sides > 0:
-            bonus_dice_roll = random.randint(1, team.bonus_dice_sides)
-            current_app.logger.info(f"Team {team.name} erhält Bonus-Würfel: {bonus_dice_roll} (von 1-{team.bonus_dice_sides})")
-        else:
-            current_app.logger.info(f"Team {team.name} erhält keinen Bonus-Würfel")
-        
-        total_roll = standard_dice_roll + bonus_dice_roll
-        old_position = team.current_position
-        
-        # Einfache Bewegung (ohne Sonderfelder erstmal)
-        max_field_index = current_app.config.get('MAX_BOARD_FIELDS', 72)
-        new_position = min(team.current_position + total_roll, max_field_index)
-        team.current_position = new_position
-        
-        # Sonderfeld-Behandlung (falls Module verfügbar)
-        special_field_result = None
-        barrier_check_result = None
-        
+        # Zug prüfen → würfeln → Feld → Zug weitergeben → Events, ein Commit
+        from app.services.roll_pipeline import RollRejected, execute_roll
         try:
-            from app.game_logic.special_fields import handle_special_field_action, check_barrier_release
-            
-            # SONDERFELD: Prüfe Sperren-Status
-            if team.is_blocked:
-                # Team ist blockiert - prüfe ob es freikommt
-                barrier_check_result = check_barrier_release(team, standard_dice_roll, active_session, bonus_dice_roll)
-                
-                if barrier_check_result['released']:
-                    # Team ist befreit und kann sich normal bewegen
-                    team.current_position = new_position
-                else:
-                    # Team bleibt blockiert, keine Bewegung
-                    new_position = old_position
-                    team.current_position = old_position
-            
-            # Prüfe Sonderfeld-Aktion nach Bewegung (nur wenn nicht blockiert)
-            if not team.is_blocked or (barrier_check_result and barrier_check_result.get('released', False)):
-                all_teams = Team.query.all()
-                dice_info = {
-                    "old_position": old_position,
-                    "new_position": new_position,
-                    "dice_roll": standard_dice_roll,
-                    "bonus_roll": bonus_dice_roll,
-                    "total_roll": total_roll
-                }
-                special_field_result = handle_special_field_action(team, all_teams, active_session, dice_info)
-        except ImportError as e:
-            current_app.logger.warning(f"Sonderfeld-Module nicht verfügbar: {e}")
-        except Exception as e:
-            current_app.logger.error(f"Fehler bei Sonderfeld-Behandlung: {e}")
-            # Fehler bei Sonderfeldern sollen das Würfeln nicht stoppen
-        
-        # Event für den Würfelwurf erstellen
-        event_description = f"Team {team.name} würfelte selbst: {standard_dice_roll}"
-        if bonus_dice_roll > 0:
-            event_description += f" (Bonus: {bonus_dice_roll}, Gesamt: {total_roll})"
-        
-        # ZIELFELD: Prüfe Gewinn-Bedingung BEFORE using it
-        # WICHTIG: Team muss BEREITS auf Position 72 gewesen sein (old_position), nicht erst durch den Wurf dorthin gekommen
-        victory_triggered = False
-        if old_position == 72 and total_roll >= 6:
-            # Team war bereits auf Zielfeld und hat 6+ gewürfelt - hat gewonnen!
-            victory_triggered = True
-            current_app.logger.info(f"🏆 VICTORY: Team {team.name} war auf Position 72 und würfelte {total_roll} (>= 6) - SIEG!")
-        elif old_position == 72 and total_roll < 6:
-            # Team war auf Zielfeld, hat aber weniger als 6 gewürfelt
-            current_app.logger.info(f"🎯 FINAL FIELD: Team {team.name} war auf Position 72, würfelte {total_roll} - braucht mindestens 6 zum Gewinnen")
-        elif new_position == 72:
-            # Team ist gerade erst auf Position 72 angekommen - muss nächste Runde 6+ würfeln
-            current_app.logger.info(f"🎯 REACHED FINAL FIELD: Team {team.name} erreichte Position 72 - muss nächste Runde mindestens 6 würfeln")
-
-        if team.is_blocked and (not barrier_check_result or not barrier_check_result.get('released', False)):
-            event_description += f" - BLOCKIERT: Konnte sich nicht befreien."
-        else:
-            event_description += f" und bewegte sich von Feld {old_position} zu Feld {new_position}."
-            
-        # Victory handling - update event description
-        if victory_triggered:
-            event_description += f" 🏆 SIEG! Team war auf Zielfeld und würfelte {total_roll}!"
-        elif old_position == 72 and total_roll < 6:
-            event_description += f" 🎯 War auf Zielfeld - braucht mindestens 6 zum Gewinnen (gewürfelt: {total_roll})"
-        elif new_position == 72:
-            event_description += f" 🎯 Erreichte Zielfeld - braucht nächste Runde mindestens 6 zum Gewinnen"
-
-        # Prepare dice event data
-        dice_event_data = {
-            "standard_roll": standard_dice_roll,
-            "bonus_roll": bonus_dice_roll,
-            "total_roll": total_roll,
-            "old_position": old_position,
-            "new_position": new_position,
-            "rolled_by": "team",
-            "was_blocked": team.is_blocked and (not barrier_check_result or not barrier_check_result.get('released', False)),
-            "barrier_released": barrier_check_result.get('released', False) if barrier_check_result else False,
-            "victory_triggered": victory_triggered,
-            "needs_final_roll": old_position == 72 and total_roll < 6
-        }
-        
-        # Add barrier config if team was blocked
-        if team.is_blocked:
-            barrier_config = None
-            display_text = 'Höhere Zahl benötigt'
-            
-            # Try to get config from barrier_check_result first
-            if barrier_check_result and barrier_check_result.get('barrier_config'):
-                barrier_config = barrier_check_result.get('barrier_config', {})
-                display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from check result: {barrier_config}")
-            else:
-                # Fallback: Get config from team's stored blocked_config
-                try:
-                    if hasattr(team, 'blocked_config') and team.blocked_config:
-                        import json
-                        barrier_config = json.loads(team.blocked_config)
-                        display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                        current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from team storage: {barrier_config}")
-                    else:
-                        # Fallback 2: Get current barrier field configuration
-                        try:
-                            from app.models import FieldConfiguration
-                            barrier_field_config = FieldConfiguration.get_config_for_field('barrier')
-                            if barrier_field_config and barrier_field_config.is_enabled:
-                                config_data = barrier_field_config.config_dict
-                                target_numbers = config_data.get('target_numbers', [4, 5, 6])
-                                
-                                # Parse the target numbers using the same logic as handle_barrier_field
-                                from app.game_logic.special_fields import _parse_barrier_config
-                                barrier_config = _parse_barrier_config(target_numbers)
-                                display_text = barrier_config.get('display_text', 'Höhere Zahl benötigt')
-                                current_app.logger.info(f"[BARRIER DEBUG] Got barrier config from FieldConfiguration: {barrier_config}")
-                            else:
-                                raise Exception("No barrier field configuration found")
-                        except Exception as fe:
-                            current_app.logger.warning(f"[BARRIER DEBUG] Could not load barrier field config: {fe}")
-                            # Ultimate fallback: create basic config from blocked_target_number
-                            target_number = team.blocked_target_number or 4
-                            barrier_config = {
-                                'mode': 'minimum', 
-                                'min_number': target_number,
-                                'display_text': f'Würfle mindestens eine {target_number}!'
-                            }
-                            display_text = barrier_config['display_text']
-                            current_app.logger.info(f"[BARRIER DEBUG] Created ultimate fallback barrier config: {barrier_config}")
-                except Exception as e:
-                    current_app.logger.error(f"[BARRIER DEBUG] Error getting barrier config: {e}")
-                    barrier_config = {'mode': 'minimum', 'min_number': 4, 'display_text': 'Würfle mindestens eine 4!'}
-                    display_text = barrier_config['display_text']
-            
-            dice_event_data["barrier_config"] = barrier_config or {}
-            dice_event_data["barrier_display_text"] = display_text
-            current_app.logger.info(f"[BARRIER DEBUG] Final barrier data - config: {barrier_config}, text: {display_text}")
-        else:
-            current_app.logger.info(f"[BARRIER DEBUG] Team {team.name} is not blocked")
-        
-        dice_event = GameEvent(
-            game_session_id=active_session.id,
-            event_type="team_dice_roll",
-            description=event_description,
-            related_team_id=team.id,
-            data_json=json.dumps(dice_event_data)
-        )
-        db.session.add(dice_event)
-        
-        # ZIELFELD: Victory automatisch auslösen wenn gewonnen
-        if victory_triggered:
-            try:
-                # Speichere Victory Event
-                victory_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="game_victory",
-                    description=f"Team {team.name} hat das Spiel gewonnen!",
-                    related_team_id=team.id,
-                    data_json=json.dumps({
-                        "winning_team_id": team.id,
-                        "winning_team_name": team.name,
-                        "victory_timestamp": datetime.utcnow().isoformat(),
-                        "final_position": team.current_position,
-                        "final_dice_roll": total_roll
-                    })
-                )
-                db.session.add(victory_event)
-                
-                # Setze Spiel auf beendet
-                active_session.current_phase = 'GAME_FINISHED'
-                
-                current_app.logger.info(f"🏆 Victory automatisch ausgelöst für Team {team.name}")
-                
-            except Exception as ve:
-                current_app.logger.error(f"Fehler beim Victory-Handling: {ve}")
-                db.session.rollback()
-                return jsonify({"success": False, "error": f"Victory-Fehler: {str(ve)}"}), 500
-
-        # Setze Bonuswürfel zurück (wird nach jedem Wurf verbraucht)
-        team.bonus_dice_sides = 0
-        
-        # FIX: Verbesserte Logik für Rundenerkennung - prüfe wieviele Teams bereits gewürfelt haben
-        next_team = None
-        round_complete = False
-        
-        if active_session.dice_roll_order:
-            try:
-                team_ids = [int(tid) for tid in active_session.dice_roll_order.split(',') if tid.strip().isdigit()]
-                total_teams = len(team_ids)
-                
-                # Zähle ALLE Würfel-Events in dieser Session
-                all_dice_events_in_session = GameEvent.query.filter_by(
-                    game_session_id=active_session.id
-                ).filter(
-                    GameEvent.event_type.in_(['team_dice_roll', 'admin_dice_roll'])
-                ).count()
-                
-                # Nach diesem Wurf haben wir einen weiteren Event
-                total_events_after_this_roll = all_dice_events_in_session + 1
-                
-                current_app.logger.info(f"Würfel-Events: {total_events_after_this_roll}, Teams: {total_teams}")
-                
-                # FIX: Ermittle das nächste Team in der Reihenfolge  
-                current_index = team_ids.index(team.id)
-                next_index = (current_index + 1) % len(team_ids)
-                next_team = Team.query.get(team_ids[next_index])
-                
-                # FIX: Runde ist beendet wenn wir beim letzten Team sind UND es gerade gewürfelt hat
-                # Das bedeutet: wir sind bei Team an letzter Position in dice_roll_order
-                is_last_team_in_order = current_index == (total_teams - 1)
-                
-                if is_last_team_in_order:
-                    # Letztes Team hat gewürfelt - Runde beenden
-                    round_complete = True
-                    current_app.logger.info(f"Letztes Team ({team.name}) hat gewürfelt - Runde beendet")
-                else:
-                    current_app.logger.info(f"Team {team.name} (Position {current_index + 1}/{total_teams}) hat gewürfelt. Nächstes Team: {next_team.name if next_team else 'None'}")
-                    
-            except (ValueError, IndexError) as e:
-                current_app.logger.warning(f"Fehler beim Ermitteln des nächsten Teams: {e}. Reihenfolge: {active_session.dice_roll_order}")
-                # Fallback: Runde beenden
-                round_complete = True
-        
-        # FIX: Verwende round_complete statt nächstes Team Vergleich
-        if round_complete:
-            # Prüfe ob ein Feld-Minigame gestartet wurde (Phase geändert von special_field_action)
-            if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
-                # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame")
-                active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
-            else:
-                # Kein Feld-Minigame - normale Rundenvervollständigung
-                active_session.current_phase = 'ROUND_OVER'
-                active_session.current_team_turn_id = None
-                
-                # WICHTIG: Erstelle Event für Rundenende
-                round_end_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="dice_round_ended",
-                    description="Würfelrunde beendet - alle Teams haben gewürfelt"
-                )
-                db.session.add(round_end_event)
-                
-                current_app.logger.info(f"Alle Teams haben gewürfelt. Runde beendet.")
-        elif next_team:
-            # Runde geht weiter - nächstes Team ist dran
-            active_session.current_team_turn_id = next_team.id
-            current_app.logger.info(f"Nächstes Team am Zug: {next_team.name}")
-        else:
-            # Fallback: Keine Teams gefunden oder Fehler - prüfe ob Feld-Minigame läuft
-            if active_session.current_phase == 'FIELD_MINIGAME_SELECTION_PENDING':
-                # Feld-Minigame wurde ausgelöst - nicht ROUND_OVER setzen
-                current_app.logger.info(f"Team {team.name} landete auf Minigame-Feld - Runde wartet auf Feld-Minigame (Fallback)")
-                active_session.current_team_turn_id = None  # Kein nächstes Team, aber Phase bleibt
-            else:
-                # Kein Feld-Minigame - beende Runde
-                active_session.current_phase = 'ROUND_OVER'
-                active_session.current_team_turn_id = None
-                
-                # WICHTIG: Erstelle Event für Rundenende
-                round_end_event = GameEvent(
-                    game_session_id=active_session.id,
-                    event_type="dice_round_ended",
-                    description="Würfelrunde beendet - keine weiteren Teams"
-                )
-                db.session.add(round_end_event)
-                
-                current_app.logger.info(f"Keine weiteren Teams. Runde beendet.")
-        
-        db.session.commit()
+            outcome = execute_roll('team', team_id=current_user.id)
+        except RollRejected as rejected:
+            return jsonify({"success": False, "error": rejected.message}), rejected.status
+        
+        team = outcome["team"]
+        next_team = outcome["next_team"]
+        active_session = outcome["session"]
+        roll_result = outcome["roll"]
+        standard_dice_roll = roll_result["standard_roll"]
+        bonus_dice_roll = roll_result["bonus_roll"]
+        total_roll = roll_result["total_roll"]
+        old_position = roll_result["old_position"]
+        new_position = roll_result["new_position"]
+        victory_triggered = roll_result["victory_triggered"]
+        barrier_check_result = roll_result["barrier_check_result"]
+        special_field_result = roll_result["special_field_result"]
         
         # Bereite Response vor
         response_data = {
@@ -1417,10 +922,10 @@ def team_roll_dice():
             "team_name": team.name,
             "next_team_name": next_team.name if next_team else None,
             "phase": active_session.current_phase,
-            "was_blocked": team.is_blocked and (not barrier_check_result or not barrier_check_result.get('released', False)),
-            "barrier_released": barrier_check_result.get('released', False) if barrier_check_result else False,
+            "was_blocked": roll_result["was_blocked"],
+            "barrier_released": roll_result["barrier_released"],
             "victory_triggered": victory_triggered,
-            "needs_final_roll": old_position == 72 and total_roll < 6
+            "needs_final_roll": roll_result["needs_final_roll"]
         }
         
         # Füge Barrier-Check-Informationen hinzu
@@ -1446,6 +951,7 @@ def team_roll_dice():
 
 @teams_bp.route('/api/active-fields')
 @login_required
+@cached_response(FIELD_CONFIG, private=True)
 def get_active_fields():
     """Gibt eine Übersicht aller aktiven Spezialfelder zurück"""
     try:
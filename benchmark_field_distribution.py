@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Feld-Verteilung über verschiedene Brettgrößen.
+
+Legt eine temporäre SQLite-Datenbank mit der Standard-Feldkonfiguration an
+und misst je Brettgröße (`MAX_BOARD_FIELDS` + 1 Felder):
+
+- reine Platzierung (`field_placement.place_fields` mit vorgeladenen Specs),
+- `calculate_smart_field_distribution` inkl. Laden der Konfigurationen,
+- `get_field_preview_data` (Admin-Vorschau / Board-Bootstrap),
+- SQL-Anweisungen pro Verteilung und Vorschau,
+- Konflikte und Umverteilungen der Platzierung.
+
+Aufruf:
+    python benchmark_field_distribution.py [--sizes 73,200,500,1000,5000] [--repeat 5] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+
+
+def _timed(function, repeat):
+    """Bester Lauf aus `repeat` Wiederholungen (Sekunden) und das letzte Ergebnis."""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='73,200,500,1000,5000',
+                        help='Brettgrößen (Anzahl Felder inkl. Start und Ziel), kommagetrennt')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+
+    from sqlalchemy import event
+    from app import create_app, db
+    from app.admin.field_config import get_field_preview_data
+    from app.game_logic.field_placement import place_fields
+    from app.game_logic.special_fields import (calculate_smart_field_distribution,
+                                               clear_field_distribution_cache, get_field_specs)
+    from app.models import FieldConfiguration
+
+    with tempfile.TemporaryDirectory() as workdir:
+        class BenchmarkConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'benchmark.db')
+
+        app = create_app(BenchmarkConfig)
+        with app.app_context():
+            db.create_all()
+            FieldConfiguration.initialize_default_configs()
+            db.session.commit()
+
+            counter = {'statements': 0}
+
+            @event.listens_for(db.engine, 'before_cursor_execute')
+            def _count_statement(*_):
+                counter['statements'] += 1
+
+            specs = get_field_specs()
+            print(f"{len(specs)} aktivierte Feld-Typen, bester von {args.repeat} Läufen\n")
+            print(f"{'Felder':>7}  {'Platzierung':>12}  {'Verteilung':>12}  {'Vorschau':>12}  "
+                  f"{'SQL Vert.':>9}  {'SQL Vorsch.':>11}  {'Konflikte':>9}  {'Umverteilt':>10}")
+
+            for size in sizes:
+                app.config['MAX_BOARD_FIELDS'] = size - 1
+                clear_field_distribution_cache()
+
+                stats = {}
+                placement_time, _ = _timed(
+                    lambda: place_fields(specs, size, random.Random(args.seed), stats), args.repeat)
+
+                counter['statements'] = 0
+                distribution_time, distribution = _timed(
+                    lambda: calculate_smart_field_distribution(size, random.Random(args.seed)), args.repeat)
+                distribution_statements = counter['statements'] / args.repeat
+
+                def preview():
+                    clear_field_distribution_cache()
+                    return get_field_preview_data()
+
+                counter['statements'] = 0
+                preview_time, preview_data = _timed(preview, args.repeat)
+                preview_statements = counter['statements'] / args.repeat
+
+                assert len(distribution) == size and preview_data['total_fields'] == size
+                print(f"{size:>7}  {placement_time * 1000:>9.2f} ms  {distribution_time * 1000:>9.2f} ms  "
+                      f"{preview_time * 1000:>9.2f} ms  {distribution_statements:>9.1f}  "
+                      f"{preview_statements:>11.1f}  {stats['total_conflicts']:>9}  {stats['redistributed']:>10}")
+
+
+if __name__ == '__main__':
+    main()
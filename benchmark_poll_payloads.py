@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Payload-Größe der Polling-Endpunkte mit und ohne Feldauswahl.
+
+Legt in einer temporären SQLite-Datenbank 20 Teams mit Charakter,
+vollständigen Charakter-Anpassungen und Würfel-Historie an und misst die
+Antwortgröße (roh und gzip) von
+
+    /teams/api/dashboard-status   (als eingeloggtes Team)
+    /api/board-status
+    /api/v1/status/board
+
+jeweils vollständig, mit `fields=` (wie es die Clients nutzen) und mit
+`encoding=compact`.
+
+Aufruf:
+    python benchmark_poll_payloads.py [--teams 20] [--moves 15]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+
+# Schlanke Abfrage des Team-Dashboards (siehe app/static/js/pages/team_dashboard.js)
+DASHBOARD_SPARSE = '-teams.character,-teams.character_customization,-game_progress'
+
+VARIANTS = {
+    '/teams/api/dashboard-status': [
+        ('voll', {}),
+        ('fields (Client)', {'fields': DASHBOARD_SPARSE}),
+        ('fields + compact', {'fields': DASHBOARD_SPARSE, 'encoding': 'compact'}),
+    ],
+    '/api/board-status': [
+        ('voll', {}),
+        ('fields', {'fields': 'teams.id,teams.position,teams.is_blocked,game_session,last_dice_result'}),
+        ('compact', {'encoding': 'compact'}),
+    ],
+    '/api/v1/status/board': [
+        ('voll', {}),
+        ('fields', {'fields': 'teams.id,teams.position,session.phase,session.current_team_turn_id,last_dice'}),
+        ('compact', {'encoding': 'compact'}),
+    ],
+}
+
+
+def _seed(db, team_count, moves):
+    from app.models import Character, GameEvent, GameSession, Team
+
+    session = GameSession(is_active=True, current_phase='DICE_ROLLING')
+    db.session.add(session)
+    db.session.flush()
+
+    rng = random.Random(42)
+    teams = []
+    for index in range(team_count):
+        character = Character(name=f'Charakter {index}', js_file=f'js/characters/c{index}.js',
+                              image_file=f'images/characters/c{index}.png', color='#4169E1')
+        team = Team(name=f'Team {index + 1}', character=character, current_position=rng.randint(0, 60))
+        # Alle Standardwerte explizit speichern, wie nach dem Bearbeiten im Charakter-Editor
+        team.set_character_customization(team.get_character_customization())
+        db.session.add_all([character, team])
+        teams.append(team)
+    db.session.flush()
+
+    session.current_team_turn_id = teams[0].id
+    session.dice_roll_order = ','.join(str(team.id) for team in teams)
+    for team in teams:
+        position = 0
+        for _ in range(moves):
+            roll = rng.randint(1, 6)
+            db.session.add(GameEvent(
+                game_session_id=session.id, event_type='dice_roll', related_team_id=team.id,
+                data_json=json.dumps({'standard_roll': roll, 'bonus_roll': 0, 'total_roll': roll,
+                                      'old_position': position, 'new_position': position + roll}),
+            ))
+            position += roll
+    db.session.commit()
+    return teams[0].id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--moves', type=int, default=15)
+    args = parser.parse_args()
+
+    from app import create_app, db
+
+    with tempfile.TemporaryDirectory() as workdir:
+        class BenchmarkConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'benchmark.db')
+            WTF_CSRF_ENABLED = False
+
+        app = create_app(BenchmarkConfig)
+        with app.app_context():
+            db.create_all()
+            team_id = _seed(db, args.teams, args.moves)
+
+        client = app.test_client()
+        with client.session_transaction() as http_session:
+            http_session['_user_id'] = f'team_{team_id}'
+            http_session['_fresh'] = True
+
+        print(f"{args.teams} Teams, {args.moves} Züge pro Team\n")
+        print(f"{'Endpunkt / Variante':<52} {'Bytes':>9} {'gzip':>8} {'vs. voll':>9}")
+        for path, variants in VARIANTS.items():
+            baseline = None
+            for label, params in variants:
+                response = client.get(path, query_string=params)
+                body = response.get_data()
+                if response.status_code != 200:
+                    print(f"{path} [{label}]: HTTP {response.status_code}")
+                    continue
+                raw = len(body)
+                baseline = baseline or raw
+                print(f"{path + ' [' + label + ']':<52} {raw:>9} {len(gzip.compress(body)):>8} "
+                      f"{raw / baseline:>8.0%}")
+            print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Profilbild-Upload als Base64-JSON vs. binär (multipart/Roh-Body).
+
+Vergleicht für ein ca. 5 MB großes Foto die Verarbeitung, wie sie die beiden
+Upload-Routen durchführen (ohne HTTP und Datenbank):
+
+    base64  Request-Body (JSON) -> json.loads -> decode_base64_image -> save_profile_image
+    binary  Request-Body (Stream) -> spool_upload -> process_image_file
+
+Jede Variante läuft in einem eigenen Prozess, damit der Spitzen-Speicher
+(ru_maxrss) nicht von der anderen beeinflusst wird. Zusätzlich wird mit
+tracemalloc der Python-seitige Spitzenwert gemessen (Base64-String, JSON,
+dekodierte Bytes); Pillows Pixelpuffer erfasst nur ru_maxrss.
+
+Aufruf:
+    python benchmark_profile_upload.py [--size-mb 5] [--runs 5]
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_photo(path, size_mb):
+    """Erzeugt ein verrauschtes JPEG (schlecht komprimierbar) von ungefähr `size_mb` MB."""
+    from PIL import Image
+
+    target = size_mb * 1024 * 1024
+    width = 1600
+    while True:
+        height = width * 3 // 4
+        image = Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=92)
+        if buffer.tell() >= target or width >= 6000:
+            break
+        width += 400
+    with open(path, 'wb') as f:
+        f.write(buffer.getvalue())
+
+
+def _static_app(static_folder):
+    from flask import Flask
+    return Flask(__name__, static_folder=static_folder)
+
+
+def run_variant(mode, photo_path, runs):
+    from app.services.profile_images import (decode_base64_image, process_image_file,
+                                             save_profile_image, spool_upload)
+
+    with open(photo_path, 'rb') as f:
+        photo = f.read()
+    # So kommt der Body beim Server an
+    if mode == 'base64':
+        body = json.dumps({
+            'player_name': 'Benchmark',
+            'image_data': 'data:image/jpeg;base64,' + base64.b64encode(photo).decode('ascii'),
+        }).encode('utf-8')
+    else:
+        body = photo
+    del photo
+
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    latencies = []
+    py_peak = 0
+
+    with tempfile.TemporaryDirectory() as static_folder, _static_app(static_folder).app_context():
+        for _ in range(runs):
+            tracemalloc.start()
+            started = time.perf_counter()
+            if mode == 'base64':
+                data = json.loads(body)
+                save_profile_image(decode_base64_image(data['image_data']))
+                del data
+            else:
+                process_image_file(spool_upload(io.BytesIO(body)))
+            latencies.append(time.perf_counter() - started)
+            py_peak = max(py_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            # Dateien entfernen, sonst überspringt save_profile_image das Schreiben
+            for dirpath, _, filenames in os.walk(static_folder):
+                for filename in filenames:
+                    os.remove(os.path.join(dirpath, filename))
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_rss //= 1024
+        baseline_rss //= 1024
+    latencies.sort()
+    print(json.dumps({
+        'mode': mode,
+        'body_bytes': len(body),
+        'median_ms': latencies[len(latencies) // 2] * 1000,
+        'min_ms': latencies[0] * 1000,
+        'python_peak_kb': py_peak // 1024,
+        'rss_growth_kb': peak_rss - baseline_rss,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=float, default=5.0)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--variant', choices=('base64', 'binary'), help=argparse.SUPPRESS)
+    parser.add_argument('--photo', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.photo, args.runs)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        photo_path = os.path.join(workdir, 'photo.jpg')
+        make_photo(photo_path, args.size_mb)
+        print(f"Testfoto: {os.path.getsize(photo_path) / 1024 / 1024:.1f} MB, {args.runs} Durchläufe\n")
+
+        results = []
+        for variant in ('base64', 'binary'):
+            output = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, '--photo', photo_path, '--runs', str(args.runs)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'Variante':<8} {'Body':>10} {'Median':>10} {'Min':>10} {'Py-Peak':>10} {'RSS +':>10}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['body_bytes'] / 1024:>8.0f}KB {r['median_ms']:>8.1f}ms {r['min_ms']:>8.1f}ms "
+              f"{r['python_peak_kb']:>8}KB {r['rss_growth_kb']:>8}KB")
+
+
+if __name__ == '__main__':
+    main()
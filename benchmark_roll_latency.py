@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Latenz eines Würfelwurfs vom POST bis zum Event im Stream.
+
+Legt in einer temporären SQLite-Datenbank eine Sitzung in der Würfelphase
+mit N Teams und Standard-Feldkonfiguration an, öffnet den SSE-Stream
+`/api/v1/stream` in einem eigenen Thread und würfelt als Admin über
+`/admin/admin_roll_dice` (bzw. `--route team` als Team am Zug, `--route round`
+für den Runden-Wurf aller restlichen Teams über `/admin/admin_roll_round`).
+Gemessen wird je Request
+
+- POST-Latenz (Antwort des Wurfs bzw. der ganzen Runde),
+- POST bis Event sichtbar im Stream (enthält das Poll-Intervall des Streams),
+- SQL-Anweisungen und Commits (nur im Request-Thread gezählt).
+
+Nach jeder Runde (oder Feld-Minigame/Sieg) wird die Sitzung ungemessen
+wieder in die Würfelphase gesetzt.
+
+Aufruf:
+    python benchmark_roll_latency.py [--teams 6] [--rolls 200] [--poll 0.2] [--route admin|team|round]
+"""
+
+import argparse
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+
+ROUTES = {
+    'admin': ('/admin/admin_roll_dice', 'admin_dice_roll'),
+    'team': ('/teams/api/team_roll_dice', 'team_dice_roll'),
+    'round': ('/admin/admin_roll_round', 'round_roll_finished'),
+}
+
+
+def _seed(db, team_count):
+    from app.models import Admin, FieldConfiguration, GameSession, Team
+
+    FieldConfiguration.initialize_default_configs()
+    admin = Admin(username='benchmark')
+    admin.set_password('benchmark')
+    teams = [Team(name=f'Team {index + 1}', current_position=0) for index in range(team_count)]
+    db.session.add_all([admin] + teams)
+    db.session.flush()
+
+    session = GameSession(is_active=True, current_phase='DICE_ROLLING',
+                          dice_roll_order=','.join(str(team.id) for team in teams),
+                          current_team_turn_id=teams[0].id)
+    db.session.add(session)
+    db.session.commit()
+    return admin.id
+
+
+def _reset_round(db):
+    """Neue Würfelrunde; nach einem Sieg starten alle Teams wieder bei 0."""
+    from app.models import GameSession, Team
+
+    session = GameSession.query.filter_by(is_active=True).first()
+    if session.current_phase == 'DICE_ROLLING' and session.current_team_turn_id:
+        return session.current_team_turn_id
+    if session.current_phase == 'GAME_FINISHED':
+        for team in Team.query.all():
+            team.current_position = 0
+            team.is_blocked = False
+    order = [int(team_id) for team_id in session.dice_roll_order.split(',')]
+    session.current_phase = 'DICE_ROLLING'
+    session.current_team_turn_id = order[0]
+    session.turn_index = 0
+    db.session.commit()
+    return order[0]
+
+
+def _read_stream(app, poll, event_type, arrivals, ready):
+    """Liest den SSE-Stream und legt (Event-ID, Ankunftszeit) in `arrivals` ab."""
+    client = app.test_client()
+    response = client.get('/api/v1/stream', query_string={'poll': poll, 'event_types': event_type})
+    buffer = ''
+    for chunk in response.response:
+        buffer += chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+        while '\n\n' in buffer:
+            message, buffer = buffer.split('\n\n', 1)
+            if 'stream_connected' in message:
+                ready.set()
+            elif f'event: {event_type}' in message:
+                arrivals.put(time.perf_counter())
+
+
+def _percentiles(values):
+    values = sorted(values)
+    if not values:
+        return '-'
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+    return (f"Ø {sum(values) / len(values) * 1000:7.2f} ms  p50 {pick(0.5) * 1000:7.2f} ms  "
+            f"p95 {pick(0.95) * 1000:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--teams', type=int, default=6)
+    parser.add_argument('--rolls', type=int, default=200, help='Anzahl Requests (bei --route round: Runden)')
+    parser.add_argument('--poll', type=float, default=0.2, help='Poll-Intervall des Streams (0.2-5.0 s)')
+    parser.add_argument('--route', choices=sorted(ROUTES), default='admin')
+    args = parser.parse_args()
+
+    from sqlalchemy import event
+    from app import create_app, db
+
+    path, event_type = ROUTES[args.route]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        class BenchmarkConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'benchmark.db')
+            WTF_CSRF_ENABLED = False
+
+        app = create_app(BenchmarkConfig)
+        with app.app_context():
+            db.create_all()
+            admin_id = _seed(db, args.teams)
+            engine = db.engine
+
+        counters = {'statements': 0, 'commits': 0}
+        request_thread = threading.get_ident()
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def _count_statement(*_):
+            if threading.get_ident() == request_thread:
+                counters['statements'] += 1
+
+        @event.listens_for(engine, 'commit')
+        def _count_commit(*_):
+            if threading.get_ident() == request_thread:
+                counters['commits'] += 1
+
+        arrivals, ready = queue.Queue(), threading.Event()
+        threading.Thread(target=_read_stream, args=(app, args.poll, event_type, arrivals, ready),
+                         daemon=True).start()
+        if not ready.wait(10):
+            print("❌ Stream hat sich nicht verbunden", file=sys.stderr)
+            sys.exit(1)
+
+        client = app.test_client()
+        post_latency, visible_latency, statements, commits = [], [], [], []
+        for _ in range(args.rolls):
+            with app.app_context():
+                team_id = _reset_round(db)
+                db.session.remove()
+            with client.session_transaction() as http_session:
+                http_session['_user_id'] = f'team_{team_id}' if args.route == 'team' else f'admin_{admin_id}'
+                http_session['_fresh'] = True
+
+            counters['statements'] = counters['commits'] = 0
+            started = time.perf_counter()
+            response = client.post(path, json={})
+            answered = time.perf_counter()
+            if response.status_code != 200:
+                print(f"❌ HTTP {response.status_code}: {response.get_json()}", file=sys.stderr)
+                sys.exit(1)
+            statements.append(counters['statements'])
+            commits.append(counters['commits'])
+            post_latency.append(answered - started)
+            try:
+                visible_latency.append(arrivals.get(timeout=max(5.0, args.poll * 10)) - started)
+            except queue.Empty:
+                print("⚠️  Event nicht im Stream angekommen", file=sys.stderr)
+
+        print(f"{args.rolls} Requests über {path}, {args.teams} Teams, Stream-Poll {args.poll:.2f}s\n")
+        print(f"  POST-Antwort:                {_percentiles(post_latency)}")
+        print(f"  POST → Event im Stream:      {_percentiles(visible_latency)}")
+        print(f"  SQL-Anweisungen pro Request: Ø {sum(statements) / len(statements):.1f} "
+              f"(min {min(statements)}, max {max(statements)})")
+        print(f"  Commits pro Request:         Ø {sum(commits) / len(commits):.2f} (max {max(commits)})")
+
+
+if __name__ == '__main__':
+    main()
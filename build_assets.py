@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Build-Schritt für die Seiten-Bundles (siehe app/services/asset_manifest.py).
+
+Befehle:
+    python build_assets.py extract game_board.html game_board
+        Verschiebt Inline-<script>/<style>-Blöcke ohne Jinja-Syntax aus dem
+        Template nach static/js/pages/<name>.js bzw. static/css/pages/<name>.css
+        und ersetzt sie durch asset_url()-Einbindungen.
+
+    python build_assets.py build
+        Minifiziert alle Quellen unter static/js/pages und static/css/pages,
+        schreibt inhalts-gehashte Kopien nach static/dist/ und das Manifest
+        static/dist/manifest.json. Veraltete Bundles werden entfernt.
+        Anschließend werden alle JS/CSS-Dateien unter static/ vorkomprimiert
+        (.gz, mit `brotli` zusätzlich .br).
+
+Für die Minifizierung werden `rjsmin`/`rcssmin` verwendet, falls installiert.
+Ohne diese Pakete werden CSS-Kommentare und überflüssige Leerzeichen entfernt
+und JavaScript unverändert übernommen (nur gehasht).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+STATIC_DIR = os.path.join(PROJECT_ROOT, 'app', 'static')
+TEMPLATE_DIR = os.path.join(PROJECT_ROOT, 'app', 'templates')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+SOURCE_DIRS = ('js/pages', 'css/pages')
+
+# Kleine Blöcke bleiben inline (eigener Request lohnt sich nicht)
+MIN_EXTRACT_SIZE = 2048
+
+_BLOCK_RE = re.compile(r'<(script|style)>(.*?)</\1>', re.S)
+_JINJA_RE = re.compile(r'\{\{|\{%|\{#')
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PRECOMPRESS_EXTENSIONS = ('.js', '.css', '.json', '.svg')
+# Ordner mit Nutzerdaten/Inhalten werden nicht angefasst
+PRECOMPRESS_SKIP_DIRS = ('minigame_folders', 'saved_rounds', 'team_images', 'field_minigames')
+PRECOMPRESS_MIN_SIZE = 1024
+
+
+def minify_css(source):
+    if rcssmin is not None:
+        return rcssmin.cssmin(source)
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line) + '\n'
+
+
+def minify_js(source):
+    if rjsmin is not None:
+        return rjsmin.jsmin(source)
+    return source
+
+
+def extract(template_name, bundle_name):
+    """Lagert große, Jinja-freie Inline-Blöcke eines Templates aus."""
+    template_path = os.path.join(TEMPLATE_DIR, template_name)
+    with open(template_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    counters = {'script': 0, 'style': 0}
+
+    def replace(match):
+        kind, body = match.group(1), match.group(2)
+        if len(body) < MIN_EXTRACT_SIZE or _JINJA_RE.search(body):
+            return match.group(0)
+
+        counters[kind] += 1
+        suffix = '' if counters[kind] == 1 else f'-{counters[kind]}'
+        if kind == 'script':
+            logical = f'js/pages/{bundle_name}{suffix}.js'
+            tag = f'<script src="{{{{ asset_url(\'{logical}\') }}}}"></script>'
+        else:
+            logical = f'css/pages/{bundle_name}{suffix}.css'
+            tag = f'<link rel="stylesheet" href="{{{{ asset_url(\'{logical}\') }}}}">'
+
+        target = os.path.join(STATIC_DIR, logical)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as out:
+            out.write(body.strip('\n') + '\n')
+        print(f"  {template_name}: {kind} ({len(body)} Zeichen) -> static/{logical}")
+        return tag
+
+    content = _BLOCK_RE.sub(replace, content)
+    with open(template_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def _write_if_smaller(path, data, original_size):
+    if len(data) < original_size:
+        with open(path, 'wb') as out:
+            out.write(data)
+        return True
+    if os.path.exists(path):
+        os.remove(path)
+    return False
+
+
+def precompress():
+    """Legt .gz/.br-Varianten neben statischen Textdateien an."""
+    count = 0
+    for dirpath, dirnames, filenames in os.walk(STATIC_DIR):
+        if os.path.relpath(dirpath, STATIC_DIR).split(os.sep)[0] in PRECOMPRESS_SKIP_DIRS:
+            dirnames[:] = []
+            continue
+        for filename in filenames:
+            if not filename.endswith(PRECOMPRESS_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) < PRECOMPRESS_MIN_SIZE:
+                continue
+
+            if _write_if_smaller(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0), len(data)):
+                count += 1
+            if brotli is not None:
+                _write_if_smaller(path + '.br', brotli.compress(data, quality=11), len(data))
+    print(f"{count} Dateien vorkomprimiert (gzip{' + brotli' if brotli is not None else ''}).")
+
+
+def build():
+    """Erzeugt gehashte Bundles und das Manifest."""
+    assets = {}
+    written = set()
+
+    for source_dir in SOURCE_DIRS:
+        root = os.path.join(STATIC_DIR, source_dir)
+        if not os.path.isdir(root):
+            continue
+        for filename in sorted(os.listdir(root)):
+            name, ext = os.path.splitext(filename)
+            if ext not in ('.js', '.css'):
+                continue
+
+            logical = f'{source_dir}/{filename}'
+            with open(os.path.join(root, filename), 'r', encoding='utf-8') as f:
+                source = f.read()
+            minified = minify_js(source) if ext == '.js' else minify_css(source)
+            data = minified.encode('utf-8')
+
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            hashed = f'{os.path.basename(DIST_DIR)}/{source_dir}/{name}.{digest}{ext}'
+            target = os.path.join(STATIC_DIR, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as out:
+                out.write(data)
+
+            assets[logical] = hashed
+            written.add(os.path.normpath(target))
+            print(f"  {logical}: {len(source.encode('utf-8'))} -> {len(data)} Bytes ({hashed})")
+
+    # Veraltete Bundles (inkl. vorkomprimierter Varianten) entfernen
+    for dirpath, _, filenames in os.walk(DIST_DIR):
+        for filename in filenames:
+            path = os.path.normpath(os.path.join(dirpath, filename))
+            base = path[:-3] if path.endswith(('.gz', '.br')) else path
+            if base.endswith(('.js', '.css')) and base not in written:
+                os.remove(path)
+
+    os.makedirs(DIST_DIR, exist_ok=True)
+    with open(os.path.join(DIST_DIR, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({'assets': assets}, f, indent=2, sort_keys=True)
+    print(f"Manifest mit {len(assets)} Bundles geschrieben.")
+
+    precompress()
+
+
+if __name__ == '__main__':
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'extract' and len(sys.argv) == 4:
+        extract(sys.argv[2], sys.argv[3])
+    elif command == 'build':
+        build()
+    else:
+        print(__doc__)
+        sys.exit(1)
@@ -29,6 +29,9 @@ class Config:
     # Maximale Anzahl an Minispielen pro Ordner (optional)
     MAX_MINIGAMES_PER_FOLDER = 100
 
+    # MEHRERE SPIELE PRO INSTANZ
+    DEFAULT_GAME_KEY = os.environ.get('DEFAULT_GAME_KEY', 'default')  # Spiel ohne ?game=/X-Game-Key
+
     # SPIELBRETT-KONFIGURATION
     MAX_BOARD_FIELDS = 72  # Maximale Anzahl Felder auf dem Spielbrett (0-72 = 73 Felder)
     
@@ -80,6 +83,19 @@ class Config:
     PARTICLE_EFFECTS = True
     SOUND_EFFECTS = True  # Für zukünftige Audio-Implementation
     
+    # KOMPRESSION
+    COMPRESS_MIN_SIZE = 1024  # JSON-Antworten ab dieser Größe (Bytes) werden gzip/brotli-komprimiert
+
+    # BILDVERARBEITUNG
+    IMAGE_WORKERS = int(os.environ.get('IMAGE_WORKERS', 2))  # Threads für Profilbild-Uploads
+    IMAGE_JOB_QUEUE_SIZE = 32  # Max. gleichzeitig offene Bild-Jobs (darüber: HTTP 503)
+    PROFILE_IMAGE_MAX_BYTES = 10 * 1024 * 1024  # Max. Dateigröße beim binären Upload
+
+    # MEDIEN-AUSLIEFERUNG (Videos/Audio, siehe app/services/media_files.py)
+    MEDIA_MAX_AGE = 3600  # Cache-Dauer in Sekunden
+    MEDIA_ACCEL_MODE = os.environ.get('MEDIA_ACCEL_MODE')  # None, 'x-accel' (nginx) oder 'x-sendfile' (Apache)
+    MEDIA_ACCEL_PREFIX = os.environ.get('MEDIA_ACCEL_PREFIX', '/protected-static/')  # interne nginx-Location für static/
+
     # DEBUGGING
     DEBUG_SPECIAL_FIELDS = False  # Zusätzliche Debug-Logs für Sonderfelder
     FORCE_SPECIAL_FIELD_TRIGGERS = False  # Immer Sonderfeld-Aktionen auslösen (nur für Tests)
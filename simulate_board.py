@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Monte-Carlo-Simulator für Brett-Konfigurationen (siehe app/game_logic/simulation.py).
+
+Spielt viele komplette Spiele mit den echten Regeln der Spiel-Engine und der
+Feld-Verteilung aus `special_fields.py` und gibt aus:
+
+- erwartete Spiellänge in Runden und Würfen,
+- Landungen je Feldtyp,
+- Wirkung von Katapulten und Positionstausch,
+- Verweildauer auf Sperren-Feldern,
+- Siegquoten je Team und je Platzierung in der Siegrunde.
+
+Aufruf:
+    python simulate_board.py                          aktuelle Konfiguration der DB
+    python simulate_board.py --layout fields.json     Export aus "Import/Export"
+    python simulate_board.py --teams 6 --games 200000 --policy fixed
+    python simulate_board.py --bonus 1:6,2:4,3:2,4:1  eigene PLACEMENT_BONUS_DICE
+    python simulate_board.py --check 2000             Gegenprobe über engine.roll
+    python simulate_board.py --json                   Kennzahlen als JSON
+
+Benötigt `numpy` (`pip install numpy`).
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from config import Config
+
+
+def _parse_bonus(spec):
+    """'1:6,2:4' -> {1: 6, 2: 4}"""
+    bonus = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        place, sides = part.split(':')
+        bonus[int(place)] = int(sides)
+    return bonus
+
+
+def _load_rules(layout_path):
+    """Feld-Regeln aus der App-Datenbank oder aus einem Konfigurations-Export."""
+    from app import create_app, db
+    from app.game_logic.special_fields import get_field_rules
+
+    if not layout_path:
+        app = create_app()
+        with app.app_context():
+            return get_field_rules(app.config.get('MAX_BOARD_FIELDS', 72)), app.config.get('PLACEMENT_BONUS_DICE', {})
+
+    with open(layout_path, 'r', encoding='utf-8') as f:
+        import_data = json.load(f)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        class SimulationConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(workdir, 'simulation.db')
+
+        from app.admin.field_config import import_field_configurations
+
+        app = create_app(SimulationConfig)
+        with app.app_context():
+            db.create_all()
+            result = import_field_configurations(import_data)
+            for error in result['errors']:
+                print(f"⚠️  {error}", file=sys.stderr)
+            rules = get_field_rules(app.config.get('MAX_BOARD_FIELDS', 72))
+            db.session.remove()
+            return rules, app.config.get('PLACEMENT_BONUS_DICE', {})
+
+
+def _fmt(value, digits=1):
+    return '-' if value is None else f"{value:.{digits}f}"
+
+
+def _print_report(stats, rules, elapsed):
+    rounds, rolls = stats['rounds'], stats['rolls']
+    print(f"{stats['games']} Spiele, {stats['teams']} Teams, Strategie '{stats['policy']}', "
+          f"Bonus je Platz {stats['bonus_by_place']} ({elapsed:.2f}s)")
+    if stats['unfinished']:
+        print(f"⚠️  {stats['unfinished']} Spiele ohne Sieger nach Rundenlimit")
+
+    print("\nSpiellänge")
+    print(f"  Runden   Ø {_fmt(rounds['mean'])}  p10 {_fmt(rounds['p10'], 0)}  "
+          f"p50 {_fmt(rounds['p50'], 0)}  p90 {_fmt(rounds['p90'], 0)}")
+    print(f"  Würfe    Ø {_fmt(rolls['mean'])}  p10 {_fmt(rolls['p10'], 0)}  "
+          f"p50 {_fmt(rolls['p50'], 0)}  p90 {_fmt(rolls['p90'], 0)}")
+
+    print("\nLandungen je Feldtyp")
+    for field_type, values in sorted(stats['landings'].items(), key=lambda item: -item[1]['share']):
+        print(f"  {field_type:<18} {values['share']:>7.1%}  {values['per_game']:>6.2f} pro Spiel")
+
+    print("\nSonderfelder")
+    for kind, values in stats['catapult'].items():
+        print(f"  {kind:<18} {values['per_game']:>6.2f} pro Spiel, Ø {_fmt(values['mean_distance'])} Felder")
+    swap = stats['swap']
+    print(f"  {'player_swap':<18} {swap['per_game']:>6.2f} pro Spiel, Ø Gewinn {_fmt(swap['gain']['mean'])} Felder "
+          f"(p10 {_fmt(swap['gain']['p10'], 0)}, p90 {_fmt(swap['gain']['p90'], 0)}), "
+          f"{swap['failed_per_game']:.2f} ohne Partner")
+    barrier = stats['barrier']
+    dwell = barrier['dwell_rounds']
+    print(f"  {'barrier':<18} {barrier['per_game']:>6.2f} pro Spiel, Verweildauer Ø {_fmt(dwell['mean'])} Runden "
+          f"(p50 {_fmt(dwell['p50'], 0)}, p90 {_fmt(dwell['p90'], 0)})"
+          + ('' if rules.barrier_config else ' [deaktiviert]'))
+
+    print("\nSiegquote")
+    print("  je Team:              " + '  '.join(f"T{index + 1} {rate:.1%}"
+                                                for index, rate in enumerate(stats['win_rate_by_team'])))
+    print("  je Platz (Siegrunde): " + '  '.join(f"P{index + 1} {rate:.1%}"
+                                                for index, rate in enumerate(stats['win_rate_by_place'])))
+    spread = max(stats['win_rate_by_team']) - min(stats['win_rate_by_team'])
+    print(f"  Spreizung je Team:    {spread:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--layout', help='JSON-Export der Feld-Konfigurationen (Standard: aktuelle DB)')
+    parser.add_argument('--teams', type=int, default=4)
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--policy', default='random', help='random | fixed | none')
+    parser.add_argument('--bonus', help='Bonuswürfel je Platz, z.B. 1:6,2:4,3:2 (Standard: PLACEMENT_BONUS_DICE)')
+    parser.add_argument('--max-rounds', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--check', type=int, default=0, metavar='N',
+                        help='zusätzlich N Spiele über engine.roll zur Gegenprobe')
+    parser.add_argument('--json', action='store_true', help='Kennzahlen als JSON ausgeben')
+    args = parser.parse_args()
+
+    try:
+        from app.game_logic import simulation
+    except ImportError as e:
+        print(f"❌ Simulation benötigt numpy ({e}). Installation: pip install numpy", file=sys.stderr)
+        sys.exit(1)
+
+    rules, bonus_dice = _load_rules(args.layout)
+    if args.bonus:
+        bonus_dice = _parse_bonus(args.bonus)
+    max_rounds = args.max_rounds or simulation.DEFAULT_MAX_ROUNDS
+
+    started = time.perf_counter()
+    try:
+        stats = simulation.simulate(rules, args.teams, args.games, bonus_dice, args.policy, args.seed, max_rounds)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    reference = None
+    if args.check:
+        reference = simulation.simulate_reference(rules, args.teams, args.check, bonus_dice,
+                                                  args.policy, args.seed, max_rounds)
+
+    if args.json:
+        print(json.dumps({'simulation': stats, 'reference': reference}, indent=2))
+        return
+
+    _print_report(stats, rules, elapsed)
+    if reference:
+        print(f"\nGegenprobe über engine.roll ({reference['games']} Spiele): "
+              f"Runden Ø {_fmt(reference['rounds']['mean'])} (vektorisiert {_fmt(stats['rounds']['mean'])}), "
+              "Siegquote je Team " + '  '.join(f"{rate:.1%}" for rate in reference['win_rate_by_team']))
+
+
+if __name__ == '__main__':
+    main()